@@ -0,0 +1,39 @@
+"""add source credential cache
+
+Revision ID: 20261019_0003
+Revises: 20260216_0002
+Create Date: 2026-10-19 10:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0003"
+down_revision = "20260216_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "source_credentials",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("source_id", sa.Integer(), sa.ForeignKey("sources.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("name", sa.String(length=128), nullable=False),
+        sa.Column("value_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("invalidated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("invalid_reason", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.UniqueConstraint("source_id", "name", name="uq_source_credentials_source_name"),
+    )
+    op.create_index("ix_source_credentials_source_id", "source_credentials", ["source_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_source_credentials_source_id", table_name="source_credentials")
+    op.drop_table("source_credentials")
@@ -0,0 +1,44 @@
+"""add crawl quarantine items
+
+Revision ID: 20261019_0004
+Revises: 20261019_0003
+Create Date: 2026-10-19 11:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0004"
+down_revision = "20261019_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "crawl_quarantine_items",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("source_id", sa.Integer(), sa.ForeignKey("sources.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("run_id", sa.Integer(), sa.ForeignKey("crawl_runs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("external_id", sa.String(length=128), nullable=True),
+        sa.Column("stage", sa.String(length=32), nullable=False),
+        sa.Column("error_type", sa.String(length=128), nullable=False),
+        sa.Column("error", sa.Text(), nullable=False),
+        sa.Column("payload_ref", sa.String(length=1024), nullable=True),
+        sa.Column("payload_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_crawl_quarantine_items_run_id", "crawl_quarantine_items", ["run_id"])
+    op.create_index(
+        "ix_crawl_quarantine_items_source_external",
+        "crawl_quarantine_items",
+        ["source_id", "external_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_crawl_quarantine_items_source_external", table_name="crawl_quarantine_items")
+    op.drop_index("ix_crawl_quarantine_items_run_id", table_name="crawl_quarantine_items")
+    op.drop_table("crawl_quarantine_items")
@@ -0,0 +1,28 @@
+"""add crawl run meta json and partial status
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19 12:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0005"
+down_revision = "20261019_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE crawlrunstatus ADD VALUE IF NOT EXISTS 'partial'")
+    op.add_column("crawl_runs", sa.Column("meta_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    # Postgres cannot drop enum values; fold partial runs back into success instead.
+    op.execute("UPDATE crawl_runs SET status = 'success' WHERE status = 'partial'")
+    op.drop_column("crawl_runs", "meta_json")
@@ -0,0 +1,74 @@
+"""rebuild job search vectors with cjk tokens
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19 14:00:00
+"""
+
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0007"
+down_revision = "20261019_0006"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+# Frozen copy of app.utils.search_tokens as of this revision: a migration must not change
+# behaviour when the live tokenizer does.
+_CJK_RUN = r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+"
+_TOKEN_RE = re.compile(rf"({_CJK_RUN})|([0-9a-z]+)")
+
+
+def _search_document(*parts: str | None) -> str:
+    tokens: dict[str, None] = {}
+    for part in parts:
+        for cjk, word in _TOKEN_RE.findall((part or "").lower()):
+            if word:
+                tokens.setdefault(word, None)
+                continue
+            for char in cjk:
+                tokens.setdefault(char, None)
+            for i in range(len(cjk) - 1):
+                tokens.setdefault(cjk[i : i + 2], None)
+    return " ".join(tokens)
+
+
+def upgrade() -> None:
+    # Vectors written with plain to_tsvector('simple', text) hold whole Chinese phrases as single
+    # lexemes; re-tokenize every job so bigram queries can match them.
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, title, responsibilities, qualifications FROM jobs "
+                "WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text("UPDATE jobs SET search_vector = to_tsvector('simple', :doc) WHERE id = :id"),
+            [
+                {
+                    "id": row.id,
+                    # Skills are parsed from the description, which responsibilities already holds.
+                    "doc": _search_document(row.title, row.responsibilities, row.qualifications),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE jobs SET search_vector = to_tsvector('simple', "
+        "concat_ws(' ', title, responsibilities, qualifications))"
+    )
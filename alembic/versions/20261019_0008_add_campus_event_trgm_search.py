@@ -0,0 +1,47 @@
+"""add campus event trigram search
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 15:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0008"
+down_revision = "20261019_0007"
+branch_labels = None
+depends_on = None
+
+SEARCH_TEXT_EXPR = (
+    "coalesce(title, '') || ' ' || coalesce(company_name, '') || ' ' || "
+    "coalesce(school_name, '') || ' ' || coalesce(venue, '')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "campus_events",
+        sa.Column("search_text", sa.Text(), sa.Computed(SEARCH_TEXT_EXPR, persisted=True), nullable=True),
+    )
+    for name, column in (
+        ("ix_campus_events_search_text_trgm", "search_text"),
+        ("ix_campus_events_school_name_trgm", "school_name"),
+        ("ix_campus_events_company_name_trgm", "company_name"),
+    ):
+        op.create_index(
+            name,
+            "campus_events",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_campus_events_company_name_trgm", table_name="campus_events")
+    op.drop_index("ix_campus_events_school_name_trgm", table_name="campus_events")
+    op.drop_index("ix_campus_events_search_text_trgm", table_name="campus_events")
+    op.drop_column("campus_events", "search_text")
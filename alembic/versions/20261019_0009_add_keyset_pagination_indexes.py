@@ -0,0 +1,37 @@
+"""add keyset pagination indexes
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19 16:00:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0009"
+down_revision = "20261019_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Expressions must match the Keyset definitions in app.dao so the planner can use them.
+    op.execute(
+        "CREATE INDEX ix_jobs_keyset_time ON jobs "
+        "(coalesce(published_at, '-infinity'::timestamptz) DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_jobs_keyset_salary ON jobs "
+        "(coalesce(salary_max, '-Infinity'::numeric) DESC, "
+        "coalesce(published_at, '-infinity'::timestamptz) DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_campus_events_keyset_time ON campus_events "
+        "(coalesce(starts_at, 'infinity'::timestamptz), id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_campus_events_keyset_time", table_name="campus_events")
+    op.drop_index("ix_jobs_keyset_salary", table_name="jobs")
+    op.drop_index("ix_jobs_keyset_time", table_name="jobs")
@@ -0,0 +1,56 @@
+"""add stats rollups
+
+Revision ID: 20261019_0010
+Revises: 20261019_0009
+Create Date: 2026-10-19 17:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0010"
+down_revision = "20261019_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stats_rollups",
+        sa.Column("scope", sa.String(length=32), nullable=False),
+        sa.Column("dimension", sa.String(length=32), nullable=False),
+        sa.Column("bucket", sa.String(length=255), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "dimension", "bucket", name="pk_stats_rollups"),
+    )
+    op.create_index("ix_stats_rollups_top", "stats_rollups", ["scope", "dimension", "count"])
+    # Seed from the base tables once; ingest deltas and the reconcile job keep it current after.
+    op.execute(
+        """
+        INSERT INTO stats_rollups (scope, dimension, bucket, count)
+        SELECT 'jobs', 'source', s.code, count(j.id)
+        FROM sources s JOIN jobs j ON j.source_id = s.id GROUP BY s.code
+        UNION ALL
+        SELECT 'jobs', 'city', coalesce(l.city, ''), count(j.id)
+        FROM locations l JOIN jobs j ON j.location_id = l.id GROUP BY coalesce(l.city, '')
+        UNION ALL
+        SELECT 'jobs', 'category', coalesce(job_category, ''), count(id)
+        FROM jobs GROUP BY coalesce(job_category, '')
+        UNION ALL
+        SELECT 'campus_events', 'source', s.code, count(e.id)
+        FROM sources s JOIN campus_events e ON e.source_id = s.id GROUP BY s.code
+        UNION ALL
+        SELECT 'campus_events', 'city', coalesce(city, ''), count(id)
+        FROM campus_events GROUP BY coalesce(city, '')
+        UNION ALL
+        SELECT 'campus_events', 'school', coalesce(school_name, ''), count(id)
+        FROM campus_events GROUP BY coalesce(school_name, '')
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stats_rollups_top", table_name="stats_rollups")
+    op.drop_table("stats_rollups")
@@ -0,0 +1,107 @@
+"""add job search docs read model
+
+Revision ID: 20261019_0011
+Revises: 20261019_0010
+Create Date: 2026-10-19 18:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0011"
+down_revision = "20261019_0010"
+branch_labels = None
+depends_on = None
+
+TIME_KEY = "coalesce(published_at, '-infinity'::timestamptz) DESC"
+SALARY_KEY = "coalesce(salary_max, '-Infinity'::numeric) DESC"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_search_docs",
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("source_id", sa.Integer(), nullable=False),
+        sa.Column("source_code", sa.String(length=64), nullable=False),
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("company_name", sa.String(length=255), nullable=False),
+        sa.Column("industry", sa.String(length=128), nullable=True),
+        sa.Column("location_id", sa.Integer(), nullable=True),
+        sa.Column("province", sa.String(length=64), nullable=True),
+        sa.Column("city", sa.String(length=64), nullable=True),
+        sa.Column("district", sa.String(length=64), nullable=True),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("job_category", sa.String(length=128), nullable=True),
+        sa.Column(
+            "education_requirement",
+            postgresql.ENUM(name="educationlevel", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("experience_min_months", sa.Integer(), nullable=True),
+        sa.Column("salary_min", sa.Numeric(12, 2), nullable=True),
+        sa.Column("salary_max", sa.Numeric(12, 2), nullable=True),
+        sa.Column("salary_currency", sa.String(length=8), nullable=True),
+        sa.Column("salary_period", sa.String(length=16), nullable=True),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["job_id"], ["jobs.id"], name="fk_job_search_docs_job_id_jobs", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("job_id", name="pk_job_search_docs"),
+    )
+    # Backfill before indexing so the bulk load does not maintain ten indexes row by row.
+    op.execute(
+        """
+        INSERT INTO job_search_docs (
+            job_id, source_id, source_code, company_id, company_name, industry,
+            location_id, province, city, district, title, job_category, education_requirement,
+            experience_min_months, salary_min, salary_max, salary_currency, salary_period,
+            published_at, search_vector
+        )
+        SELECT j.id, j.source_id, s.code, j.company_id, c.display_name, c.industry,
+               j.location_id, l.province, l.city, l.district, j.title, j.job_category,
+               j.education_requirement, j.experience_min_months, j.salary_min, j.salary_max,
+               j.salary_currency, j.salary_period, j.published_at, j.search_vector
+        FROM jobs j
+        JOIN companies c ON c.id = j.company_id
+        JOIN sources s ON s.id = j.source_id
+        LEFT JOIN locations l ON l.id = j.location_id
+        """
+    )
+    op.create_index(
+        "ix_job_search_docs_search_vector", "job_search_docs", ["search_vector"], postgresql_using="gin"
+    )
+    op.execute(f"CREATE INDEX ix_job_search_docs_keyset_time ON job_search_docs ({TIME_KEY}, job_id DESC)")
+    op.execute(
+        "CREATE INDEX ix_job_search_docs_keyset_salary ON job_search_docs "
+        f"({SALARY_KEY}, {TIME_KEY}, job_id DESC)"
+    )
+    for name, column in (
+        ("ix_job_search_docs_city_time", "city"),
+        ("ix_job_search_docs_province_time", "province"),
+        ("ix_job_search_docs_category_time", "job_category"),
+        ("ix_job_search_docs_source_time", "source_code"),
+    ):
+        op.execute(f"CREATE INDEX {name} ON job_search_docs ({column}, {TIME_KEY}, job_id DESC)")
+    op.create_index("ix_job_search_docs_company_id", "job_search_docs", ["company_id"])
+    op.create_index("ix_job_search_docs_location_id", "job_search_docs", ["location_id"])
+
+    # The list endpoint no longer sorts on jobs directly.
+    op.drop_index("ix_jobs_keyset_salary", table_name="jobs")
+    op.drop_index("ix_jobs_keyset_time", table_name="jobs")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_jobs_keyset_time ON jobs "
+        "(coalesce(published_at, '-infinity'::timestamptz) DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_jobs_keyset_salary ON jobs "
+        "(coalesce(salary_max, '-Infinity'::numeric) DESC, "
+        "coalesce(published_at, '-infinity'::timestamptz) DESC, id DESC)"
+    )
+    op.drop_table("job_search_docs")
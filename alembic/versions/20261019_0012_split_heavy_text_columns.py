@@ -0,0 +1,156 @@
+"""move long text and raw payloads into side tables
+
+Revision ID: 20261019_0012
+Revises: 20261019_0011
+Create Date: 2026-10-19 19:00:00
+"""
+
+import hashlib
+import zlib
+
+from alembic import op
+import orjson
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0012"
+down_revision = "20261019_0011"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+
+# Frozen copy of app.utils.raw_payload as of this revision: canonical sorted-key JSON, digest
+# over the uncompressed bytes, zlib level 6.
+def _encode_payload(payload) -> tuple[bytes, str, str]:
+    raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return zlib.compress(raw, 6), "zlib+json", hashlib.sha256(raw).hexdigest()
+
+
+def _decode_payload(data: bytes, encoding: str):
+    if encoding == "zlib+json":
+        data = zlib.decompress(data)
+    elif encoding != "json":
+        raise ValueError(f"unknown payload encoding {encoding}")
+    return orjson.loads(data)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_bodies",
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("responsibilities", sa.Text(), nullable=True),
+        sa.Column("qualifications", sa.Text(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], name="fk_job_bodies_job_id_jobs", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id", name="pk_job_bodies"),
+    )
+    op.create_table(
+        "campus_event_bodies",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("raw_payload", sa.LargeBinary(), nullable=True),
+        sa.Column("payload_encoding", sa.String(length=16), nullable=True),
+        sa.Column("payload_sha256", sa.String(length=64), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["event_id"],
+            ["campus_events.id"],
+            name="fk_campus_event_bodies_event_id_campus_events",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("event_id", name="pk_campus_event_bodies"),
+    )
+
+    op.execute(
+        "INSERT INTO job_bodies (job_id, responsibilities, qualifications) "
+        "SELECT id, responsibilities, qualifications FROM jobs"
+    )
+    # Payloads are re-encoded in Python so their digests match what ingest computes later.
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, description, raw_payload_json FROM campus_events "
+                "WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        params = []
+        for row in rows:
+            data, encoding, sha256 = _encode_payload(row.raw_payload_json) if row.raw_payload_json else (None,) * 3
+            params.append(
+                {
+                    "event_id": row.id,
+                    "description": row.description,
+                    "raw_payload": data,
+                    "payload_encoding": encoding,
+                    "payload_sha256": sha256,
+                }
+            )
+        bind.execute(
+            sa.text(
+                "INSERT INTO campus_event_bodies "
+                "(event_id, description, raw_payload, payload_encoding, payload_sha256) "
+                "VALUES (:event_id, :description, :raw_payload, :payload_encoding, :payload_sha256)"
+            ),
+            params,
+        )
+        last_id = rows[-1].id
+
+    # Dropped columns stop being read at once; their space comes back as rows are rewritten
+    # (or immediately with VACUUM FULL jobs, campus_events).
+    op.drop_column("jobs", "qualifications")
+    op.drop_column("jobs", "responsibilities")
+    op.drop_column("campus_events", "raw_payload_json")
+    op.drop_column("campus_events", "description")
+
+
+def downgrade() -> None:
+    op.add_column("campus_events", sa.Column("description", sa.Text(), nullable=True))
+    op.add_column(
+        "campus_events",
+        sa.Column("raw_payload_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.add_column("jobs", sa.Column("responsibilities", sa.Text(), nullable=True))
+    op.add_column("jobs", sa.Column("qualifications", sa.Text(), nullable=True))
+
+    op.execute(
+        "UPDATE jobs SET responsibilities = b.responsibilities, qualifications = b.qualifications "
+        "FROM job_bodies b WHERE b.job_id = jobs.id"
+    )
+    op.execute(
+        "UPDATE campus_events SET description = b.description "
+        "FROM campus_event_bodies b WHERE b.event_id = campus_events.id"
+    )
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT event_id, raw_payload, payload_encoding FROM campus_event_bodies "
+                "WHERE event_id > :last_id AND raw_payload IS NOT NULL ORDER BY event_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text("UPDATE campus_events SET raw_payload_json = CAST(:payload AS jsonb) WHERE id = :id"),
+            [
+                {
+                    "id": row.event_id,
+                    "payload": orjson.dumps(_decode_payload(row.raw_payload, row.payload_encoding)).decode(),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].event_id
+
+    op.drop_table("campus_event_bodies")
+    op.drop_table("job_bodies")
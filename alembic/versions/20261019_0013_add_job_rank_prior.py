@@ -0,0 +1,89 @@
+"""add static quality score and rank prior to job_search_docs
+
+Revision ID: 20261019_0013
+Revises: 20261019_0012
+Create Date: 2026-10-19 20:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0013"
+down_revision = "20261019_0012"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+# Frozen copy of app.search.ranking.quality_score / rank_prior as of this revision.
+QUALITY_WEIGHTS = {"salary": 0.25, "education": 0.1, "experience": 0.1, "location": 0.1, "body": 0.45}
+QUALITY_BODY_CHARS = 600
+QUALITY_DAYS = 7.0
+SECONDS_PER_DAY = 86400.0
+
+
+def _quality_score(row) -> float:
+    body_chars = len(row.responsibilities or "") + len(row.qualifications or "")
+    score = QUALITY_WEIGHTS["body"] * min(body_chars, QUALITY_BODY_CHARS) / QUALITY_BODY_CHARS
+    if row.salary_max is not None:
+        score += QUALITY_WEIGHTS["salary"]
+    if row.education not in (None, "unknown"):
+        score += QUALITY_WEIGHTS["education"]
+    if row.experience_min_months is not None:
+        score += QUALITY_WEIGHTS["experience"]
+    if row.city:
+        score += QUALITY_WEIGHTS["location"]
+    return round(score, 4)
+
+
+def _rank_prior(quality: float, published_at) -> float:
+    days = published_at.timestamp() / SECONDS_PER_DAY if published_at is not None else 0.0
+    return days + quality * QUALITY_DAYS
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_search_docs", sa.Column("quality_score", sa.Float(), server_default=sa.text("0"), nullable=False)
+    )
+    op.add_column(
+        "job_search_docs", sa.Column("rank_prior", sa.Float(), server_default=sa.text("0"), nullable=False)
+    )
+
+    # Scored in Python with the rules ingest used at this revision.
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT d.job_id, d.salary_max, d.education_requirement::text AS education, "
+                "d.experience_min_months, d.city, d.published_at, b.responsibilities, b.qualifications "
+                "FROM job_search_docs d LEFT JOIN job_bodies b ON b.job_id = d.job_id "
+                "WHERE d.job_id > :last_id ORDER BY d.job_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        params = []
+        for row in rows:
+            quality = _quality_score(row)
+            params.append(
+                {"job_id": row.job_id, "quality": quality, "prior": _rank_prior(quality, row.published_at)}
+            )
+        bind.execute(
+            sa.text(
+                "UPDATE job_search_docs SET quality_score = :quality, rank_prior = :prior "
+                "WHERE job_id = :job_id"
+            ),
+            params,
+        )
+        last_id = rows[-1].job_id
+
+    op.execute("CREATE INDEX ix_job_search_docs_rank_prior ON job_search_docs (rank_prior DESC, job_id DESC)")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_search_docs_rank_prior", table_name="job_search_docs")
+    op.drop_column("job_search_docs", "rank_prior")
+    op.drop_column("job_search_docs", "quality_score")
@@ -0,0 +1,106 @@
+"""add CNY/month salary range and midpoint to job_search_docs
+
+Revision ID: 20261019_0014
+Revises: 20261019_0013
+Create Date: 2026-10-19 21:00:00
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0014"
+down_revision = "20261019_0013"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+TIME_KEY = "coalesce(published_at, '-infinity'::timestamptz) DESC"
+OLD_SALARY_KEY = "coalesce(salary_max, '-Infinity'::numeric) DESC"
+SALARY_KEY = "coalesce(salary_monthly_mid, -1) DESC"
+
+# Frozen copy of app.utils.salary.monthly_salary_range as of this revision.
+PERIOD_MONTHS = {"month": Decimal(1), "year": Decimal(12)}
+
+
+def _monthly_range(salary_min, salary_max, currency, period) -> tuple[int, int] | None:
+    months = PERIOD_MONTHS.get(period or "")
+    if currency != "CNY" or months is None:
+        return None
+    low = salary_min if salary_min is not None else salary_max
+    high = salary_max if salary_max is not None else salary_min
+    if low is None or high is None:
+        return None
+    low, high = sorted((low, high))
+    return tuple(
+        int((Decimal(amount) / months).to_integral_value(rounding=ROUND_HALF_UP)) for amount in (low, high)
+    )
+
+
+def upgrade() -> None:
+    op.add_column("job_search_docs", sa.Column("salary_monthly_mid", sa.Integer(), nullable=True))
+    op.add_column("job_search_docs", sa.Column("salary_monthly_range", postgresql.INT4RANGE(), nullable=True))
+
+    # Normalized in Python with the rules ingest used at this revision.
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT job_id, salary_min, salary_max, salary_currency, salary_period FROM job_search_docs "
+                "WHERE job_id > :last_id ORDER BY job_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        params = []
+        for row in rows:
+            monthly = _monthly_range(row.salary_min, row.salary_max, row.salary_currency, row.salary_period)
+            if monthly is not None:
+                params.append(
+                    {
+                        "job_id": row.job_id,
+                        "mid": (monthly[0] + monthly[1]) // 2,
+                        "low": monthly[0],
+                        "high": monthly[1],
+                    }
+                )
+        if params:
+            bind.execute(
+                sa.text(
+                    "UPDATE job_search_docs SET salary_monthly_mid = :mid, "
+                    "salary_monthly_range = int4range(:low, :high, '[]') WHERE job_id = :job_id"
+                ),
+                params,
+            )
+        last_id = rows[-1].job_id
+
+    op.drop_index("ix_job_search_docs_keyset_salary", table_name="job_search_docs")
+    op.execute(
+        "CREATE INDEX ix_job_search_docs_keyset_salary ON job_search_docs "
+        f"({SALARY_KEY}, {TIME_KEY}, job_id DESC)"
+    )
+    op.create_index(
+        "ix_job_search_docs_salary_monthly",
+        "job_search_docs",
+        ["salary_monthly_range"],
+        postgresql_using="gist",
+    )
+    # Salary filters run on job_search_docs; this (min, max) btree only cost ingest writes.
+    op.drop_index("ix_jobs_salary_range", table_name="jobs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_jobs_salary_range", "jobs", ["salary_min", "salary_max"])
+    op.drop_index("ix_job_search_docs_salary_monthly", table_name="job_search_docs")
+    op.drop_index("ix_job_search_docs_keyset_salary", table_name="job_search_docs")
+    op.execute(
+        "CREATE INDEX ix_job_search_docs_keyset_salary ON job_search_docs "
+        f"({OLD_SALARY_KEY}, {TIME_KEY}, job_id DESC)"
+    )
+    op.drop_column("job_search_docs", "salary_monthly_range")
+    op.drop_column("job_search_docs", "salary_monthly_mid")
@@ -0,0 +1,92 @@
+"""add region hierarchy and ancestor region ids
+
+Revision ID: 20261019_0015
+Revises: 20261019_0014
+Create Date: 2026-10-19 22:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0015"
+down_revision = "20261019_0014"
+branch_labels = None
+depends_on = None
+
+TIME_KEY = "coalesce(published_at, '-infinity'::timestamptz) DESC"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "regions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("parent_id", sa.Integer(), nullable=True),
+        sa.Column("level", sa.SmallInteger(), nullable=False),
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("path_key", sa.String(length=255), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["parent_id"], ["regions.id"], name="fk_regions_parent_id_regions", ondelete="RESTRICT"
+        ),
+        sa.PrimaryKeyConstraint("id", name="pk_regions"),
+        sa.UniqueConstraint("path_key", name="uq_regions_path_key"),
+    )
+    op.create_index("ix_regions_level_name", "regions", ["level", "name"])
+    op.add_column("locations", sa.Column("region_ids", postgresql.ARRAY(sa.Integer()), nullable=True))
+    op.add_column(
+        "job_search_docs",
+        sa.Column("region_ids", postgresql.ARRAY(sa.Integer()), server_default=sa.text("'{}'"), nullable=False),
+    )
+
+    # Same tree LocationDAO builds at ingest: one node per level-tagged name path.
+    bind = op.get_bind()
+    node_ids: dict[str, int] = {}
+    locations = bind.execute(sa.text("SELECT id, province, city, district FROM locations ORDER BY id")).all()
+    params = []
+    for location in locations:
+        region_ids: list[int] = []
+        parent_id = None
+        segments: list[str] = []
+        for level, name in ((1, location.province), (2, location.city), (3, location.district)):
+            if not name:
+                continue
+            segments.append(f"{level}:{name}")
+            path_key = "/".join(segments)
+            if path_key not in node_ids:
+                node_ids[path_key] = bind.execute(
+                    sa.text(
+                        "INSERT INTO regions (parent_id, level, name, path_key) "
+                        "VALUES (:parent_id, :level, :name, :path_key) RETURNING id"
+                    ),
+                    {"parent_id": parent_id, "level": level, "name": name, "path_key": path_key},
+                ).scalar_one()
+            parent_id = node_ids[path_key]
+            region_ids.append(parent_id)
+        params.append({"id": location.id, "region_ids": region_ids})
+    if params:
+        bind.execute(sa.text("UPDATE locations SET region_ids = :region_ids WHERE id = :id"), params)
+    op.execute(
+        "UPDATE job_search_docs d SET region_ids = l.region_ids "
+        "FROM locations l WHERE l.id = d.location_id AND l.region_ids <> '{}'"
+    )
+
+    op.create_index("ix_job_search_docs_region_ids", "job_search_docs", ["region_ids"], postgresql_using="gin")
+    # Province / city filters are region-id membership checks now.
+    op.drop_index("ix_job_search_docs_city_time", table_name="job_search_docs")
+    op.drop_index("ix_job_search_docs_province_time", table_name="job_search_docs")
+
+
+def downgrade() -> None:
+    for name, column in (
+        ("ix_job_search_docs_city_time", "city"),
+        ("ix_job_search_docs_province_time", "province"),
+    ):
+        op.execute(f"CREATE INDEX {name} ON job_search_docs ({column}, {TIME_KEY}, job_id DESC)")
+    op.drop_index("ix_job_search_docs_region_ids", table_name="job_search_docs")
+    op.drop_column("job_search_docs", "region_ids")
+    op.drop_column("locations", "region_ids")
+    op.drop_index("ix_regions_level_name", table_name="regions")
+    op.drop_table("regions")
@@ -0,0 +1,29 @@
+"""add shared response cache versions
+
+Revision ID: 20261019_0016
+Revises: 20261019_0015
+Create Date: 2026-10-19 23:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0016"
+down_revision = "20261019_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cache_versions",
+        sa.Column("name", sa.String(length=160), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("name", name="pk_cache_versions"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cache_versions")
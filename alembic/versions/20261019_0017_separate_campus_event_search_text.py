@@ -0,0 +1,50 @@
+"""separate campus event search_text fields with a unit separator
+
+Revision ID: 20261019_0017
+Revises: 20261019_0016
+Create Date: 2026-10-19 23:30:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0017"
+down_revision = "20261019_0016"
+branch_labels = None
+depends_on = None
+
+# Keywords cannot contain U+001F, so a keyword no longer matches across two fields.
+SEARCH_TEXT_EXPR = (
+    "coalesce(title, '') || E'\\x1f' || coalesce(company_name, '') || E'\\x1f' || "
+    "coalesce(school_name, '') || E'\\x1f' || coalesce(venue, '')"
+)
+OLD_SEARCH_TEXT_EXPR = (
+    "coalesce(title, '') || ' ' || coalesce(company_name, '') || ' ' || "
+    "coalesce(school_name, '') || ' ' || coalesce(venue, '')"
+)
+
+
+def _replace_search_text(expr: str) -> None:
+    # A generated column's expression cannot be altered in place; rebuild the column and index.
+    op.drop_index("ix_campus_events_search_text_trgm", table_name="campus_events")
+    op.drop_column("campus_events", "search_text")
+    op.add_column(
+        "campus_events",
+        sa.Column("search_text", sa.Text(), sa.Computed(expr, persisted=True), nullable=True),
+    )
+    op.create_index(
+        "ix_campus_events_search_text_trgm",
+        "campus_events",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def upgrade() -> None:
+    _replace_search_text(SEARCH_TEXT_EXPR)
+
+
+def downgrade() -> None:
+    _replace_search_text(OLD_SEARCH_TEXT_EXPR)
@@ -0,0 +1,293 @@
+"""Versioned response cache for read-heavy list/stats endpoints.
+
+Entries are keyed by scope, data version and normalized query parameters. A crawl commit bumps
+the version of its source (and the scope-wide version), so later reads simply miss the old keys;
+stale entries are never read again and age out through LRU eviction or the safety TTL. Versions
+always live somewhere every process sees (Redis or the cache_versions table), because crawls
+commit in the worker process while the API workers serve the cached reads.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import orjson
+
+from app.core.config import get_settings
+from app.dao.cache_version_dao import CacheVersionDAO
+
+logger = logging.getLogger(__name__)
+
+ALL_SOURCES = "*"
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> tuple[Any, float] | None: ...
+
+    async def set(self, key: str, value: Any, cost_seconds: float, ttl_seconds: float) -> None: ...
+
+    async def get_version(self, name: str) -> int: ...
+
+    async def bump_version(self, name: str) -> int: ...
+
+
+class VersionStore(Protocol):
+    async def get(self, name: str) -> int: ...
+
+    async def bump(self, name: str) -> int: ...
+
+
+class LocalVersions:
+    """In-process counters; only correct when every bump happens in the reading process."""
+
+    def __init__(self) -> None:
+        self.versions: dict[str, int] = {}
+
+    async def get(self, name: str) -> int:
+        return self.versions.get(name, 0)
+
+    async def bump(self, name: str) -> int:
+        self.versions[name] = self.versions.get(name, 0) + 1
+        return self.versions[name]
+
+
+class DatabaseVersions:
+    """Counters in the cache_versions table, read at most once per `ttl_seconds` per name.
+
+    A bump made by another process is seen within `ttl_seconds`; this process's own bumps are
+    seen at once.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.dao = CacheVersionDAO()
+        self.cached: dict[str, tuple[float, int]] = {}
+
+    async def get(self, name: str) -> int:
+        now = self.clock()
+        entry = self.cached.get(name)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        async with self.session_factory() as session:
+            version = await self.dao.get(session, name)
+        self.cached[name] = (now + self.ttl_seconds, version)
+        return version
+
+    async def bump(self, name: str) -> int:
+        async with self.session_factory() as session:
+            version = await self.dao.bump(session, name)
+            await session.commit()
+        self.cached[name] = (self.clock() + self.ttl_seconds, version)
+        return version
+
+
+class MemoryCacheBackend:
+    """Per-process LRU bounded by entry count; version counters come from `versions`.
+
+    Values are stored as orjson bytes, like in Redis, so every hit decodes a fresh copy and a
+    caller that edits its result cannot change what later requests get.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+        versions: VersionStore | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.clock = clock
+        self.entries: OrderedDict[str, tuple[float, bytes, float]] = OrderedDict()
+        self.versions = versions if versions is not None else LocalVersions()
+
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, raw, cost_seconds = entry
+        if expires_at <= self.clock():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return orjson.loads(raw), cost_seconds
+
+    async def set(self, key: str, value: Any, cost_seconds: float, ttl_seconds: float) -> None:
+        self.entries[key] = (self.clock() + ttl_seconds, _dumps(value), cost_seconds)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def get_version(self, name: str) -> int:
+        return await self.versions.get(name)
+
+    async def bump_version(self, name: str) -> int:
+        return await self.versions.bump(name)
+
+
+class RedisCacheBackend:
+    """Shared across workers; run Redis with `maxmemory` + `allkeys-lru` to bound memory."""
+
+    def __init__(self, url: str, prefix: str = "respcache") -> None:
+        try:
+            import redis.asyncio as redis
+        except ImportError as exc:
+            raise RuntimeError("APP_RESPONSE_CACHE_BACKEND=redis requires redis installed") from exc
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        raw = await self.client.get(f"{self.prefix}:entry:{key}")
+        if raw is None:
+            return None
+        payload = orjson.loads(raw)
+        return payload["value"], float(payload["cost"])
+
+    async def set(self, key: str, value: Any, cost_seconds: float, ttl_seconds: float) -> None:
+        raw = _dumps({"value": value, "cost": cost_seconds})
+        await self.client.set(f"{self.prefix}:entry:{key}", raw, px=int(ttl_seconds * 1000))
+
+    async def get_version(self, name: str) -> int:
+        raw = await self.client.get(f"{self.prefix}:version:{name}")
+        return int(raw or 0)
+
+    async def bump_version(self, name: str) -> int:
+        return int(await self.client.incr(f"{self.prefix}:version:{name}"))
+
+
+@dataclass
+class EndpointStats:
+    hits: int = 0
+    misses: int = 0
+    saved_seconds: float = 0.0
+    computed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "saved_db_seconds": round(self.saved_seconds, 3),
+            "computed_db_seconds": round(self.computed_seconds, 3),
+        }
+
+
+@dataclass
+class ResponseCache:
+    backend: CacheBackend | None
+    ttl_seconds: float
+    clock: Callable[[], float] = time.perf_counter
+    stats: dict[str, EndpointStats] = field(default_factory=dict)
+
+    async def get_or_compute(
+        self,
+        scope: str,
+        name: str,
+        params: dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+        *,
+        source_code: str | None = None,
+    ) -> Any:
+        """Return the cached `name` result for `params`, or run `compute` and cache it.
+
+        `scope` is the data set ("jobs", "campus_events") whose version tags the key;
+        `source_code` narrows it to one source, so a crawl of another source does not evict this
+        entry. Backend errors degrade to computing the result uncached.
+        """
+        if self.backend is None:
+            return await compute()
+        stats = self.stats.setdefault(f"{scope}.{name}", EndpointStats())
+        key = None
+        try:
+            version = await self.backend.get_version(version_name(scope, source_code))
+            key = f"{scope}.{name}:v{version}:{query_signature(params)}"
+            cached = await self.backend.get(key)
+        except Exception:  # noqa: BLE001
+            logger.warning("response cache read failed scope=%s", scope, exc_info=True)
+            cached = None
+        if cached is not None:
+            value, cost_seconds = cached
+            stats.hits += 1
+            stats.saved_seconds += cost_seconds
+            return value
+
+        stats.misses += 1
+        started = self.clock()
+        value = await compute()
+        cost_seconds = self.clock() - started
+        stats.computed_seconds += cost_seconds
+        if key is not None:
+            try:
+                await self.backend.set(key, value, cost_seconds, self.ttl_seconds)
+            except Exception:  # noqa: BLE001
+                logger.warning("response cache write failed scope=%s", scope, exc_info=True)
+        return value
+
+    async def bump(self, scope: str, source_code: str | None = None) -> None:
+        """Called after new data for `source_code` (or the whole scope) is committed."""
+        if self.backend is None:
+            return
+        try:
+            if source_code:
+                await self.backend.bump_version(version_name(scope, source_code))
+            await self.backend.bump_version(version_name(scope, None))
+        except Exception:  # noqa: BLE001
+            logger.warning("response cache version bump failed scope=%s", scope, exc_info=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        total = EndpointStats()
+        for item in self.stats.values():
+            total.hits += item.hits
+            total.misses += item.misses
+            total.saved_seconds += item.saved_seconds
+            total.computed_seconds += item.computed_seconds
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "total": total.to_dict(),
+            "endpoints": {name: item.to_dict() for name, item in sorted(self.stats.items())},
+        }
+
+
+def _dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def version_name(scope: str, source_code: str | None) -> str:
+    return f"{scope}:{source_code or ALL_SOURCES}"
+
+
+def query_signature(params: dict[str, Any]) -> str:
+    # Values are kept verbatim: the DAOs filter on the raw strings, so " 销售" and "销售" can
+    # match different rows and must not share a key. Unset filters (None / "") are dropped.
+    normalized = {name: value for name, value in params.items() if value is not None and value != ""}
+    return orjson.dumps(normalized, default=str, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+
+
+_CACHE: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _CACHE
+    if _CACHE is None:
+        settings = get_settings()
+        backend: CacheBackend | None
+        if settings.response_cache_backend == "redis":
+            backend = RedisCacheBackend(settings.response_cache_redis_url)
+        elif settings.response_cache_backend == "memory":
+            from app.core.database import SessionLocal
+
+            versions = DatabaseVersions(SessionLocal, settings.response_cache_version_ttl_seconds)
+            backend = MemoryCacheBackend(settings.response_cache_max_entries, versions=versions)
+        else:
+            backend = None
+        _CACHE = ResponseCache(backend=backend, ttl_seconds=settings.response_cache_ttl_seconds)
+    return _CACHE
@@ -31,7 +31,34 @@ class Settings(BaseSettings):
     crawler_default_timeout_seconds: int = 20
     crawler_default_retry_count: int = 3
     crawler_default_backoff_seconds: float = 1.0
+    crawler_max_backoff_seconds: float = 30.0
+    crawler_circuit_failure_threshold: int = 3
+    crawler_circuit_window_seconds: float = 60.0
+    crawler_circuit_cooldown_seconds: float = 600.0
+    crawler_max_item_failure_ratio: float = 0.2
+    crawler_execution_mode: Literal["inline", "subprocess"] = "inline"
+    crawler_sandbox_memory_mb: int = 1024
+    crawler_sandbox_cpu_seconds: int = 900
+    crawler_sandbox_wall_seconds: int = 1800
+    credential_refresh_interval_minutes: int = 10
+    credential_refresh_lead_seconds: float = 1800.0
+    stats_reconcile_interval_minutes: int = 360
     sites_config_path: str = "configs/sites.yaml"
+    gazetteer_path: str = "configs/gazetteer.yaml"
+    count_exact_threshold: int = 10000
+    count_cache_ttl_seconds: float = 30.0
+    response_cache_backend: Literal["memory", "redis", "off"] = "memory"
+    response_cache_redis_url: str = "redis://localhost:6379/0"
+    response_cache_max_entries: int = 4096
+    response_cache_ttl_seconds: float = 300.0
+    response_cache_version_ttl_seconds: float = 1.0
+    raw_payload_compression: Literal["zlib", "none"] = "zlib"
+    search_index_enabled: bool = False
+    search_index_refresh_seconds: float = 30.0
+    search_index_refresh_overlap_seconds: float = 600.0
+    search_index_rebuild_interval_minutes: int = 360
+    search_snapshot_path: str = ""
+    search_rerank_window: int = 500
 
 
 @lru_cache
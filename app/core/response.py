@@ -1,5 +1,9 @@
+from decimal import Decimal
 from typing import Any
 
+import orjson
+from fastapi.responses import JSONResponse
+
 from app.middlewares.request_context import get_request_id
 
 
@@ -19,3 +23,25 @@ def error_response(code: int, message: str, data: Any = None) -> dict[str, Any]:
         "request_id": get_request_id(),
         "data": data,
     }
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class OrjsonResponse(JSONResponse):
+    """Renders plain dicts / lists / datetimes / enums with orjson in one pass."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def list_response(data: Any) -> OrjsonResponse:
+    """Success envelope for list endpoints.
+
+    Returning a Response skips FastAPI's jsonable_encoder walk over every item; list payloads are
+    already built from plain row tuples, so orjson can serialize them directly.
+    """
+    return OrjsonResponse(success_response(data))
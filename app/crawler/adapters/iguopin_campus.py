@@ -4,9 +4,8 @@ import logging
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-import httpx
-
 from app.crawler.campus_base import CampusEventAdapter
+from app.crawler.proxy_pool import build_http_client
 from app.crawler.types_event import NormalizedCampusEvent
 from app.utils.hash import sha1_hex
 from app.utils.time import now_utc
@@ -39,7 +38,7 @@ class IGuoPinCampusAdapter(CampusEventAdapter):
         }
         if self.proxy_url:
             client_kwargs["proxy"] = self.proxy_url
-        self.client = httpx.AsyncClient(**client_kwargs)
+        self.client = build_http_client(self.source_code, self.config, client_kwargs)
 
     async def crawl(self) -> list[NormalizedCampusEvent]:
         now = now_utc()
@@ -72,30 +71,30 @@ class IGuoPinCampusAdapter(CampusEventAdapter):
                     ends_at = self._parse_datetime(item.get("end_time"))
 
                     dedup = sha1_hex("|".join([self.source_code, event_id, title]))
-                    items.append(
-                        NormalizedCampusEvent(
-                            source_code=self.source_code,
-                            external_event_id=event_id,
-                            source_url=source_url,
-                            title=title[:255],
-                            company_name=str(company_name) if company_name else None,
-                            school_name=str(school_name) if school_name else None,
-                            province=None,
-                            city=str(city) if city else None,
-                            venue=str(venue) if venue else None,
-                            starts_at=starts_at,
-                            ends_at=ends_at,
-                            event_type=event_type,
-                            event_status="upcoming",
-                            description=str(item.get("desc") or "") or None,
-                            tags=["国聘", alias],
-                            registration_url=str(item.get("apply_url") or "") or None,
-                            raw_payload=item if isinstance(item, dict) else None,
-                            dedup_fingerprint=dedup,
-                            first_crawled_at=now,
-                            last_crawled_at=now,
-                        )
+                    event = NormalizedCampusEvent(
+                        source_code=self.source_code,
+                        external_event_id=event_id,
+                        source_url=source_url,
+                        title=title[:255],
+                        company_name=str(company_name) if company_name else None,
+                        school_name=str(school_name) if school_name else None,
+                        province=None,
+                        city=str(city) if city else None,
+                        venue=str(venue) if venue else None,
+                        starts_at=starts_at,
+                        ends_at=ends_at,
+                        event_type=event_type,
+                        event_status="upcoming",
+                        description=str(item.get("desc") or "") or None,
+                        tags=["国聘", alias],
+                        registration_url=str(item.get("apply_url") or "") or None,
+                        raw_payload=item if isinstance(item, dict) else None,
+                        dedup_fingerprint=dedup,
+                        first_crawled_at=now,
+                        last_crawled_at=now,
                     )
+                    items.append(event)
+                    self.emit(event)
 
         await self.client.aclose()
         return items
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import re
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-import httpx
-
 from app.crawler.base import SiteAdapter
+from app.crawler.policy import RequestPolicy, RiskSignalError
+from app.crawler.proxy_pool import build_http_client
+from app.crawler.timing import throttle_sleep
 from app.crawler.types import NormalizedJob, RawJob
 from app.utils.normalizers import normalize_job
 
@@ -58,6 +58,9 @@ class IGuoPinJobsAdapter(SiteAdapter):
             else None
         )
         self.last_crawl_meta: dict[str, object] = {}
+        self.request_policy = RequestPolicy.from_config(
+            self.source_code, self.config, max_attempts=self.retry_count, base_delay_seconds=1.5
+        )
 
         natures = self.config.get("job_natures")
         if isinstance(natures, list) and natures:
@@ -78,7 +81,7 @@ class IGuoPinJobsAdapter(SiteAdapter):
             client_kwargs["cookies"] = self.cookies
         if self.proxy_url:
             client_kwargs["proxy"] = self.proxy_url
-        self.client = httpx.AsyncClient(**client_kwargs)
+        self.client = build_http_client(self.source_code, self.config, client_kwargs)
 
     async def fetch_list(self) -> list[dict]:
         items, _ = await self._collect_list_items()
@@ -175,6 +178,7 @@ class IGuoPinJobsAdapter(SiteAdapter):
         normalized_jobs: list[NormalizedJob] = []
         seen_ids: set[str] = set()
         seen_fingerprints: set[str] = set()
+        self.item_failures = []
 
         try:
             items, nature_summaries = await self._collect_list_items()
@@ -184,20 +188,15 @@ class IGuoPinJobsAdapter(SiteAdapter):
                     continue
                 seen_ids.add(external_id)
 
-                detail = await self.fetch_detail(item)
-                try:
-                    raw = self.parse_raw_job(item, detail)
-                    normalized = self.normalize(raw)
-                    if normalized.dedup_fingerprint in seen_fingerprints:
-                        continue
-                    seen_fingerprints.add(normalized.dedup_fingerprint)
-                    normalized_jobs.append(normalized)
-                except Exception as exc:  # noqa: BLE001
-                    logger.warning("iguopin_jobs parse_failed id=%s error=%s", external_id, str(exc))
+                normalized = await self.build_item(item)
+                if normalized is None or normalized.dedup_fingerprint in seen_fingerprints:
                     continue
+                seen_fingerprints.add(normalized.dedup_fingerprint)
+                normalized_jobs.append(normalized)
+                self.emit(normalized)
 
                 if index % 20 == 0 and self.request_interval_seconds > 0:
-                    await asyncio.sleep(self.request_interval_seconds)
+                    await throttle_sleep(self.request_interval_seconds)
                 if len(normalized_jobs) >= self.max_items:
                     break
 
@@ -212,6 +211,7 @@ class IGuoPinJobsAdapter(SiteAdapter):
                 "proxy_enabled": int(bool(self.proxy_url)),
                 "fetched_items": len(items),
                 "normalized_items": len(normalized_jobs),
+                "failed_items": len(self.item_failures),
                 "by_nature": nature_summaries,
             }
             logger.info("iguopin_jobs crawl_summary %s", self.last_crawl_meta)
@@ -282,7 +282,7 @@ class IGuoPinJobsAdapter(SiteAdapter):
                 if total_hint > 0 and page * self.page_size >= total_hint:
                     break
                 if self.request_interval_seconds > 0:
-                    await asyncio.sleep(self.request_interval_seconds)
+                    await throttle_sleep(self.request_interval_seconds)
 
             summaries.append(
                 {
@@ -301,40 +301,36 @@ class IGuoPinJobsAdapter(SiteAdapter):
 
     async def _post_json_with_retry(self, path: str, payload: dict) -> dict:
         url = f"{self.base_url}{path}"
-        last_error: Exception | None = None
-        for attempt in range(1, self.retry_count + 1):
-            try:
-                response = await self.client.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                if not isinstance(data, dict):
-                    return {}
-                message = str(data.get("msg") or data.get("message") or "")
-                if self._is_rate_limited_message(message):
-                    raise RuntimeError(f"iguopin_jobs rate_limited: {message}")
-                return data
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt >= self.retry_count:
-                    break
-                await asyncio.sleep(min(1.5 * attempt, 6.0))
-        raise RuntimeError(f"iguopin_jobs request failed: {url}") from last_error
+
+        async def attempt() -> dict:
+            response = await self.client.post(url, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            if not isinstance(data, dict):
+                return {}
+            message = str(data.get("msg") or data.get("message") or "")
+            if self._is_rate_limited_message(message):
+                raise RiskSignalError(f"iguopin_jobs rate_limited: {message}")
+            return data
+
+        try:
+            return await self.request_policy.call(attempt)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"iguopin_jobs request failed: {url}, reason={exc}") from exc
 
     async def _get_json_with_retry(self, path: str, params: dict[str, str]) -> dict:
         url = f"{self.base_url}{path}"
-        last_error: Exception | None = None
-        for attempt in range(1, self.retry_count + 1):
-            try:
-                response = await self.client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                return data if isinstance(data, dict) else {}
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt >= self.retry_count:
-                    break
-                await asyncio.sleep(min(1.5 * attempt, 6.0))
-        raise RuntimeError(f"iguopin_jobs detail request failed: {url}") from last_error
+
+        async def attempt() -> dict:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            return data if isinstance(data, dict) else {}
+
+        try:
+            return await self.request_policy.call(attempt)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"iguopin_jobs detail request failed: {url}, reason={exc}") from exc
 
     @staticmethod
     def _clean_text(value: object) -> str | None:
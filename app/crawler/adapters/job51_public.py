@@ -12,9 +12,25 @@ import httpx
 
 from app.crawler.adapters.http_common import resolve_cookies
 from app.crawler.base import SiteAdapter
+from app.crawler.credentials import (
+    CredentialExpiredError,
+    ensure_cookie_credential,
+    fingerprint_name,
+    get_credential_store,
+)
+from app.crawler.policy import (
+    PermanentRequestError,
+    RequestPolicy,
+    RiskSignalError,
+    TransientResponseError,
+    check_risk_status,
+)
+from app.crawler.proxy_pool import build_http_client, hint_detector
+from app.crawler.timing import throttle_sleep
 from app.crawler.types import NormalizedJob, RawJob
 from app.utils.hash import sha1_hex
 from app.utils.normalizers import normalize_job
+from app.utils.time import now_utc
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +41,10 @@ EXPERIENCE_SINGLE_MONTH_RE = re.compile(r"(?P<month>\d+)\s*月")
 CHALLENGE_HINTS = ("滑动验证", "aliyunwaf", "acw_sc__v2", "security verification", "captcha")
 
 
+class SignatureRejectedError(PermanentRequestError):
+    """51job rejected a signed URL or type__1260 token; replaying the same request cannot succeed."""
+
+
 class Job51PublicAdapter(SiteAdapter):
     source_code = "job51_public"
     default_api_url = "https://we.51job.com/api/job/search-pc"
@@ -55,7 +75,13 @@ class Job51PublicAdapter(SiteAdapter):
         self.trust_env = bool(self.config.get("trust_env", False))
         self.proxy_url = str(self.config.get("proxy_url") or self.config.get("proxy") or "").strip() or None
         self.cookies = resolve_cookies(self.config, env_keys=("JOB51_COOKIE", "APP_JOB51_COOKIE"))
+        self.credentials = get_credential_store(self.source_code)
+        self.signed_url_ttl_seconds = float(self.config.get("signed_url_ttl_seconds") or 0) or None
+        self.type_token_ttl_seconds = float(self.config.get("type_token_ttl_seconds") or 0) or None
         self.last_crawl_meta: dict[str, object] = {}
+        self.request_policy = RequestPolicy.from_config(
+            self.source_code, self.config, max_attempts=self.retry_count, base_delay_seconds=1.5
+        )
 
         base_params = self.config.get("base_params")
         if isinstance(base_params, dict):
@@ -105,23 +131,41 @@ class Job51PublicAdapter(SiteAdapter):
             client_kwargs["cookies"] = self.cookies
         if self.proxy_url:
             client_kwargs["proxy"] = self.proxy_url
-        self.client = httpx.AsyncClient(**client_kwargs)
+        self.client = build_http_client(
+            self.source_code, self.config, client_kwargs, challenge_detector=hint_detector(CHALLENGE_HINTS)
+        )
 
     async def fetch_list(self) -> list[dict]:
+        ensure_cookie_credential(self.source_code, self.config, self.cookies)
         if self.browser_mode:
             return await self._fetch_list_from_browser()
         if self.signed_url_entries:
             return await self._fetch_list_from_signed_urls()
 
+        type_token = self.query_params.get("type__1260")
+        credential_name = fingerprint_name("type__1260", type_token) if type_token else None
+        if credential_name:
+            self._ensure_credential(credential_name, ttl_seconds=self.type_token_ttl_seconds, label="type__1260 token")
+
         items: list[dict] = []
         seen_ids: set[str] = set()
         by_keyword: list[dict[str, object]] = []
 
-        for keyword in self.keywords:
+        start_keyword_index = self.resume_int("keyword_index", 0)
+        for keyword_index, keyword in enumerate(self.keywords):
+            if keyword_index < start_keyword_index:
+                continue
+            first_page = self.start_page
+            if keyword_index == start_keyword_index:
+                first_page = self.resume_int("page", self.start_page)
             pages_fetched = 0
             seen_count = 0
-            for page in range(self.start_page, self.start_page + self.max_pages):
-                payload = await self._request_page_with_retry(keyword=keyword, page=page)
+            for page in range(first_page, self.start_page + self.max_pages):
+                if self.deadline_reached(keyword_index=keyword_index, page=page):
+                    break
+                payload = await self._request_page_with_retry(
+                    keyword=keyword, page=page, credential_name=credential_name
+                )
                 page_items = self._extract_items(payload)
                 if not page_items:
                     break
@@ -137,13 +181,15 @@ class Job51PublicAdapter(SiteAdapter):
 
                 logger.info("job51_public page_fetched keyword=%s page=%s items=%s", keyword, page, len(page_items))
                 if self.request_interval_seconds > 0:
-                    await asyncio.sleep(self.request_interval_seconds)
+                    await throttle_sleep(self.request_interval_seconds)
 
                 total = self._extract_total(payload)
                 if total > 0 and (page - self.start_page + 1) * self.page_size >= total:
                     break
 
             by_keyword.append({"keyword": keyword, "pages_fetched": pages_fetched, "unique_items_added": seen_count})
+            if self.resume_state is not None:
+                break
 
         self.last_crawl_meta = {
             "source_code": self.source_code,
@@ -155,6 +201,7 @@ class Job51PublicAdapter(SiteAdapter):
             "pagination_mode": self.pagination_mode,
             "fetched_items": len(items),
             "by_keyword": by_keyword,
+            "resume": self.resume_state,
         }
         if not items and self.fail_on_empty:
             raise RuntimeError("51job blocked/empty response, provide valid cookie and request template")
@@ -168,7 +215,10 @@ class Job51PublicAdapter(SiteAdapter):
 
         for entry in self.signed_url_entries:
             raw_url = entry["url"]
+            credential_name = fingerprint_name("signed_url", raw_url)
             try:
+                # Known-dead signed URLs fail here without spending a request on them.
+                self._ensure_credential(credential_name, ttl_seconds=self.signed_url_ttl_seconds, label="signed url")
                 payload = await self._request_json_with_retry(
                     url=raw_url,
                     params=None,
@@ -176,6 +226,7 @@ class Job51PublicAdapter(SiteAdapter):
                     json_payload=None,
                     method_override="GET",
                     headers_override=entry.get("headers"),
+                    credential_name=credential_name,
                 )
             except Exception as exc:  # noqa: BLE001
                 failed_urls.append(raw_url)
@@ -209,7 +260,7 @@ class Job51PublicAdapter(SiteAdapter):
                 }
             )
             if self.request_interval_seconds > 0:
-                await asyncio.sleep(self.request_interval_seconds)
+                await throttle_sleep(self.request_interval_seconds)
 
         self.last_crawl_meta = {
             "source_code": self.source_code,
@@ -430,7 +481,7 @@ class Job51PublicAdapter(SiteAdapter):
         finally:
             await self.client.aclose()
 
-    async def _request_page_with_retry(self, *, keyword: str, page: int) -> dict:
+    async def _request_page_with_retry(self, *, keyword: str, page: int, credential_name: str | None = None) -> dict:
         context = {
             "keyword": keyword,
             "page": page,
@@ -440,16 +491,29 @@ class Job51PublicAdapter(SiteAdapter):
 
         if self.request_method == "GET":
             params = self._build_query(context)
-            return await self._request_json_with_retry(url=self.api_url, params=params, data=None, json_payload=None)
+            return await self._request_json_with_retry(
+                url=self.api_url, params=params, data=None, json_payload=None, credential_name=credential_name
+            )
 
         params = self._build_query(context)
         if self.body_type == "json":
             payload = self._build_json_body(context)
-            return await self._request_json_with_retry(url=self.api_url, params=params, data=None, json_payload=payload)
+            return await self._request_json_with_retry(
+                url=self.api_url, params=params, data=None, json_payload=payload, credential_name=credential_name
+            )
 
         # default POST form
         form = self._build_form_body(context)
-        return await self._request_json_with_retry(url=self.api_url, params=params, data=form, json_payload=None)
+        return await self._request_json_with_retry(
+            url=self.api_url, params=params, data=form, json_payload=None, credential_name=credential_name
+        )
+
+    def _ensure_credential(self, name: str, *, ttl_seconds: float | None, label: str) -> None:
+        entry = self.credentials.track(name, {"label": label}, ttl_seconds=ttl_seconds)
+        if entry.is_valid(now_utc()):
+            return
+        reason = entry.invalid_reason or f"expired at {entry.expires_at.isoformat() if entry.expires_at else '?'}"
+        raise CredentialExpiredError(f"51job {label} is no longer valid ({reason}), capture a fresh one")
 
     def _build_query(self, context: dict[str, object]) -> dict[str, str | int]:
         if self.request_method == "GET" and not self.query_params:
@@ -519,8 +583,8 @@ class Job51PublicAdapter(SiteAdapter):
         json_payload: dict | None,
         method_override: str | None = None,
         headers_override: dict[str, str] | None = None,
+        credential_name: str | None = None,
     ) -> dict:
-        last_error: Exception | None = None
         method = (method_override or self.request_method).upper()
         request_headers: dict[str, str] | None = None
         if headers_override:
@@ -533,65 +597,74 @@ class Job51PublicAdapter(SiteAdapter):
                 if key.lower() in {"accept-encoding", "content-length", "host", "connection"}:
                     request_headers.pop(key, None)
 
-        for attempt in range(1, self.retry_count + 1):
-            try:
-                if method == "GET":
-                    response = await self.client.get(url, params=params, headers=request_headers)
-                elif method == "POST":
-                    response = await self.client.post(
-                        url,
-                        params=params,
-                        data=data,
-                        json=json_payload,
-                        headers=request_headers,
-                    )
-                else:
-                    raise RuntimeError(f"unsupported request_method: {method}")
-                raw_bytes = response.content
-                text = raw_bytes.decode("utf-8", errors="ignore")
-                lowered = text.lower()
-                if any(token in lowered for token in CHALLENGE_HINTS):
-                    raise RuntimeError("51job anti-bot challenge detected, login cookie required")
-
-                content_type = str(response.headers.get("content-type") or "").lower()
-                if "application/json" not in content_type:
-                    if response.status_code >= 400:
-                        snippet = raw_bytes[:120]
-                        raise RuntimeError(
-                            f"51job http_{response.status_code} non_json_body_prefix={snippet!r}"
-                        )
-                    raise RuntimeError("51job non-json response, likely anti-bot challenge")
-
-                payload: dict
-                try:
-                    payload = response.json()
-                except Exception:
-                    payload = {}
-                    for encoding in ("utf-8", "gbk"):
-                        try:
-                            parsed = json.loads(raw_bytes.decode(encoding, errors="ignore"))
-                        except Exception:  # noqa: BLE001
-                            continue
-                        if isinstance(parsed, dict):
-                            payload = parsed
-                            break
-                if not isinstance(payload, dict):
-                    return {}
-                status = str(payload.get("status") or payload.get("code") or "").strip()
-                message = self._clean_text(payload.get("message")) or self._clean_text(payload.get("msg")) or ""
-                if status in {"110011"} or "鉴权失败" in message or "签名错误" in message:
-                    raise RuntimeError("51job cupid signature invalid, refresh latest signed request")
-                if status == "10002" or "签名不正确" in message:
-                    raise RuntimeError("51job vapi signature invalid, refresh latest type__1260 token")
+        async def attempt() -> dict:
+            if method == "GET":
+                response = await self.client.get(url, params=params, headers=request_headers)
+            elif method == "POST":
+                response = await self.client.post(
+                    url,
+                    params=params,
+                    data=data,
+                    json=json_payload,
+                    headers=request_headers,
+                )
+            else:
+                raise RuntimeError(f"unsupported request_method: {method}")
+            raw_bytes = response.content
+            text = raw_bytes.decode("utf-8", errors="ignore")
+            lowered = text.lower()
+            if any(token in lowered for token in CHALLENGE_HINTS):
+                raise RiskSignalError("51job anti-bot challenge detected, login cookie required")
+            check_risk_status(response, label="51job")
+
+            content_type = str(response.headers.get("content-type") or "").lower()
+            if "application/json" not in content_type:
                 if response.status_code >= 400:
-                    raise RuntimeError(f"51job http_{response.status_code}: {message or status or 'unknown'}")
-                return payload
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt >= self.retry_count:
-                    break
-                await asyncio.sleep(min(1.5 * attempt, 5.0))
-        raise RuntimeError(f"51job request failed: {url}, reason={last_error}") from last_error
+                    snippet = raw_bytes[:120]
+                    raise httpx.HTTPStatusError(
+                        f"51job http_{response.status_code} non_json_body_prefix={snippet!r}",
+                        request=response.request,
+                        response=response,
+                    )
+                raise TransientResponseError("51job non-json response, likely anti-bot challenge")
+
+            payload: dict
+            try:
+                payload = response.json()
+            except Exception:
+                payload = {}
+                for encoding in ("utf-8", "gbk"):
+                    try:
+                        parsed = json.loads(raw_bytes.decode(encoding, errors="ignore"))
+                    except Exception:  # noqa: BLE001
+                        continue
+                    if isinstance(parsed, dict):
+                        payload = parsed
+                        break
+            if not isinstance(payload, dict):
+                return {}
+            status = str(payload.get("status") or payload.get("code") or "").strip()
+            message = self._clean_text(payload.get("message")) or self._clean_text(payload.get("msg")) or ""
+            if status in {"110011"} or "鉴权失败" in message or "签名错误" in message:
+                raise SignatureRejectedError("51job cupid signature invalid, refresh latest signed request")
+            if status == "10002" or "签名不正确" in message:
+                raise SignatureRejectedError("51job vapi signature invalid, refresh latest type__1260 token")
+            if response.status_code >= 400:
+                raise httpx.HTTPStatusError(
+                    f"51job http_{response.status_code}: {message or status or 'unknown'}",
+                    request=response.request,
+                    response=response,
+                )
+            return payload
+
+        try:
+            return await self.request_policy.call(attempt)
+        except SignatureRejectedError as exc:
+            if credential_name:
+                self.credentials.invalidate(credential_name, str(exc))
+            raise RuntimeError(f"51job request failed: {url}, reason={exc}") from exc
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"51job request failed: {url}, reason={exc}") from exc
 
     @staticmethod
     def _load_signed_url_entries(value: object) -> list[dict[str, object]]:
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-import asyncio
 import html
 import logging
 import re
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-import httpx
-
 from app.crawler.adapters.http_common import resolve_cookies
 from app.crawler.base import SiteAdapter
+from app.crawler.credentials import ensure_cookie_credential
+from app.crawler.policy import RequestPolicy, RiskSignalError
+from app.crawler.proxy_pool import build_http_client, hint_detector
+from app.crawler.timing import throttle_sleep
 from app.crawler.types import NormalizedJob, RawJob
 from app.utils.hash import sha1_hex
 from app.utils.normalizers import normalize_job
@@ -67,6 +68,9 @@ class Job58PublicAdapter(SiteAdapter):
         self.list_urls = self._load_list_urls(self.config.get("list_urls"))
         self.cookies = resolve_cookies(self.config, env_keys=("JOB58_COOKIE", "APP_JOB58_COOKIE"))
         self.last_crawl_meta: dict[str, object] = {}
+        self.request_policy = RequestPolicy.from_config(
+            self.source_code, self.config, max_attempts=self.retry_count, base_delay_seconds=1.5
+        )
 
         headers = {
             "User-Agent": (
@@ -91,9 +95,12 @@ class Job58PublicAdapter(SiteAdapter):
             client_kwargs["cookies"] = self.cookies
         if self.proxy_url:
             client_kwargs["proxy"] = self.proxy_url
-        self.client = httpx.AsyncClient(**client_kwargs)
+        self.client = build_http_client(
+            self.source_code, self.config, client_kwargs, challenge_detector=hint_detector(CAPTCHA_HINTS)
+        )
 
     async def fetch_list(self) -> list[dict]:
+        ensure_cookie_credential(self.source_code, self.config, self.cookies)
         items: list[dict] = []
         seen_urls: set[str] = set()
         per_category_meta: list[dict[str, object]] = []
@@ -102,10 +109,6 @@ class Job58PublicAdapter(SiteAdapter):
             targets = self._build_target_list_urls()
             for category, page, url in targets:
                 page_html = await self._get_text_with_retry(url)
-                if self._is_captcha_page(page_html):
-                    raise RuntimeError(
-                        "58 blocked/captcha page returned, provide JOB58 cookie or proxy"
-                    )
 
                 page_items = self._parse_list_items(page_html, category=category)
                 if not page_items:
@@ -144,7 +147,7 @@ class Job58PublicAdapter(SiteAdapter):
                 if len(items) >= self.max_items:
                     break
                 if self.request_interval_seconds > 0:
-                    await asyncio.sleep(self.request_interval_seconds)
+                    await throttle_sleep(self.request_interval_seconds)
 
             self.last_crawl_meta = {
                 "source_code": self.source_code,
@@ -168,10 +171,8 @@ class Job58PublicAdapter(SiteAdapter):
         if not source_url:
             return list_item
         html_text = await self._get_text_with_retry(source_url)
-        if self._is_captcha_page(html_text):
-            raise RuntimeError("58 detail blocked/captcha page returned")
         if self.detail_request_interval_seconds > 0:
-            await asyncio.sleep(self.detail_request_interval_seconds)
+            await throttle_sleep(self.detail_request_interval_seconds)
         return {
             "source_url": source_url,
             "html": html_text,
@@ -259,18 +260,17 @@ class Job58PublicAdapter(SiteAdapter):
         return targets
 
     async def _get_text_with_retry(self, url: str) -> str:
-        last_error: Exception | None = None
-        for attempt in range(1, self.retry_count + 1):
-            try:
-                response = await self.client.get(url)
-                response.raise_for_status()
-                return response.text
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt >= self.retry_count:
-                    break
-                await asyncio.sleep(min(1.5 * attempt, 5.0))
-        raise RuntimeError(f"58 request failed: {url}, reason={last_error}") from last_error
+        async def attempt() -> str:
+            response = await self.client.get(url)
+            response.raise_for_status()
+            if self._is_captcha_page(response.text):
+                raise RiskSignalError("58 blocked/captcha page returned, provide JOB58 cookie or configure proxy_pool")
+            return response.text
+
+        try:
+            return await self.request_policy.call(attempt)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"58 request failed: {url}, reason={exc}") from exc
 
     @staticmethod
     def _is_captcha_page(text: str) -> bool:
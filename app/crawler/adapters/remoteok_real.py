@@ -6,6 +6,8 @@ from datetime import datetime
 
 from app.crawler.base import SiteAdapter
 from app.crawler.client import CrawlerClient
+from app.crawler.policy import RequestPolicy
+from app.crawler.proxy_pool import get_proxy_pool
 from app.crawler.types import NormalizedJob, RawJob
 from app.utils.normalizers import normalize_job
 
@@ -37,6 +39,10 @@ class RemoteOKRealAdapter(SiteAdapter):
             deny_paths=deny_paths,
             proxy=proxy_url,
             trust_env=trust_env,
+            policy=RequestPolicy.from_config(
+                self.source_code, self.config, max_attempts=retry_count, base_delay_seconds=1.0
+            ),
+            proxy_pool=get_proxy_pool(self.source_code, self.config),
             headers=headers
             or {
                 "User-Agent": "JobAggregatorBot/0.1 (+https://example.com)",
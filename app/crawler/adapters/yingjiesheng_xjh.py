@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import hmac
 import html
@@ -11,9 +10,11 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
 
-import httpx
-
 from app.crawler.campus_base import CampusEventAdapter
+from app.crawler.credentials import get_credential_store
+from app.crawler.policy import PermanentRequestError, RequestPolicy
+from app.crawler.proxy_pool import build_http_client
+from app.crawler.timing import throttle_sleep, timed
 from app.crawler.types_event import NormalizedCampusEvent
 from app.utils.hash import sha1_hex
 from app.utils.time import now_utc
@@ -39,6 +40,14 @@ LEGACY_COMPANY_RE = re.compile(
 )
 LEGACY_SCHOOL_RE = re.compile(r"/xuanjianghui_school_\d+\.html\"[^>]*>(?P<school>.*?)</a>", re.IGNORECASE | re.DOTALL)
 LEGACY_VENUE_RE = re.compile(r'<td width="290"><span class="i">(?P<venue>.*?)</span>', re.IGNORECASE | re.DOTALL)
+SIGN_KEY_CREDENTIAL = "young_sign_key"
+# Whole api messages that mean the signature was rejected; a substring test would also catch
+# unrelated errors ("design", "assign") and throw away a good key.
+SIGN_ERROR_MESSAGES = frozenset({"签名错误", "签名不正确"})
+
+
+class SignKeyRejectedError(PermanentRequestError):
+    """The api rejected our signature; the cached young_sign_key has rotated."""
 
 
 class YingJieShengXjhAdapter(CampusEventAdapter):
@@ -60,6 +69,8 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
         self.request_interval_seconds = max(0.0, float(self.config.get("request_interval_seconds") or 0.1))
         self.kx_types = self._load_kx_types(self.config.get("kx_types"))
         self.static_sign_key = str(self.config.get("young_sign_key") or "")
+        self.sign_key_ttl_seconds = max(60.0, float(self.config.get("sign_key_ttl_seconds") or 12 * 3600))
+        self.credentials = get_credential_store(self.source_code)
         self.user_agent = str(self.config.get("user_agent") or "Mozilla/5.0")
         self.include_legacy_html = bool(self.config.get("include_legacy_html", True))
         self.legacy_list_url_template = str(self.config.get("legacy_list_url_template") or LEGACY_LIST_URL_TEMPLATE)
@@ -70,6 +81,9 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
         self.trust_env = bool(self.config.get("trust_env", False))
         self.proxy_url = str(self.config.get("proxy_url") or self.config.get("proxy") or "").strip() or None
         self.last_crawl_meta: dict[str, object] = {}
+        self.request_policy = RequestPolicy.from_config(
+            self.source_code, self.config, max_attempts=self.retry_count, base_delay_seconds=2.0
+        )
 
         client_kwargs: dict[str, object] = {
             "timeout": self.timeout_seconds,
@@ -82,7 +96,7 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
         }
         if self.proxy_url:
             client_kwargs["proxy"] = self.proxy_url
-        self.client = httpx.AsyncClient(**client_kwargs)
+        self.client = build_http_client(self.source_code, self.config, client_kwargs)
         self._sign_key: str | None = self.static_sign_key or None
 
     async def crawl(self) -> list[NormalizedCampusEvent]:
@@ -93,15 +107,22 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
             seen_ids: set[str] = set()
             kx_summaries: list[dict[str, int]] = []
             legacy_summary: dict[str, object] | None = None
+            # A previous partial run leaves {"phase", "kx_index", "page" | "legacy_page"} to continue from.
+            resume_phase = str(self.resume_from.get("phase") or "api")
+            start_kx_index = self.resume_int("kx_index", 0) if resume_phase == "api" else len(self.kx_types)
 
-            for kx_type in self.kx_types:
-                page = 1
+            for kx_index, kx_type in enumerate(self.kx_types):
+                if kx_index < start_kx_index:
+                    continue
+                page = self.resume_int("page", 1) if kx_index == start_kx_index else 1
                 pages_fetched = 0
                 total_count_hint = 0
                 list_items_count = 0
                 unique_events_added = 0
 
                 while page <= self.max_pages:
+                    if self.deadline_reached(phase="api", kx_index=kx_index, page=page):
+                        break
                     list_payload = {
                         "pageSize": self.page_size,
                         "pageNum": page,
@@ -144,6 +165,8 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
 
                         detail: dict = item
                         if self.fetch_detail:
+                            if self.deadline_reached(phase="api", kx_index=kx_index, page=page):
+                                break
                             detail_resp = await self._signed_json_request(
                                 method="GET",
                                 path=f"open/noauth/yjs/xjh/{event_id}",
@@ -152,20 +175,24 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
                             if isinstance(detail_body, dict):
                                 detail = detail_body
 
-                        event = self._build_event(
-                            now=now,
-                            list_item=item,
-                            detail=detail,
-                            kx_type=kx_type,
-                        )
+                        with timed("normalize"):
+                            event = self._build_event(
+                                now=now,
+                                list_item=item,
+                                detail=detail,
+                                kx_type=kx_type,
+                            )
                         if event is None:
                             continue
                         if event.external_event_id in seen_ids:
                             continue
                         seen_ids.add(event.external_event_id)
                         events.append(event)
+                        self.emit(event)
                         unique_events_added += 1
 
+                    if self.resume_state is not None:
+                        break
                     if total_count > 0 and page * self.page_size >= total_count:
                         break
                     page += 1
@@ -179,10 +206,15 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
                         "unique_events_added": unique_events_added,
                     }
                 )
+                if self.resume_state is not None:
+                    break
 
-            if self.include_legacy_html:
+            if self.include_legacy_html and self.resume_state is None:
+                legacy_start_page = self.resume_int("legacy_page", 1) if resume_phase == "legacy" else 1
                 try:
-                    legacy_summary = await self._crawl_legacy_html(now=now, seen_ids=seen_ids, events=events)
+                    legacy_summary = await self._crawl_legacy_html(
+                        now=now, seen_ids=seen_ids, events=events, start_page=legacy_start_page
+                    )
                 except Exception as exc:  # noqa: BLE001
                     logger.warning("yingjiesheng_xjh legacy_html_failed error=%s", str(exc))
                     legacy_summary = {
@@ -201,6 +233,8 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
                 "kx_types": self.kx_types,
                 "total_unique_events": len(events),
                 "by_kx_type": kx_summaries,
+                "resumed_from": self.resume_from or None,
+                "resume": self.resume_state,
             }
             if legacy_summary is not None:
                 self.last_crawl_meta["legacy_html"] = legacy_summary
@@ -215,16 +249,20 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
         now: datetime,
         seen_ids: set[str],
         events: list[NormalizedCampusEvent],
+        start_page: int = 1,
     ) -> dict[str, int]:
         pages_fetched = 0
         rows_seen = 0
         unique_events_added = 0
         previous_signature: tuple[str, ...] | None = None
 
-        for page in range(1, self.legacy_max_pages + 1):
+        for page in range(start_page, self.legacy_max_pages + 1):
+            if self.deadline_reached(phase="legacy", legacy_page=page):
+                break
             page_url = self.legacy_list_url_template.format(page=page)
             page_text = await self._fetch_legacy_page_with_retry(page_url)
-            rows = self._parse_legacy_rows(page_text)
+            with timed("parse"):
+                rows = self._parse_legacy_rows(page_text)
             if not rows:
                 logger.info("yingjiesheng_xjh legacy_page_empty page=%s", page)
                 break
@@ -239,17 +277,19 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
             rows_seen += len(rows)
             logger.info("yingjiesheng_xjh legacy_page_fetched page=%s rows=%s", page, len(rows))
             for row in rows:
-                event = self._build_event_from_legacy_row(now=now, row=row)
+                with timed("normalize"):
+                    event = self._build_event_from_legacy_row(now=now, row=row)
                 if event is None:
                     continue
                 if event.external_event_id in seen_ids:
                     continue
                 seen_ids.add(event.external_event_id)
                 events.append(event)
+                self.emit(event)
                 unique_events_added += 1
 
             if self.legacy_request_interval_seconds > 0:
-                await asyncio.sleep(self.legacy_request_interval_seconds)
+                await throttle_sleep(self.legacy_request_interval_seconds)
 
         return {
             "enabled": 1,
@@ -259,19 +299,16 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
         }
 
     async def _fetch_legacy_page_with_retry(self, url: str) -> str:
-        last_error: Exception | None = None
-        for attempt in range(1, self.retry_count + 1):
-            try:
-                response = await self.client.get(url, follow_redirects=True)
-                response.raise_for_status()
-                response.encoding = "gbk"
-                return response.text
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt >= self.retry_count:
-                    break
-                await asyncio.sleep(min(2.0 * attempt, 6.0))
-        raise RuntimeError(f"legacy page request failed after retries: {url}") from last_error
+        async def attempt() -> str:
+            response = await self.client.get(url, follow_redirects=True)
+            response.raise_for_status()
+            response.encoding = "gbk"
+            return response.text
+
+        try:
+            return await self.request_policy.call(attempt)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"legacy page request failed after retries: {url}") from exc
 
     def _parse_legacy_rows(self, page_text: str) -> list[dict[str, str]]:
         rows: list[dict[str, str]] = []
@@ -377,9 +414,22 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
             last_crawled_at=now,
         )
 
-    async def _ensure_sign_key(self) -> None:
-        if self._sign_key:
+    async def refresh_credentials(self) -> None:
+        """Re-scrape the sign key ahead of its TTL; called by the background credential refresh job."""
+        try:
+            await self._ensure_sign_key(force=True)
+        finally:
+            await self.client.aclose()
+
+    async def _ensure_sign_key(self, *, force: bool = False) -> None:
+        if self._sign_key and not force:
             return
+        if not force:
+            cached = self.credentials.get(SIGN_KEY_CREDENTIAL)
+            if isinstance(cached, dict) and cached.get("key"):
+                self._sign_key = str(cached["key"])
+                self.from_domain = str(cached.get("from_domain") or self.from_domain)
+                return
 
         page_text = await self._fetch_text_with_retry(self.landing_url)
         key_match = SIGN_KEY_RE.search(page_text)
@@ -390,20 +440,22 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
         domain_match = FROM_DOMAIN_RE.search(page_text)
         if domain_match is not None and domain_match.group("domain"):
             self.from_domain = domain_match.group("domain")
+        self.credentials.put(
+            SIGN_KEY_CREDENTIAL,
+            {"key": self._sign_key, "from_domain": self.from_domain},
+            ttl_seconds=self.sign_key_ttl_seconds,
+        )
 
     async def _fetch_text_with_retry(self, url: str) -> str:
-        last_error: Exception | None = None
-        for attempt in range(1, self.retry_count + 1):
-            try:
-                response = await self.client.get(url, follow_redirects=True)
-                response.raise_for_status()
-                return response.text
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt >= self.retry_count:
-                    break
-                await asyncio.sleep(min(2.0 * attempt, 6.0))
-        raise RuntimeError(f"request failed after retries: {url}") from last_error
+        async def attempt() -> str:
+            response = await self.client.get(url, follow_redirects=True)
+            response.raise_for_status()
+            return response.text
+
+        try:
+            return await self.request_policy.call(attempt)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"request failed after retries: {url}") from exc
 
     async def _signed_json_request(
         self,
@@ -412,10 +464,25 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
         path: str,
         json_payload: dict | None = None,
     ) -> dict:
+        method_upper = method.upper()
+        try:
+            try:
+                payload = await self._send_signed(method_upper, path, json_payload)
+            except SignKeyRejectedError as exc:
+                # The key rotated server-side: drop the cached one, re-scrape it and replay once.
+                self.credentials.invalidate(SIGN_KEY_CREDENTIAL, str(exc))
+                await self._ensure_sign_key(force=True)
+                payload = await self._send_signed(method_upper, path, json_payload)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"api request failed: {method_upper} {path}") from exc
+        if self.request_interval_seconds > 0:
+            await throttle_sleep(self.request_interval_seconds)
+        return payload
+
+    async def _send_signed(self, method_upper: str, path: str, json_payload: dict | None) -> dict:
         if not self._sign_key:
             raise RuntimeError("missing sign key")
 
-        method_upper = method.upper()
         timestamp = int(datetime.now(tz=timezone.utc).timestamp())
         query_items: list[tuple[str, str]] = [
             ("version", self.api_version),
@@ -449,32 +516,26 @@ class YingJieShengXjhAdapter(CampusEventAdapter):
         }
         request_url = f"{self.api_base_url}/{relative_url}"
 
-        last_error: Exception | None = None
-        for attempt in range(1, self.retry_count + 1):
-            try:
-                if method_upper == "GET":
-                    response = await self.client.get(request_url, headers=headers)
-                else:
-                    response = await self.client.post(
-                        request_url,
-                        content=body_text.encode("utf-8"),
-                        headers=headers,
-                    )
-                response.raise_for_status()
-                payload = response.json()
-                status = str(payload.get("status", ""))
-                if status != "1":
-                    raise RuntimeError(f"yingjiesheng api status={status}, message={payload.get('message')}")
-
-                if self.request_interval_seconds > 0:
-                    await asyncio.sleep(self.request_interval_seconds)
-                return payload
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt >= self.retry_count:
-                    break
-                await asyncio.sleep(min(2.0 * attempt, 6.0))
-        raise RuntimeError(f"api request failed: {method_upper} {path}") from last_error
+        async def attempt() -> dict:
+            if method_upper == "GET":
+                response = await self.client.get(request_url, headers=headers)
+            else:
+                response = await self.client.post(
+                    request_url,
+                    content=body_text.encode("utf-8"),
+                    headers=headers,
+                )
+            response.raise_for_status()
+            payload = response.json()
+            status = str(payload.get("status", ""))
+            if status != "1":
+                message = str(payload.get("message") or "")
+                if message.strip() in SIGN_ERROR_MESSAGES:
+                    raise SignKeyRejectedError(f"yingjiesheng api status={status}, message={message}")
+                raise RuntimeError(f"yingjiesheng api status={status}, message={message}")
+            return payload
+
+        return await self.request_policy.call(attempt)
 
     def _build_event(
         self,
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import re
 from datetime import datetime
@@ -10,6 +9,10 @@ import httpx
 
 from app.crawler.adapters.http_common import resolve_cookies
 from app.crawler.base import SiteAdapter
+from app.crawler.credentials import ensure_cookie_credential
+from app.crawler.policy import RequestPolicy, RiskSignalError
+from app.crawler.proxy_pool import build_http_client, hint_detector
+from app.crawler.timing import throttle_sleep
 from app.crawler.types import NormalizedJob, RawJob
 from app.utils.normalizers import normalize_job
 
@@ -20,6 +23,13 @@ EXPERIENCE_SINGLE_YEAR_RE = re.compile(r"(?P<year>\d+)\s*年")
 EXPERIENCE_RANGE_MONTH_RE = re.compile(r"(?P<low>\d+)\s*-\s*(?P<high>\d+)\s*月")
 EXPERIENCE_SINGLE_MONTH_RE = re.compile(r"(?P<month>\d+)\s*月")
 SECURITY_HINTS = ("security verification", "captcha", "验证", "滑动")
+_security_page = hint_detector(SECURITY_HINTS)
+
+
+def _is_challenge_response(response: httpx.Response) -> bool:
+    # Only non-JSON bodies are verification pages; job JSON may legitimately contain "验证".
+    content_type = (response.headers.get("content-type") or "").lower()
+    return "json" not in content_type and _security_page(response)
 
 
 class ZhaopinPublicAdapter(SiteAdapter):
@@ -48,6 +58,9 @@ class ZhaopinPublicAdapter(SiteAdapter):
         self.proxy_url = str(self.config.get("proxy_url") or self.config.get("proxy") or "").strip() or None
         self.cookies = resolve_cookies(self.config, env_keys=("ZHAOPIN_COOKIE", "APP_ZHAOPIN_COOKIE"))
         self.last_crawl_meta: dict[str, object] = {}
+        self.request_policy = RequestPolicy.from_config(
+            self.source_code, self.config, max_attempts=self.retry_count, base_delay_seconds=1.5
+        )
 
         base_params = self.config.get("base_params")
         if isinstance(base_params, dict):
@@ -75,17 +88,26 @@ class ZhaopinPublicAdapter(SiteAdapter):
             client_kwargs["cookies"] = self.cookies
         if self.proxy_url:
             client_kwargs["proxy"] = self.proxy_url
-        self.client = httpx.AsyncClient(**client_kwargs)
+        self.client = build_http_client(
+            self.source_code, self.config, client_kwargs, challenge_detector=_is_challenge_response
+        )
 
     async def fetch_list(self) -> list[dict]:
+        ensure_cookie_credential(self.source_code, self.config, self.cookies)
         items: list[dict] = []
         seen_ids: set[str] = set()
         by_keyword: list[dict[str, object]] = []
 
-        for keyword in self.keywords:
+        start_keyword_index = self.resume_int("keyword_index", 0)
+        for keyword_index, keyword in enumerate(self.keywords):
+            if keyword_index < start_keyword_index:
+                continue
+            first_page = self.resume_int("page", 1) if keyword_index == start_keyword_index else 1
             pages_fetched = 0
             seen_count = 0
-            for page in range(1, self.max_pages + 1):
+            for page in range(first_page, self.max_pages + 1):
+                if self.deadline_reached(keyword_index=keyword_index, page=page):
+                    break
                 params: dict[str, str | int] = dict(self.base_params)
                 params["kw"] = keyword
                 params["start"] = (page - 1) * self.page_size
@@ -116,13 +138,15 @@ class ZhaopinPublicAdapter(SiteAdapter):
 
                 logger.info("zhaopin_public page_fetched keyword=%s page=%s items=%s", keyword, page, len(page_items))
                 if self.request_interval_seconds > 0:
-                    await asyncio.sleep(self.request_interval_seconds)
+                    await throttle_sleep(self.request_interval_seconds)
 
                 total = self._to_int(data.get("numFound")) or self._to_int(data.get("numTotal"))
                 if total > 0 and page * self.page_size >= total:
                     break
 
             by_keyword.append({"keyword": keyword, "pages_fetched": pages_fetched, "unique_items_added": seen_count})
+            if self.resume_state is not None:
+                break
 
         self.last_crawl_meta = {
             "source_code": self.source_code,
@@ -131,6 +155,7 @@ class ZhaopinPublicAdapter(SiteAdapter):
             "max_pages": self.max_pages,
             "fetched_items": len(items),
             "by_keyword": by_keyword,
+            "resume": self.resume_state,
         }
         if not items and self.fail_on_empty:
             raise RuntimeError("zhaopin blocked/empty response, please login and provide Zhaopin cookie")
@@ -223,27 +248,24 @@ class ZhaopinPublicAdapter(SiteAdapter):
             await self.client.aclose()
 
     async def _get_json_with_retry(self, url: str, params: dict[str, str | int]) -> dict:
-        last_error: Exception | None = None
-        for attempt in range(1, self.retry_count + 1):
-            try:
-                response = await self.client.get(url, params=params)
-                response.raise_for_status()
-                content_type = (response.headers.get("content-type") or "").lower()
-                text = response.text
-                if "json" not in content_type:
-                    lowered = text.lower()
-                    if any(token in lowered for token in SECURITY_HINTS):
-                        raise RuntimeError("zhaopin blocked by verification page, login cookie required")
-                payload = response.json()
-                if not isinstance(payload, dict):
-                    return {}
-                return payload
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt >= self.retry_count:
-                    break
-                await asyncio.sleep(min(1.5 * attempt, 5.0))
-        raise RuntimeError(f"zhaopin request failed: {url}, reason={last_error}") from last_error
+        async def attempt() -> dict:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            content_type = (response.headers.get("content-type") or "").lower()
+            text = response.text
+            if "json" not in content_type:
+                lowered = text.lower()
+                if any(token in lowered for token in SECURITY_HINTS):
+                    raise RiskSignalError("zhaopin blocked by verification page, login cookie required")
+            payload = response.json()
+            if not isinstance(payload, dict):
+                return {}
+            return payload
+
+        try:
+            return await self.request_policy.call(attempt)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"zhaopin request failed: {url}, reason={exc}") from exc
 
     @staticmethod
     def _extract_external_id(item: dict) -> str:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import datetime
 
@@ -8,11 +7,30 @@ import httpx
 
 from app.crawler.adapters.http_common import resolve_cookies
 from app.crawler.base import SiteAdapter
+from app.crawler.credentials import ensure_cookie_credential
+from app.crawler.policy import RequestPolicy, RiskSignalError
+from app.crawler.proxy_pool import build_http_client
+from app.crawler.timing import throttle_sleep
 from app.crawler.types import NormalizedJob, RawJob
 from app.utils.normalizers import normalize_job
 
 logger = logging.getLogger(__name__)
 
+CAPTCHA_CODE = 37
+
+
+def _is_blocked_payload(payload: dict) -> bool:
+    message = str(payload.get("message") or "")
+    return int(payload.get("code") or 0) == CAPTCHA_CODE or "异常" in message or "captcha" in message.lower()
+
+
+def _is_challenge_response(response: httpx.Response) -> bool:
+    try:
+        payload = response.json()
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and _is_blocked_payload(payload)
+
 
 class ZhiPinPublicAdapter(SiteAdapter):
     source_code = "zhipin_public"
@@ -33,6 +51,9 @@ class ZhiPinPublicAdapter(SiteAdapter):
         self.proxy_url = str(self.config.get("proxy_url") or self.config.get("proxy") or "").strip() or None
         self.cookies = resolve_cookies(self.config, env_keys=("BOSS_COOKIE", "APP_BOSS_COOKIE"))
         self.last_crawl_meta: dict[str, object] = {}
+        self.request_policy = RequestPolicy.from_config(
+            self.source_code, self.config, max_attempts=self.retry_count, base_delay_seconds=1.5
+        )
 
         headers = {
             "User-Agent": "Mozilla/5.0",
@@ -50,17 +71,26 @@ class ZhiPinPublicAdapter(SiteAdapter):
             client_kwargs["cookies"] = self.cookies
         if self.proxy_url:
             client_kwargs["proxy"] = self.proxy_url
-        self.client = httpx.AsyncClient(**client_kwargs)
+        self.client = build_http_client(
+            self.source_code, self.config, client_kwargs, challenge_detector=_is_challenge_response
+        )
 
     async def fetch_list(self) -> list[dict]:
+        ensure_cookie_credential(self.source_code, self.config, self.cookies)
         items: list[dict] = []
         seen_ids: set[str] = set()
         by_keyword: list[dict[str, object]] = []
 
-        for keyword in self.keywords:
+        start_keyword_index = self.resume_int("keyword_index", 0)
+        for keyword_index, keyword in enumerate(self.keywords):
+            if keyword_index < start_keyword_index:
+                continue
+            first_page = self.resume_int("page", 1) if keyword_index == start_keyword_index else 1
             pages_fetched = 0
             seen_count = 0
-            for page in range(1, self.max_pages + 1):
+            for page in range(first_page, self.max_pages + 1):
+                if self.deadline_reached(keyword_index=keyword_index, page=page):
+                    break
                 payload = await self._get_json_with_retry(
                     self.api_url,
                     params={
@@ -70,14 +100,6 @@ class ZhiPinPublicAdapter(SiteAdapter):
                         "pageSize": self.page_size,
                     },
                 )
-                code = payload.get("code")
-                message = str(payload.get("message") or "")
-                if int(code or 0) == 37 or "异常" in message or "captcha" in message.lower():
-                    raise RuntimeError(
-                        "zhipin blocked/captcha, please login in browser and provide BOSS cookie "
-                        f"(code={code}, message={message})"
-                    )
-
                 zp_data = payload.get("zpData")
                 if not isinstance(zp_data, dict):
                     break
@@ -98,9 +120,11 @@ class ZhiPinPublicAdapter(SiteAdapter):
 
                 logger.info("zhipin_public page_fetched keyword=%s page=%s items=%s", keyword, page, len(page_items))
                 if self.request_interval_seconds > 0:
-                    await asyncio.sleep(self.request_interval_seconds)
+                    await throttle_sleep(self.request_interval_seconds)
 
             by_keyword.append({"keyword": keyword, "pages_fetched": pages_fetched, "unique_items_added": seen_count})
+            if self.resume_state is not None:
+                break
 
         self.last_crawl_meta = {
             "source_code": self.source_code,
@@ -110,6 +134,7 @@ class ZhiPinPublicAdapter(SiteAdapter):
             "max_pages": self.max_pages,
             "fetched_items": len(items),
             "by_keyword": by_keyword,
+            "resume": self.resume_state,
         }
         if not items and self.fail_on_empty:
             raise RuntimeError("zhipin blocked/empty response, please login and provide BOSS cookie")
@@ -170,21 +195,24 @@ class ZhiPinPublicAdapter(SiteAdapter):
             await self.client.aclose()
 
     async def _get_json_with_retry(self, url: str, params: dict) -> dict:
-        last_error: Exception | None = None
-        for attempt in range(1, self.retry_count + 1):
-            try:
-                response = await self.client.get(url, params=params)
-                response.raise_for_status()
-                payload = response.json()
-                if not isinstance(payload, dict):
-                    return {}
-                return payload
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt >= self.retry_count:
-                    break
-                await asyncio.sleep(min(1.5 * attempt, 5.0))
-        raise RuntimeError(f"zhipin request failed: {url}") from last_error
+        async def attempt() -> dict:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            payload = response.json()
+            if not isinstance(payload, dict):
+                return {}
+            if _is_blocked_payload(payload):
+                # Raised inside the policy so a session pool can rotate to another cookie set.
+                raise RiskSignalError(
+                    "zhipin blocked/captcha, please login in browser and provide BOSS cookie "
+                    f"(code={payload.get('code')}, message={payload.get('message')})"
+                )
+            return payload
+
+        try:
+            return await self.request_policy.call(attempt)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"zhipin request failed: {url}, reason={exc}") from exc
 
     @staticmethod
     def _parse_datetime(value: object) -> datetime | None:
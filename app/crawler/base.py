@@ -1,13 +1,32 @@
+import json
+import logging
 from abc import ABC, abstractmethod
 
-from app.crawler.types import NormalizedJob, RawJob
+from app.crawler.deadline import ResumableCrawlMixin
+from app.crawler.policy import is_source_level_failure
+from app.crawler.timing import timed
+from app.crawler.types import ItemFailure, NormalizedJob, RawJob
 
+logger = logging.getLogger(__name__)
 
-class SiteAdapter(ABC):
+EXTERNAL_ID_KEYS = ("external_job_id", "job_id", "jobId", "encryptJobId", "number", "id")
+PAYLOAD_REF_KEYS = ("source_url", "detail_url", "url", "href", "jobHref")
+MAX_QUARANTINE_PAYLOAD_CHARS = 20_000
+
+
+class ItemFailureRatioError(RuntimeError):
+    """Too many items of a run failed in detail/parse/normalize; the run is marked failed."""
+
+
+class SiteAdapter(ResumableCrawlMixin, ABC):
     source_code: str
 
     def __init__(self, config: dict | None = None) -> None:
         self.config = config or {}
+        self.item_failures: list[ItemFailure] = []
+        self.fetch_detail_enabled = False
+        self.skipped_details = 0
+        self._init_resumable()
 
     @abstractmethod
     async def fetch_list(self) -> list[dict]:
@@ -27,8 +46,84 @@ class SiteAdapter(ABC):
 
     async def crawl(self) -> list[NormalizedJob]:
         output: list[NormalizedJob] = []
-        for item in await self.fetch_list():
-            detail = await self.fetch_detail(item)
-            raw = self.parse_raw_job(item, detail)
-            output.append(self.normalize(raw))
+        self.item_failures = []
+        self.skipped_details = 0
+        items = await self.fetch_list()
+        for index, item in enumerate(items):
+            if self.fetch_detail_enabled and self.deadline.expired():
+                # Keep what is built and skip the remaining detail calls. The skip is a metric, not a
+                # resume point: only a list cursor set by the adapter (deadline_reached) marks the run
+                # partial, and the next run refetches these items from the list anyway.
+                self.skipped_details = len(items) - index
+                logger.info("%s deadline_reached skipped_details=%s", self.source_code, self.skipped_details)
+                break
+            normalized = await self.build_item(item)
+            if normalized is not None:
+                output.append(normalized)
+                self.emit(normalized)
         return output
+
+    async def build_item(self, list_item: dict) -> NormalizedJob | None:
+        """Run detail/parse/normalize for one item; failures are quarantined instead of aborting the run.
+
+        Risk signals, open circuits and expired credentials still propagate: they affect every
+        remaining item, so continuing would only burn the crawl budget.
+        """
+        stage = "fetch_detail"
+        try:
+            detail = await self.fetch_detail(list_item)
+            stage = "parse"
+            with timed("parse"):
+                raw = self.parse_raw_job(list_item, detail)
+            stage = "normalize"
+            with timed("normalize"):
+                return self.normalize(raw)
+        except Exception as exc:  # noqa: BLE001
+            if is_source_level_failure(exc):
+                raise
+            self.record_item_failure(list_item, stage=stage, exc=exc)
+            return None
+
+    def record_item_failure(self, list_item: dict, *, stage: str, exc: BaseException) -> ItemFailure:
+        failure = ItemFailure(
+            stage=stage,
+            error_type=type(exc).__name__,
+            error=str(exc)[:2000],
+            external_id=self.item_external_id(list_item),
+            payload_ref=self.item_payload_ref(list_item),
+            payload=_bounded_payload(list_item),
+        )
+        self.item_failures.append(failure)
+        logger.warning(
+            "%s item_failed stage=%s external_id=%s error=%s",
+            self.source_code,
+            stage,
+            failure.external_id,
+            failure.error,
+        )
+        return failure
+
+    def item_external_id(self, list_item: dict) -> str | None:
+        for key in EXTERNAL_ID_KEYS:
+            value = list_item.get(key)
+            if value is not None and str(value).strip():
+                return str(value).strip()[:128]
+        return None
+
+    def item_payload_ref(self, list_item: dict) -> str | None:
+        for key in PAYLOAD_REF_KEYS:
+            value = list_item.get(key)
+            if isinstance(value, str) and value.strip():
+                return value.strip()[:1024]
+        return None
+
+
+def _bounded_payload(list_item: dict) -> dict | None:
+    # Keep the list item for replay, but never let one bloated payload blow up the quarantine row.
+    try:
+        text = json.dumps(list_item, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        return None
+    if len(text) > MAX_QUARANTINE_PAYLOAD_CHARS:
+        return {"truncated": True, "prefix": text[:MAX_QUARANTINE_PAYLOAD_CHARS]}
+    return json.loads(text)
@@ -1,13 +1,15 @@
 from abc import ABC, abstractmethod
 
+from app.crawler.deadline import ResumableCrawlMixin
 from app.crawler.types_event import NormalizedCampusEvent
 
 
-class CampusEventAdapter(ABC):
+class CampusEventAdapter(ResumableCrawlMixin, ABC):
     source_code: str
 
     def __init__(self, config: dict | None = None) -> None:
         self.config = config or {}
+        self._init_resumable()
 
     @abstractmethod
     async def crawl(self) -> list[NormalizedCampusEvent]:
@@ -1,9 +1,11 @@
-import asyncio
 import random
 from urllib.parse import urlparse
 
 import httpx
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from app.crawler.policy import CircuitBreaker, RequestPolicy, RetryPolicy
+from app.crawler.proxy_pool import ProxyPool, ProxyPoolClient
+from app.crawler.timing import throttle_sleep, with_timing_hooks
 
 
 class CrawlerClient:
@@ -19,6 +21,8 @@ class CrawlerClient:
         cookies: dict[str, str] | None = None,
         proxy: str | None = None,
         trust_env: bool = False,
+        policy: RequestPolicy | None = None,
+        proxy_pool: ProxyPool | None = None,
     ) -> None:
         self.timeout_seconds = timeout_seconds
         self.retry_count = retry_count
@@ -26,13 +30,24 @@ class CrawlerClient:
         self.jitter_ms = jitter_ms
         self.allow_paths = allow_paths or []
         self.deny_paths = deny_paths or []
-        self.client = httpx.AsyncClient(
-            timeout=timeout_seconds,
-            headers=headers,
-            cookies=cookies,
-            proxy=proxy,
-            trust_env=trust_env,
+        self.policy = policy or RequestPolicy(
+            RetryPolicy(max_attempts=retry_count, base_delay_seconds=1.0, max_delay_seconds=8.0),
+            CircuitBreaker(source_code="anonymous"),
+        )
+        client_kwargs: dict[str, object] = with_timing_hooks(
+            {
+                "timeout": timeout_seconds,
+                "headers": headers,
+                "cookies": cookies,
+                "proxy": proxy,
+                "trust_env": trust_env,
+            }
         )
+        self.client: httpx.AsyncClient | ProxyPoolClient
+        if proxy_pool is not None:
+            self.client = ProxyPoolClient(proxy_pool, client_kwargs)
+        else:
+            self.client = httpx.AsyncClient(**client_kwargs)  # type: ignore[arg-type]
 
     def _allowed(self, url: str) -> bool:
         path = urlparse(url).path
@@ -42,20 +57,17 @@ class CrawlerClient:
             return False
         return True
 
-    @retry(
-        retry=retry_if_exception_type((httpx.RequestError, httpx.TimeoutException)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8),
-        reraise=True,
-    )
     async def get(self, url: str) -> httpx.Response:
         if not self._allowed(url):
             raise PermissionError(f"Path is blocked by allow/deny rules: {url}")
 
-        await asyncio.sleep((1.0 / self.qps) + random.uniform(0, self.jitter_ms / 1000.0))
-        response = await self.client.get(url)
-        response.raise_for_status()
-        return response
+        async def attempt() -> httpx.Response:
+            await throttle_sleep((1.0 / self.qps) + random.uniform(0, self.jitter_ms / 1000.0))
+            response = await self.client.get(url)
+            response.raise_for_status()
+            return response
+
+        return await self.policy.call(attempt)
 
     async def close(self) -> None:
         await self.client.aclose()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from app.crawler.policy import PermanentRequestError
+from app.utils.hash import sha1_hex
+from app.utils.time import now_utc
+
+logger = logging.getLogger(__name__)
+
+
+class CredentialExpiredError(PermanentRequestError):
+    """A cached credential is past its TTL or was invalidated by an auth error."""
+
+
+@dataclass
+class CredentialEntry:
+    name: str
+    value: Any
+    expires_at: datetime | None = None
+    refreshed_at: datetime | None = None
+    invalidated_at: datetime | None = None
+    invalid_reason: str | None = None
+    dirty: bool = False
+
+    def is_valid(self, now: datetime) -> bool:
+        if self.invalidated_at is not None:
+            return False
+        return self.expires_at is None or self.expires_at > now
+
+    def expires_within(self, now: datetime, seconds: float) -> bool:
+        if self.invalidated_at is not None:
+            return True
+        return self.expires_at is not None and self.expires_at <= now + timedelta(seconds=seconds)
+
+
+class CredentialStore:
+    """Per-source credential cache; persisted by SourceCredentialDAO so entries survive restarts."""
+
+    def __init__(self, source_code: str) -> None:
+        self.source_code = source_code
+        self.entries: dict[str, CredentialEntry] = {}
+
+    def get(self, name: str) -> Any | None:
+        entry = self.entries.get(name)
+        if entry is None or not entry.is_valid(now_utc()):
+            return None
+        return entry.value
+
+    def put(self, name: str, value: Any, *, ttl_seconds: float | None = None) -> CredentialEntry:
+        now = now_utc()
+        entry = CredentialEntry(
+            name=name,
+            value=value,
+            expires_at=now + timedelta(seconds=ttl_seconds) if ttl_seconds else None,
+            refreshed_at=now,
+            dirty=True,
+        )
+        self.entries[name] = entry
+        return entry
+
+    def track(
+        self,
+        name: str,
+        value: Any,
+        *,
+        expires_at: datetime | None = None,
+        ttl_seconds: float | None = None,
+    ) -> CredentialEntry:
+        """Register an externally supplied credential (cookie, signed url) without resetting its state.
+
+        An explicit expires_at always wins; ttl_seconds only applies the first time the credential is seen.
+        """
+        entry = self.entries.get(name)
+        if entry is not None and (expires_at is None or entry.expires_at == expires_at):
+            return entry
+        now = now_utc()
+        if expires_at is None and ttl_seconds:
+            expires_at = now + timedelta(seconds=ttl_seconds)
+        entry = CredentialEntry(name=name, value=value, expires_at=expires_at, refreshed_at=now, dirty=True)
+        self.entries[name] = entry
+        return entry
+
+    def invalidate(self, name: str, reason: str) -> None:
+        entry = self.entries.get(name)
+        if entry is None:
+            entry = CredentialEntry(name=name, value=None)
+            self.entries[name] = entry
+        if entry.invalidated_at is not None:
+            return
+        entry.invalidated_at = now_utc()
+        entry.invalid_reason = reason[:255]
+        entry.dirty = True
+        logger.warning("credential_invalidated source=%s name=%s reason=%s", self.source_code, name, reason)
+
+    def is_invalidated(self, name: str) -> bool:
+        entry = self.entries.get(name)
+        return entry is not None and entry.invalidated_at is not None
+
+    def due_for_refresh(self, lead_seconds: float) -> list[str]:
+        now = now_utc()
+        return [name for name, entry in self.entries.items() if entry.expires_within(now, lead_seconds)]
+
+    def load(self, entries: list[CredentialEntry]) -> None:
+        for entry in entries:
+            current = self.entries.get(entry.name)
+            if current is not None and current.dirty:
+                continue
+            self.entries[entry.name] = entry
+
+    def adopt(self, entries: list[CredentialEntry]) -> None:
+        """Take over changes made elsewhere (a sandboxed crawl) so the next save persists them."""
+        for entry in entries:
+            entry.dirty = True
+            self.entries[entry.name] = entry
+
+    def dirty_entries(self) -> list[CredentialEntry]:
+        return [entry for entry in self.entries.values() if entry.dirty]
+
+
+_STORES: dict[str, CredentialStore] = {}
+
+
+def get_credential_store(source_code: str) -> CredentialStore:
+    store = _STORES.get(source_code)
+    if store is None:
+        store = CredentialStore(source_code)
+        _STORES[source_code] = store
+    return store
+
+
+def fingerprint_name(prefix: str, value: str) -> str:
+    """Name a user-supplied credential by content so replacing it starts from a clean slate."""
+    return f"{prefix}:{sha1_hex(value)[:16]}"
+
+
+def parse_expires_at(value: object) -> datetime | None:
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return None
+    return parsed
+
+
+def ensure_cookie_credential(source_code: str, config: dict | None, cookies: dict[str, str] | None) -> None:
+    """Track cookie expiry from config_json.cookie_expires_at and fail fast once it has lapsed."""
+    if not cookies:
+        return
+    cfg = config or {}
+    store = get_credential_store(source_code)
+    cookie_string = "; ".join(f"{k}={v}" for k, v in sorted(cookies.items()))
+    name = fingerprint_name("cookies", cookie_string)
+    entry = store.track(name, {"keys": sorted(cookies)}, expires_at=parse_expires_at(cfg.get("cookie_expires_at")))
+    if entry.is_valid(now_utc()):
+        return
+    reason = entry.invalid_reason or f"expired at {entry.expires_at.isoformat() if entry.expires_at else '?'}"
+    raise CredentialExpiredError(
+        f"{source_code} cookie is no longer valid ({reason}), refresh via scripts/set_source_cookie.py"
+    )
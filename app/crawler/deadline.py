@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlDeadline:
+    """Wall-clock budget for one crawl run, from config_json.run_deadline_seconds."""
+
+    def __init__(self, seconds: float | None, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.seconds = seconds if seconds and seconds > 0 else None
+        self.clock = clock
+        self.started_at = clock()
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> CrawlDeadline:
+        cfg = config or {}
+        return cls(float(cfg.get("run_deadline_seconds") or 0) or None)
+
+    def remaining(self) -> float | None:
+        if self.seconds is None:
+            return None
+        return max(0.0, self.seconds - (self.clock() - self.started_at))
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+
+class ResumableCrawlMixin:
+    """Deadline and resume-cursor plumbing shared by SiteAdapter and CampusEventAdapter.
+
+    The service sets `resume_from` from the previous partial run; an adapter that stops on
+    its deadline stores where to continue in `resume_state`, which marks the run partial.
+    Items passed to `emit` as they are built reach `item_sink` (the sandbox pipe) before the
+    crawl returns, so a killed run still hands over what it had.
+    """
+
+    source_code: str
+    config: dict
+
+    def _init_resumable(self) -> None:
+        self.deadline = CrawlDeadline.from_config(self.config)
+        self.resume_from: dict[str, object] = {}
+        self.resume_state: dict[str, object] | None = None
+        self.item_sink: Callable[[object], None] | None = None
+
+    def emit(self, item: object) -> None:
+        """Hand a finished item to the sink; call it right after appending to the returned list."""
+        if self.item_sink is not None:
+            self.item_sink(item)
+
+    def resume_int(self, key: str, default: int) -> int:
+        value = self.resume_from.get(key)
+        try:
+            return max(default, int(value)) if value is not None else default
+        except (TypeError, ValueError):
+            return default
+
+    def deadline_reached(self, **cursor: object) -> bool:
+        """Return True (and record `cursor` as the resume point) once the run deadline has passed."""
+        if not self.deadline.expired():
+            return False
+        if self.resume_state is None:
+            self.resume_state = dict(cursor)
+            logger.info(
+                "%s deadline_reached seconds=%s resume=%s",
+                self.source_code,
+                self.deadline.seconds,
+                self.resume_state,
+            )
+        return True
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+import httpx
+
+from app.core.config import get_settings
+from app.crawler.timing import record_retry, throttle_sleep
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RISK_STATUS_CODES = frozenset({403, 429})
+# Client errors worth another attempt; every other 4xx fails the same way on retry.
+RETRYABLE_CLIENT_STATUS_CODES = frozenset({408, 429})
+
+ChallengeDetector = Callable[[httpx.Response], bool]
+
+
+class RiskSignalError(RuntimeError):
+    """Raised by adapters when a response looks like captcha / anti-bot / throttling."""
+
+    def __init__(self, message: str, *, status_code: int | None = None, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of issuing a request while a source's circuit is open."""
+
+
+class PermanentRequestError(RuntimeError):
+    """Raised when retrying cannot help, e.g. a rejected signature or expired credential."""
+
+
+class TransientResponseError(RuntimeError):
+    """Raised by adapters for a response that may be fine on the next attempt (non-JSON body)."""
+
+
+# Failures worth another attempt besides 408 / 429 / 5xx. Anything else raised inside an attempt
+# (KeyError, TypeError, validation errors from adapter code) fails the same way again.
+RETRYABLE_ERRORS = (
+    httpx.TransportError,
+    httpx.DecodingError,
+    json.JSONDecodeError,  # truncated JSON body
+    RiskSignalError,
+    TransientResponseError,
+)
+
+
+def is_source_level_failure(exc: BaseException) -> bool:
+    """True when the error (or anything it wraps) means the whole source is unusable right now."""
+    current: BaseException | None = exc
+    while current is not None:
+        if isinstance(current, (RiskSignalError, CircuitOpenError, PermanentRequestError)):
+            return True
+        current = current.__cause__
+    return False
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    text = value.strip()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        target = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if target.tzinfo is None:
+        target = target.replace(tzinfo=timezone.utc)
+    return max(0.0, (target - datetime.now(timezone.utc)).total_seconds())
+
+
+def check_risk_status(response: httpx.Response, *, label: str) -> None:
+    if response.status_code in RISK_STATUS_CODES:
+        raise RiskSignalError(
+            f"{label} http_{response.status_code} throttled/forbidden",
+            status_code=response.status_code,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+
+def classify_failure(exc: BaseException) -> tuple[bool, float | None]:
+    """Return (is_risk_signal, retry_after_seconds) for a failed attempt."""
+    if isinstance(exc, RiskSignalError):
+        return True, exc.retry_after
+    if isinstance(exc, httpx.HTTPStatusError):
+        response = exc.response
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return response.status_code in RISK_STATUS_CODES, retry_after
+    return False, None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for 408 / 429 / 5xx and RETRYABLE_ERRORS; other 4xx and programming errors are permanent.
+
+    Risk signals retry so session pools can rotate to another cookie set between attempts.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        return status_code >= 500 or status_code in RETRYABLE_CLIENT_STATUS_CODES
+    return isinstance(exc, RETRYABLE_ERRORS)
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay_seconds: float = 1.0
+    max_delay_seconds: float = 30.0
+
+    def compute_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        # Exponential backoff with full jitter; a server-provided Retry-After is a floor.
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** max(0, attempt - 1)))
+        delay = random.uniform(0.0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay_seconds))
+        return delay
+
+
+@dataclass
+class CircuitBreaker:
+    source_code: str
+    failure_threshold: int = 3
+    window_seconds: float = 60.0
+    cooldown_seconds: float = 600.0
+    clock: Callable[[], float] = time.monotonic
+    opened_at: float | None = None
+    last_reason: str | None = None
+    _risk_events: deque[float] = field(default_factory=deque, repr=False)
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.cooldown_seconds:
+            return "half_open"
+        return "open"
+
+    def remaining_cooldown(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.cooldown_seconds - (self.clock() - self.opened_at))
+
+    def ensure_closed(self) -> None:
+        if self.state == "open":
+            raise CircuitOpenError(
+                f"circuit open for source={self.source_code}, "
+                f"retry in {int(self.remaining_cooldown())}s, last_risk={self.last_reason}"
+            )
+
+    def record_success(self) -> None:
+        self.opened_at = None
+        self._risk_events.clear()
+
+    def record_risk(self, reason: str) -> None:
+        now = self.clock()
+        self.last_reason = reason[:200]
+        if self.state == "half_open":
+            # The trial request after cooldown was challenged again; reopen immediately.
+            self._open(now)
+            return
+        self._risk_events.append(now)
+        while self._risk_events and now - self._risk_events[0] > self.window_seconds:
+            self._risk_events.popleft()
+        if len(self._risk_events) >= self.failure_threshold:
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.opened_at = now
+        self._risk_events.clear()
+        logger.warning(
+            "circuit_opened source=%s cooldown_seconds=%s reason=%s",
+            self.source_code,
+            self.cooldown_seconds,
+            self.last_reason,
+        )
+
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(source_code: str, config: dict | None = None) -> CircuitBreaker:
+    """Process-wide breaker per source, so the open state survives across crawl runs."""
+    settings = get_settings()
+    cfg = config or {}
+    raw = cfg.get("circuit_breaker")
+    breaker_cfg = raw if isinstance(raw, dict) else {}
+    breaker = _BREAKERS.get(source_code)
+    if breaker is None:
+        breaker = CircuitBreaker(source_code=source_code)
+        _BREAKERS[source_code] = breaker
+    breaker.failure_threshold = max(
+        1, int(breaker_cfg.get("failure_threshold") or settings.crawler_circuit_failure_threshold)
+    )
+    breaker.window_seconds = float(breaker_cfg.get("window_seconds") or settings.crawler_circuit_window_seconds)
+    breaker.cooldown_seconds = float(
+        breaker_cfg.get("cooldown_seconds") or settings.crawler_circuit_cooldown_seconds
+    )
+    return breaker
+
+
+class RequestPolicy:
+    def __init__(
+        self,
+        retry: RetryPolicy,
+        breaker: CircuitBreaker,
+        *,
+        sleep: Callable[[float], Awaitable[None]] = throttle_sleep,
+    ) -> None:
+        self.retry = retry
+        self.breaker = breaker
+        self.sleep = sleep
+        self.retries = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        source_code: str,
+        config: dict | None,
+        *,
+        max_attempts: int,
+        base_delay_seconds: float,
+    ) -> RequestPolicy:
+        settings = get_settings()
+        cfg = config or {}
+        raw = cfg.get("retry")
+        retry_cfg = raw if isinstance(raw, dict) else {}
+        retry = RetryPolicy(
+            max_attempts=max(1, int(max_attempts)),
+            base_delay_seconds=float(retry_cfg.get("backoff_seconds") or base_delay_seconds),
+            max_delay_seconds=float(retry_cfg.get("max_backoff_seconds") or settings.crawler_max_backoff_seconds),
+        )
+        return cls(retry, get_circuit_breaker(source_code, cfg))
+
+    async def call(self, operation: Callable[[], Awaitable[T]]) -> T:
+        for attempt in range(1, self.retry.max_attempts + 1):
+            self.breaker.ensure_closed()
+            try:
+                result = await operation()
+            except (CircuitOpenError, PermanentRequestError):
+                raise
+            except Exception as exc:  # noqa: BLE001
+                is_risk, retry_after = classify_failure(exc)
+                if is_risk:
+                    self.breaker.record_risk(str(exc))
+                    if self.breaker.state == "open":
+                        raise CircuitOpenError(
+                            f"circuit opened for source={self.breaker.source_code}: {exc}"
+                        ) from exc
+                if attempt >= self.retry.max_attempts or not is_retryable(exc):
+                    raise
+                self.retries += 1
+                record_retry()
+                await self.sleep(self.retry.compute_delay(attempt, retry_after))
+                continue
+            self.breaker.record_success()
+            return result
+        raise RuntimeError("unreachable retry loop exit")
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+import httpx
+
+from app.crawler.policy import RISK_STATUS_CODES, ChallengeDetector, RiskSignalError
+from app.crawler.session_pool import SessionPoolClient, get_session_pool
+from app.crawler.timing import throttle_sleep, with_timing_hooks
+
+logger = logging.getLogger(__name__)
+
+
+class ProxyPoolExhaustedError(RiskSignalError):
+    """No proxy of a source frees up (quarantine or rate limit) within the caller's max wait."""
+
+
+@dataclass
+class TokenBucket:
+    rate: float
+    capacity: float
+    clock: Callable[[], float] = time.monotonic
+    tokens: float = field(init=False)
+    updated_at: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.tokens = self.capacity
+        self.updated_at = self.clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_take(self) -> float:
+        """Take one token; return 0 on success, otherwise seconds until a token is available."""
+        self._refill()
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+@dataclass
+class ProxyState:
+    url: str
+    bucket: TokenBucket
+    window: int = 20
+    requests: int = 0
+    errors: int = 0
+    captcha_hits: int = 0
+    strikes: int = 0
+    latency_ewma: float | None = None
+    quarantined_until: float = 0.0
+    last_used_at: float = 0.0
+    recent: deque[bool] = field(default_factory=deque, repr=False)
+
+    def error_rate(self) -> float:
+        if not self.recent:
+            return 0.0
+        return sum(1 for ok in self.recent if not ok) / len(self.recent)
+
+    def health_score(self) -> float:
+        latency = self.latency_ewma if self.latency_ewma is not None else 1.0
+        return (1.0 - self.error_rate()) / (1.0 + latency)
+
+    def to_dict(self, now: float) -> dict[str, object]:
+        return {
+            "url": self.url,
+            "requests": self.requests,
+            "errors": self.errors,
+            "captcha_hits": self.captcha_hits,
+            "error_rate": round(self.error_rate(), 3),
+            "latency_ms": int((self.latency_ewma or 0.0) * 1000),
+            "quarantined_seconds_left": max(0, int(self.quarantined_until - now)),
+        }
+
+
+class ProxyPool:
+    def __init__(
+        self,
+        source_code: str,
+        proxy_urls: list[str],
+        *,
+        rate_per_second: float = 1.0,
+        burst: float = 1.0,
+        quarantine_seconds: float = 300.0,
+        max_error_rate: float = 0.5,
+        min_samples: int = 5,
+        max_wait_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = throttle_sleep,
+    ) -> None:
+        if not proxy_urls:
+            raise ValueError("proxy pool requires at least one proxy url")
+        self.source_code = source_code
+        self.quarantine_seconds = quarantine_seconds
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.max_wait_seconds = max_wait_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.proxies = [
+            ProxyState(url=url, bucket=TokenBucket(rate=max(rate_per_second, 0.01), capacity=max(burst, 1.0), clock=clock))
+            for url in dict.fromkeys(proxy_urls)
+        ]
+
+    def healthy(self) -> list[ProxyState]:
+        now = self.clock()
+        return [proxy for proxy in self.proxies if proxy.quarantined_until <= now]
+
+    def try_acquire(self) -> tuple[ProxyState | None, float]:
+        """Pick the healthiest proxy that has a token; otherwise return the shortest wait."""
+        now = self.clock()
+        healthy = self.healthy()
+        if not healthy:
+            return None, min(proxy.quarantined_until for proxy in self.proxies) - now
+
+        waits: list[float] = []
+        for proxy in sorted(healthy, key=lambda p: (-p.health_score(), p.last_used_at)):
+            wait = proxy.bucket.try_take()
+            if wait <= 0:
+                proxy.last_used_at = now
+                return proxy, 0.0
+            waits.append(wait)
+        return None, min(waits)
+
+    async def acquire(self) -> ProxyState:
+        while True:
+            proxy, wait = self.try_acquire()
+            if proxy is not None:
+                return proxy
+            if wait > self.max_wait_seconds:
+                healthy = len(self.healthy())
+                if healthy:
+                    cause = f"rate limit reached on all {healthy} healthy proxies, next token in {wait:.1f}s"
+                else:
+                    cause = f"all proxies quarantined, next release in {int(wait)}s"
+                raise ProxyPoolExhaustedError(
+                    f"{cause} for source={self.source_code}, "
+                    f"quarantined={len(self.proxies) - healthy}/{len(self.proxies)}"
+                )
+            await self.sleep(wait)
+
+    def report(self, proxy: ProxyState, *, ok: bool, latency: float, challenged: bool = False) -> None:
+        proxy.requests += 1
+        proxy.latency_ewma = latency if proxy.latency_ewma is None else 0.8 * proxy.latency_ewma + 0.2 * latency
+        proxy.recent.append(ok and not challenged)
+        while len(proxy.recent) > proxy.window:
+            proxy.recent.popleft()
+        if not ok or challenged:
+            proxy.errors += 1
+        if challenged:
+            proxy.captcha_hits += 1
+            self._quarantine(proxy, reason="challenge")
+        elif len(proxy.recent) >= self.min_samples and proxy.error_rate() >= self.max_error_rate:
+            self._quarantine(proxy, reason="error_rate")
+        elif ok:
+            proxy.strikes = 0
+
+    def _quarantine(self, proxy: ProxyState, *, reason: str) -> None:
+        proxy.strikes += 1
+        duration = min(self.quarantine_seconds * (2 ** (proxy.strikes - 1)), self.quarantine_seconds * 8)
+        proxy.quarantined_until = self.clock() + duration
+        proxy.recent.clear()
+        logger.warning(
+            "proxy_quarantined source=%s proxy=%s reason=%s seconds=%s",
+            self.source_code,
+            proxy.url,
+            reason,
+            int(duration),
+        )
+
+    def snapshot(self) -> list[dict[str, object]]:
+        now = self.clock()
+        return [proxy.to_dict(now) for proxy in self.proxies]
+
+
+_POOLS: dict[str, ProxyPool] = {}
+
+
+def get_proxy_pool(source_code: str, config: dict | None) -> ProxyPool | None:
+    """Process-wide pool per source; rebuilt only when the configured proxy list changes."""
+    cfg = config or {}
+    raw = cfg.get("proxy_pool")
+    if not isinstance(raw, dict):
+        return None
+    proxies = raw.get("proxies")
+    urls = [str(x).strip() for x in proxies if str(x).strip()] if isinstance(proxies, list) else []
+    if not urls:
+        return None
+
+    existing = _POOLS.get(source_code)
+    if existing is not None and [proxy.url for proxy in existing.proxies] == list(dict.fromkeys(urls)):
+        return existing
+    pool = ProxyPool(
+        source_code,
+        urls,
+        rate_per_second=float(raw.get("rate_per_second") or 1.0),
+        burst=float(raw.get("burst") or 1.0),
+        quarantine_seconds=float(raw.get("quarantine_seconds") or 300.0),
+        max_error_rate=float(raw.get("max_error_rate") or 0.5),
+        min_samples=int(raw.get("min_samples") or 5),
+        max_wait_seconds=float(raw.get("max_wait_seconds") or 30.0),
+    )
+    _POOLS[source_code] = pool
+    return pool
+
+
+def hint_detector(hints: tuple[str, ...]) -> ChallengeDetector:
+    lowered_hints = tuple(hint.lower() for hint in hints)
+
+    def detect(response: httpx.Response) -> bool:
+        lowered = response.text.lower()
+        return any(hint in lowered for hint in lowered_hints)
+
+    return detect
+
+
+class ProxyPoolClient:
+    """Drop-in for the subset of httpx.AsyncClient the adapters use, rotating across a ProxyPool."""
+
+    def __init__(
+        self,
+        pool: ProxyPool,
+        client_kwargs: dict[str, object],
+        *,
+        challenge_detector: ChallengeDetector | None = None,
+        client_factory: Callable[..., httpx.AsyncClient] = httpx.AsyncClient,
+    ) -> None:
+        self.pool = pool
+        self.client_kwargs = {k: v for k, v in client_kwargs.items() if k != "proxy"}
+        self.challenge_detector = challenge_detector
+        self.client_factory = client_factory
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def _client_for(self, proxy_url: str) -> httpx.AsyncClient:
+        client = self._clients.get(proxy_url)
+        if client is None:
+            client = self.client_factory(**self.client_kwargs, proxy=proxy_url)
+            self._clients[proxy_url] = client
+        return client
+
+    async def request(self, method: str, url: str, **kwargs: object) -> httpx.Response:
+        proxy = await self.pool.acquire()
+        client = self._client_for(proxy.url)
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)  # type: ignore[arg-type]
+        except httpx.HTTPError:
+            self.pool.report(proxy, ok=False, latency=time.perf_counter() - started)
+            raise
+        challenged = response.status_code in RISK_STATUS_CODES
+        if not challenged and self.challenge_detector is not None:
+            challenged = self.challenge_detector(response)
+        self.pool.report(
+            proxy,
+            ok=response.status_code < 500,
+            latency=time.perf_counter() - started,
+            challenged=challenged,
+        )
+        return response
+
+    async def get(self, url: str, **kwargs: object) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: object) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+
+def build_http_client(
+    source_code: str,
+    config: dict | None,
+    client_kwargs: dict[str, object],
+    *,
+    challenge_detector: ChallengeDetector | None = None,
+) -> httpx.AsyncClient | ProxyPoolClient | SessionPoolClient:
+    client_kwargs = with_timing_hooks(client_kwargs)
+    session_pool = get_session_pool(source_code, config)
+    if session_pool is not None:
+        # config_json.session_pool cookie sets replace the single resolve_cookies() jar.
+        base_kwargs = {k: v for k, v in client_kwargs.items() if k != "cookies"}
+        return SessionPoolClient(
+            session_pool,
+            lambda cookies: _build_transport_client(
+                source_code, config, {**base_kwargs, "cookies": cookies}, challenge_detector
+            ),
+            challenge_detector=challenge_detector,
+        )
+    return _build_transport_client(source_code, config, client_kwargs, challenge_detector)
+
+
+def _build_transport_client(
+    source_code: str,
+    config: dict | None,
+    client_kwargs: dict[str, object],
+    challenge_detector: ChallengeDetector | None,
+) -> httpx.AsyncClient | ProxyPoolClient:
+    pool = get_proxy_pool(source_code, config)
+    if pool is None:
+        return httpx.AsyncClient(**client_kwargs)  # type: ignore[arg-type]
+    return ProxyPoolClient(pool, client_kwargs, challenge_detector=challenge_detector)
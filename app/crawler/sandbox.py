@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Literal
+
+from app.core.config import get_settings
+from app.crawler.credentials import CredentialEntry, CredentialStore
+from app.crawler.timing import collect_timings, current_timings
+from app.crawler.types import ItemFailure
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms run without rlimits
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+AdapterKind = Literal["job", "campus"]
+ITEM_BATCH_SIZE = 200
+POLL_SECONDS = 1.0
+
+
+class SandboxCrawlError(RuntimeError):
+    """The sandboxed crawl raised, was killed on its wall-clock limit, or died on an rlimit."""
+
+
+@dataclass
+class SandboxLimits:
+    memory_mb: int | None
+    cpu_seconds: int | None
+    wall_seconds: float | None
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> SandboxLimits:
+        """APP_CRAWLER_SANDBOX_* defaults, overridden per source by config_json.sandbox.
+
+        memory_mb caps the address space (RLIMIT_AS), which also applies to a Playwright browser
+        launched from the child; browser mode needs a much larger value than HTTP-only adapters.
+        """
+        settings = get_settings()
+        raw = (config or {}).get("sandbox")
+        cfg = raw if isinstance(raw, dict) else {}
+        memory_mb = int(cfg.get("memory_mb", settings.crawler_sandbox_memory_mb) or 0)
+        cpu_seconds = int(cfg.get("cpu_seconds", settings.crawler_sandbox_cpu_seconds) or 0)
+        wall_seconds = float(cfg.get("wall_seconds", settings.crawler_sandbox_wall_seconds) or 0)
+        return cls(
+            memory_mb=memory_mb or None,
+            cpu_seconds=cpu_seconds or None,
+            wall_seconds=wall_seconds or None,
+        )
+
+
+@dataclass
+class CrawlOutcome:
+    """What a crawl hands to ingest, whether the adapter ran inline or in a sandbox."""
+
+    items: list[Any] = field(default_factory=list)
+    item_failures: list[ItemFailure] = field(default_factory=list)
+    crawl_meta: dict[str, Any] = field(default_factory=dict)
+    resume_state: dict[str, Any] | None = None
+    peak_rss_kb: int | None = None
+    # Why a killed sandbox stopped early; its streamed items are kept but the run counts as failed.
+    aborted: str | None = None
+
+    @classmethod
+    def from_adapter(cls, adapter: Any, items: list[Any]) -> CrawlOutcome:
+        crawl_meta = getattr(adapter, "last_crawl_meta", None)
+        crawl_meta = dict(crawl_meta) if isinstance(crawl_meta, dict) else {}
+        skipped_details = getattr(adapter, "skipped_details", 0)
+        if skipped_details:
+            crawl_meta["skipped_details"] = skipped_details
+        return cls(
+            items=items,
+            item_failures=list(getattr(adapter, "item_failures", [])),
+            crawl_meta=crawl_meta,
+            resume_state=adapter.resume_state,
+        )
+
+
+def sandbox_enabled(config: dict | None) -> bool:
+    """APP_CRAWLER_EXECUTION_MODE=subprocess, or config_json.sandbox.enabled for a single source."""
+    raw = (config or {}).get("sandbox")
+    if isinstance(raw, dict) and "enabled" in raw:
+        return bool(raw["enabled"])
+    return get_settings().crawler_execution_mode == "subprocess"
+
+
+async def run_in_sandbox(
+    kind: AdapterKind,
+    source_code: str,
+    config: dict,
+    *,
+    resume_from: dict[str, Any],
+    credentials: CredentialStore,
+    limits: SandboxLimits,
+) -> CrawlOutcome:
+    """Run one adapter crawl in a spawned child process and collect its results.
+
+    Items come back over a pipe in batches while the crawl runs; credential changes and phase
+    timings made in the child are folded back into the parent's store and timings, even when the
+    crawl fails. A child killed on its wall-clock limit or an rlimit keeps the items it already
+    streamed: the outcome carries them with `aborted` (and `crawl_meta.sandbox_aborted`) set.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(
+        target=_child_main,
+        args=(
+            child_conn,
+            kind,
+            source_code,
+            config,
+            resume_from,
+            list(credentials.entries.values()),
+            limits,
+        ),
+        name=f"crawl-{source_code}",
+        daemon=True,
+    )
+    process.start()
+    child_conn.close()
+    logger.info(
+        "sandbox started source=%s pid=%s memory_mb=%s cpu_seconds=%s wall_seconds=%s",
+        source_code,
+        process.pid,
+        limits.memory_mb,
+        limits.cpu_seconds,
+        limits.wall_seconds,
+    )
+
+    outcome = CrawlOutcome()
+    final: dict[str, Any] | None = None
+    aborted: str | None = None
+    deadline = time.monotonic() + limits.wall_seconds if limits.wall_seconds else None
+    try:
+        while True:
+            poll_seconds = POLL_SECONDS
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    process.kill()
+                    aborted = f"sandbox killed after wall-clock limit {limits.wall_seconds:g}s source={source_code}"
+                    break
+                poll_seconds = min(poll_seconds, remaining)
+            sampled = _peak_rss_kb(process.pid)
+            if sampled:
+                outcome.peak_rss_kb = max(outcome.peak_rss_kb or 0, sampled)
+            try:
+                message = await asyncio.to_thread(_recv, parent_conn, poll_seconds)
+            except EOFError:
+                break
+            if message is None:
+                continue
+            kind_tag, payload = message
+            if kind_tag == "items":
+                outcome.items.extend(payload)
+            else:
+                final = payload
+                break
+    finally:
+        parent_conn.close()
+        await asyncio.to_thread(process.join, 5.0)
+        if process.is_alive():
+            process.kill()
+        _record_peak(outcome)
+
+    if final is None:
+        aborted = aborted or f"sandbox exited with code {process.exitcode} source={source_code}"
+        if not outcome.items:
+            raise SandboxCrawlError(aborted)
+        # Credentials, failures and timings only travel in the final message; the items do not.
+        logger.warning("%s kept_items=%s", aborted, len(outcome.items))
+        outcome.aborted = aborted
+        outcome.crawl_meta = {"sandbox_aborted": aborted}
+        return outcome
+
+    credentials.adopt(final.get("credentials") or [])
+    timings = current_timings()
+    if timings is not None:
+        timings.merge(final.get("timing") or {})
+    child_rss = final.get("peak_rss_kb")
+    if child_rss:
+        outcome.peak_rss_kb = max(outcome.peak_rss_kb or 0, int(child_rss))
+        _record_peak(outcome)
+    if final.get("error"):
+        raise SandboxCrawlError(final["error"])
+    outcome.item_failures = list(final.get("item_failures") or [])
+    outcome.crawl_meta = dict(final.get("crawl_meta") or {})
+    outcome.resume_state = final.get("resume_state")
+    return outcome
+
+
+class _ItemSink:
+    """Child-side batching of emitted items onto the pipe.
+
+    A batch goes out when it is full or POLL_SECONDS after the previous one, so a slow crawl
+    still hands items over before it can be killed.
+    """
+
+    def __init__(self, conn: Connection) -> None:
+        self.conn = conn
+        self.pending: list[Any] = []
+        self.sent = 0
+        self.flushed_at = time.monotonic()
+
+    def add(self, item: Any) -> None:
+        self.pending.append(item)
+        if len(self.pending) >= ITEM_BATCH_SIZE or time.monotonic() - self.flushed_at >= POLL_SECONDS:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.pending:
+            self.conn.send(("items", self.pending))
+            self.sent += len(self.pending)
+            self.pending = []
+        self.flushed_at = time.monotonic()
+
+    def finish(self, items: list[Any]) -> None:
+        self.pending = []
+        rest = items[self.sent :]
+        for start in range(0, len(rest), ITEM_BATCH_SIZE):
+            self.conn.send(("items", rest[start : start + ITEM_BATCH_SIZE]))
+        self.sent += len(rest)
+
+
+def _record_peak(outcome: CrawlOutcome) -> None:
+    timings = current_timings()
+    if timings is not None and outcome.peak_rss_kb:
+        timings.peak_rss_kb = max(timings.peak_rss_kb or 0, outcome.peak_rss_kb)
+
+
+def _recv(conn: Connection, timeout: float) -> Any | None:
+    if not conn.poll(timeout):
+        return None
+    return conn.recv()
+
+
+def _peak_rss_kb(pid: int | None) -> int | None:
+    # VmHWM is the child's resident high-water mark; unlike ru_maxrss it is readable before a kill.
+    if pid is None:
+        return None
+    try:
+        status = Path(f"/proc/{pid}/status").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmHWM:"):
+            fields = line.split()
+            return int(fields[1]) if len(fields) > 1 and fields[1].isdigit() else None
+    return None
+
+
+def _describe(exc: BaseException) -> str:
+    # Exceptions do not cross the pipe; keep the cause chain text so risk-pause matching works.
+    parts: list[str] = []
+    current: BaseException | None = exc
+    while current is not None and len(parts) < 5:
+        parts.append(f"{type(current).__name__}: {current}")
+        current = current.__cause__
+    return " <- ".join(parts)
+
+
+def _apply_limits(limits: SandboxLimits) -> None:
+    if resource is None:
+        return
+    if limits.memory_mb:
+        limit = limits.memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if limits.cpu_seconds:
+        # SIGXCPU at the soft limit, SIGKILL shortly after if the child ignores it.
+        resource.setrlimit(resource.RLIMIT_CPU, (limits.cpu_seconds, limits.cpu_seconds + 5))
+
+
+def _child_main(
+    conn: Connection,
+    kind: AdapterKind,
+    source_code: str,
+    config: dict,
+    resume_from: dict[str, Any],
+    credential_entries: list[CredentialEntry],
+    limits: SandboxLimits,
+) -> None:
+    _apply_limits(limits)
+    try:
+        result = asyncio.run(
+            _child_crawl(conn, kind, source_code, config, resume_from, credential_entries)
+        )
+        conn.send(("done", result))
+    finally:
+        conn.close()
+
+
+async def _child_crawl(
+    conn: Connection,
+    kind: AdapterKind,
+    source_code: str,
+    config: dict,
+    resume_from: dict[str, Any],
+    credential_entries: list[CredentialEntry],
+) -> dict[str, Any]:
+    from app.crawler.campus_registry import get_campus_adapter
+    from app.crawler.credentials import get_credential_store
+    from app.crawler.registry import get_adapter
+
+    store = get_credential_store(source_code)
+    store.load(credential_entries)
+    sink = _ItemSink(conn)
+    result: dict[str, Any] = {}
+    with collect_timings() as timings:
+        try:
+            factory = get_adapter if kind == "job" else get_campus_adapter
+            adapter = factory(source_code, config)
+            adapter.resume_from = dict(resume_from)
+            adapter.item_sink = sink.add
+            outcome = CrawlOutcome.from_adapter(adapter, await adapter.crawl())
+            # Emitted items are a prefix of the returned list; adapters that never emit send it all here.
+            sink.finish(outcome.items)
+            result = {
+                "crawl_meta": outcome.crawl_meta,
+                "resume_state": outcome.resume_state,
+                "item_failures": outcome.item_failures,
+            }
+        except Exception as exc:  # noqa: BLE001
+            result = {"error": _describe(exc)}
+    result["credentials"] = store.dirty_entries()
+    result["timing"] = timings.to_dict()
+    if resource is not None:
+        result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+
+from app.crawler.adapters.http_common import parse_cookie_string
+from app.crawler.policy import RISK_STATUS_CODES, ChallengeDetector, RiskSignalError
+from app.crawler.timing import throttle_sleep
+from app.utils.hash import sha1_hex
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPoolExhaustedError(RiskSignalError):
+    """Every cookie session of a source is retired, cooling down or out of budget."""
+
+
+@dataclass
+class CookieSession:
+    name: str
+    cookies: dict[str, str]
+    requests: int = 0
+    window_requests: int = 0
+    window_started_at: float = 0.0
+    throttles: int = 0
+    challenges: int = 0
+    last_throttled_at: float | None = None
+    cooldown_until: float = 0.0
+    retired: bool = False
+    retired_reason: str | None = None
+
+    def to_dict(self, now: float) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "requests": self.requests,
+            "window_requests": self.window_requests,
+            "throttles": self.throttles,
+            "challenges": self.challenges,
+            "cooldown_seconds_left": max(0, int(self.cooldown_until - now)),
+            "retired": self.retired,
+            "retired_reason": self.retired_reason,
+        }
+
+
+class SessionPool:
+    def __init__(
+        self,
+        source_code: str,
+        cookie_sets: list[dict[str, str]],
+        *,
+        request_budget: int = 200,
+        budget_window_seconds: float = 3600.0,
+        cooldown_seconds: float = 600.0,
+        max_challenges: int = 1,
+        max_wait_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = throttle_sleep,
+    ) -> None:
+        if not cookie_sets:
+            raise ValueError("session pool requires at least one cookie set")
+        self.source_code = source_code
+        self.request_budget = max(1, request_budget)
+        self.budget_window_seconds = budget_window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.max_challenges = max(1, max_challenges)
+        self.max_wait_seconds = max_wait_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.sessions = [
+            CookieSession(name=session_name(cookies), cookies=cookies, window_started_at=clock())
+            for cookies in cookie_sets
+        ]
+
+    def active(self) -> list[CookieSession]:
+        return [session for session in self.sessions if not session.retired]
+
+    def _roll_window(self, session: CookieSession, now: float) -> None:
+        if now - session.window_started_at >= self.budget_window_seconds:
+            session.window_started_at = now
+            session.window_requests = 0
+
+    def try_acquire(self) -> tuple[CookieSession | None, float]:
+        """Pick the least-recently-throttled usable session; otherwise return the shortest wait."""
+        now = self.clock()
+        active = self.active()
+        if not active:
+            return None, float("inf")
+
+        waits: list[float] = []
+        usable: list[CookieSession] = []
+        for session in active:
+            self._roll_window(session, now)
+            if session.cooldown_until > now:
+                waits.append(session.cooldown_until - now)
+            elif session.window_requests >= self.request_budget:
+                waits.append(session.window_started_at + self.budget_window_seconds - now)
+            else:
+                usable.append(session)
+        if not usable:
+            return None, min(waits)
+
+        # Never-throttled sessions first, then the one whose last throttle is oldest;
+        # ties go to the session with the most budget left.
+        chosen = min(
+            usable,
+            key=lambda s: (
+                s.last_throttled_at is not None,
+                s.last_throttled_at or 0.0,
+                s.window_requests,
+            ),
+        )
+        chosen.window_requests += 1
+        chosen.requests += 1
+        return chosen, 0.0
+
+    async def acquire(self) -> CookieSession:
+        while True:
+            session, wait = self.try_acquire()
+            if session is not None:
+                return session
+            if wait > self.max_wait_seconds:
+                raise SessionPoolExhaustedError(
+                    f"no usable cookie session for source={self.source_code}, "
+                    f"active={len(self.active())}/{len(self.sessions)}"
+                )
+            await self.sleep(wait)
+
+    def report(self, session: CookieSession, *, throttled: bool = False, challenged: bool = False) -> None:
+        now = self.clock()
+        if challenged:
+            session.challenges += 1
+            if session.challenges >= self.max_challenges:
+                self.retire(session, reason="challenge")
+                return
+        if throttled or challenged:
+            session.throttles += 1
+            session.last_throttled_at = now
+            session.cooldown_until = now + self.cooldown_seconds
+            logger.warning(
+                "session_cooldown source=%s session=%s seconds=%s",
+                self.source_code,
+                session.name,
+                int(self.cooldown_seconds),
+            )
+
+    def retire(self, session: CookieSession, *, reason: str) -> None:
+        if session.retired:
+            return
+        session.retired = True
+        session.retired_reason = reason
+        logger.warning(
+            "session_retired source=%s session=%s reason=%s active=%s",
+            self.source_code,
+            session.name,
+            reason,
+            len(self.active()),
+        )
+
+    def snapshot(self) -> list[dict[str, object]]:
+        now = self.clock()
+        return [session.to_dict(now) for session in self.sessions]
+
+
+def session_name(cookies: dict[str, str]) -> str:
+    # Identify a session without exposing cookie values in logs or crawl meta.
+    return sha1_hex("; ".join(f"{k}={v}" for k, v in sorted(cookies.items())))[:12]
+
+
+def _parse_cookie_set(value: object) -> dict[str, str]:
+    if isinstance(value, dict):
+        return {str(k).strip(): str(v).strip() for k, v in value.items() if str(k).strip() and v is not None}
+    if isinstance(value, str):
+        return parse_cookie_string(value)
+    return {}
+
+
+_SESSION_POOLS: dict[str, SessionPool] = {}
+
+
+def get_session_pool(source_code: str, config: dict | None) -> SessionPool | None:
+    """Process-wide pool per source; rebuilt only when the configured cookie sets change."""
+    cfg = config or {}
+    raw = cfg.get("session_pool")
+    if not isinstance(raw, dict):
+        return None
+    entries = raw.get("cookies")
+    cookie_sets = [_parse_cookie_set(x) for x in entries] if isinstance(entries, list) else []
+    cookie_sets = [cookies for cookies in cookie_sets if cookies]
+    if not cookie_sets:
+        return None
+
+    names = list(dict.fromkeys(session_name(cookies) for cookies in cookie_sets))
+    existing = _SESSION_POOLS.get(source_code)
+    if existing is not None and [session.name for session in existing.sessions] == names:
+        return existing
+    unique = list({session_name(cookies): cookies for cookies in cookie_sets}.values())
+    pool = SessionPool(
+        source_code,
+        unique,
+        request_budget=int(raw.get("request_budget") or 200),
+        budget_window_seconds=float(raw.get("budget_window_seconds") or 3600.0),
+        cooldown_seconds=float(raw.get("cooldown_seconds") or 600.0),
+        max_challenges=int(raw.get("max_challenges") or 1),
+        max_wait_seconds=float(raw.get("max_wait_seconds") or 30.0),
+    )
+    _SESSION_POOLS[source_code] = pool
+    return pool
+
+
+class SessionPoolClient:
+    """Rotates requests across cookie sessions, each with its own client and cookie jar."""
+
+    def __init__(
+        self,
+        pool: SessionPool,
+        client_factory: Callable[[dict[str, str]], httpx.AsyncClient],
+        *,
+        challenge_detector: ChallengeDetector | None = None,
+    ) -> None:
+        self.pool = pool
+        self.client_factory = client_factory
+        self.challenge_detector = challenge_detector
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def _client_for(self, session: CookieSession) -> httpx.AsyncClient:
+        client = self._clients.get(session.name)
+        if client is None:
+            client = self.client_factory(session.cookies)
+            self._clients[session.name] = client
+        return client
+
+    async def request(self, method: str, url: str, **kwargs: object) -> httpx.Response:
+        session = await self.pool.acquire()
+        client = self._client_for(session)
+        response = await client.request(method, url, **kwargs)
+        challenged = self.challenge_detector is not None and self.challenge_detector(response)
+        self.pool.report(
+            session,
+            throttled=response.status_code in RISK_STATUS_CODES,
+            challenged=challenged,
+        )
+        return response
+
+    async def get(self, url: str, **kwargs: object) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: object) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import httpx
+
+PHASES = ("http_wait", "throttle_sleep", "parse", "normalize", "db_read", "db_write", "commit")
+_STARTED_KEY = "crawl_timing_started"
+
+
+class CrawlTimings:
+    """Per-run phase clock.
+
+    Nested phases are exclusive: entering `db_read` inside `db_write` pauses the outer phase,
+    so the per-phase seconds add up instead of double counting.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.started_at = clock()
+        self.seconds: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.requests = 0
+        self.bytes_downloaded = 0
+        self.retries = 0
+        self.peak_rss_kb: int | None = None
+        self._stack: list[list[object]] = []
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + max(0.0, seconds)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        now = self.clock()
+        if self._stack:
+            parent = self._stack[-1]
+            self.add(str(parent[0]), now - float(parent[1]))  # type: ignore[arg-type]
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            end = self.clock()
+            _, since = self._stack.pop()
+            self.add(name, end - float(since))  # type: ignore[arg-type]
+            if self._stack:
+                self._stack[-1][1] = end
+
+    def merge(self, data: dict) -> None:
+        """Fold a `to_dict()` snapshot from another process (sandboxed crawl) into this run."""
+        for name, value in (data.get("phases") or {}).items():
+            self.add(name, float(value or 0.0))
+        self.requests += int(data.get("requests") or 0)
+        self.bytes_downloaded += int(data.get("bytes_downloaded") or 0)
+        self.retries += int(data.get("retries") or 0)
+
+    def to_dict(self) -> dict[str, object]:
+        total = self.clock() - self.started_at
+        data: dict[str, object] = {
+            "total_seconds": round(total, 3),
+            "phases": {name: round(value, 3) for name, value in self.seconds.items()},
+            "unaccounted_seconds": round(max(0.0, total - sum(self.seconds.values())), 3),
+            "requests": self.requests,
+            "bytes_downloaded": self.bytes_downloaded,
+            "retries": self.retries,
+        }
+        if self.peak_rss_kb is not None:
+            data["peak_rss_kb"] = self.peak_rss_kb
+        return data
+
+
+_CURRENT: ContextVar[CrawlTimings | None] = ContextVar("crawl_timings", default=None)
+
+
+@contextmanager
+def collect_timings() -> Iterator[CrawlTimings]:
+    timings = CrawlTimings()
+    token = _CURRENT.set(timings)
+    try:
+        yield timings
+    finally:
+        _CURRENT.reset(token)
+
+
+def current_timings() -> CrawlTimings | None:
+    return _CURRENT.get()
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    timings = _CURRENT.get()
+    if timings is None:
+        yield
+        return
+    with timings.phase(phase):
+        yield
+
+
+async def throttle_sleep(seconds: float) -> None:
+    """asyncio.sleep that books the wait as throttle time on the current run."""
+    started = time.perf_counter()
+    await asyncio.sleep(seconds)
+    timings = _CURRENT.get()
+    if timings is not None:
+        timings.add("throttle_sleep", time.perf_counter() - started)
+
+
+def record_retry() -> None:
+    timings = _CURRENT.get()
+    if timings is not None:
+        timings.retries += 1
+
+
+async def _on_request(request: httpx.Request) -> None:
+    request.extensions[_STARTED_KEY] = time.perf_counter()
+
+
+async def _on_response(response: httpx.Response) -> None:
+    timings = _CURRENT.get()
+    if timings is None:
+        return
+    # Read the body here so http_wait covers the download, not just the headers.
+    await response.aread()
+    started = response.request.extensions.get(_STARTED_KEY)
+    if isinstance(started, float):
+        timings.add("http_wait", time.perf_counter() - started)
+    timings.requests += 1
+    # Pre-buffered responses (mock transports) never go through the download counter.
+    timings.bytes_downloaded += response.num_bytes_downloaded or len(response.content)
+
+
+def with_timing_hooks(client_kwargs: dict[str, object]) -> dict[str, object]:
+    raw = client_kwargs.get("event_hooks")
+    hooks: dict[str, list] = {k: list(v) for k, v in raw.items()} if isinstance(raw, dict) else {}
+    hooks.setdefault("request", []).append(_on_request)
+    hooks.setdefault("response", []).append(_on_response)
+    return {**client_kwargs, "event_hooks": hooks}
+
+
+def summarize_timings(timings: list[dict]) -> dict[str, object]:
+    """Average per-phase seconds and counters over persisted `CrawlRun.timing_json` rows."""
+    runs = [item for item in timings if isinstance(item, dict)]
+    if not runs:
+        return {"runs": 0}
+    count = len(runs)
+    totals = sorted(float(item.get("total_seconds") or 0.0) for item in runs)
+    phase_sums = dict.fromkeys(PHASES, 0.0)
+    for item in runs:
+        for name, value in (item.get("phases") or {}).items():
+            phase_sums[name] = phase_sums.get(name, 0.0) + float(value or 0.0)
+    total_sum = sum(totals)
+    return {
+        "runs": count,
+        "avg_total_seconds": round(total_sum / count, 3),
+        "p95_total_seconds": round(totals[min(count - 1, int(0.95 * count))], 3),
+        "avg_phase_seconds": {name: round(value / count, 3) for name, value in phase_sums.items()},
+        "phase_share": {
+            name: round(value / total_sum, 4) if total_sum > 0 else 0.0 for name, value in phase_sums.items()
+        },
+        "avg_requests": round(sum(int(item.get("requests") or 0) for item in runs) / count, 1),
+        "avg_bytes_downloaded": round(
+            sum(int(item.get("bytes_downloaded") or 0) for item in runs) / count, 1
+        ),
+        "avg_retries": round(sum(int(item.get("retries") or 0) for item in runs) / count, 2),
+    }
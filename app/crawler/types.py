@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
 from app.models.enums import EducationLevel, JobType, RemoteType
 
@@ -77,3 +78,15 @@ class NormalizedJob:
     last_crawled_at: datetime
 
     skills: list[str]
+    # CJK uni/bigrams + lowercase words for jobs.search_vector (app/utils/search_tokens.py).
+    search_document: str = ""
+
+
+@dataclass
+class ItemFailure:
+    stage: str
+    error_type: str
+    error: str
+    external_id: str | None = None
+    payload_ref: str | None = None
+    payload: dict[str, Any] | None = None
@@ -0,0 +1,19 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cache_version import CacheVersion
+
+
+class CacheVersionDAO:
+    async def get(self, session: AsyncSession, name: str) -> int:
+        version = await session.scalar(select(CacheVersion.version).where(CacheVersion.name == name))
+        return int(version or 0)
+
+    async def bump(self, session: AsyncSession, name: str) -> int:
+        stmt = insert(CacheVersion).values(name=name, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CacheVersion.name],
+            set_={"version": CacheVersion.version + 1, "updated_at": func.now()},
+        ).returning(CacheVersion.version)
+        return int((await session.execute(stmt)).scalar_one())
@@ -0,0 +1,55 @@
+from typing import Any
+
+from sqlalchemy import func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.campus_event_body import CampusEventBody
+from app.utils.raw_payload import decode_payload, encode_payload
+
+
+class CampusEventBodyDAO:
+    async def upsert(
+        self,
+        session: AsyncSession,
+        *,
+        event_id: int,
+        description: str | None,
+        raw_payload: dict[str, Any] | None,
+    ) -> bool:
+        """Write description + encoded payload; returns whether a row was inserted or changed."""
+        compression = get_settings().raw_payload_compression
+        encoded = encode_payload(raw_payload, compression) if raw_payload else None
+        stmt = insert(CampusEventBody).values(
+            event_id=event_id,
+            description=description,
+            raw_payload=encoded.data if encoded else None,
+            payload_encoding=encoded.encoding if encoded else None,
+            payload_sha256=encoded.sha256 if encoded else None,
+        )
+        # Payloads compare by digest, so an unchanged detail body is never rewritten.
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CampusEventBody.event_id],
+            set_={
+                "description": stmt.excluded.description,
+                "raw_payload": stmt.excluded.raw_payload,
+                "payload_encoding": stmt.excluded.payload_encoding,
+                "payload_sha256": stmt.excluded.payload_sha256,
+                "updated_at": func.now(),
+            },
+            where=or_(
+                CampusEventBody.description.is_distinct_from(stmt.excluded.description),
+                CampusEventBody.payload_sha256.is_distinct_from(stmt.excluded.payload_sha256),
+            ),
+        ).returning(CampusEventBody.event_id)
+        return (await session.execute(stmt)).scalar_one_or_none() is not None
+
+    async def get(self, session: AsyncSession, event_id: int) -> CampusEventBody | None:
+        return await session.get(CampusEventBody, event_id)
+
+    async def load_payload(self, session: AsyncSession, event_id: int) -> dict[str, Any] | None:
+        body = await self.get(session, event_id)
+        if body is None or body.raw_payload is None:
+            return None
+        return decode_payload(body.raw_payload, body.payload_encoding)
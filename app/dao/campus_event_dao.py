@@ -1,28 +1,72 @@
-from sqlalchemy import func, or_, select
+from sqlalchemy import ColumnElement, Select, func, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crawler.timing import timed
 from app.crawler.types_event import NormalizedCampusEvent
-from app.models.campus_event import CampusEvent
+from app.dao.campus_event_body_dao import CampusEventBodyDAO
+from app.dao.counting import TotalCounter
+from app.dao.pagination import InvalidCursorError, Keyset, SortKey, page_window
+from app.dao.stats_rollup_dao import NULL_BUCKET, RollupDelta, StatsRollupDAO
+from app.models.campus_event import SEARCH_TEXT_SEPARATOR, CampusEvent
+from app.models.campus_event_body import CampusEventBody
 from app.models.source import Source
 
+# Upcoming events first, undated ones last; ids ascend so the order is one index range.
+EVENT_KEYSET = Keyset(
+    "time",
+    (SortKey(CampusEvent.starts_at, "'infinity'::timestamptz"), SortKey(CampusEvent.id)),
+    descending=False,
+)
+
+# List rows are plain tuples of exactly the response fields, labelled by their item key; the
+# description, tags and raw payload columns (often TOASTed) are only read by the detail view.
+EVENT_LIST_COLUMNS = (
+    CampusEvent.id,
+    CampusEvent.title,
+    CampusEvent.company_name,
+    CampusEvent.school_name,
+    CampusEvent.city,
+    CampusEvent.venue,
+    CampusEvent.starts_at,
+    CampusEvent.event_type,
+    CampusEvent.event_status,
+    Source.code.label("source_code"),
+    CampusEvent.source_url,
+)
+
 
 class CampusEventDAO:
+    def __init__(self) -> None:
+        self.counter = TotalCounter("campus_events")
+        self.rollup_dao = StatsRollupDAO()
+        self.body_dao = CampusEventBodyDAO()
+
     async def upsert_events(
         self, session: AsyncSession, source_id: int, events: list[NormalizedCampusEvent]
     ) -> tuple[int, int]:
         inserted_count = 0
         updated_count = 0
+        rollup = RollupDelta()
+        with timed("db_read"):
+            source = await session.get(Source, source_id)
 
         for event in events:
             exists_stmt = select(CampusEvent).where(
                 CampusEvent.source_id == source_id,
                 CampusEvent.external_event_id == event.external_event_id,
             )
-            existed = (await session.execute(exists_stmt)).scalar_one_or_none()
+            with timed("db_read"):
+                existed = (await session.execute(exists_stmt)).scalar_one_or_none()
+            has_changes = False
             if existed is None:
                 inserted_count += 1
+                rollup.add("source", source.code)
+                rollup.add("city", event.city)
+                rollup.add("school", event.school_name)
             else:
+                rollup.move("city", existed.city, event.city)
+                rollup.move("school", existed.school_name, event.school_name)
                 # Count as "updated" only when core business fields changed (exclude crawl timestamps).
                 has_changes = any(
                     [
@@ -39,13 +83,9 @@ class CampusEventDAO:
                         existed.starts_at != event.starts_at,
                         existed.ends_at != event.ends_at,
                         existed.event_status != event.event_status,
-                        existed.description != event.description,
                         (existed.tags_json or []) != (event.tags or []),
-                        (existed.raw_payload_json or {}) != (event.raw_payload or {}),
                     ]
                 )
-                if has_changes:
-                    updated_count += 1
 
             stmt = insert(CampusEvent).values(
                 source_id=source_id,
@@ -63,9 +103,7 @@ class CampusEventDAO:
                 starts_at=event.starts_at,
                 ends_at=event.ends_at,
                 event_status=event.event_status,
-                description=event.description,
                 tags_json=event.tags,
-                raw_payload_json=event.raw_payload,
                 first_crawled_at=event.first_crawled_at,
                 last_crawled_at=event.last_crawled_at,
             )
@@ -85,14 +123,19 @@ class CampusEventDAO:
                     "starts_at": event.starts_at,
                     "ends_at": event.ends_at,
                     "event_status": event.event_status,
-                    "description": event.description,
                     "tags_json": event.tags,
-                    "raw_payload_json": event.raw_payload,
                     "last_crawled_at": event.last_crawled_at,
                 },
+            ).returning(CampusEvent.id)
+            event_id = (await session.execute(stmt)).scalar_one()
+
+            body_changed = await self.body_dao.upsert(
+                session, event_id=event_id, description=event.description, raw_payload=event.raw_payload
             )
-            await session.execute(stmt)
+            if existed is not None and (has_changes or body_changed):
+                updated_count += 1
 
+        await self.rollup_dao.apply(session, "campus_events", rollup)
         await session.flush()
         return inserted_count, updated_count
 
@@ -113,74 +156,98 @@ class CampusEventDAO:
         event_type: str | None,
         source_code: str | None,
         sort_by: str,
+        cursor: str | None = None,
     ) -> dict:
+        keyset = None if sort_by == "recent" else EVENT_KEYSET
+        if cursor and keyset is None:
+            raise InvalidCursorError(f"sort order {sort_by} does not support cursors")
+        after = keyset.after(keyset.decode(cursor)) if cursor and keyset is not None else None
+
+        stmt = self.build_search_stmt(
+            keyword=keyword,
+            city=city,
+            school=school,
+            company=company,
+            event_type=event_type,
+            source_code=source_code,
+        )
+
+        filters = {
+            "keyword": keyword,
+            "city": city,
+            "school": school,
+            "company": company,
+            "event_type": event_type,
+            "source_code": source_code,
+        }
+        counted = await self.counter.count(session, stmt, filters)
+
+        if keyset is None:
+            stmt = stmt.order_by(CampusEvent.created_at.desc())
+        else:
+            stmt = stmt.order_by(*keyset.order_by())
+        stmt = stmt.where(after) if after is not None else stmt.offset((page - 1) * page_size)
+        rows, has_more = page_window((await session.execute(stmt.limit(page_size + 1))).all(), page_size)
+
+        items = [row._asdict() for row in rows]
+        next_cursor = keyset.cursor_for(rows[-1]) if keyset is not None and has_more else None
+        return {
+            "items": items,
+            "page": page,
+            "page_size": page_size,
+            "total": counted.total,
+            "total_exact": counted.exact,
+            "next_cursor": next_cursor,
+        }
+
+    def build_search_stmt(
+        self,
+        *,
+        keyword: str | None = None,
+        city: str | None = None,
+        school: str | None = None,
+        company: str | None = None,
+        event_type: str | None = None,
+        source_code: str | None = None,
+    ) -> Select:
+        """Filter statement for search_events; every substring filter maps to a pg_trgm GIN index.
+
+        `keyword` matches the generated `search_text` column (title, company, school, venue), so
+        one trigram index replaces the four-way ILIKE OR; a match never spans two fields. Patterns
+        need at least three characters to yield a trigram; shorter keywords still work but fall
+        back to a scan. `%` and `_` in the filters match literally.
+        """
         stmt = (
-            select(CampusEvent, Source.code.label("source_code"))
+            select(*EVENT_LIST_COLUMNS)
             .join(Source, Source.id == CampusEvent.source_id)
             .where(CampusEvent.event_status != "deleted")
         )
-
+        keyword = keyword.replace(SEARCH_TEXT_SEPARATOR, "") if keyword else None
         if keyword:
-            stmt = stmt.where(
-                or_(
-                    CampusEvent.title.ilike(f"%{keyword}%"),
-                    CampusEvent.company_name.ilike(f"%{keyword}%"),
-                    CampusEvent.school_name.ilike(f"%{keyword}%"),
-                    CampusEvent.venue.ilike(f"%{keyword}%"),
-                )
-            )
+            stmt = stmt.where(_contains(CampusEvent.search_text, keyword))
         if city:
             stmt = stmt.where(CampusEvent.city == city)
         if school:
-            stmt = stmt.where(CampusEvent.school_name.ilike(f"%{school}%"))
+            stmt = stmt.where(_contains(CampusEvent.school_name, school))
         if company:
-            stmt = stmt.where(CampusEvent.company_name.ilike(f"%{company}%"))
+            stmt = stmt.where(_contains(CampusEvent.company_name, company))
         if event_type:
             stmt = stmt.where(CampusEvent.event_type == event_type)
         if source_code:
             stmt = stmt.where(Source.code == source_code)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = (await session.execute(count_stmt)).scalar_one()
-
-        if sort_by == "recent":
-            stmt = stmt.order_by(CampusEvent.created_at.desc())
-        else:
-            stmt = stmt.order_by(CampusEvent.starts_at.asc().nullslast(), CampusEvent.id.desc())
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-        rows = (await session.execute(stmt)).all()
-
-        items = []
-        for event, source in rows:
-            items.append(
-                {
-                    "id": event.id,
-                    "title": event.title,
-                    "company_name": event.company_name,
-                    "school_name": event.school_name,
-                    "city": event.city,
-                    "venue": event.venue,
-                    "starts_at": event.starts_at,
-                    "event_type": event.event_type,
-                    "event_status": event.event_status,
-                    "source_code": source,
-                    "source_url": event.source_url,
-                }
-            )
-
-        return {"items": items, "page": page, "page_size": page_size, "total": total}
+        return stmt
 
     async def get_event_detail(self, session: AsyncSession, event_id: int) -> dict | None:
         stmt = (
-            select(CampusEvent, Source.code.label("source_code"))
+            select(CampusEvent, Source.code.label("source_code"), CampusEventBody.description)
             .join(Source, Source.id == CampusEvent.source_id)
+            .join(CampusEventBody, CampusEventBody.event_id == CampusEvent.id, isouter=True)
             .where(CampusEvent.id == event_id)
         )
         row = (await session.execute(stmt)).first()
         if row is None:
             return None
-        event, source_code = row
+        event, source_code, description = row
         return {
             "id": event.id,
             "title": event.title,
@@ -193,7 +260,7 @@ class CampusEventDAO:
             "ends_at": event.ends_at,
             "event_type": event.event_type,
             "event_status": event.event_status,
-            "description": event.description,
+            "description": description,
             "tags": event.tags_json or [],
             "source_code": source_code,
             "source_url": event.source_url,
@@ -205,29 +272,44 @@ class CampusEventDAO:
         return (await session.execute(stmt)).scalar_one_or_none()
 
     async def basic_stats(self, session: AsyncSession) -> dict:
-        by_source_stmt = (
-            select(Source.code, func.count(CampusEvent.id))
-            .join(CampusEvent, CampusEvent.source_id == Source.id)
-            .group_by(Source.code)
-            .order_by(Source.code.asc())
-        )
-        by_city_stmt = (
-            select(CampusEvent.city, func.count(CampusEvent.id))
-            .group_by(CampusEvent.city)
-            .order_by(func.count(CampusEvent.id).desc())
-            .limit(20)
-        )
-        by_school_stmt = (
-            select(CampusEvent.school_name, func.count(CampusEvent.id))
-            .group_by(CampusEvent.school_name)
-            .order_by(func.count(CampusEvent.id).desc())
-            .limit(20)
-        )
-
-        by_source = [{"source": code, "count": count} for code, count in (await session.execute(by_source_stmt)).all()]
-        by_city = [{"city": city or "unknown", "count": count} for city, count in (await session.execute(by_city_stmt)).all()]
+        # Served from stats_rollups (kept current by upsert_events); rollup_counts is the full recount.
+        by_source = [
+            {"source": code, "count": count}
+            for code, count in await self.rollup_dao.top(session, "campus_events", "source")
+        ]
+        by_city = [
+            {"city": city or "unknown", "count": count}
+            for city, count in await self.rollup_dao.top(session, "campus_events", "city", limit=20)
+        ]
         by_school = [
             {"school": school or "unknown", "count": count}
-            for school, count in (await session.execute(by_school_stmt)).all()
+            for school, count in await self.rollup_dao.top(session, "campus_events", "school", limit=20)
         ]
         return {"by_source": by_source, "by_city": by_city, "by_school": by_school}
+
+    async def rollup_counts(self, session: AsyncSession) -> dict[tuple[str, str], int]:
+        """Full-table GROUP BY counts for every rollup dimension; used to reconcile drift."""
+        dimensions = (
+            (
+                "source",
+                select(Source.code, func.count(CampusEvent.id))
+                .join(CampusEvent, CampusEvent.source_id == Source.id)
+                .group_by(Source.code),
+            ),
+            ("city", select(CampusEvent.city, func.count(CampusEvent.id)).group_by(CampusEvent.city)),
+            (
+                "school",
+                select(CampusEvent.school_name, func.count(CampusEvent.id)).group_by(CampusEvent.school_name),
+            ),
+        )
+        counts: dict[tuple[str, str], int] = {}
+        for dimension, stmt in dimensions:
+            for bucket, count in (await session.execute(stmt)).all():
+                counts[(dimension, bucket or NULL_BUCKET)] = count
+        return counts
+
+
+def _contains(column: ColumnElement[str | None], value: str) -> ColumnElement[bool]:
+    """Case-insensitive substring filter with LIKE metacharacters in `value` taken literally."""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
@@ -0,0 +1,118 @@
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import ClauseElement, Executable, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+
+from app.core.cache import query_signature
+from app.core.config import get_settings
+
+CACHE_MAX_ENTRIES = 2048
+
+
+@dataclass(frozen=True)
+class CountResult:
+    total: int
+    exact: bool
+
+
+class _ExplainJson(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJson, "postgresql")
+def _compile_explain(element: _ExplainJson, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class _CountCache:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self.entries: OrderedDict[tuple[str, str], tuple[float, CountResult]] = OrderedDict()
+
+    def get(self, key: tuple[str, str]) -> CountResult | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= self.clock():
+            del self.entries[key]
+            return None
+        return result
+
+    def put(self, key: tuple[str, str], result: CountResult, ttl_seconds: float) -> None:
+        self.entries[key] = (self.clock() + ttl_seconds, result)
+        self.entries.move_to_end(key)
+        while len(self.entries) > CACHE_MAX_ENTRIES:
+            self.entries.popitem(last=False)
+
+    def clear(self, scope: str | None = None) -> None:
+        if scope is None:
+            self.entries.clear()
+            return
+        for key in [key for key in self.entries if key[0] == scope]:
+            del self.entries[key]
+
+
+_CACHE = _CountCache()
+
+
+def invalidate_counts(scope: str | None = None) -> None:
+    """Drop cached totals after a crawl commit; other workers catch up within the cache TTL."""
+    _CACHE.clear(scope)
+
+
+class TotalCounter:
+    """Count strategy for list endpoints.
+
+    Every count runs capped at APP_COUNT_EXACT_THRESHOLD + 1 rows, so it never scans a broad match
+    and a selective filter is always exact, however far off the planner's estimate is (it often
+    overshoots on `region_ids &&` and `search_vector @@`). Only a count that hits the cap falls
+    back to the planner's row estimate, flagged as approximate. Results are cached per normalized filter
+    signature for APP_COUNT_CACHE_TTL_SECONDS, so cursor paging does not recount every page.
+    """
+
+    def __init__(self, scope: str, cache: _CountCache | None = None) -> None:
+        self.scope = scope
+        self.cache = cache or _CACHE
+
+    async def count(
+        self, session: AsyncSession, stmt: Select, filters: dict[str, Any]
+    ) -> CountResult:
+        settings = get_settings()
+        key = (self.scope, query_signature(filters))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        threshold = settings.count_exact_threshold
+        if threshold > 0:
+            counted = await self.bounded_count(session, stmt, threshold + 1)
+            if counted <= threshold:
+                result = CountResult(counted, True)
+            else:
+                # The estimate can undershoot; past the cap the true total is only known to be larger.
+                result = CountResult(max(await self.estimate_rows(session, stmt), counted), False)
+        else:
+            result = CountResult(await self.estimate_rows(session, stmt), False)
+
+        if settings.count_cache_ttl_seconds > 0:
+            self.cache.put(key, result, settings.count_cache_ttl_seconds)
+        return result
+
+    async def estimate_rows(self, session: AsyncSession, stmt: Select) -> int:
+        raw = (await session.execute(_ExplainJson(stmt))).scalar_one()
+        plan = json.loads(raw) if isinstance(raw, str) else raw
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def bounded_count(self, session: AsyncSession, stmt: Select, limit: int) -> int:
+        count_stmt = select(func.count()).select_from(stmt.limit(limit).subquery())
+        return (await session.execute(count_stmt)).scalar_one()
@@ -0,0 +1,37 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crawler.types import ItemFailure
+from app.models.crawl_run import CrawlQuarantineItem
+from app.utils.time import now_utc
+
+
+class CrawlQuarantineDAO:
+    async def add_failures(
+        self,
+        session: AsyncSession,
+        *,
+        source_id: int,
+        run_id: int,
+        failures: list[ItemFailure],
+    ) -> int:
+        if not failures:
+            return 0
+        now = now_utc()
+        session.add_all(
+            [
+                CrawlQuarantineItem(
+                    source_id=source_id,
+                    run_id=run_id,
+                    external_id=failure.external_id,
+                    stage=failure.stage,
+                    error_type=failure.error_type,
+                    error=failure.error,
+                    payload_ref=failure.payload_ref,
+                    payload_json=failure.payload,
+                    created_at=now,
+                )
+                for failure in failures
+            ]
+        )
+        await session.flush()
+        return len(failures)
@@ -29,21 +29,74 @@ class CrawlRunDAO:
         crawled_count: int,
         inserted_count: int,
         updated_count: int,
+        failed_count: int = 0,
+        meta_json: dict | None = None,
+        partial: bool = False,
     ) -> None:
-        run.status = CrawlRunStatus.success
+        run.status = CrawlRunStatus.partial if partial else CrawlRunStatus.success
         run.finished_at = now_utc()
         run.crawled_count = crawled_count
         run.inserted_count = inserted_count
         run.updated_count = updated_count
+        run.failed_count = failed_count
+        run.meta_json = meta_json
         await session.flush()
 
-    async def finish_failed(self, session: AsyncSession, run: CrawlRun, reason: str) -> None:
+    async def mark_aborted(self, session: AsyncSession, run: CrawlRun, reason: str) -> None:
+        """A crawl killed mid-run: what arrived is stored, but the run is recorded as failed.
+
+        It left no resume cursor, so the next run starts over instead of resuming.
+        """
+        run.status = CrawlRunStatus.failed
+        run.error_summary = reason[:2000]
+        await session.flush()
+
+    async def finish_failed(
+        self,
+        session: AsyncSession,
+        run: CrawlRun,
+        reason: str,
+        failed_count: int | None = None,
+        timing_json: dict | None = None,
+    ) -> None:
         run.status = CrawlRunStatus.failed
         run.finished_at = now_utc()
         run.error_summary = reason[:2000]
-        run.failed_count += 1
+        # Item-level failures are counted when known; otherwise the run itself counts as one failure.
+        run.failed_count = failed_count if failed_count else run.failed_count + 1
+        run.timing_json = timing_json
+        await session.flush()
+
+    async def record_timing(self, session: AsyncSession, run: CrawlRun, timing_json: dict) -> None:
+        run.timing_json = timing_json
         await session.flush()
 
     async def get_by_id(self, session: AsyncSession, run_id: int) -> CrawlRun | None:
         result = await session.execute(select(CrawlRun).where(CrawlRun.id == run_id))
         return result.scalar_one_or_none()
+
+    async def get_resume_state(self, session: AsyncSession, source_id: int, before_run_id: int) -> dict:
+        """Resume cursor left by the source's previous run, if that run stopped on its deadline."""
+        stmt = (
+            select(CrawlRun)
+            .where(CrawlRun.source_id == source_id, CrawlRun.id < before_run_id)
+            .order_by(CrawlRun.id.desc())
+            .limit(1)
+        )
+        previous = (await session.execute(stmt)).scalar_one_or_none()
+        if previous is None or previous.status != CrawlRunStatus.partial:
+            return {}
+        resume = (previous.meta_json or {}).get("resume")
+        return dict(resume) if isinstance(resume, dict) else {}
+
+    async def list_recent_timings(
+        self, session: AsyncSession, source_id: int, limit: int = 20
+    ) -> list[dict]:
+        stmt = (
+            select(CrawlRun.timing_json)
+            .where(CrawlRun.source_id == source_id, CrawlRun.timing_json.is_not(None))
+            .order_by(CrawlRun.id.desc())
+            .limit(limit)
+        )
+        rows = (await session.execute(stmt)).scalars().all()
+        return [row for row in rows if isinstance(row, dict)]
@@ -0,0 +1,37 @@
+from sqlalchemy import func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job_body import JobBody
+
+
+class JobBodyDAO:
+    async def upsert(
+        self,
+        session: AsyncSession,
+        *,
+        job_id: int,
+        responsibilities: str | None,
+        qualifications: str | None,
+    ) -> bool:
+        """Write the job text; returns whether a row was inserted or actually changed."""
+        stmt = insert(JobBody).values(
+            job_id=job_id, responsibilities=responsibilities, qualifications=qualifications
+        )
+        # Unchanged text (the common re-crawl case) leaves the row and its TOAST chunks alone.
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobBody.job_id],
+            set_={
+                "responsibilities": stmt.excluded.responsibilities,
+                "qualifications": stmt.excluded.qualifications,
+                "updated_at": func.now(),
+            },
+            where=or_(
+                JobBody.responsibilities.is_distinct_from(stmt.excluded.responsibilities),
+                JobBody.qualifications.is_distinct_from(stmt.excluded.qualifications),
+            ),
+        ).returning(JobBody.job_id)
+        return (await session.execute(stmt)).scalar_one_or_none() is not None
+
+    async def get(self, session: AsyncSession, job_id: int) -> JobBody | None:
+        return await session.get(JobBody, job_id)
@@ -1,63 +1,172 @@
+import math
 from decimal import Decimal
 
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import ColumnElement, Select, case, false, func, or_, select, tuple_, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
+from app.crawler.timing import timed
 from app.crawler.types import NormalizedJob
 from app.dao.company_dao import CompanyDAO
+from app.dao.counting import CountResult, TotalCounter
+from app.dao.job_body_dao import JobBodyDAO
+from app.dao.job_search_doc_dao import JobSearchDocDAO
 from app.dao.location_dao import LocationDAO
+from app.dao.pagination import InvalidCursorError, Keyset, SortKey, page_window
+from app.dao.region_dao import RegionDAO
+from app.dao.stats_rollup_dao import NULL_BUCKET, RollupDelta, StatsRollupDAO
 from app.models.company import Company
 from app.models.job import Job
+from app.models.job_body import JobBody
+from app.models.job_search_doc import JobSearchDoc
 from app.models.location import Location
 from app.models.source import Source
+from app.search.ranking import RERANK_FIELDS, rerank
+from app.utils.search_tokens import build_search_document, build_search_query
+
+# Cursor-capable sort orders; each is backed by an expression index of the same shape on
+# job_search_docs.
+JOB_KEYSETS = {
+    "time": Keyset(
+        "time",
+        (
+            SortKey(JobSearchDoc.published_at, "'-infinity'::timestamptz"),
+            SortKey(JobSearchDoc.job_id),
+        ),
+    ),
+    "salary": Keyset(
+        "salary",
+        (
+            SortKey(JobSearchDoc.salary_monthly_mid, "-1"),
+            SortKey(JobSearchDoc.published_at, "'-infinity'::timestamptz"),
+            SortKey(JobSearchDoc.job_id),
+        ),
+    ),
+}
+
+# Columns a list row needs; rows come back as plain tuples, never hydrated into the session.
+JOB_LIST_COLUMNS = (
+    JobSearchDoc.job_id,
+    JobSearchDoc.title,
+    JobSearchDoc.company_name,
+    JobSearchDoc.city,
+    JobSearchDoc.salary_min,
+    JobSearchDoc.salary_max,
+    JobSearchDoc.salary_currency,
+    JobSearchDoc.salary_period,
+    JobSearchDoc.salary_monthly_mid,  # salary cursor key
+    JobSearchDoc.education_requirement,
+    JobSearchDoc.published_at,
+    JobSearchDoc.source_code,
+)
+
+# Facet buckets on the CNY/month midpoint: (exclusive upper bound, label); the last is open-ended.
+SALARY_FACET_BUCKETS = (
+    (5000, "0-5k"),
+    (10000, "5-10k"),
+    (15000, "10-15k"),
+    (20000, "15-20k"),
+    (30000, "20-30k"),
+    (50000, "30-50k"),
+)
+SALARY_FACET_TOP = "50k+"
+SALARY_FACET_LABELS = (*(label for _, label in SALARY_FACET_BUCKETS), SALARY_FACET_TOP, "unknown")
+FACET_NAMES = ("city", "category", "education", "source", "salary")
+FACET_LIMIT = 20
+
+
+def salary_filter(
+    salary_min: Decimal | float | None, salary_max: Decimal | float | None, *, include_unknown: bool
+) -> ColumnElement[bool]:
+    """Jobs whose CNY/month range lies within [salary_min, salary_max] (either end optional).
+
+    Containment on `salary_monthly_range` is answered by its GiST index; jobs with an unknown
+    salary are added (GiST also indexes NULLs) only when `include_unknown` is set.
+    """
+    low = math.ceil(salary_min) if salary_min is not None else None
+    high = math.floor(salary_max) if salary_max is not None else None
+    if low is not None and high is not None and low > high:
+        known = false()  # no integer salary fits; int4range() would reject the bounds
+    else:
+        known = JobSearchDoc.salary_monthly_range.contained_by(func.int4range(low, high, "[]"))
+    return or_(known, JobSearchDoc.salary_monthly_range.is_(None)) if include_unknown else known
 
 
 class JobDAO:
     def __init__(self) -> None:
+        self.counter = TotalCounter("jobs")
         self.company_dao = CompanyDAO()
         self.location_dao = LocationDAO()
+        self.region_dao = RegionDAO()
+        self.rollup_dao = StatsRollupDAO()
+        self.search_doc_dao = JobSearchDocDAO()
+        self.body_dao = JobBodyDAO()
 
     async def upsert_jobs(self, session: AsyncSession, source_id: int, jobs: list[NormalizedJob]) -> tuple[int, int]:
         inserted_count = 0
         updated_count = 0
+        rollup = RollupDelta()
+        companies: dict[int, Company] = {}
+        locations: dict[int, Location] = {}
+        location_by_key: dict[str, Location] = {}
+        with timed("db_read"):
+            source = await session.get(Source, source_id)
 
         for normalized in jobs:
-            company = await self.company_dao.get_or_create(session, normalized.company_name)
-            location = await self.location_dao.get_or_create(
-                session=session,
-                normalized_key=normalized.location_key,
-                province=normalized.province,
-                city=normalized.city,
-                district=normalized.district,
-            )
+            with timed("db_read"):
+                company = await self.company_dao.get_or_create(session, normalized.company_name)
+                # A location key fixes province/city/district, so one upsert per key per batch.
+                location = location_by_key.get(normalized.location_key)
+                if location is None:
+                    location = await self.location_dao.get_or_create(
+                        session=session,
+                        normalized_key=normalized.location_key,
+                        province=normalized.province,
+                        city=normalized.city,
+                        district=normalized.district,
+                    )
+                    location_by_key[normalized.location_key] = location
 
-            search_text = " ".join(
-                [
-                    normalized.title,
-                    normalized.responsibilities or "",
-                    normalized.qualifications or "",
-                    " ".join(normalized.skills),
-                ]
+            search_document = normalized.search_document or build_search_document(
+                normalized.title,
+                normalized.responsibilities,
+                normalized.qualifications,
+                " ".join(normalized.skills),
             )
 
-            existing_stmt = select(Job).where(
-                Job.source_id == source_id,
-                Job.external_job_id == normalized.external_job_id,
-            )
-            existing_external = (await session.execute(existing_stmt)).scalar_one_or_none()
-            existing_fingerprint = None
-            if existing_external is None:
-                existing_fingerprint_stmt = select(Job).where(
+            with timed("db_read"):
+                existing_stmt = select(Job).where(
                     Job.source_id == source_id,
-                    Job.dedup_fingerprint == normalized.dedup_fingerprint,
+                    Job.external_job_id == normalized.external_job_id,
                 )
-                existing_fingerprint = (await session.execute(existing_fingerprint_stmt)).scalar_one_or_none()
+                existing_external = (await session.execute(existing_stmt)).scalar_one_or_none()
+                existing_fingerprint = None
+                if existing_external is None:
+                    existing_fingerprint_stmt = select(Job).where(
+                        Job.source_id == source_id,
+                        Job.dedup_fingerprint == normalized.dedup_fingerprint,
+                    )
+                    existing_fingerprint = (
+                        await session.execute(existing_fingerprint_stmt)
+                    ).scalar_one_or_none()
 
             existing = existing_external or existing_fingerprint
+            has_changes = False
             if existing is None:
                 inserted_count += 1
+                rollup.add("source", source.code)
+                rollup.add("city", location.city)
+                rollup.add("category", normalized.job_category)
             else:
+                if existing.location_id is None:
+                    rollup.add("city", location.city)
+                elif existing.location_id != location.id:
+                    with timed("db_read"):
+                        previous_location = await session.get(Location, existing.location_id)
+                    previous_city = previous_location.city if previous_location else None
+                    rollup.move("city", previous_city, location.city)
+                rollup.move("category", existing.job_category, normalized.job_category)
                 # Count as "updated" only when core business fields changed (exclude crawl timestamps).
                 has_changes = any(
                     [
@@ -79,16 +188,12 @@ class JobDAO:
                         existing.education_requirement != normalized.education_requirement,
                         existing.experience_min_months != normalized.experience_min_months,
                         existing.experience_max_months != normalized.experience_max_months,
-                        existing.responsibilities != normalized.responsibilities,
-                        existing.qualifications != normalized.qualifications,
                         (existing.benefits_json or []) != (normalized.benefits or []),
                         (existing.tags_json or []) != (normalized.tags or []),
                         existing.updated_at_source != normalized.updated_at_source,
                         existing.status != "active",
                     ]
                 )
-                if has_changes:
-                    updated_count += 1
 
             if existing_external is None and existing_fingerprint is not None:
                 # A different external ID maps to the same business fingerprint. Keep one canonical row and update it.
@@ -114,17 +219,16 @@ class JobDAO:
                         education_requirement=normalized.education_requirement,
                         experience_min_months=normalized.experience_min_months,
                         experience_max_months=normalized.experience_max_months,
-                        responsibilities=normalized.responsibilities,
-                        qualifications=normalized.qualifications,
                         benefits_json=normalized.benefits,
                         tags_json=normalized.tags,
                         updated_at_source=normalized.updated_at_source,
                         last_crawled_at=normalized.last_crawled_at,
-                        search_vector=func.to_tsvector("simple", search_text),
+                        search_vector=func.to_tsvector("simple", search_document),
                         status="active",
                     )
                 )
                 await session.execute(update_stmt)
+                job_id = existing_fingerprint.id
             else:
                 stmt = insert(Job).values(
                     source_id=source_id,
@@ -147,15 +251,13 @@ class JobDAO:
                     education_requirement=normalized.education_requirement,
                     experience_min_months=normalized.experience_min_months,
                     experience_max_months=normalized.experience_max_months,
-                    responsibilities=normalized.responsibilities,
-                    qualifications=normalized.qualifications,
                     benefits_json=normalized.benefits,
                     tags_json=normalized.tags,
                     published_at=normalized.published_at,
                     updated_at_source=normalized.updated_at_source,
                     first_crawled_at=normalized.first_crawled_at,
                     last_crawled_at=normalized.last_crawled_at,
-                    search_vector=func.to_tsvector("simple", search_text),
+                    search_vector=func.to_tsvector("simple", search_document),
                     status="active",
                 )
                 stmt = stmt.on_conflict_do_update(
@@ -179,19 +281,41 @@ class JobDAO:
                         "education_requirement": normalized.education_requirement,
                         "experience_min_months": normalized.experience_min_months,
                         "experience_max_months": normalized.experience_max_months,
-                        "responsibilities": normalized.responsibilities,
-                        "qualifications": normalized.qualifications,
                         "benefits_json": normalized.benefits,
                         "tags_json": normalized.tags,
                         "updated_at_source": normalized.updated_at_source,
                         "last_crawled_at": normalized.last_crawled_at,
-                        "search_vector": func.to_tsvector("simple", search_text),
+                        "search_vector": func.to_tsvector("simple", search_document),
                         "status": "active",
                     },
-                )
+                ).returning(Job.id)
+
+                job_id = (await session.execute(stmt)).scalar_one()
 
-                await session.execute(stmt)
+            body_changed = await self.body_dao.upsert(
+                session,
+                job_id=job_id,
+                responsibilities=normalized.responsibilities,
+                qualifications=normalized.qualifications,
+            )
+            if existing is not None and (has_changes or body_changed):
+                updated_count += 1
+            await self.search_doc_dao.upsert(
+                session,
+                job_id=job_id,
+                source=source,
+                company=company,
+                location=location,
+                normalized=normalized,
+                search_document=search_document,
+            )
+            companies[company.id] = company
+            locations[location.id] = location
 
+        # The company/location upserts may have renamed rows other jobs' docs also embed.
+        await self.search_doc_dao.sync_companies(session, companies.values())
+        await self.search_doc_dao.sync_locations(session, locations.values())
+        await self.rollup_dao.apply(session, "jobs", rollup)
         await session.flush()
         return inserted_count, updated_count
 
@@ -213,83 +337,184 @@ class JobDAO:
         industry: str | None,
         source_code: str | None,
         sort_by: str,
+        cursor: str | None = None,
+        facets: bool = False,
+        salary_unknown: bool = True,
     ) -> dict:
-        stmt = (
-            select(Job, Company.display_name.label("company_name"), Source.code.label("source_code"), Location.city)
-            .join(Company, Company.id == Job.company_id)
-            .join(Source, Source.id == Job.source_id)
-            .join(Location, Location.id == Job.location_id, isouter=True)
-        )
+        # Served from the job_search_docs read model alone: no joins, no full Job entity.
+        stmt = select(*JOB_LIST_COLUMNS)
 
-        if keyword:
-            ts_query = func.plainto_tsquery("simple", keyword)
-            stmt = stmt.where(
-                or_(
-                    Job.search_vector.op("@@")(ts_query),
-                    Job.title.ilike(f"%{keyword}%"),
-                    Job.responsibilities.ilike(f"%{keyword}%"),
-                )
-            )
+        # Keywords are tokenized like the stored documents, so the GIN index alone answers them.
+        search_query = build_search_query(keyword)
+        ts_query = func.to_tsquery("simple", search_query) if search_query else None
+        if ts_query is not None:
+            stmt = stmt.where(JobSearchDoc.search_vector.op("@@")(ts_query))
 
-        if province:
-            stmt = stmt.where(Location.province == province)
-        if city:
-            stmt = stmt.where(Location.city == city)
-        if district:
-            stmt = stmt.where(Location.district == district)
+        for level, name in (("province", province), ("city", city), ("district", district)):
+            if name:
+                # Any node of that level with the name, e.g. every city-level "朝阳".
+                region_ids = await self.region_dao.filter_ids(session, level, name)
+                stmt = stmt.where(JobSearchDoc.region_ids.overlap(list(region_ids)) if region_ids else false())
         if category:
-            stmt = stmt.where(Job.job_category == category)
+            stmt = stmt.where(JobSearchDoc.job_category == category)
         if education:
-            stmt = stmt.where(Job.education_requirement == education)
+            stmt = stmt.where(JobSearchDoc.education_requirement == education)
         if experience_min is not None:
-            stmt = stmt.where(or_(Job.experience_min_months.is_(None), Job.experience_min_months >= experience_min))
-        if salary_min is not None:
-            stmt = stmt.where(or_(Job.salary_min.is_(None), Job.salary_min >= salary_min))
-        if salary_max is not None:
-            stmt = stmt.where(or_(Job.salary_max.is_(None), Job.salary_max <= salary_max))
+            stmt = stmt.where(
+                or_(
+                    JobSearchDoc.experience_min_months.is_(None),
+                    JobSearchDoc.experience_min_months >= experience_min,
+                )
+            )
+        if salary_min is not None or salary_max is not None:
+            stmt = stmt.where(salary_filter(salary_min, salary_max, include_unknown=salary_unknown))
         if industry:
-            stmt = stmt.where(Company.industry == industry)
+            stmt = stmt.where(JobSearchDoc.industry == industry)
         if source_code:
-            stmt = stmt.where(Source.code == source_code)
+            stmt = stmt.where(JobSearchDoc.source_code == source_code)
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = (await session.execute(count_stmt)).scalar_one()
+        # Relevance ranks are not a stable key, so only the time/salary orders take cursors.
+        keyset = JOB_KEYSETS.get(sort_by, JOB_KEYSETS["time"])
+        if sort_by == "relevance" and ts_query is not None:
+            keyset = None
+        if cursor and keyset is None:
+            raise InvalidCursorError(f"sort order {sort_by} does not support cursors")
+        after = keyset.after(keyset.decode(cursor)) if cursor and keyset is not None else None
 
-        if sort_by == "salary":
-            stmt = stmt.order_by(Job.salary_max.desc().nullslast(), Job.published_at.desc().nullslast())
-        elif sort_by == "relevance" and keyword:
-            stmt = stmt.order_by(func.ts_rank_cd(Job.search_vector, func.plainto_tsquery("simple", keyword)).desc())
+        facet_counts = None
+        if facets:
+            # The facet pass already visited every matching row; its grand-total row is the total.
+            facet_counts, total = await self.facet_counts(session, stmt)
+            counted = CountResult(total, True)
         else:
-            stmt = stmt.order_by(Job.published_at.desc().nullslast(), Job.id.desc())
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-        rows = (await session.execute(stmt)).all()
-
-        items = []
-        for job, company_name, src_code, city_value in rows:
-            items.append(
+            counted = await self.counter.count(
+                session,
+                stmt,
                 {
-                    "id": job.id,
-                    "title": job.title,
-                    "company_name": company_name,
-                    "city": city_value,
-                    "salary_min": float(job.salary_min) if job.salary_min is not None else None,
-                    "salary_max": float(job.salary_max) if job.salary_max is not None else None,
-                    "salary_currency": job.salary_currency,
-                    "salary_period": job.salary_period,
-                    "education_requirement": getattr(job.education_requirement, "value", str(job.education_requirement)),
-                    "published_at": job.published_at,
-                    "source_code": src_code,
-                }
+                    "keyword": search_query,
+                    "province": province,
+                    "city": city,
+                    "district": district,
+                    "category": category,
+                    "education": education,
+                    "experience_min": experience_min,
+                    "salary_min": salary_min,
+                    "salary_max": salary_max,
+                    "salary_unknown": salary_unknown,
+                    "industry": industry,
+                    "source_code": source_code,
+                },
             )
 
+        if keyset is None:
+            rows, has_more = await self.relevance_page(session, stmt, search_query, page, page_size)
+        else:
+            stmt = stmt.order_by(*keyset.order_by())
+            stmt = stmt.where(after) if after is not None else stmt.offset((page - 1) * page_size)
+            rows, has_more = page_window((await session.execute(stmt.limit(page_size + 1))).all(), page_size)
+
+        items = [
+            {
+                "id": row.job_id,
+                "title": row.title,
+                "company_name": row.company_name,
+                "city": row.city,
+                "salary_min": float(row.salary_min) if row.salary_min is not None else None,
+                "salary_max": float(row.salary_max) if row.salary_max is not None else None,
+                "salary_currency": row.salary_currency,
+                "salary_period": row.salary_period,
+                "education_requirement": getattr(
+                    row.education_requirement, "value", str(row.education_requirement)
+                ),
+                "published_at": row.published_at,
+                "source_code": row.source_code,
+            }
+            for row in rows
+        ]
+
         return {
             "items": items,
             "page": page,
             "page_size": page_size,
-            "total": total,
+            "total": counted.total,
+            "total_exact": counted.exact,
+            "next_cursor": keyset.cursor_for(rows[-1]) if keyset is not None and has_more else None,
+            **({"facets": facet_counts} if facet_counts is not None else {}),
         }
 
+    async def relevance_page(
+        self, session: AsyncSession, stmt: Select, search_query: str, page: int, page_size: int
+    ) -> tuple[list, bool]:
+        """One page of two-phase relevance order (see app.search.ranking).
+
+        The first APP_SEARCH_RERANK_WINDOW matches in `rank_prior` order are reranked in Python;
+        the rest follow in `rank_prior` order. Both parts are deterministic, so offset pages
+        neither repeat nor skip rows, and no rank is computed for the full match set.
+        """
+        window = get_settings().search_rerank_window
+        stmt = stmt.add_columns(*(getattr(JobSearchDoc, name) for name in RERANK_FIELDS)).order_by(
+            JobSearchDoc.rank_prior.desc(), JobSearchDoc.job_id.desc()
+        )
+        start, stop = (page - 1) * page_size, page * page_size + 1
+        rows: list = []
+        if start < window:
+            candidates = (await session.execute(stmt.limit(window))).all()
+            rows = rerank(candidates, search_query)[start:stop]
+            if len(candidates) < window:
+                return page_window(rows, page_size)  # the window held every match
+        if len(rows) < stop - start:
+            tail = stmt.offset(max(start, window)).limit(stop - start - len(rows))
+            rows.extend((await session.execute(tail)).all())
+        return page_window(rows, page_size)
+
+    async def facet_counts(self, session: AsyncSession, stmt: Select) -> tuple[dict[str, list[dict]], int]:
+        """City / category / education / source / salary counts and the total for a filtered
+        search, in one scan.
+
+        GROUPING SETS aggregates every facet, plus the empty set for the total, over the same
+        filtered rows; GROUPING() tells which facet a result row belongs to, since a NULL value
+        is itself a bucket ("unknown").
+        """
+        salary_bucket = case(
+            (JobSearchDoc.salary_monthly_mid.is_(None), "unknown"),
+            *((JobSearchDoc.salary_monthly_mid < upper, label) for upper, label in SALARY_FACET_BUCKETS),
+            else_=SALARY_FACET_TOP,
+        )
+        matched = stmt.with_only_columns(
+            JobSearchDoc.city.label("city"),
+            JobSearchDoc.job_category.label("category"),
+            JobSearchDoc.education_requirement.label("education"),
+            JobSearchDoc.source_code.label("source"),
+            salary_bucket.label("salary"),
+        ).subquery()
+        columns = [matched.c[name] for name in FACET_NAMES]
+        facet_stmt = select(
+            *columns,
+            *(func.grouping(column) for column in columns),
+            func.count(),
+        ).group_by(func.grouping_sets(*columns, tuple_()))
+
+        buckets: dict[str, list[dict]] = {name: [] for name in FACET_NAMES}
+        total = 0
+        width = len(FACET_NAMES)
+        for row in (await session.execute(facet_stmt)).all():
+            grouping = list(row[width : 2 * width])
+            if 0 not in grouping:
+                total = row[-1]  # the empty grouping set: every matching row
+                continue
+            # Exactly one facet column is grouped (GROUPING() == 0) in each single-column set.
+            index = grouping.index(0)
+            value = getattr(row[index], "value", row[index])
+            buckets[FACET_NAMES[index]].append({"value": value or "unknown", "count": row[-1]})
+
+        for name, items in buckets.items():
+            if name == "salary":
+                items.sort(key=lambda item: SALARY_FACET_LABELS.index(item["value"]))
+            else:
+                items.sort(key=lambda item: (-item["count"], str(item["value"])))
+                del items[FACET_LIMIT:]
+        return buckets, total
+
     async def get_job_detail(self, session: AsyncSession, job_id: int) -> dict | None:
         stmt = (
             select(
@@ -297,17 +522,20 @@ class JobDAO:
                 Company.display_name.label("company_name"),
                 Source.code.label("source_code"),
                 Location.city.label("city"),
+                JobBody.responsibilities,
+                JobBody.qualifications,
             )
             .join(Company, Company.id == Job.company_id)
             .join(Source, Source.id == Job.source_id)
             .join(Location, Location.id == Job.location_id, isouter=True)
+            .join(JobBody, JobBody.job_id == Job.id, isouter=True)
             .where(Job.id == job_id)
         )
         row = (await session.execute(stmt)).first()
         if row is None:
             return None
 
-        job, company_name, source_code, city = row
+        job, company_name, source_code, city, responsibilities, qualifications = row
         return {
             "id": job.id,
             "title": job.title,
@@ -323,38 +551,25 @@ class JobDAO:
             "source_url": job.source_url,
             "job_category": job.job_category,
             "seniority": job.seniority,
-            "responsibilities": job.responsibilities,
-            "qualifications": job.qualifications,
+            "responsibilities": responsibilities,
+            "qualifications": qualifications,
             "tags": job.tags_json or [],
             "benefits": job.benefits_json or [],
         }
 
     async def basic_stats(self, session: AsyncSession) -> dict:
-        by_source_stmt = (
-            select(Source.code, func.count(Job.id))
-            .join(Job, Job.source_id == Source.id)
-            .group_by(Source.code)
-            .order_by(Source.code.asc())
-        )
-        by_city_stmt = (
-            select(Location.city, func.count(Job.id))
-            .join(Job, Job.location_id == Location.id)
-            .group_by(Location.city)
-            .order_by(func.count(Job.id).desc())
-            .limit(20)
-        )
-        by_category_stmt = (
-            select(Job.job_category, func.count(Job.id))
-            .group_by(Job.job_category)
-            .order_by(func.count(Job.id).desc())
-            .limit(20)
-        )
-
-        by_source = [{"source": code, "count": count} for code, count in (await session.execute(by_source_stmt)).all()]
-        by_city = [{"city": city, "count": count} for city, count in (await session.execute(by_city_stmt)).all()]
+        # Served from stats_rollups (kept current by upsert_jobs); rollup_counts is the full recount.
+        by_source = [
+            {"source": code, "count": count}
+            for code, count in await self.rollup_dao.top(session, "jobs", "source")
+        ]
+        by_city = [
+            {"city": city, "count": count}
+            for city, count in await self.rollup_dao.top(session, "jobs", "city", limit=20)
+        ]
         by_category = [
             {"category": category or "unknown", "count": count}
-            for category, count in (await session.execute(by_category_stmt)).all()
+            for category, count in await self.rollup_dao.top(session, "jobs", "category", limit=20)
         ]
 
         return {
@@ -363,6 +578,25 @@ class JobDAO:
             "by_category": by_category,
         }
 
+    async def rollup_counts(self, session: AsyncSession) -> dict[tuple[str, str], int]:
+        """Full-table GROUP BY counts for every rollup dimension; used to reconcile drift."""
+        by_source_stmt = (
+            select(Source.code, func.count(Job.id)).join(Job, Job.source_id == Source.id).group_by(Source.code)
+        )
+        by_city_stmt = (
+            select(Location.city, func.count(Job.id))
+            .join(Job, Job.location_id == Location.id)
+            .group_by(Location.city)
+        )
+        by_category_stmt = select(Job.job_category, func.count(Job.id)).group_by(Job.job_category)
+
+        counts: dict[tuple[str, str], int] = {}
+        dimensions = (("source", by_source_stmt), ("city", by_city_stmt), ("category", by_category_stmt))
+        for dimension, stmt in dimensions:
+            for bucket, count in (await session.execute(stmt)).all():
+                counts[(dimension, bucket or NULL_BUCKET)] = count
+        return counts
+
     async def exists_by_id(self, session: AsyncSession, job_id: int) -> bool:
         stmt = select(Job.id).where(Job.id == job_id)
         return (await session.execute(stmt)).scalar_one_or_none() is not None
@@ -0,0 +1,152 @@
+from collections.abc import AsyncIterator, Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import Range, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crawler.types import NormalizedJob
+from app.models.company import Company
+from app.models.job_search_doc import JobSearchDoc
+from app.models.location import Location
+from app.models.source import Source
+from app.search.ranking import QUALITY_DAYS, SECONDS_PER_DAY, quality_score, rank_prior
+from app.utils.salary import monthly_salary_midpoint, monthly_salary_range
+
+# Everything the in-process search index (app.search.job_index) keeps per document.
+JOB_INDEX_COLUMNS = (
+    JobSearchDoc.job_id,
+    JobSearchDoc.title,
+    JobSearchDoc.company_name,
+    JobSearchDoc.industry,
+    JobSearchDoc.city,
+    JobSearchDoc.region_ids,
+    JobSearchDoc.job_category,
+    JobSearchDoc.education_requirement,
+    JobSearchDoc.experience_min_months,
+    JobSearchDoc.salary_min,
+    JobSearchDoc.salary_max,
+    JobSearchDoc.salary_currency,
+    JobSearchDoc.salary_period,
+    JobSearchDoc.salary_monthly_mid,
+    func.lower(JobSearchDoc.salary_monthly_range).label("salary_monthly_low"),
+    # Canonical int4range upper bounds are exclusive.
+    (func.upper(JobSearchDoc.salary_monthly_range) - 1).label("salary_monthly_high"),
+    JobSearchDoc.published_at,
+    JobSearchDoc.source_code,
+    JobSearchDoc.updated_at,
+)
+
+
+class JobSearchDocDAO:
+    async def upsert(
+        self,
+        session: AsyncSession,
+        *,
+        job_id: int,
+        source: Source,
+        company: Company,
+        location: Location | None,
+        normalized: NormalizedJob,
+        search_document: str,
+    ) -> None:
+        quality = quality_score(
+            salary_max=normalized.salary_max,
+            education=normalized.education_requirement,
+            experience_min_months=normalized.experience_min_months,
+            city=normalized.city,
+            responsibilities=normalized.responsibilities,
+            qualifications=normalized.qualifications,
+        )
+        monthly = monthly_salary_range(
+            normalized.salary_min, normalized.salary_max, normalized.salary_currency, normalized.salary_period
+        )
+        values = {
+            "source_id": source.id,
+            "source_code": source.code,
+            "company_id": company.id,
+            "company_name": company.display_name,
+            "industry": company.industry,
+            "location_id": location.id if location else None,
+            "province": location.province if location else None,
+            "city": location.city if location else None,
+            "district": location.district if location else None,
+            "region_ids": (location.region_ids or []) if location else [],
+            "title": normalized.title,
+            "job_category": normalized.job_category,
+            "education_requirement": normalized.education_requirement,
+            "experience_min_months": normalized.experience_min_months,
+            "salary_min": normalized.salary_min,
+            "salary_max": normalized.salary_max,
+            "salary_currency": normalized.salary_currency,
+            "salary_period": normalized.salary_period,
+            "salary_monthly_mid": monthly_salary_midpoint(monthly),
+            "salary_monthly_range": Range(*monthly, bounds="[]") if monthly is not None else None,
+            "search_vector": func.to_tsvector("simple", search_document),
+            "quality_score": quality,
+        }
+        stmt = insert(JobSearchDoc).values(
+            job_id=job_id,
+            published_at=normalized.published_at,
+            rank_prior=rank_prior(quality, normalized.published_at),
+            **values,
+        )
+        # published_at is first-seen like on jobs, so re-crawls keep the row's place in time order;
+        # rank_prior is recomputed from the stored value (SQL twin of ranking.rank_prior).
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobSearchDoc.job_id],
+            set_={
+                **values,
+                "rank_prior": func.coalesce(func.extract("epoch", JobSearchDoc.published_at), 0)
+                / SECONDS_PER_DAY
+                + quality * QUALITY_DAYS,
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(stmt)
+
+    async def sync_companies(self, session: AsyncSession, companies: Iterable[Company]) -> None:
+        """Copy renamed / re-classified companies onto every doc that embeds them."""
+        for company in companies:
+            await session.execute(
+                update(JobSearchDoc)
+                .where(
+                    JobSearchDoc.company_id == company.id,
+                    (JobSearchDoc.company_name != company.display_name)
+                    | JobSearchDoc.industry.is_distinct_from(company.industry),
+                )
+                .values(company_name=company.display_name, industry=company.industry)
+            )
+
+    async def sync_locations(self, session: AsyncSession, locations: Iterable[Location]) -> None:
+        for location in locations:
+            await session.execute(
+                update(JobSearchDoc)
+                .where(
+                    JobSearchDoc.location_id == location.id,
+                    JobSearchDoc.province.is_distinct_from(location.province)
+                    | JobSearchDoc.city.is_distinct_from(location.city)
+                    | JobSearchDoc.district.is_distinct_from(location.district)
+                    | (JobSearchDoc.region_ids != (location.region_ids or [])),
+                )
+                .values(
+                    province=location.province,
+                    city=location.city,
+                    district=location.district,
+                    region_ids=location.region_ids or [],
+                )
+            )
+
+    async def iter_index_docs(
+        self, session: AsyncSession, *, since: datetime | None = None, batch_size: int = 5000
+    ) -> AsyncIterator[list[Mapping[str, Any]]]:
+        """Stream docs (all, or updated since `since`) with their search lexemes as `terms`."""
+        stmt = select(
+            *JOB_INDEX_COLUMNS, func.tsvector_to_array(JobSearchDoc.search_vector).label("terms")
+        )
+        if since is not None:
+            stmt = stmt.where(JobSearchDoc.updated_at >= since)
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for batch in result.mappings().partitions(batch_size):
+            yield batch
@@ -1,11 +1,20 @@
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dao.job_search_doc_dao import JobSearchDocDAO
+from app.dao.region_dao import RegionDAO
+from app.models.job import Job
+from app.models.job_search_doc import JobSearchDoc
 from app.models.location import Location
+from app.utils.location import normalize_location, stored_location_text
 
 
 class LocationDAO:
+    def __init__(self) -> None:
+        self.region_dao = RegionDAO()
+        self.search_doc_dao = JobSearchDocDAO()
+
     async def get_or_create(
         self,
         session: AsyncSession,
@@ -26,12 +35,56 @@ class LocationDAO:
             set_={"province": province, "city": city, "district": district},
         ).returning(Location)
         result = await session.execute(stmt)
-        row = result.scalar_one_or_none()
-        if row is not None:
-            return row
-
-        fallback = await session.execute(select(Location).where(Location.normalized_key == normalized_key))
-        location = fallback.scalar_one_or_none()
+        location = result.scalar_one_or_none()
+        if location is None:
+            fallback = await session.execute(select(Location).where(Location.normalized_key == normalized_key))
+            location = fallback.scalar_one_or_none()
         if location is None:
             raise RuntimeError("Failed to upsert location")
+        if location.region_ids is None:
+            # First sighting: attach the region path once; later jobs copy it from the row.
+            location.region_ids = await self.region_dao.ensure_path(session, province, city, district)
         return location
+
+    async def recanonicalize(self, session: AsyncSession) -> dict[str, int]:
+        """Re-resolve every row against the current gazetteer; the caller commits.
+
+        A row whose key changed is re-keyed in place, or merged into the row already holding
+        the new key: its jobs and search docs move over and it is deleted. Stats rollups are
+        left to StatsRollupService.reconcile.
+        """
+        stats = {"checked": 0, "rekeyed": 0, "merged": 0}
+        changed: dict[int, Location] = {}
+        rows = (await session.execute(select(Location).order_by(Location.id))).scalars().all()
+        for location in rows:
+            text = stored_location_text(location.normalized_key, location.province, location.city, location.district)
+            if text is None:
+                continue
+            stats["checked"] += 1
+            province, city, district, key = normalize_location(text)
+            if key == location.normalized_key:
+                continue
+            target = (
+                await session.execute(select(Location).where(Location.normalized_key == key))
+            ).scalar_one_or_none()
+            if target is None:
+                location.normalized_key = key
+                location.province, location.city, location.district = province, city, district
+                location.region_ids = await self.region_dao.ensure_path(session, province, city, district)
+                await session.flush()
+                changed[location.id] = location
+                stats["rekeyed"] += 1
+                continue
+            if target.region_ids is None:
+                target.region_ids = await self.region_dao.ensure_path(session, province, city, district)
+            await session.execute(update(Job).where(Job.location_id == location.id).values(location_id=target.id))
+            await session.execute(
+                update(JobSearchDoc).where(JobSearchDoc.location_id == location.id).values(location_id=target.id)
+            )
+            changed.pop(location.id, None)
+            changed[target.id] = target
+            await session.delete(location)
+            await session.flush()
+            stats["merged"] += 1
+        await self.search_doc_dao.sync_locations(session, changed.values())
+        return stats
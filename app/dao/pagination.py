@@ -0,0 +1,105 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, literal, literal_column, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """The cursor is malformed or was issued for a different sort order."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    column: Any
+    # SQL literal standing in for NULL so a nullable column sorts like NULLS LAST while the key
+    # stays comparable as a row value; it must match the expression index text exactly.
+    null_as: str | None = None
+
+    def expr(self) -> ColumnElement:
+        if self.null_as is None:
+            return self.column
+        return func.coalesce(self.column, literal_column(self.null_as))
+
+    def bound(self, value: Any) -> ColumnElement:
+        if value is None and self.null_as is not None:
+            return literal_column(self.null_as)
+        return literal(value, self.column.type)
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """One sort order that supports opaque cursors.
+
+    All keys share one direction and end with a unique column, so "rows after the cursor" is a
+    single row-value comparison that an index on the same expressions answers as a range scan.
+    Rows inserted behind the cursor never shift the pages that follow it.
+    """
+
+    name: str
+    keys: tuple[SortKey, ...]
+    descending: bool = True
+
+    def order_by(self) -> list[ColumnElement]:
+        return [key.expr().desc() if self.descending else key.expr().asc() for key in self.keys]
+
+    def after(self, values: list[Any]) -> ColumnElement:
+        row = tuple_(*(key.expr() for key in self.keys))
+        bound = tuple_(*(key.bound(value) for key, value in zip(self.keys, values, strict=True)))
+        return row < bound if self.descending else row > bound
+
+    def cursor_for(self, row: Any) -> str:
+        """Cursor pointing just past `row`, an ORM object or result row carrying every key column."""
+        return self.encode([getattr(row, key.column.key) for key in self.keys])
+
+    def encode(self, values: list[Any]) -> str:
+        payload = {"k": self.name, "v": [_dump_value(value) for value in values]}
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode(self, cursor: str) -> list[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            values = payload["v"]
+            if payload["k"] != self.name or len(values) != len(self.keys):
+                raise InvalidCursorError(f"cursor does not match sort order {self.name}")
+            return [_load_value(key, value) for key, value in zip(self.keys, values, strict=True)]
+        except InvalidCursorError:
+            raise
+        except (binascii.Error, InvalidOperation, TypeError, KeyError, ValueError) as exc:
+            raise InvalidCursorError("malformed cursor") from exc
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _load_value(key: SortKey, value: Any) -> Any:
+    if value is None:
+        if key.null_as is None:
+            raise InvalidCursorError("cursor value must not be null")
+        return None
+    python_type = key.column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(str(value))
+    if python_type is int:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise InvalidCursorError("cursor value must be an integer")
+        return value
+    return python_type(value)
+
+
+def page_window(rows: list[Any], page_size: int) -> tuple[list[Any], bool]:
+    """Split a `LIMIT page_size + 1` result into the page and whether another page follows."""
+    return rows[:page_size], len(rows) > page_size
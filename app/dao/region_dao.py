@@ -0,0 +1,88 @@
+import time
+from collections.abc import Callable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.region import Region
+
+# Region.level of each location filter.
+REGION_LEVELS = {"province": 1, "city": 2, "district": 3}
+# The directory reloads at most this often when a filter names a region it does not know yet,
+# and at least this often so regions created by other workers' ingests become filterable.
+DIRECTORY_MISS_RELOAD_SECONDS = 10.0
+DIRECTORY_TTL_SECONDS = 300.0
+
+
+class RegionDirectory:
+    """Process-local `(level, name) -> region ids` map for expanding location filters.
+
+    The region tree holds a few thousand nodes, so it is loaded whole; ids never change, so a
+    stale directory can only miss regions created since the last load.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self.by_name: dict[tuple[int, str], tuple[int, ...]] | None = None
+        self.loaded_at = 0.0
+
+    async def ids(self, session: AsyncSession, level: int, name: str) -> tuple[int, ...]:
+        age = self.clock() - self.loaded_at
+        if (
+            self.by_name is None
+            or age >= DIRECTORY_TTL_SECONDS
+            or ((level, name) not in self.by_name and age >= DIRECTORY_MISS_RELOAD_SECONDS)
+        ):
+            await self.load(session)
+        return self.by_name.get((level, name), ())
+
+    async def load(self, session: AsyncSession) -> None:
+        by_name: dict[tuple[int, str], list[int]] = {}
+        for region_id, level, name in (await session.execute(select(Region.id, Region.level, Region.name))).all():
+            by_name.setdefault((level, name), []).append(region_id)
+        self.by_name = {key: tuple(sorted(ids)) for key, ids in by_name.items()}
+        self.loaded_at = self.clock()
+
+    def clear(self) -> None:
+        self.by_name = None
+
+
+_DIRECTORY = RegionDirectory()
+
+
+def invalidate_regions() -> None:
+    """Reload the directory on next use, after a local ingest may have added regions."""
+    _DIRECTORY.clear()
+
+
+class RegionDAO:
+    def __init__(self, directory: RegionDirectory | None = None) -> None:
+        self.directory = directory or _DIRECTORY
+
+    async def ensure_path(
+        self, session: AsyncSession, province: str | None, city: str | None, district: str | None
+    ) -> list[int]:
+        """Ids of the province / city / district nodes, root first, creating missing ones.
+
+        Runs inside the caller's ingest transaction, so a rollback leaves no ids behind.
+        """
+        region_ids: list[int] = []
+        parent_id: int | None = None
+        segments: list[str] = []
+        for level, name in ((1, province), (2, city), (3, district)):
+            if not name:
+                continue
+            segments.append(f"{level}:{name}")
+            stmt = insert(Region).values(parent_id=parent_id, level=level, name=name, path_key="/".join(segments))
+            # A no-op update, so RETURNING also yields the id of an existing node.
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Region.path_key], set_={"name": stmt.excluded.name}
+            ).returning(Region.id)
+            parent_id = (await session.execute(stmt)).scalar_one()
+            region_ids.append(parent_id)
+        return region_ids
+
+    async def filter_ids(self, session: AsyncSession, level_name: str, name: str) -> tuple[int, ...]:
+        """Region ids a `province` / `city` / `district` filter value stands for."""
+        return await self.directory.ids(session, REGION_LEVELS[level_name], name)
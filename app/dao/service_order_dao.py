@@ -1,8 +1,27 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dao.pagination import Keyset, SortKey, page_window
 from app.models.service_order import ServiceOrder
 
+ORDER_KEYSET = Keyset("id", (SortKey(ServiceOrder.id),))
+
+# Projected list columns, labelled by item key; notes and applicant profile stay detail-only.
+ORDER_LIST_COLUMNS = (
+    ServiceOrder.id,
+    ServiceOrder.order_no,
+    ServiceOrder.user_name,
+    ServiceOrder.phone,
+    ServiceOrder.status,
+    ServiceOrder.delivery_type,
+    ServiceOrder.target_job_id,
+    ServiceOrder.target_event_id,
+    ServiceOrder.target_company_name,
+    ServiceOrder.amount_cents,
+    ServiceOrder.currency,
+    ServiceOrder.created_at,
+)
+
 
 class ServiceOrderDAO:
     async def create(self, session: AsyncSession, payload: dict) -> ServiceOrder:
@@ -15,31 +34,29 @@ class ServiceOrderDAO:
         stmt = select(ServiceOrder).where(ServiceOrder.id == order_id)
         return (await session.execute(stmt)).scalar_one_or_none()
 
-    async def list_orders(self, session: AsyncSession, *, page: int, page_size: int, phone: str | None) -> dict:
-        stmt = select(ServiceOrder)
+    async def list_orders(
+        self,
+        session: AsyncSession,
+        *,
+        page: int,
+        page_size: int,
+        phone: str | None,
+        cursor: str | None = None,
+    ) -> dict:
+        after = ORDER_KEYSET.after(ORDER_KEYSET.decode(cursor)) if cursor else None
+        stmt = select(*ORDER_LIST_COLUMNS)
         if phone:
             stmt = stmt.where(ServiceOrder.phone == phone)
 
         total_stmt = select(func.count()).select_from(stmt.subquery())
         total = (await session.execute(total_stmt)).scalar_one()
-        stmt = stmt.order_by(ServiceOrder.id.desc()).offset((page - 1) * page_size).limit(page_size)
-        orders = (await session.execute(stmt)).scalars().all()
-
-        items = [
-            {
-                "id": order.id,
-                "order_no": order.order_no,
-                "user_name": order.user_name,
-                "phone": order.phone,
-                "status": order.status,
-                "delivery_type": order.delivery_type,
-                "target_job_id": order.target_job_id,
-                "target_event_id": order.target_event_id,
-                "target_company_name": order.target_company_name,
-                "amount_cents": order.amount_cents,
-                "currency": order.currency,
-                "created_at": order.created_at,
-            }
-            for order in orders
-        ]
-        return {"items": items, "page": page, "page_size": page_size, "total": total}
+        stmt = stmt.order_by(*ORDER_KEYSET.order_by())
+        stmt = stmt.where(after) if after is not None else stmt.offset((page - 1) * page_size)
+        rows, has_more = page_window((await session.execute(stmt.limit(page_size + 1))).all(), page_size)
+        return {
+            "items": [row._asdict() for row in rows],
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "next_cursor": ORDER_KEYSET.cursor_for(rows[-1]) if has_more else None,
+        }
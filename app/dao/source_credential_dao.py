@@ -0,0 +1,52 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crawler.credentials import CredentialEntry, CredentialStore
+from app.models.source_credential import SourceCredential
+
+
+class SourceCredentialDAO:
+    async def hydrate(self, session: AsyncSession, source_id: int, store: CredentialStore) -> None:
+        stmt = select(SourceCredential).where(SourceCredential.source_id == source_id)
+        rows = (await session.execute(stmt)).scalars().all()
+        store.load(
+            [
+                CredentialEntry(
+                    name=row.name,
+                    value=row.value_json,
+                    expires_at=row.expires_at,
+                    refreshed_at=row.refreshed_at,
+                    invalidated_at=row.invalidated_at,
+                    invalid_reason=row.invalid_reason,
+                )
+                for row in rows
+            ]
+        )
+
+    async def save_dirty(self, session: AsyncSession, source_id: int, store: CredentialStore) -> int:
+        entries = store.dirty_entries()
+        for entry in entries:
+            stmt = insert(SourceCredential).values(
+                source_id=source_id,
+                name=entry.name,
+                value_json=entry.value,
+                expires_at=entry.expires_at,
+                refreshed_at=entry.refreshed_at,
+                invalidated_at=entry.invalidated_at,
+                invalid_reason=entry.invalid_reason,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[SourceCredential.source_id, SourceCredential.name],
+                set_={
+                    "value_json": entry.value,
+                    "expires_at": entry.expires_at,
+                    "refreshed_at": entry.refreshed_at,
+                    "invalidated_at": entry.invalidated_at,
+                    "invalid_reason": entry.invalid_reason,
+                },
+            )
+            await session.execute(stmt)
+            entry.dirty = False
+        await session.flush()
+        return len(entries)
@@ -0,0 +1,80 @@
+from collections import Counter
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.stats_rollup import StatsRollup
+
+NULL_BUCKET = ""
+
+
+class RollupDelta:
+    """Per-bucket count changes collected while an ingest batch is written."""
+
+    def __init__(self) -> None:
+        self.changes: Counter[tuple[str, str]] = Counter()
+
+    def add(self, dimension: str, bucket: str | None, amount: int = 1) -> None:
+        self.changes[(dimension, bucket or NULL_BUCKET)] += amount
+
+    def move(self, dimension: str, old: str | None, new: str | None) -> None:
+        if (old or NULL_BUCKET) != (new or NULL_BUCKET):
+            self.add(dimension, old, -1)
+            self.add(dimension, new, 1)
+
+    def nonzero(self) -> list[tuple[str, str, int]]:
+        # Sorted so concurrent ingests lock rollup rows in the same order and cannot deadlock.
+        return sorted((dim, bucket, amount) for (dim, bucket), amount in self.changes.items() if amount)
+
+
+class StatsRollupDAO:
+    async def apply(self, session: AsyncSession, scope: str, delta: RollupDelta) -> None:
+        """Add the deltas inside the caller's ingest transaction."""
+        rows = [
+            {"scope": scope, "dimension": dimension, "bucket": bucket, "count": amount}
+            for dimension, bucket, amount in delta.nonzero()
+        ]
+        if not rows:
+            return
+        stmt = insert(StatsRollup).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StatsRollup.scope, StatsRollup.dimension, StatsRollup.bucket],
+            set_={"count": StatsRollup.count + stmt.excluded.count, "updated_at": func.now()},
+        )
+        await session.execute(stmt)
+
+    async def top(
+        self, session: AsyncSession, scope: str, dimension: str, limit: int | None = None
+    ) -> list[tuple[str | None, int]]:
+        stmt = select(StatsRollup.bucket, StatsRollup.count).where(
+            StatsRollup.scope == scope,
+            StatsRollup.dimension == dimension,
+            StatsRollup.count > 0,
+        )
+        if limit is None:
+            stmt = stmt.order_by(StatsRollup.bucket.asc())
+        else:
+            stmt = stmt.order_by(StatsRollup.count.desc(), StatsRollup.bucket.asc()).limit(limit)
+        return [(bucket or None, count) for bucket, count in (await session.execute(stmt)).all()]
+
+    async def lock_for_reconcile(self, session: AsyncSession) -> None:
+        # Conflicts with the row locks of in-flight ingests: waits for them to commit and holds new
+        # deltas back until the recount is written, so no increment is lost. Reads stay unblocked.
+        await session.execute(text("LOCK TABLE stats_rollups IN EXCLUSIVE MODE"))
+
+    async def load(self, session: AsyncSession, scope: str) -> dict[tuple[str, str], int]:
+        stmt = select(StatsRollup.dimension, StatsRollup.bucket, StatsRollup.count).where(
+            StatsRollup.scope == scope
+        )
+        return {(dim, bucket): count for dim, bucket, count in (await session.execute(stmt)).all()}
+
+    async def replace(self, session: AsyncSession, scope: str, counts: dict[tuple[str, str], int]) -> None:
+        await session.execute(delete(StatsRollup).where(StatsRollup.scope == scope))
+        rows = [
+            {"scope": scope, "dimension": dim, "bucket": bucket, "count": count}
+            for (dim, bucket), count in sorted(counts.items())
+            if count
+        ]
+        if rows:
+            await session.execute(insert(StatsRollup).values(rows))
@@ -13,15 +13,18 @@ from app.router.v1.jobs import router as jobs_router
 from app.router.v1.orders import router as orders_router
 from app.router.v1.sources import router as sources_router
 from app.router.v1.stats import router as stats_router
+from app.service.job_index_service import get_job_index_service
 from app.tasks.scheduler import scheduler_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await get_job_index_service().warm_up()
     if app.state.settings.scheduler_enabled:
         await scheduler_service.start()
     yield
     await scheduler_service.stop()
+    await get_job_index_service().close()
 
 
 def create_app() -> FastAPI:
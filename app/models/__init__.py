@@ -1,27 +1,42 @@
+from app.models.cache_version import CacheVersion
 from app.models.company import Company
 from app.models.campus_event import CampusEvent
-from app.models.crawl_run import CrawlRun, CrawlRunEvent
+from app.models.campus_event_body import CampusEventBody
+from app.models.crawl_run import CrawlQuarantineItem, CrawlRun, CrawlRunEvent
 from app.models.job import Job, job_skills
+from app.models.job_body import JobBody
+from app.models.job_search_doc import JobSearchDoc
 from app.models.job_version import JobVersion
 from app.models.location import Location
+from app.models.region import Region
 from app.models.resume import Resume
 from app.models.service_order import ServiceOrder
 from app.models.skill import Skill
 from app.models.source import Source
+from app.models.source_credential import SourceCredential
+from app.models.stats_rollup import StatsRollup
 from app.models.user import User
 
 __all__ = [
+    "CacheVersion",
     "CampusEvent",
+    "CampusEventBody",
     "Company",
+    "CrawlQuarantineItem",
     "CrawlRun",
     "CrawlRunEvent",
     "Job",
+    "JobBody",
+    "JobSearchDoc",
     "JobVersion",
     "Location",
+    "Region",
     "Resume",
     "ServiceOrder",
     "Skill",
     "Source",
+    "SourceCredential",
+    "StatsRollup",
     "User",
     "job_skills",
 ]
@@ -1,12 +1,19 @@
 from datetime import datetime
-from typing import Any
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, UniqueConstraint
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, String, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin
 
+# Joins the fields of search_text; keywords never contain it, so a match cannot span two fields.
+SEARCH_TEXT_SEPARATOR = "\x1f"
+# `||` on text is immutable (concat_ws is not), so it can back a stored generated column.
+SEARCH_TEXT_EXPR = (
+    "coalesce(title, '') || E'\\x1f' || coalesce(company_name, '') || E'\\x1f' || "
+    "coalesce(school_name, '') || E'\\x1f' || coalesce(venue, '')"
+)
+
 
 class CampusEvent(Base, TimestampMixin):
     __tablename__ = "campus_events"
@@ -18,6 +25,27 @@ class CampusEvent(Base, TimestampMixin):
         Index("ix_campus_events_school_name", "school_name"),
         Index("ix_campus_events_event_type", "event_type"),
         Index("ix_campus_events_status", "event_status"),
+        # Keyset pagination (EVENT_KEYSET in app.dao.campus_event_dao).
+        Index("ix_campus_events_keyset_time", text("coalesce(starts_at, 'infinity'::timestamptz)"), "id"),
+        # pg_trgm GIN indexes back the substring filters in CampusEventDAO.search_events.
+        Index(
+            "ix_campus_events_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_campus_events_school_name_trgm",
+            "school_name",
+            postgresql_using="gin",
+            postgresql_ops={"school_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_campus_events_company_name_trgm",
+            "company_name",
+            postgresql_using="gin",
+            postgresql_ops={"company_name": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -36,14 +64,13 @@ class CampusEvent(Base, TimestampMixin):
     province: Mapped[str | None] = mapped_column(String(64), nullable=True)
     city: Mapped[str | None] = mapped_column(String(64), nullable=True)
     venue: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    search_text: Mapped[str | None] = mapped_column(Text, Computed(SEARCH_TEXT_EXPR, persisted=True))
 
     starts_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     ends_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     event_status: Mapped[str] = mapped_column(String(32), default="upcoming")
 
-    description: Mapped[str | None] = mapped_column(Text, nullable=True)
     tags_json: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
-    raw_payload_json: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
 
     first_crawled_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     last_crawled_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
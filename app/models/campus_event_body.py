@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, LargeBinary, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CampusEventBody(Base):
+    """Event description and raw source payload, kept off the hot `campus_events` rows.
+
+    The payload is stored encoded (see app.utils.raw_payload) with the digest of its canonical
+    JSON, so re-crawls of an unchanged detail page skip rewriting it.
+    """
+
+    __tablename__ = "campus_event_bodies"
+
+    event_id: Mapped[int] = mapped_column(
+        ForeignKey("campus_events.id", ondelete="CASCADE"), primary_key=True
+    )
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    raw_payload: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    payload_encoding: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    payload_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
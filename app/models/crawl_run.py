@@ -28,6 +28,8 @@ class CrawlRun(Base):
     updated_count: Mapped[int] = mapped_column(Integer, default=0)
     failed_count: Mapped[int] = mapped_column(Integer, default=0)
     error_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    meta_json: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    timing_json: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
 
 
 class CrawlRunEvent(Base):
@@ -40,3 +42,19 @@ class CrawlRunEvent(Base):
     message: Mapped[str] = mapped_column(Text)
     meta_json: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class CrawlQuarantineItem(Base):
+    __tablename__ = "crawl_quarantine_items"
+    __table_args__ = (Index("ix_crawl_quarantine_items_source_external", "source_id", "external_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    source_id: Mapped[int] = mapped_column(ForeignKey("sources.id", ondelete="CASCADE"))
+    run_id: Mapped[int] = mapped_column(ForeignKey("crawl_runs.id", ondelete="CASCADE"), index=True)
+    external_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    stage: Mapped[str] = mapped_column(String(32))
+    error_type: Mapped[str] = mapped_column(String(128))
+    error: Mapped[str] = mapped_column(Text)
+    payload_ref: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    payload_json: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -35,3 +35,4 @@ class CrawlRunStatus(str, Enum):
     success = "success"
     failed = "failed"
     paused = "paused"
+    partial = "partial"
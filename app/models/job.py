@@ -12,7 +12,6 @@ from sqlalchemy import (
     Numeric,
     String,
     Table,
-    Text,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
@@ -37,7 +36,6 @@ class Job(Base, TimestampMixin):
         UniqueConstraint("source_id", "external_job_id", name="uq_jobs_source_external_job_id"),
         UniqueConstraint("source_id", "dedup_fingerprint", name="uq_jobs_source_dedup_fingerprint"),
         Index("ix_jobs_published_at", "published_at"),
-        Index("ix_jobs_salary_range", "salary_min", "salary_max"),
         Index("ix_jobs_job_category", "job_category"),
         Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
     )
@@ -77,8 +75,6 @@ class Job(Base, TimestampMixin):
     experience_max_months: Mapped[int | None] = mapped_column(Integer, nullable=True)
     headcount: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    responsibilities: Mapped[str | None] = mapped_column(Text, nullable=True)
-    qualifications: Mapped[str | None] = mapped_column(Text, nullable=True)
     benefits_json: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
     tags_json: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
 
@@ -0,0 +1,78 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, Numeric, String, func, text
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import ARRAY, INT4RANGE, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.enums import EducationLevel
+
+# Shared sort-key expression; must match JOB_KEYSETS in app.dao.job_dao.
+_TIME_KEY = "coalesce(published_at, '-infinity'::timestamptz) DESC"
+_SALARY_KEY = "coalesce(salary_monthly_mid, -1) DESC"
+
+
+class JobSearchDoc(Base):
+    """Join-free read model for `GET /jobs`, one row per job, written by JobDAO.upsert_jobs.
+
+    Company, source and location fields are copied in, so list queries filter, sort and page
+    on this table alone. Location filters are GIN membership checks on `region_ids`; the other
+    filter columns get a composite index ending in the time sort key.
+    """
+
+    __tablename__ = "job_search_docs"
+    __table_args__ = (
+        Index("ix_job_search_docs_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_job_search_docs_keyset_time", text(_TIME_KEY), text("job_id DESC")),
+        Index("ix_job_search_docs_keyset_salary", text(_SALARY_KEY), text(_TIME_KEY), text("job_id DESC")),
+        Index("ix_job_search_docs_salary_monthly", "salary_monthly_range", postgresql_using="gist"),
+        Index("ix_job_search_docs_rank_prior", text("rank_prior DESC"), text("job_id DESC")),
+        Index("ix_job_search_docs_region_ids", "region_ids", postgresql_using="gin"),
+        Index("ix_job_search_docs_category_time", "job_category", text(_TIME_KEY), text("job_id DESC")),
+        Index("ix_job_search_docs_source_time", "source_code", text(_TIME_KEY), text("job_id DESC")),
+        Index("ix_job_search_docs_company_id", "company_id"),
+        Index("ix_job_search_docs_location_id", "location_id"),
+    )
+
+    job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+
+    source_id: Mapped[int] = mapped_column(Integer)
+    source_code: Mapped[str] = mapped_column(String(64))
+    company_id: Mapped[int] = mapped_column(Integer)
+    company_name: Mapped[str] = mapped_column(String(255))
+    industry: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    location_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    province: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    city: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    district: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Ancestor region ids of the location; province / city / district filters are membership
+    # checks on this array (GIN) instead of string comparisons.
+    region_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), server_default=text("'{}'"))
+
+    title: Mapped[str] = mapped_column(String(255))
+    job_category: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    education_requirement: Mapped[EducationLevel] = mapped_column(
+        SAEnum(EducationLevel, name="educationlevel", create_type=False), default=EducationLevel.unknown
+    )
+    experience_min_months: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    salary_min: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
+    salary_max: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
+    salary_currency: Mapped[str | None] = mapped_column(String(8), nullable=True)
+    salary_period: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    # CNY/month normalization of the raw salary (app.utils.salary.monthly_salary_range); NULL
+    # when the amount, currency or period is unknown. Filters and the salary sort use these.
+    salary_monthly_mid: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    salary_monthly_range: Mapped[Any] = mapped_column(INT4RANGE, nullable=True)
+    published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    search_vector: Mapped[Any] = mapped_column(TSVECTOR, nullable=True)
+    # Relevance phase one (app.search.ranking): static completeness score and the stored
+    # recency + quality key candidates are read in.
+    quality_score: Mapped[float] = mapped_column(Float, server_default=text("0"))
+    rank_prior: Mapped[float] = mapped_column(Float, server_default=text("0"))
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -1,4 +1,5 @@
-from sqlalchemy import Index, String
+from sqlalchemy import Index, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin
@@ -16,3 +17,5 @@ class Location(Base, TimestampMixin):
     city: Mapped[str | None] = mapped_column(String(64), nullable=True)
     district: Mapped[str | None] = mapped_column(String(64), nullable=True)
     normalized_key: Mapped[str] = mapped_column(String(255), unique=True)
+    # Region ids of the province / city / district, root first (app.dao.region_dao).
+    region_ids: Mapped[list[int] | None] = mapped_column(ARRAY(Integer), nullable=True)
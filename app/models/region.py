@@ -0,0 +1,22 @@
+from sqlalchemy import ForeignKey, Index, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+
+class Region(Base, TimestampMixin):
+    """One node of the administrative-division tree: province (1) > city (2) > district (3).
+
+    Nodes are never renamed or deleted, so their ids are stable and can be copied into
+    `locations.region_ids` / `job_search_docs.region_ids` as ancestor paths.
+    """
+
+    __tablename__ = "regions"
+    __table_args__ = (Index("ix_regions_level_name", "level", "name"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int | None] = mapped_column(ForeignKey("regions.id", ondelete="RESTRICT"), nullable=True)
+    level: Mapped[int] = mapped_column(SmallInteger)
+    name: Mapped[str] = mapped_column(String(64))
+    # Level-tagged names from the root ("1:北京/2:北京/3:朝阳"); identifies the node.
+    path_key: Mapped[str] = mapped_column(String(255), unique=True)
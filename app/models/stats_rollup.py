@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, PrimaryKeyConstraint, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class StatsRollup(Base):
+    """Row counts per (scope, dimension, bucket), maintained by ingest deltas.
+
+    `scope` is the counted table ("jobs", "campus_events"), `dimension` the grouping
+    ("source", "city", ...) and `bucket` the group value, with "" standing for NULL.
+    """
+
+    __tablename__ = "stats_rollups"
+    __table_args__ = (
+        PrimaryKeyConstraint("scope", "dimension", "bucket", name="pk_stats_rollups"),
+        Index("ix_stats_rollups_top", "scope", "dimension", "count"),
+    )
+
+    scope: Mapped[str] = mapped_column(String(32))
+    dimension: Mapped[str] = mapped_column(String(32))
+    bucket: Mapped[str] = mapped_column(String(255))
+    count: Mapped[int] = mapped_column(BigInteger, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
-from app.core.response import success_response
+from app.core.response import list_response, success_response
 from app.schemas.crawler import CrawlRunCreateRequest
 from app.service.campus_crawl_service import CampusCrawlService
 from app.service.campus_event_service import CampusEventService
@@ -23,6 +23,7 @@ async def list_campus_events(
     company: str | None = None,
     event_type: str | None = None,
     source: str | None = None,
+    cursor: str | None = None,
     session: AsyncSession = Depends(get_session),
 ):
     data = await event_service.search(
@@ -36,8 +37,9 @@ async def list_campus_events(
         event_type=event_type,
         source=source,
         sort_by=sort_by,
+        cursor=cursor,
     )
-    return success_response(data)
+    return list_response(data)
 
 
 @router.get("/campus-events/stats/basic")
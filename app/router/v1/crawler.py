@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crawler.campus_registry import REGISTRY as CAMPUS_CRAWLER_REGISTRY
@@ -37,3 +37,13 @@ async def trigger_crawl(
 async def get_crawl_run(run_id: int, session: AsyncSession = Depends(get_session)):
     data = await crawl_service.get_run(session, run_id)
     return success_response(data)
+
+
+@router.get("/crawler/sources/{source_code}/timing")
+async def get_source_crawl_timing(
+    source_code: str,
+    limit: int = Query(default=20, ge=1, le=200),
+    session: AsyncSession = Depends(get_session),
+):
+    data = await crawl_service.get_source_timing(session, source_code, limit=limit)
+    return success_response(data)
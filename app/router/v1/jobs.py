@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
-from app.core.response import success_response
+from app.core.response import list_response, success_response
 from app.service.job_service import JobService
 
 router = APIRouter()
@@ -23,8 +23,11 @@ async def list_jobs(
     experience_min: int | None = None,
     salary_min: float | None = None,
     salary_max: float | None = None,
+    salary_unknown: bool = True,
     industry: str | None = None,
     source: str | None = None,
+    cursor: str | None = None,
+    facets: bool = False,
     session: AsyncSession = Depends(get_session),
 ):
     data = await job_service.search(
@@ -41,10 +44,13 @@ async def list_jobs(
         experience_min=experience_min,
         salary_min=salary_min,
         salary_max=salary_max,
+        salary_unknown=salary_unknown,
         industry=industry,
         source=source,
+        cursor=cursor,
+        facets=facets,
     )
-    return success_response(data)
+    return list_response(data)
 
 
 @router.get("/jobs/{job_id}")
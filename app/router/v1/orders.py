@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
-from app.core.response import success_response
+from app.core.response import list_response, success_response
 from app.schemas.order import CreateOrderRequest
 from app.service.order_service import OrderService
 
@@ -24,10 +24,13 @@ async def list_orders(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     phone: str | None = None,
+    cursor: str | None = None,
     session: AsyncSession = Depends(get_session),
 ):
-    data = await order_service.list_orders(session, page=page, page_size=page_size, phone=phone)
-    return success_response(data)
+    data = await order_service.list_orders(
+        session, page=page, page_size=page_size, phone=phone, cursor=cursor
+    )
+    return list_response(data)
 
 
 @router.get("/orders/{order_id}")
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_response_cache
 from app.core.database import get_session
 from app.core.response import success_response
 from app.service.job_service import JobService
@@ -13,3 +14,8 @@ job_service = JobService()
 async def basic_stats(session: AsyncSession = Depends(get_session)):
     data = await job_service.basic_stats(session)
     return success_response(data)
+
+
+@router.get("/stats/cache")
+async def response_cache_stats():
+    return success_response(get_response_cache().snapshot())
@@ -0,0 +1,444 @@
+"""In-process inverted index over `job_search_docs` for filter-only and short-keyword `/jobs` queries.
+
+One dense position per indexed document, with:
+
+- postings: for every region id (see app.dao.region_dao), every category / education / industry
+  / source value and every search lexeme, a sorted `array("I")` of positions;
+- column arrays: interned string codes, salary (as listed, and the CNY/month range and midpoint
+  the salary filter and sort use), experience and `published_at` (microseconds), so predicates and sort keys are evaluated per position without touching Python objects.
+
+Updates are append-only: a changed document gets a new position and its old one is tombstoned,
+so postings stay sorted without ever being rewritten. Callers rebuild once tombstones pile up.
+Keyword lexemes come straight from the stored `search_vector`, so matching follows the SQL path
+term for term (CJK bigrams AND-ed, Latin words by prefix).
+"""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from app.dao.pagination import Keyset
+from app.utils.search_tokens import build_search_query
+
+# Equality filters of JobDAO.search_jobs, by index field name.
+FILTER_FIELDS = ("job_category", "education", "industry", "source_code")
+# Location filters; like the SQL path they match region ids, not the stored names.
+LOCATION_FILTERS = ("province", "city", "district")
+# Display-only string columns carried for response items.
+DISPLAY_FIELDS = ("title", "company_name", "city", "salary_currency", "salary_period")
+
+NULL_CODE = 0
+NULL_TIME = -(2**63)  # sorts like coalesce(published_at, '-infinity')
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class JobIndexQuery:
+    page: int
+    page_size: int
+    sort_by: str = "time"
+    keyword: str | None = None
+    province: str | None = None
+    city: str | None = None
+    district: str | None = None
+    category: str | None = None
+    education: str | None = None
+    industry: str | None = None
+    source_code: str | None = None
+    experience_min: int | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_unknown: bool = True
+    cursor: str | None = None
+    # Region ids each location filter expands to (RegionDAO.filter_ids), in
+    # `location_filters()` order; JobIndexService fills them in before searching.
+    regions: tuple[tuple[int, ...], ...] | None = None
+
+    def location_filters(self) -> dict[str, str]:
+        values = {"province": self.province, "city": self.city, "district": self.district}
+        return {level: name for level, name in values.items() if name}
+
+    def equality_filters(self) -> dict[str, str]:
+        values = {
+            "job_category": self.category,
+            "education": self.education,
+            "industry": self.industry,
+            "source_code": self.source_code,
+        }
+        return {field: value for field, value in values.items() if value}
+
+
+def to_micros(value: datetime | None) -> int:
+    if value is None:
+        return NULL_TIME
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def from_micros(value: int) -> datetime | None:
+    if value == NULL_TIME:
+        return None
+    return datetime.fromtimestamp(value // 1_000_000, timezone.utc).replace(microsecond=value % 1_000_000)
+
+
+class JobIndexBase:
+    """Query evaluation shared by the mutable index and read-only snapshots (app.search.snapshot).
+
+    Subclasses provide the column sequences (`job_ids`, `published`, `salary_min`, `salary_max`,
+    `monthly_low`, `monthly_high`, `monthly_mid`, `experience_min`, `alive`, `codes[field]`) and the lookups below; any sequence of ints or
+    floats works, including memoryviews over a mapped file.
+    """
+
+    job_ids: Sequence[int]
+    published: Sequence[int]
+    salary_min: Sequence[float]
+    salary_max: Sequence[float]
+    monthly_low: Sequence[int]  # -1 stands for NULL, like the coalesce in the salary sort key
+    monthly_high: Sequence[int]
+    monthly_mid: Sequence[int]
+    experience_min: Sequence[int]
+    alive: Sequence[int]
+    codes: dict[str, Sequence[int]]
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def string(self, code: int) -> str | None:
+        raise NotImplementedError
+
+    def lookup(self, value: str) -> int | None:
+        """Code of an interned string, or None when no document carries it."""
+        raise NotImplementedError
+
+    def posting(self, field: str, code: int) -> Sequence[int]:
+        raise NotImplementedError
+
+    def region_posting(self, region_id: int) -> Sequence[int]:
+        raise NotImplementedError
+
+    def term_posting(self, term: str) -> Sequence[int]:
+        raise NotImplementedError
+
+    def prefix_postings(self, prefix: str) -> list[Sequence[int]]:
+        raise NotImplementedError
+
+    def order(self, sort_by: str) -> Sequence[int]:
+        """Live positions sorted by the `sort_by` key, descending."""
+        raise NotImplementedError
+
+    def search(self, query: JobIndexQuery, keyset: Keyset, count_threshold: int | None = None) -> dict:
+        """Same result shape, order, totals and cursors as JobDAO.search_jobs for the query.
+
+        With `count_threshold` (APP_COUNT_EXACT_THRESHOLD), range-filtered walks of the whole
+        order stop counting past that many matches and return an estimate, like TotalCounter.
+        """
+        postings = self._postings(query)
+        # Scan the shortest posting list; every other filter is checked per position.
+        driver = min(postings, key=len) if postings else None
+        predicate, filtered = self._predicate(query, [p for p in postings if p is not driver])
+        sort_key = self._sort_key(query.sort_by)
+        after = self._cursor_key(query, keyset) if query.cursor else None
+
+        need = query.page_size + 1 if after is not None else query.page * query.page_size + 1
+        exact = True
+        if driver is None:
+            order = self.order(query.sort_by)
+            page = self._walk_order(order, sort_key, predicate, after, need)
+            # The order holds only live positions, so without range filters it is the match set.
+            total, exact = self._count(order, predicate, count_threshold) if filtered else (len(order), True)
+        else:
+            matches = [position for position in driver if predicate(position)]
+            total = len(matches)
+            if after is not None:
+                matches = [position for position in matches if sort_key(position) < after]
+            page = heapq.nlargest(need, matches, key=sort_key)
+        if after is None:
+            page = page[(query.page - 1) * query.page_size :]
+        has_more = len(page) > query.page_size
+        page = page[: query.page_size]
+
+        next_cursor = None
+        if has_more:
+            next_cursor = keyset.encode(self._cursor_values(query.sort_by, page[-1]))
+        return {
+            "items": [self._item(position) for position in page],
+            "page": query.page,
+            "page_size": query.page_size,
+            "total": total,
+            "total_exact": exact,
+            "next_cursor": next_cursor,
+        }
+
+    def _postings(self, query: JobIndexQuery) -> list[Sequence[int]]:
+        """Posting lists every match must appear in: one per filter and keyword term."""
+        if query.location_filters() and query.regions is None:
+            raise ValueError("location filters must be resolved to region ids before searching")
+        # A filter naming regions in several places matches any of them; none matches nothing.
+        postings: list[Sequence[int]] = [
+            _union([self.region_posting(region_id) for region_id in region_ids])
+            for region_ids in query.regions or ()
+        ]
+        for name, value in query.equality_filters().items():
+            code = self.lookup(value)
+            postings.append(self.posting(name, code) if code is not None else ())
+        search_query = build_search_query(query.keyword)
+        for term in search_query.split(" & ") if search_query else ():
+            if not term.endswith(":*"):
+                postings.append(self.term_posting(term))
+                continue
+            postings.append(_union(self.prefix_postings(term[:-2])))
+        return postings
+
+    def _predicate(
+        self, query: JobIndexQuery, postings: list[Sequence[int]]
+    ) -> tuple[Callable[[int], bool], bool]:
+        """Per-position check for live documents matching `postings` and the range filters.
+
+        Returns the predicate and whether it filters anything beyond liveness.
+        """
+        checks: list[Callable[[int], bool]] = [
+            lambda p, posting=posting: _contains(posting, p) for posting in postings
+        ]
+        if query.experience_min is not None:
+            experience, floor = self.experience_min, query.experience_min
+            checks.append(lambda p: experience[p] < 0 or experience[p] >= floor)
+        if query.salary_min is not None or query.salary_max is not None:
+            # Same containment as app.dao.job_dao.salary_filter on the integer CNY/month bounds.
+            low = math.ceil(query.salary_min) if query.salary_min is not None else -math.inf
+            high = math.floor(query.salary_max) if query.salary_max is not None else math.inf
+            monthly_low, monthly_high, monthly_mid = self.monthly_low, self.monthly_high, self.monthly_mid
+            unknown = query.salary_unknown
+            checks.append(
+                lambda p: unknown if monthly_mid[p] < 0 else low <= monthly_low[p] and monthly_high[p] <= high
+            )
+
+        alive = self.alive
+        return (lambda p: alive[p] == 1 and all(check(p) for check in checks)), bool(checks)
+
+    def _sort_key(self, sort_by: str) -> Callable[[int], tuple]:
+        published, job_ids, monthly_mid = self.published, self.job_ids, self.monthly_mid
+        if sort_by == "salary":
+            # coalesce(salary_monthly_mid, -1) DESC, coalesce(published_at, '-infinity') DESC, id DESC
+            return lambda p: (monthly_mid[p], published[p], job_ids[p])
+        return lambda p: (published[p], job_ids[p])
+
+    def _walk_order(
+        self,
+        order: Sequence[int],
+        sort_key: Callable[[int], tuple],
+        predicate: Callable[[int], bool],
+        after: tuple | None,
+        need: int,
+    ) -> list[int]:
+        """Unfiltered-by-posting queries: read the presorted order instead of sorting everything."""
+        start = 0
+        if after is not None:
+            # `order` descends by key; negating the key makes it ascending for bisect.
+            start = bisect_right(order, _negate(after), key=lambda p: _negate(sort_key(p)))
+        page: list[int] = []
+        for position in order[start:]:
+            if predicate(position):
+                page.append(position)
+                if len(page) == need:
+                    break
+        return page
+
+    def _count(
+        self, order: Sequence[int], predicate: Callable[[int], bool], threshold: int | None
+    ) -> tuple[int, bool]:
+        """Matches in `order`; past `threshold` matches, extrapolated from the share scanned."""
+        matched = 0
+        for scanned, position in enumerate(order, 1):
+            if predicate(position):
+                matched += 1
+                if threshold is not None and matched > threshold:
+                    return round(matched * len(order) / scanned), False
+        return matched, True
+
+    def _cursor_key(self, query: JobIndexQuery, keyset: Keyset) -> tuple:
+        values = keyset.decode(query.cursor)
+        if query.sort_by == "salary":
+            salary, published, job_id = values
+            return (-1 if salary is None else salary, to_micros(published), job_id)
+        published, job_id = values
+        return (to_micros(published), job_id)
+
+    def _cursor_values(self, sort_by: str, position: int) -> list[Any]:
+        published = from_micros(self.published[position])
+        job_id = self.job_ids[position]
+        if sort_by == "salary":
+            mid = self.monthly_mid[position]
+            return [None if mid < 0 else mid, published, job_id]
+        return [published, job_id]
+
+    def _item(self, position: int) -> dict:
+        string, codes = self.string, self.codes
+        return {
+            "id": self.job_ids[position],
+            "title": string(codes["title"][position]),
+            "company_name": string(codes["company_name"][position]),
+            "city": string(codes["city"][position]),
+            "salary_min": _to_optional(self.salary_min[position]),
+            "salary_max": _to_optional(self.salary_max[position]),
+            "salary_currency": string(codes["salary_currency"][position]),
+            "salary_period": string(codes["salary_period"][position]),
+            "education_requirement": string(codes["education"][position]),
+            "published_at": from_micros(self.published[position]),
+            "source_code": string(codes["source_code"][position]),
+        }
+
+
+class JobSearchIndex(JobIndexBase):
+    """Mutable in-memory index, built and refreshed from the database."""
+
+    def __init__(self) -> None:
+        self.job_ids = array("q")
+        self.published = array("q")
+        self.updated = array("q")
+        self.salary_min = array("d")  # NaN stands for NULL
+        self.salary_max = array("d")
+        self.monthly_low = array("i")
+        self.monthly_high = array("i")
+        self.monthly_mid = array("i")
+        self.experience_min = array("i")  # -1 stands for NULL
+        self.alive = bytearray()
+        self.codes: dict[str, array] = {name: array("I") for name in (*FILTER_FIELDS, *DISPLAY_FIELDS)}
+        self.strings: list[str | None] = [None]
+        self.string_ids: dict[str, int] = {}
+        self.postings: dict[str, dict[int, array]] = {name: {} for name in FILTER_FIELDS}
+        self.regions: dict[int, array] = {}
+        self.terms: dict[str, array] = {}
+        self.positions: dict[int, int] = {}
+        self.dead = 0
+        self._vocabulary: list[str] | None = None
+        self._orders: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def string(self, code: int) -> str | None:
+        return self.strings[code]
+
+    def lookup(self, value: str) -> int | None:
+        return self.string_ids.get(value)
+
+    def posting(self, field: str, code: int) -> Sequence[int]:
+        return self.postings[field].get(code, ())
+
+    def region_posting(self, region_id: int) -> Sequence[int]:
+        return self.regions.get(region_id, ())
+
+    def term_posting(self, term: str) -> Sequence[int]:
+        return self.terms.get(term, ())
+
+    def prefix_postings(self, prefix: str) -> list[Sequence[int]]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.terms)
+        start = bisect_left(self._vocabulary, prefix)
+        end = bisect_left(self._vocabulary, prefix + "\U0010ffff", start)
+        return [self.terms[word] for word in self._vocabulary[start:end]]
+
+    def order(self, sort_by: str) -> Sequence[int]:
+        order = self._orders.get(sort_by)
+        if order is None:
+            alive, sort_key = self.alive, self._sort_key(sort_by)
+            order = sorted((p for p in range(len(alive)) if alive[p]), key=sort_key, reverse=True)
+            self._orders[sort_by] = order
+        return order
+
+    @property
+    def dead_ratio(self) -> float:
+        return self.dead / len(self.job_ids) if self.job_ids else 0.0
+
+    def add(self, docs: Iterable[Mapping[str, Any]]) -> int:
+        """Index (or re-index) docs shaped like JobSearchDocDAO.iter_index_docs batches."""
+        added = 0
+        for doc in docs:
+            job_id = doc["job_id"]
+            updated = to_micros(doc["updated_at"])
+            previous = self.positions.get(job_id)
+            if previous is not None:
+                if self.updated[previous] >= updated:
+                    continue  # already indexed this version (refresh windows overlap)
+                self.alive[previous] = 0
+                self.dead += 1
+            position = len(self.job_ids)
+            self.positions[job_id] = position
+            self.job_ids.append(job_id)
+            self.updated.append(updated)
+            self.published.append(to_micros(doc["published_at"]))
+            self.salary_min.append(_to_float(doc["salary_min"]))
+            self.salary_max.append(_to_float(doc["salary_max"]))
+            for column, name in (
+                (self.monthly_low, "salary_monthly_low"),
+                (self.monthly_high, "salary_monthly_high"),
+                (self.monthly_mid, "salary_monthly_mid"),
+            ):
+                column.append(-1 if doc[name] is None else doc[name])
+            experience = doc["experience_min_months"]
+            self.experience_min.append(-1 if experience is None else experience)
+            self.alive.append(1)
+            for name in FILTER_FIELDS:
+                code = self._intern(_field_value(doc, name))
+                self.codes[name].append(code)
+                if code != NULL_CODE:
+                    self.postings[name].setdefault(code, array("I")).append(position)
+            for name in DISPLAY_FIELDS:
+                self.codes[name].append(self._intern(doc[name]))
+            for region_id in doc["region_ids"] or ():
+                self.regions.setdefault(region_id, array("I")).append(position)
+            for term in set(doc["terms"] or ()):
+                posting = self.terms.get(term)
+                if posting is None:
+                    self.terms[term] = posting = array("I")
+                    self._vocabulary = None
+                posting.append(position)
+            added += 1
+        if added:
+            self._orders.clear()
+        return added
+
+    def _intern(self, value: str | None) -> int:
+        if value is None:
+            return NULL_CODE
+        code = self.string_ids.get(value)
+        if code is None:
+            code = self.string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+
+def _field_value(doc: Mapping[str, Any], name: str) -> str | None:
+    if name == "education":
+        value = doc["education_requirement"]
+        return getattr(value, "value", value)
+    return doc[name]
+
+
+def _to_float(value: Decimal | float | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _to_optional(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _negate(key: tuple) -> tuple:
+    return tuple(-part for part in key)
+
+
+def _union(postings: list[Sequence[int]]) -> Sequence[int]:
+    if len(postings) == 1:
+        return postings[0]
+    return array("I", sorted(set().union(*postings)))
+
+
+def _contains(posting: Any, position: int) -> bool:
+    index = bisect_left(posting, position)
+    return index < len(posting) and posting[index] == position
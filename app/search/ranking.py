@@ -0,0 +1,122 @@
+"""Two-phase relevance ranking for keyword job search.
+
+Phase one walks `job_search_docs` in `rank_prior` order (static quality plus recency, stored
+per row and indexed) and keeps the first APP_SEARCH_RERANK_WINDOW matches. Phase two scores only
+those candidates with `relevance_score`. Matches past the window keep their `rank_prior` order,
+so every page after the window is still a plain index walk.
+"""
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+from app.utils.search_tokens import tokenize_search_text
+
+# Quality points (summing to 1) for the fields a listing fills in. Company fields are left out:
+# they change under every doc of the company without the docs being re-scored.
+QUALITY_WEIGHTS = {
+    "salary": 0.25,
+    "education": 0.1,
+    "experience": 0.1,
+    "location": 0.1,
+    "body": 0.45,
+}
+# Responsibilities + qualifications characters that earn the full body weight.
+QUALITY_BODY_CHARS = 600
+# A listing with full quality is worth this many days of recency in the phase-one order.
+QUALITY_DAYS = 7.0
+SECONDS_PER_DAY = 86400.0
+
+# Phase-two weights: a query term found in a field earns that field's weight (the best one
+# when it occurs in several); terms only found in the body / skills earn BODY_WEIGHT.
+FIELD_WEIGHTS = {"title": 3.0, "job_category": 2.0, "company_name": 1.5, "industry": 1.0}
+BODY_WEIGHT = 0.5
+TITLE_MATCH_BOOST = 2.0  # every query term is in the title
+FRESHNESS_WEIGHT = 1.5
+FRESHNESS_HALF_LIFE_DAYS = 14.0
+QUALITY_WEIGHT = 1.0
+
+# Extra columns phase two reads for each candidate.
+RERANK_FIELDS = ("job_category", "industry", "quality_score")
+
+
+def quality_score(
+    *,
+    salary_max: Any,
+    education: Any,
+    experience_min_months: int | None,
+    city: str | None,
+    responsibilities: str | None,
+    qualifications: str | None,
+) -> float:
+    """Static 0..1 completeness score of a listing, independent of any query."""
+    education_value = getattr(education, "value", education)
+    body_chars = len(responsibilities or "") + len(qualifications or "")
+    score = QUALITY_WEIGHTS["body"] * min(body_chars, QUALITY_BODY_CHARS) / QUALITY_BODY_CHARS
+    if salary_max is not None:
+        score += QUALITY_WEIGHTS["salary"]
+    if education_value not in (None, "unknown"):
+        score += QUALITY_WEIGHTS["education"]
+    if experience_min_months is not None:
+        score += QUALITY_WEIGHTS["experience"]
+    if city:
+        score += QUALITY_WEIGHTS["location"]
+    return round(score, 4)
+
+
+def rank_prior(quality: float, published_at: datetime | None) -> float:
+    """Phase-one key: publish day number plus quality converted to days.
+
+    Both parts are fixed per row, so the order never changes as time passes and an index on the
+    stored value serves it. Jobs without a publish time count as published at the epoch.
+    """
+    days = published_at.timestamp() / SECONDS_PER_DAY if published_at is not None else 0.0
+    return days + quality * QUALITY_DAYS
+
+
+def relevance_score(row: Mapping[str, Any], terms: Sequence[str], reference: datetime | None) -> float:
+    """Phase-two score of one candidate for `build_search_query` terms.
+
+    Freshness decays from `reference` (the newest candidate), not from the wall clock, so the
+    same candidates always rank the same way and offset pages stay consistent.
+    """
+    fields = {name: set(tokenize_search_text(row[name])) for name in FIELD_WEIGHTS}
+    matched = 0.0
+    in_title = 0
+    for term in terms:
+        weight = BODY_WEIGHT  # the candidate matched the tsquery, so the term is somewhere
+        for name, tokens in fields.items():
+            if _term_in(term, tokens):
+                weight = max(weight, FIELD_WEIGHTS[name])
+                in_title += name == "title"
+        matched += weight
+    score = matched / len(terms) if terms else 0.0
+    if terms and in_title == len(terms):
+        score += TITLE_MATCH_BOOST
+
+    published_at = row["published_at"]
+    if published_at is not None and reference is not None:
+        age_days = max((reference - published_at).total_seconds(), 0.0) / SECONDS_PER_DAY
+        score += FRESHNESS_WEIGHT * 0.5 ** (age_days / FRESHNESS_HALF_LIFE_DAYS)
+    return score + QUALITY_WEIGHT * (row["quality_score"] or 0.0)
+
+
+def rerank(rows: Sequence[Any], search_query: str) -> list[Any]:
+    """Candidates (result rows carrying the list and RERANK_FIELDS columns), best first."""
+    terms = search_query.split(" & ")
+    mappings = [row._mapping for row in rows]
+    published = [m["published_at"] for m in mappings if m["published_at"] is not None]
+    reference = max(published) if published else None
+    scored = [
+        (relevance_score(mapping, terms, reference), mapping["job_id"], row)
+        for mapping, row in zip(mappings, rows, strict=True)
+    ]
+    scored.sort(key=lambda entry: (entry[0], entry[1]), reverse=True)
+    return [row for _, _, row in scored]
+
+
+def _term_in(term: str, tokens: set[str]) -> bool:
+    if term.endswith(":*"):
+        prefix = term[:-2]
+        return any(token.startswith(prefix) for token in tokens)
+    return term in tokens
@@ -0,0 +1,267 @@
+"""Read-only, memory-mapped snapshots of the job search index, shared by every worker process.
+
+File layout (native byte order, recorded in the header):
+
+    b"JOBSNAP2" | header length (u64 LE) | header JSON | sections, each 8-byte aligned
+
+The header lists each section's offset, byte length and array typecode. Sections are
+fixed-width column arrays, postings (sorted keys + offsets + concatenated positions) and string
+tables (u64 offsets + UTF-8 bytes, sorted so lookups bisect). Readers cast slices of one mmap
+into memoryviews, so all workers share the same page-cache pages and a restarted worker only
+maps the file instead of rebuilding. Writers replace the file atomically (tmp + fsync + rename);
+workers that still map the previous file keep a valid view until they switch.
+"""
+
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any
+
+import orjson
+
+from app.search.job_index import DISPLAY_FIELDS, FILTER_FIELDS, JobIndexBase, JobSearchIndex
+
+MAGIC = b"JOBSNAP2"
+ALIGN = 8
+SORT_ORDERS = ("time", "salary")
+
+
+class SnapshotError(RuntimeError):
+    """The snapshot file is missing sections, truncated or written by an incompatible build."""
+
+
+class StringTable:
+    """Sorted UTF-8 strings stored as u64 end offsets plus their concatenated bytes."""
+
+    def __init__(self, offsets: memoryview, data: memoryview) -> None:
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return bytes(self.data[self.offsets[index] : self.offsets[index + 1]]).decode("utf-8")
+
+    def bisect(self, value: str) -> int:
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self[middle] < value:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find(self, value: str) -> int | None:
+        index = self.bisect(value)
+        return index if index < len(self) and self[index] == value else None
+
+
+class MappedJobIndex(JobIndexBase):
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.meta, sections = _map_sections(path)
+        try:
+            self.job_ids = sections["job_ids"]
+            self.published = sections["published"]
+            self.salary_min = sections["salary_min"]
+            self.salary_max = sections["salary_max"]
+            self.monthly_low = sections["monthly_low"]
+            self.monthly_high = sections["monthly_high"]
+            self.monthly_mid = sections["monthly_mid"]
+            self.experience_min = sections["experience_min"]
+            self.alive = sections["alive"]
+            self.codes = {name: sections[f"codes.{name}"] for name in (*FILTER_FIELDS, *DISPLAY_FIELDS)}
+            self.strings = StringTable(sections["strings.offsets"], sections["strings.data"])
+            self.postings = {
+                name: (
+                    sections[f"postings.{name}.keys"],
+                    sections[f"postings.{name}.offsets"],
+                    sections[f"postings.{name}.values"],
+                )
+                for name in (*FILTER_FIELDS, "region_ids")
+            }
+            self.terms = StringTable(sections["terms.offsets"], sections["terms.data"])
+            self.term_offsets = sections["terms.postings.offsets"]
+            self.term_values = sections["terms.postings.values"]
+            self.orders = {name: sections[f"order.{name}"] for name in SORT_ORDERS}
+        except KeyError as exc:
+            raise SnapshotError(f"snapshot {path} lacks section {exc}") from exc
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def string(self, code: int) -> str | None:
+        return None if code == 0 else self.strings[code - 1]
+
+    def lookup(self, value: str) -> int | None:
+        index = self.strings.find(value)
+        return None if index is None else index + 1
+
+    def posting(self, field: str, code: int) -> Sequence[int]:
+        keys, offsets, values = self.postings[field]
+        index = bisect_left(keys, code)
+        if index == len(keys) or keys[index] != code:
+            return ()
+        return values[offsets[index] : offsets[index + 1]]
+
+    def region_posting(self, region_id: int) -> Sequence[int]:
+        return self.posting("region_ids", region_id)
+
+    def term_posting(self, term: str) -> Sequence[int]:
+        index = self.terms.find(term)
+        if index is None:
+            return ()
+        return self.term_values[self.term_offsets[index] : self.term_offsets[index + 1]]
+
+    def prefix_postings(self, prefix: str) -> list[Sequence[int]]:
+        postings = []
+        index = self.terms.bisect(prefix)
+        while index < len(self.terms) and self.terms[index].startswith(prefix):
+            postings.append(self.term_values[self.term_offsets[index] : self.term_offsets[index + 1]])
+            index += 1
+        return postings
+
+    def order(self, sort_by: str) -> Sequence[int]:
+        return self.orders[sort_by]
+
+
+def write_job_snapshot(index: JobSearchIndex, path: str, meta: dict[str, Any]) -> None:
+    """Compact `index` (dropping tombstones) into a snapshot at `path`, replacing it atomically."""
+    live = array("I", (p for p in range(len(index.alive)) if index.alive[p]))
+    remap = array("l", [-1]) * len(index.alive)
+    for new, old in enumerate(live):
+        remap[old] = new
+
+    strings = sorted(value for value in index.strings[1:] if value is not None)
+    code_map = array("I", [0]) * len(index.strings)
+    for new, value in enumerate(strings, start=1):
+        code_map[index.string_ids[value]] = new
+
+    sections: dict[str, Any] = {
+        "job_ids": array("q", (index.job_ids[p] for p in live)),
+        "published": array("q", (index.published[p] for p in live)),
+        "salary_min": array("d", (index.salary_min[p] for p in live)),
+        "salary_max": array("d", (index.salary_max[p] for p in live)),
+        "monthly_low": array("i", (index.monthly_low[p] for p in live)),
+        "monthly_high": array("i", (index.monthly_high[p] for p in live)),
+        "monthly_mid": array("i", (index.monthly_mid[p] for p in live)),
+        "experience_min": array("i", (index.experience_min[p] for p in live)),
+        "alive": bytes([1]) * len(live),
+    }
+    for name in (*FILTER_FIELDS, *DISPLAY_FIELDS):
+        column = index.codes[name]
+        sections[f"codes.{name}"] = array("I", (code_map[column[p]] for p in live))
+    sections["strings.offsets"], sections["strings.data"] = _string_table(strings)
+
+    keyed_postings = {
+        name: sorted((code_map[code], posting) for code, posting in index.postings[name].items())
+        for name in FILTER_FIELDS
+    }
+    keyed_postings["region_ids"] = sorted(index.regions.items())
+    for name, keyed in keyed_postings.items():
+        keys, offsets, values = _postings(keyed, remap)
+        sections[f"postings.{name}.keys"] = array("I", keys)
+        sections[f"postings.{name}.offsets"] = offsets
+        sections[f"postings.{name}.values"] = values
+
+    terms = sorted(index.terms.items())
+    _, term_offsets, term_values = _postings(terms, remap)
+    # Terms whose every position was tombstoned still get an (empty) slot so indexes line up.
+    sections["terms.offsets"], sections["terms.data"] = _string_table([term for term, _ in terms])
+    sections["terms.postings.offsets"] = term_offsets
+    sections["terms.postings.values"] = term_values
+
+    for name in SORT_ORDERS:
+        sections[f"order.{name}"] = array("I", (remap[p] for p in index.order(name)))
+
+    _write_sections(path, {**meta, "docs": len(live)}, sections)
+
+
+def _postings(keyed: list[tuple[Any, Sequence[int]]], remap: array) -> tuple[list, array, array]:
+    keys: list = []
+    offsets = array("Q", [0])
+    values = array("I")
+    for key, posting in keyed:
+        # Live positions keep their relative order under the remap, so postings stay sorted.
+        values.extend(remap[p] for p in posting if remap[p] >= 0)
+        keys.append(key)
+        offsets.append(len(values))
+    return keys, offsets, values
+
+
+def _string_table(values: list[str]) -> tuple[array, bytes]:
+    offsets = array("Q", [0])
+    data = bytearray()
+    for value in values:
+        data += value.encode("utf-8")
+        offsets.append(len(data))
+    return offsets, bytes(data)
+
+
+def _padding(size: int) -> int:
+    return -size % ALIGN
+
+
+def _write_sections(path: str, meta: dict[str, Any], sections: dict[str, Any]) -> None:
+    layout: dict[str, dict[str, Any]] = {}
+    offset = 0
+    for name, data in sections.items():
+        length = len(memoryview(data).cast("B"))
+        typecode = data.typecode if isinstance(data, array) else "B"
+        layout[name] = {"offset": offset, "length": length, "typecode": typecode}
+        offset += length + _padding(length)
+    header = orjson.dumps({"byteorder": sys.byteorder, "meta": meta, "sections": layout})
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(MAGIC)
+            handle.write(len(header).to_bytes(8, "little"))
+            handle.write(header)
+            handle.write(b"\0" * _padding(len(MAGIC) + 8 + len(header)))
+            for name, data in sections.items():
+                handle.write(data)
+                handle.write(b"\0" * _padding(layout[name]["length"]))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _map_sections(path: str) -> tuple[dict[str, Any], dict[str, memoryview]]:
+    with open(path, "rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    if mapped[: len(MAGIC)] != MAGIC:
+        raise SnapshotError(f"{path} is not a job index snapshot")
+    header_length = int.from_bytes(mapped[len(MAGIC) : len(MAGIC) + 8], "little")
+    header_end = len(MAGIC) + 8 + header_length
+    header = orjson.loads(mapped[len(MAGIC) + 8 : header_end])
+    if header["byteorder"] != sys.byteorder:
+        raise SnapshotError(f"{path} was written on a {header['byteorder']}-endian host")
+
+    base = header_end + _padding(header_end)
+    # The memoryviews keep the mapping alive; it is unmapped once the last view is dropped.
+    view = memoryview(mapped)
+    sections: dict[str, memoryview] = {}
+    for name, spec in header["sections"].items():
+        start = base + spec["offset"]
+        end = start + spec["length"]
+        if end > len(mapped):
+            raise SnapshotError(f"{path} is truncated at section {name}")
+        sections[name] = view[start:end].cast(spec["typecode"])
+    return header["meta"], sections
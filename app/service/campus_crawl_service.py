@@ -2,9 +2,16 @@ import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_response_cache
+from app.crawler.campus_registry import REGISTRY as CAMPUS_REGISTRY
 from app.crawler.campus_registry import get_campus_adapter
+from app.crawler.credentials import get_credential_store
+from app.crawler.sandbox import CrawlOutcome, SandboxLimits, run_in_sandbox, sandbox_enabled
+from app.crawler.timing import CrawlTimings, collect_timings, timed
 from app.dao.campus_event_dao import CampusEventDAO
+from app.dao.counting import invalidate_counts
 from app.dao.crawl_run_dao import CrawlRunDAO
+from app.dao.source_credential_dao import SourceCredentialDAO
 from app.dao.source_dao import SourceDAO
 from app.exceptions.base import BusinessError
 from app.exceptions.codes import INVALID_REQUEST, SOURCE_DISABLED, SOURCE_NOT_FOUND
@@ -18,34 +25,97 @@ class CampusCrawlService:
         self.source_dao = SourceDAO()
         self.event_dao = CampusEventDAO()
         self.run_dao = CrawlRunDAO()
+        self.credential_dao = SourceCredentialDAO()
         self.compliance = ComplianceService()
 
-    async def run_source(self, session: AsyncSession, source_code: str, trigger_type: str = "manual") -> dict:
+    async def run_source(
+        self,
+        session: AsyncSession,
+        source_code: str,
+        trigger_type: str = "manual",
+        sandboxed: bool | None = None,
+    ) -> dict:
+        with collect_timings() as timings:
+            return await self._run_source(session, source_code, trigger_type, sandboxed, timings)
+
+    async def _run_source(
+        self,
+        session: AsyncSession,
+        source_code: str,
+        trigger_type: str,
+        sandboxed: bool | None,
+        timings: CrawlTimings,
+    ) -> dict:
         source = await self.source_dao.get_by_code(session, source_code)
         if source is None:
             raise BusinessError(SOURCE_NOT_FOUND, f"Source not found: {source_code}", 404)
         if not source.enabled:
             raise BusinessError(SOURCE_DISABLED, f"Source is disabled: {source_code}", 400)
 
+        config = source.config_json or {}
+        use_sandbox = sandbox_enabled(config) if sandboxed is None else sandboxed
+        adapter = None
         try:
-            adapter = get_campus_adapter(source_code, config=source.config_json or {})
+            if not use_sandbox:
+                adapter = get_campus_adapter(source_code, config=config)
+            elif source_code not in CAMPUS_REGISTRY:
+                raise KeyError(f"No campus crawler adapter registered for source={source_code}")
         except KeyError as exc:
             raise BusinessError(INVALID_REQUEST, str(exc), 400) from exc
 
         run = await self.run_dao.create_running(session, source_id=source.id, trigger_type=trigger_type)
         try:
             self.compliance.validate_source_allowed(source)
-            events = await adapter.crawl()
-            inserted_count, updated_count = await self.event_dao.upsert_events(session, source.id, events)
-            source_total = await self.event_dao.count_by_source(session, source.id)
-            await self.run_dao.finish_success(
-                session,
-                run,
-                crawled_count=len(events),
-                inserted_count=inserted_count,
-                updated_count=updated_count,
-            )
+            credentials = get_credential_store(source_code)
+            with timed("db_read"):
+                await self.credential_dao.hydrate(session, source.id, credentials)
+                resume_from = await self.run_dao.get_resume_state(session, source.id, run.id)
+            if adapter is None:
+                outcome = await run_in_sandbox(
+                    "campus",
+                    source_code,
+                    config,
+                    resume_from=resume_from,
+                    credentials=credentials,
+                    limits=SandboxLimits.from_config(config),
+                )
+            else:
+                adapter.resume_from = resume_from
+                outcome = CrawlOutcome.from_adapter(adapter, await adapter.crawl())
+            events = outcome.items
+            crawl_meta = dict(outcome.crawl_meta)
+            crawl_meta["resume"] = outcome.resume_state
+            with timed("db_write"):
+                inserted_count, updated_count = await self.event_dao.upsert_events(
+                    session, source.id, events
+                )
+                with timed("db_read"):
+                    source_total = await self.event_dao.count_by_source(session, source.id)
+                await self.run_dao.finish_success(
+                    session,
+                    run,
+                    crawled_count=len(events),
+                    inserted_count=inserted_count,
+                    updated_count=updated_count,
+                    meta_json=crawl_meta,
+                    partial=outcome.resume_state is not None,
+                )
+                if outcome.aborted:
+                    await self.run_dao.mark_aborted(session, run, outcome.aborted)
+                await self.credential_dao.save_dirty(session, source.id, credentials)
+            with timed("commit"):
+                await session.commit()
+            invalidate_counts("campus_events")
+            await get_response_cache().bump("campus_events", source_code)
+            # Commit time is only known after the main transaction, so the breakdown lands after it.
+            await self.run_dao.record_timing(session, run, timings.to_dict())
             await session.commit()
+            logger.info(
+                "crawl_run timing source=%s run_id=%s timing=%s",
+                source_code,
+                run.id,
+                run.timing_json,
+            )
             result = {
                 "run_id": run.id,
                 "status": getattr(run.status, "value", str(run.status)),
@@ -55,18 +125,23 @@ class CampusCrawlService:
                 "target_table": "campus_events",
                 "source_total": source_total,
             }
-            crawl_meta = getattr(adapter, "last_crawl_meta", None)
-            if isinstance(crawl_meta, dict):
-                result["crawl_meta"] = crawl_meta
+            result["crawl_meta"] = crawl_meta
+            result["timing"] = run.timing_json
             return result
         except Exception as exc:
             await session.rollback()
             failed_run = await self.run_dao.get_by_id(session, run.id)
             if failed_run is not None:
-                await self.run_dao.finish_failed(session, failed_run, str(exc))
+                await self.run_dao.finish_failed(
+                    session, failed_run, str(exc), timing_json=timings.to_dict()
+                )
                 if self.compliance.should_pause_for_risk(str(exc)):
                     source.enabled = False
                     source.paused_reason = f"auto-paused due to risk: {str(exc)[:200]}"
+                # Keep invalidations from auth errors so the next run fails fast instead of replaying them.
+                await self.credential_dao.save_dirty(
+                    session, failed_run.source_id, get_credential_store(source_code)
+                )
                 await session.commit()
             logger.exception("campus crawl failed", extra={"source_code": source_code, "run_id": run.id})
             raise
@@ -1,13 +1,16 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_response_cache
 from app.dao.campus_event_dao import CampusEventDAO
+from app.dao.pagination import InvalidCursorError
 from app.exceptions.base import BusinessError
-from app.exceptions.codes import CAMPUS_EVENT_NOT_FOUND
+from app.exceptions.codes import CAMPUS_EVENT_NOT_FOUND, INVALID_REQUEST
 
 
 class CampusEventService:
     def __init__(self) -> None:
         self.event_dao = CampusEventDAO()
+        self.cache = get_response_cache()
 
     async def search(
         self,
@@ -22,18 +25,41 @@ class CampusEventService:
         event_type: str | None,
         source: str | None,
         sort_by: str,
+        cursor: str | None = None,
     ) -> dict:
-        return await self.event_dao.search_events(
-            session,
-            page=page,
-            page_size=page_size,
-            keyword=keyword,
-            city=city,
-            school=school,
-            company=company,
-            event_type=event_type,
-            source_code=source,
-            sort_by=sort_by,
+        params = {
+            "page": page,
+            "page_size": page_size,
+            "keyword": keyword,
+            "city": city,
+            "school": school,
+            "company": company,
+            "event_type": event_type,
+            "source": source,
+            "sort_by": sort_by,
+            "cursor": cursor,
+        }
+
+        async def compute() -> dict:
+            try:
+                return await self.event_dao.search_events(
+                    session,
+                    page=page,
+                    page_size=page_size,
+                    keyword=keyword,
+                    city=city,
+                    school=school,
+                    company=company,
+                    event_type=event_type,
+                    source_code=source,
+                    sort_by=sort_by,
+                    cursor=cursor,
+                )
+            except InvalidCursorError as exc:
+                raise BusinessError(INVALID_REQUEST, str(exc), 400) from exc
+
+        return await self.cache.get_or_compute(
+            "campus_events", "search", params, compute, source_code=source
         )
 
     async def detail(self, session: AsyncSession, event_id: int) -> dict:
@@ -43,4 +69,6 @@ class CampusEventService:
         return detail
 
     async def basic_stats(self, session: AsyncSession) -> dict:
-        return await self.event_dao.basic_stats(session)
+        return await self.cache.get_or_compute(
+            "campus_events", "stats", {}, lambda: self.event_dao.basic_stats(session)
+        )
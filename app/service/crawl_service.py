@@ -2,13 +2,26 @@ import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_response_cache
+from app.core.config import get_settings
+from app.crawler.base import ItemFailureRatioError
+from app.crawler.credentials import get_credential_store
+from app.crawler.registry import REGISTRY as JOB_REGISTRY
 from app.crawler.registry import get_adapter
+from app.crawler.sandbox import CrawlOutcome, SandboxLimits, run_in_sandbox, sandbox_enabled
+from app.crawler.timing import CrawlTimings, collect_timings, summarize_timings, timed
+from app.crawler.types import ItemFailure
+from app.dao.counting import invalidate_counts
+from app.dao.crawl_quarantine_dao import CrawlQuarantineDAO
 from app.dao.crawl_run_dao import CrawlRunDAO
 from app.dao.job_dao import JobDAO
+from app.dao.region_dao import invalidate_regions
+from app.dao.source_credential_dao import SourceCredentialDAO
 from app.dao.source_dao import SourceDAO
 from app.exceptions.base import BusinessError
 from app.exceptions.codes import INVALID_REQUEST, SOURCE_DISABLED, SOURCE_NOT_FOUND
 from app.service.compliance_service import ComplianceService
+from app.service.job_index_service import get_job_index_service
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +31,33 @@ class CrawlService:
         self.source_dao = SourceDAO()
         self.job_dao = JobDAO()
         self.run_dao = CrawlRunDAO()
+        self.credential_dao = SourceCredentialDAO()
+        self.quarantine_dao = CrawlQuarantineDAO()
         self.compliance = ComplianceService()
 
-    async def run_source(self, session: AsyncSession, source_code: str, trigger_type: str = "manual") -> dict:
+    async def run_source(
+        self,
+        session: AsyncSession,
+        source_code: str,
+        trigger_type: str = "manual",
+        sandboxed: bool | None = None,
+    ) -> dict:
+        """Crawl one source and ingest the result.
+
+        `sandboxed` forces (True) or skips (False) the child-process mode; None follows
+        config_json.sandbox.enabled and APP_CRAWLER_EXECUTION_MODE.
+        """
+        with collect_timings() as timings:
+            return await self._run_source(session, source_code, trigger_type, sandboxed, timings)
+
+    async def _run_source(
+        self,
+        session: AsyncSession,
+        source_code: str,
+        trigger_type: str,
+        sandboxed: bool | None,
+        timings: CrawlTimings,
+    ) -> dict:
         source = await self.source_dao.get_by_code(session, source_code)
         if source is None:
             raise BusinessError(SOURCE_NOT_FOUND, f"Source not found: {source_code}", 404)
@@ -28,27 +65,78 @@ class CrawlService:
             raise BusinessError(SOURCE_DISABLED, f"Source is disabled: {source_code}", 400)
 
         run = await self.run_dao.create_running(session, source_id=source.id, trigger_type=trigger_type)
+        item_failures: list[ItemFailure] = []
 
         try:
             self.compliance.validate_source_allowed(source)
+            config = source.config_json or {}
+            use_sandbox = sandbox_enabled(config) if sandboxed is None else sandboxed
+            adapter = None
             try:
-                adapter = get_adapter(source_code, config=source.config_json or {})
+                if not use_sandbox:
+                    adapter = get_adapter(source_code, config=config)
+                elif source_code not in JOB_REGISTRY:
+                    raise KeyError(f"No crawler adapter registered for source={source_code}")
             except KeyError as exc:
                 raise BusinessError(INVALID_REQUEST, str(exc), 400) from exc
-            normalized_jobs = await adapter.crawl()
-            inserted_count, updated_count = await self.job_dao.upsert_jobs(
-                session,
-                source_id=source.id,
-                jobs=normalized_jobs,
-            )
-            await self.run_dao.finish_success(
-                session,
-                run,
-                crawled_count=len(normalized_jobs),
-                inserted_count=inserted_count,
-                updated_count=updated_count,
-            )
+            credentials = get_credential_store(source_code)
+            with timed("db_read"):
+                await self.credential_dao.hydrate(session, source.id, credentials)
+                resume_from = await self.run_dao.get_resume_state(session, source.id, run.id)
+            if adapter is None:
+                outcome = await run_in_sandbox(
+                    "job",
+                    source_code,
+                    config,
+                    resume_from=resume_from,
+                    credentials=credentials,
+                    limits=SandboxLimits.from_config(config),
+                )
+            else:
+                adapter.resume_from = resume_from
+                outcome = CrawlOutcome.from_adapter(adapter, await adapter.crawl())
+            normalized_jobs = outcome.items
+            crawl_meta = dict(outcome.crawl_meta)
+            crawl_meta["resume"] = outcome.resume_state
+            item_failures = outcome.item_failures
+            self._check_failure_ratio(source.config_json or {}, len(normalized_jobs), len(item_failures))
+            with timed("db_write"):
+                inserted_count, updated_count = await self.job_dao.upsert_jobs(
+                    session,
+                    source_id=source.id,
+                    jobs=normalized_jobs,
+                )
+                await self.run_dao.finish_success(
+                    session,
+                    run,
+                    crawled_count=len(normalized_jobs),
+                    inserted_count=inserted_count,
+                    updated_count=updated_count,
+                    failed_count=len(item_failures),
+                    meta_json=crawl_meta,
+                    partial=outcome.resume_state is not None,
+                )
+                if outcome.aborted:
+                    await self.run_dao.mark_aborted(session, run, outcome.aborted)
+                await self.quarantine_dao.add_failures(
+                    session, source_id=source.id, run_id=run.id, failures=item_failures
+                )
+                await self.credential_dao.save_dirty(session, source.id, credentials)
+            with timed("commit"):
+                await session.commit()
+            invalidate_counts("jobs")
+            invalidate_regions()
+            await get_response_cache().bump("jobs", source_code)
+            get_job_index_service().mark_dirty()
+            # Commit time is only known after the main transaction, so the breakdown lands after it.
+            await self.run_dao.record_timing(session, run, timings.to_dict())
             await session.commit()
+            logger.info(
+                "crawl_run timing source=%s run_id=%s timing=%s",
+                source_code,
+                run.id,
+                run.timing_json,
+            )
 
             result = {
                 "run_id": run.id,
@@ -56,24 +144,50 @@ class CrawlService:
                 "crawled_count": len(normalized_jobs),
                 "inserted_count": inserted_count,
                 "updated_count": updated_count,
+                "failed_count": len(item_failures),
             }
-            crawl_meta = getattr(adapter, "last_crawl_meta", None)
-            if isinstance(crawl_meta, dict):
-                result["crawl_meta"] = crawl_meta
+            result["crawl_meta"] = crawl_meta
+            result["timing"] = run.timing_json
             return result
         except Exception as exc:
             # Rollback aborted transaction first, then persist failure status in a fresh tx.
             await session.rollback()
             failed_run = await self.run_dao.get_by_id(session, run.id)
             if failed_run is not None:
-                await self.run_dao.finish_failed(session, failed_run, str(exc))
+                await self.run_dao.finish_failed(
+                    session,
+                    failed_run,
+                    str(exc),
+                    failed_count=len(item_failures),
+                    timing_json=timings.to_dict(),
+                )
+                await self.quarantine_dao.add_failures(
+                    session, source_id=failed_run.source_id, run_id=failed_run.id, failures=item_failures
+                )
                 if self.compliance.should_pause_for_risk(str(exc)):
                     source.enabled = False
                     source.paused_reason = f"auto-paused due to risk: {str(exc)[:200]}"
+                # Keep invalidations from auth errors so the next run fails fast instead of replaying them.
+                await self.credential_dao.save_dirty(
+                    session, failed_run.source_id, get_credential_store(source_code)
+                )
                 await session.commit()
             logger.exception("crawl failed", extra={"source_code": source_code, "run_id": run.id})
             raise
 
+    @staticmethod
+    def _check_failure_ratio(config: dict, succeeded: int, failed: int) -> None:
+        if failed == 0:
+            return
+        default = get_settings().crawler_max_item_failure_ratio
+        threshold = float(config.get("max_item_failure_ratio", default))
+        ratio = failed / (succeeded + failed)
+        if ratio > threshold:
+            raise ItemFailureRatioError(
+                f"item failure ratio {ratio:.2f} exceeds {threshold:.2f} "
+                f"(failed={failed}, succeeded={succeeded})"
+            )
+
     async def get_run(self, session: AsyncSession, run_id: int) -> dict | None:
         run = await self.run_dao.get_by_id(session, run_id)
         if run is None:
@@ -89,4 +203,15 @@ class CrawlService:
             "updated_count": run.updated_count,
             "failed_count": run.failed_count,
             "error_summary": run.error_summary,
+            "crawl_meta": run.meta_json,
+            "timing": run.timing_json,
         }
+
+    async def get_source_timing(
+        self, session: AsyncSession, source_code: str, limit: int = 20
+    ) -> dict:
+        source = await self.source_dao.get_by_code(session, source_code)
+        if source is None:
+            raise BusinessError(SOURCE_NOT_FOUND, f"Source not found: {source_code}", 404)
+        timings = await self.run_dao.list_recent_timings(session, source.id, limit=limit)
+        return {"source_code": source_code, "limit": limit, **summarize_timings(timings)}
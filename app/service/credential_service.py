@@ -0,0 +1,47 @@
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crawler.campus_registry import REGISTRY as CAMPUS_CRAWLER_REGISTRY
+from app.crawler.credentials import get_credential_store
+from app.crawler.registry import REGISTRY as JOB_CRAWLER_REGISTRY
+from app.dao.source_credential_dao import SourceCredentialDAO
+from app.dao.source_dao import SourceDAO
+
+logger = logging.getLogger(__name__)
+
+
+class CredentialService:
+    def __init__(self) -> None:
+        self.source_dao = SourceDAO()
+        self.credential_dao = SourceCredentialDAO()
+
+    async def refresh_due(self, session: AsyncSession, lead_seconds: float) -> list[dict]:
+        """Refresh scraped credentials (e.g. sign keys) that expire within lead_seconds.
+
+        Only adapters exposing `refresh_credentials()` can self-refresh; user-supplied
+        cookies and signed URLs are left to the operator and only reported via invalidation.
+        """
+        results: list[dict] = []
+        for source in await self.source_dao.list_enabled(session):
+            adapter_cls = JOB_CRAWLER_REGISTRY.get(source.code) or CAMPUS_CRAWLER_REGISTRY.get(source.code)
+            if adapter_cls is None or not hasattr(adapter_cls, "refresh_credentials"):
+                continue
+            store = get_credential_store(source.code)
+            await self.credential_dao.hydrate(session, source.id, store)
+            due = store.due_for_refresh(lead_seconds)
+            if not due:
+                continue
+
+            adapter = adapter_cls(config=source.config_json or {})
+            try:
+                await adapter.refresh_credentials()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("credential_refresh_failed source=%s names=%s error=%s", source.code, due, exc)
+                results.append({"source_code": source.code, "names": due, "error": str(exc)})
+                continue
+            saved = await self.credential_dao.save_dirty(session, source.id, store)
+            logger.info("credential_refreshed source=%s names=%s saved=%s", source.code, due, saved)
+            results.append({"source_code": source.code, "names": due, "saved": saved})
+        await session.commit()
+        return results
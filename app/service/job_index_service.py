@@ -0,0 +1,236 @@
+import asyncio
+import contextlib
+import fcntl
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.dao.job_dao import JOB_KEYSETS
+from app.dao.job_search_doc_dao import JobSearchDocDAO
+from app.dao.region_dao import RegionDAO
+from app.search.job_index import JobIndexBase, JobIndexQuery, JobSearchIndex
+from app.search.snapshot import MappedJobIndex, SnapshotError, write_job_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Rebuild instead of appending once this share of positions is tombstoned.
+MAX_DEAD_RATIO = 0.25
+
+
+class JobIndexService:
+    """Keeps the in-process job index (APP_SEARCH_INDEX_ENABLED) built and fresh.
+
+    Built at startup, then maintained by a background task that requests start when it is due:
+    after a local crawl commit (`mark_dirty`) or every APP_SEARCH_INDEX_REFRESH_SECONDS, docs
+    updated since the last refresh (minus APP_SEARCH_INDEX_REFRESH_OVERLAP_SECONDS, for ingests
+    that committed late) are re-indexed. A full rebuild every
+    APP_SEARCH_INDEX_REBUILD_INTERVAL_MINUTES also drops deleted jobs and tombstoned positions;
+    it builds a new generation on the side and requests keep reading the previous one until it
+    is swapped in.
+
+    With APP_SEARCH_SNAPSHOT_PATH set, only the worker holding the `<path>.lock` flock builds
+    and refreshes; it publishes each change as a snapshot file that the other workers mmap and
+    re-map when the file is replaced. If the publishing worker exits, the next worker to poll
+    the lock takes over.
+    """
+
+    def __init__(self) -> None:
+        self.doc_dao = JobSearchDocDAO()
+        self.region_dao = RegionDAO()
+        self.index: JobIndexBase | None = None
+        self.local: JobSearchIndex | None = None
+        self.watermark: datetime | None = None
+        self.refreshed_at = 0.0
+        self.rebuilt_at = 0.0
+        self.dirty = False
+        self.snapshot_stamp: tuple[int, int] | None = None
+        self._publisher_fd: int | None = None
+        self._lock = asyncio.Lock()
+        self._maintenance: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return get_settings().search_index_enabled
+
+    @property
+    def snapshot_path(self) -> str:
+        return get_settings().search_snapshot_path
+
+    def supports(self, *, sort_by: str, keyword: str | None, facets: bool) -> bool:
+        """Relevance order (with a keyword) and facets stay on the SQL path."""
+        if not self.enabled or facets:
+            return False
+        return not (sort_by == "relevance" and keyword and keyword.strip())
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+
+    async def warm_up(self) -> None:
+        if not self.enabled:
+            return
+        try:
+            if self._acquire_publisher():
+                async with SessionLocal() as session:
+                    await self.rebuild(session)
+            else:
+                self.refreshed_at = time.monotonic()
+                self._follow_snapshot()
+        except Exception:  # noqa: BLE001
+            logger.exception("job search index warm-up failed; /jobs stays on the SQL path")
+
+    async def close(self) -> None:
+        if self._maintenance is not None and not self._maintenance.done():
+            self._maintenance.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._maintenance
+
+    async def search(self, session: AsyncSession, query: JobIndexQuery) -> dict | None:
+        """Index result for `query`, or None when the index is not built yet."""
+        self.ensure_fresh()
+        if self.index is None:
+            return None
+        query = await self.resolve_regions(session, query)
+        keyset = JOB_KEYSETS.get(query.sort_by, JOB_KEYSETS["time"])
+        return self.index.search(query, keyset, get_settings().count_exact_threshold)
+
+    async def resolve_regions(self, session: AsyncSession, query: JobIndexQuery) -> JobIndexQuery:
+        """`query` with its location filters expanded to region ids, as JobDAO.search_jobs does."""
+        regions = [
+            await self.region_dao.filter_ids(session, level, name)
+            for level, name in query.location_filters().items()
+        ]
+        return replace(query, regions=tuple(regions))
+
+    def ensure_fresh(self) -> None:
+        """Follow the published snapshot and start due maintenance; never waits for it."""
+        settings = get_settings()
+        now = time.monotonic()
+        busy = self._maintenance is not None and not self._maintenance.done()
+        if self._publisher_fd is None and self.snapshot_path:
+            self._follow_snapshot()
+            if busy or now - self.refreshed_at < settings.search_index_refresh_seconds:
+                return
+            self.refreshed_at = now
+            if self._acquire_publisher():
+                logger.info("taking over job search snapshot publishing path=%s", self.snapshot_path)
+                self._start(self.rebuild)
+            return
+        if busy or self.local is None:
+            return  # maintenance already running, or warm-up failed
+        if now - self.rebuilt_at >= settings.search_index_rebuild_interval_minutes * 60:
+            self._start(self.rebuild)
+        elif self.dirty or now - self.refreshed_at >= settings.search_index_refresh_seconds:
+            self._start(self.refresh)
+
+    def _start(self, job: Callable[[AsyncSession], Awaitable[None]]) -> None:
+        self._maintenance = asyncio.create_task(self._maintain(job))
+
+    async def _maintain(self, job: Callable[[AsyncSession], Awaitable[None]]) -> None:
+        try:
+            async with SessionLocal() as session:
+                await job(session)
+        except Exception:  # noqa: BLE001
+            # The current generation keeps serving; the next due check retries.
+            logger.exception("job search index maintenance failed job=%s", job.__name__)
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        async with self._lock:
+            started = time.perf_counter()
+            watermark = await self._db_now(session)
+            index = JobSearchIndex()
+            async for batch in self.doc_dao.iter_index_docs(session):
+                index.add(batch)
+            self.index = self.local = index
+            self.watermark = watermark
+            self.refreshed_at = self.rebuilt_at = time.monotonic()
+            self.dirty = False
+            await self._publish(index, watermark)
+        logger.info(
+            "job search index rebuilt docs=%s seconds=%.2f", len(index), time.perf_counter() - started
+        )
+
+    async def refresh(self, session: AsyncSession) -> None:
+        async with self._lock:
+            index = self.local
+            if index is None or self.watermark is None:
+                return
+            self.dirty = False
+            watermark = await self._db_now(session)
+            overlap = timedelta(seconds=get_settings().search_index_refresh_overlap_seconds)
+            added = 0
+            async for batch in self.doc_dao.iter_index_docs(session, since=self.watermark - overlap):
+                added += index.add(batch)
+            self.watermark = watermark
+            self.refreshed_at = time.monotonic()
+            needs_rebuild = index.dead_ratio > MAX_DEAD_RATIO
+            if added and not needs_rebuild:
+                await self._publish(index, watermark)
+        if needs_rebuild:
+            await self.rebuild(session)
+
+    async def _publish(self, index: JobSearchIndex, watermark: datetime) -> None:
+        path = self.snapshot_path
+        if not path:
+            return
+        meta = {"watermark": watermark.isoformat()}
+        try:
+            # Off the event loop; the held lock keeps refreshes from mutating `index` meanwhile.
+            await asyncio.to_thread(write_job_snapshot, index, path, meta)
+        except OSError:
+            logger.exception("job search snapshot write failed path=%s", path)
+
+    def _acquire_publisher(self) -> bool:
+        """Become the worker that builds the index (always, without a snapshot path)."""
+        path = self.snapshot_path
+        if not path or self._publisher_fd is not None:
+            return True
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # Held until the process exits; the kernel releases it if the worker dies.
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._publisher_fd = fd
+        return True
+
+    def _follow_snapshot(self) -> None:
+        """Map the published snapshot when it was replaced since the last look."""
+        path = self.snapshot_path
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return  # the publisher has not written one yet
+        stamp = (stat.st_ino, stat.st_mtime_ns)
+        if stamp == self.snapshot_stamp:
+            return
+        try:
+            index = MappedJobIndex(path)
+        except (OSError, SnapshotError):
+            logger.exception("job search snapshot load failed path=%s", path)
+            return
+        self.index, self.snapshot_stamp = index, stamp
+        logger.info("job search snapshot mapped docs=%s meta=%s", len(index), index.meta)
+
+    async def _db_now(self, session: AsyncSession) -> datetime:
+        # Database clock, so the watermark compares against updated_at without clock skew.
+        return (await session.execute(select(func.now()))).scalar_one()
+
+
+_SERVICE: JobIndexService | None = None
+
+
+def get_job_index_service() -> JobIndexService:
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = JobIndexService()
+    return _SERVICE
@@ -2,14 +2,20 @@ from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_response_cache
 from app.dao.job_dao import JobDAO
+from app.dao.pagination import InvalidCursorError
 from app.exceptions.base import BusinessError
-from app.exceptions.codes import JOB_NOT_FOUND
+from app.exceptions.codes import INVALID_REQUEST, JOB_NOT_FOUND
+from app.search.job_index import JobIndexQuery
+from app.service.job_index_service import get_job_index_service
 
 
 class JobService:
     def __init__(self) -> None:
         self.job_dao = JobDAO()
+        self.cache = get_response_cache()
+        self.index_service = get_job_index_service()
 
     async def search(
         self,
@@ -29,24 +35,78 @@ class JobService:
         salary_max: float | None,
         industry: str | None,
         source: str | None,
+        cursor: str | None = None,
+        facets: bool = False,
+        salary_unknown: bool = True,
     ) -> dict:
-        return await self.job_dao.search_jobs(
-            session,
-            page=page,
-            page_size=page_size,
-            keyword=keyword,
-            province=province,
-            city=city,
-            district=district,
-            category=category,
-            education=education,
-            experience_min=experience_min,
-            salary_min=Decimal(str(salary_min)) if salary_min is not None else None,
-            salary_max=Decimal(str(salary_max)) if salary_max is not None else None,
-            industry=industry,
-            source_code=source,
-            sort_by=sort_by,
-        )
+        params = {
+            "page": page,
+            "page_size": page_size,
+            "sort_by": sort_by,
+            "keyword": keyword,
+            "province": province,
+            "city": city,
+            "district": district,
+            "category": category,
+            "education": education,
+            "experience_min": experience_min,
+            "salary_min": salary_min,
+            "salary_max": salary_max,
+            "salary_unknown": None if salary_unknown else False,
+            "industry": industry,
+            "source": source,
+            "cursor": cursor,
+            "facets": facets or None,
+        }
+
+        async def compute() -> dict:
+            try:
+                if self.index_service.supports(sort_by=sort_by, keyword=keyword, facets=facets):
+                    query = JobIndexQuery(
+                        page=page,
+                        page_size=page_size,
+                        sort_by=sort_by,
+                        keyword=keyword,
+                        province=province,
+                        city=city,
+                        district=district,
+                        category=category,
+                        education=education,
+                        industry=industry,
+                        source_code=source,
+                        experience_min=experience_min,
+                        salary_min=salary_min,
+                        salary_max=salary_max,
+                        salary_unknown=salary_unknown,
+                        cursor=cursor,
+                    )
+                    result = await self.index_service.search(session, query)
+                    if result is not None:
+                        return result
+                return await self.job_dao.search_jobs(
+                    session,
+                    page=page,
+                    page_size=page_size,
+                    keyword=keyword,
+                    province=province,
+                    city=city,
+                    district=district,
+                    category=category,
+                    education=education,
+                    experience_min=experience_min,
+                    salary_min=Decimal(str(salary_min)) if salary_min is not None else None,
+                    salary_max=Decimal(str(salary_max)) if salary_max is not None else None,
+                    industry=industry,
+                    source_code=source,
+                    sort_by=sort_by,
+                    cursor=cursor,
+                    facets=facets,
+                    salary_unknown=salary_unknown,
+                )
+            except InvalidCursorError as exc:
+                raise BusinessError(INVALID_REQUEST, str(exc), 400) from exc
+
+        return await self.cache.get_or_compute("jobs", "search", params, compute, source_code=source)
 
     async def detail(self, session: AsyncSession, job_id: int) -> dict:
         detail = await self.job_dao.get_job_detail(session, job_id)
@@ -55,4 +115,6 @@ class JobService:
         return detail
 
     async def basic_stats(self, session: AsyncSession) -> dict:
-        return await self.job_dao.basic_stats(session)
+        return await self.cache.get_or_compute(
+            "jobs", "stats", {}, lambda: self.job_dao.basic_stats(session)
+        )
@@ -5,9 +5,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dao.campus_event_dao import CampusEventDAO
 from app.dao.job_dao import JobDAO
+from app.dao.pagination import InvalidCursorError
 from app.dao.service_order_dao import ServiceOrderDAO
 from app.exceptions.base import BusinessError
-from app.exceptions.codes import ORDER_NOT_FOUND, ORDER_VALIDATION_ERROR
+from app.exceptions.codes import INVALID_REQUEST, ORDER_NOT_FOUND, ORDER_VALIDATION_ERROR
 
 
 class OrderService:
@@ -60,8 +61,20 @@ class OrderService:
             "created_at": order.created_at,
         }
 
-    async def list_orders(self, session: AsyncSession, page: int, page_size: int, phone: str | None) -> dict:
-        return await self.order_dao.list_orders(session, page=page, page_size=page_size, phone=phone)
+    async def list_orders(
+        self,
+        session: AsyncSession,
+        page: int,
+        page_size: int,
+        phone: str | None,
+        cursor: str | None = None,
+    ) -> dict:
+        try:
+            return await self.order_dao.list_orders(
+                session, page=page, page_size=page_size, phone=phone, cursor=cursor
+            )
+        except InvalidCursorError as exc:
+            raise BusinessError(INVALID_REQUEST, str(exc), 400) from exc
 
     async def detail(self, session: AsyncSession, order_id: int) -> dict:
         order = await self.order_dao.get_by_id(session, order_id)
@@ -0,0 +1,41 @@
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import get_response_cache
+from app.dao.campus_event_dao import CampusEventDAO
+from app.dao.job_dao import JobDAO
+from app.dao.stats_rollup_dao import StatsRollupDAO
+
+logger = logging.getLogger(__name__)
+
+
+class StatsRollupService:
+    def __init__(self) -> None:
+        self.rollup_dao = StatsRollupDAO()
+        self.recounters = {"jobs": JobDAO(), "campus_events": CampusEventDAO()}
+
+    async def reconcile(self, session: AsyncSession) -> list[dict]:
+        """Recount every rollup scope from the base tables and overwrite drifted buckets.
+
+        Ingest keeps the rollups current by deltas; this periodic full recount repairs anything
+        those deltas missed (manual SQL, deleted rows, a crashed partial ingest).
+        """
+        results: list[dict] = []
+        for scope, dao in self.recounters.items():
+            await self.rollup_dao.lock_for_reconcile(session)
+            actual = await dao.rollup_counts(session)
+            stored = await self.rollup_dao.load(session, scope)
+            drift: dict[str, int] = {}
+            for dimension, bucket in sorted(set(actual) | set(stored)):
+                diff = actual.get((dimension, bucket), 0) - stored.get((dimension, bucket), 0)
+                if diff:
+                    drift[f"{dimension}:{bucket}"] = diff
+            if drift:
+                await self.rollup_dao.replace(session, scope, actual)
+            await session.commit()
+            if drift:
+                await get_response_cache().bump(scope)
+                logger.warning("stats_rollup_drift scope=%s buckets=%s drift=%s", scope, len(drift), drift)
+            results.append({"scope": scope, "buckets": len(actual), "drifted_buckets": len(drift)})
+        return results
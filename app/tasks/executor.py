@@ -1,23 +1,49 @@
+from app.core.config import get_settings
 from app.core.database import SessionLocal
 from app.crawler.campus_registry import REGISTRY as CAMPUS_CRAWLER_REGISTRY
 from app.crawler.registry import REGISTRY as JOB_CRAWLER_REGISTRY
 from app.service.campus_crawl_service import CampusCrawlService
 from app.service.crawl_service import CrawlService
+from app.service.credential_service import CredentialService
+from app.service.stats_rollup_service import StatsRollupService
 
 
 class TaskExecutor:
-    def __init__(self) -> None:
+    def __init__(self, execution_mode: str | None = None) -> None:
         self.crawl_service = CrawlService()
         self.campus_crawl_service = CampusCrawlService()
+        self.credential_service = CredentialService()
+        self.stats_rollup_service = StatsRollupService()
+        # None defers to APP_CRAWLER_EXECUTION_MODE / config_json.sandbox.enabled per source;
+        # "subprocess" or "inline" forces the mode for every crawl this executor runs.
+        self.execution_mode = execution_mode
 
     async def run_crawl(self, source_code: str, trigger_type: str = "schedule") -> dict:
+        sandboxed = None if self.execution_mode is None else self.execution_mode == "subprocess"
         async with SessionLocal() as session:
             if source_code in JOB_CRAWLER_REGISTRY:
-                return await self.crawl_service.run_source(session, source_code=source_code, trigger_type=trigger_type)
+                return await self.crawl_service.run_source(
+                    session,
+                    source_code=source_code,
+                    trigger_type=trigger_type,
+                    sandboxed=sandboxed,
+                )
             if source_code in CAMPUS_CRAWLER_REGISTRY:
                 return await self.campus_crawl_service.run_source(
                     session,
                     source_code=source_code,
                     trigger_type=trigger_type,
+                    sandboxed=sandboxed,
                 )
             raise KeyError(f"No crawler adapter registered for source={source_code}")
+
+    async def run_credential_refresh(self) -> list[dict]:
+        settings = get_settings()
+        async with SessionLocal() as session:
+            return await self.credential_service.refresh_due(
+                session, lead_seconds=settings.credential_refresh_lead_seconds
+            )
+
+    async def run_stats_reconcile(self) -> list[dict]:
+        async with SessionLocal() as session:
+            return await self.stats_rollup_service.reconcile(session)
@@ -2,6 +2,7 @@ import logging
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import get_settings
 from app.core.database import SessionLocal
@@ -40,6 +41,21 @@ class SchedulerService:
         except Exception:
             logger.exception("scheduler registration failed; startup will continue")
 
+        settings = get_settings()
+        self.scheduler.add_job(
+            self._refresh_credentials,
+            trigger=IntervalTrigger(minutes=max(1, settings.credential_refresh_interval_minutes)),
+            id="credentials:refresh",
+            max_instances=1,
+            replace_existing=True,
+        )
+        self.scheduler.add_job(
+            self._reconcile_stats,
+            trigger=IntervalTrigger(minutes=max(1, settings.stats_reconcile_interval_minutes)),
+            id="stats:reconcile",
+            max_instances=1,
+            replace_existing=True,
+        )
         self.scheduler.start()
 
     async def stop(self) -> None:
@@ -52,5 +68,17 @@ class SchedulerService:
         except Exception:
             logger.exception("scheduled crawl failed", extra={"source": source_code})
 
+    async def _refresh_credentials(self) -> None:
+        try:
+            await self.executor.run_credential_refresh()
+        except Exception:
+            logger.exception("scheduled credential refresh failed")
+
+    async def _reconcile_stats(self) -> None:
+        try:
+            await self.executor.run_stats_reconcile()
+        except Exception:
+            logger.exception("scheduled stats reconcile failed")
+
 
 scheduler_service = SchedulerService()
@@ -1,13 +1,177 @@
-def normalize_location(raw: str | None) -> tuple[str | None, str | None, str | None, str]:
-    if not raw:
-        return None, None, None, "cn::unknown"
+"""Canonical province / city / district for free-form job location strings.
+
+Names come from the bundled gazetteer (APP_GAZETTEER_PATH), compiled once per process into a
+character trie: one greedy longest-match pass over the string finds every division it names,
+and the division consistent with the most matches wins. Spelling variants ("上海", "上海市",
+"Shanghai") therefore share one `locations` row. A string naming no known division
+("Worldwide", "远程") keeps its own row under a `raw::` key, so it stays distinguishable and
+can be re-resolved once the gazetteer learns it (scripts/recanonicalize_locations.py).
+"""
+
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from app.core.config import get_settings
+
+UNKNOWN_KEY = "cn::unknown"
+RAW_KEY_PREFIX = "raw::"
+# Unresolved text kept in the key; leaves room for the prefix in locations.normalized_key.
+RAW_TEXT_MAX_CHARS = 200
+# Distinct raw strings memoized per process; sources repeat a few thousand spellings.
+MEMO_SIZE = 65536
+# Suffixes a gazetteer name may carry, per level (1 province, 2 city, 3 district). Municipality
+# names resolve to their city node, so "北京市" is covered by the city suffixes.
+LEVEL_SUFFIXES = {1: ("", "省", "自治区"), 2: ("", "市", "地区", "自治州"), 3: ("", "区", "县", "市", "新区")}
+
+_END = ""  # trie key holding the nodes a surface form ends at; never a text character
+
+Division = tuple[str, ...]  # gazetteer path: (province,), (province, city) or (province, city, district)
+
+
+class Gazetteer:
+    def __init__(self) -> None:
+        self.root: dict[str, Any] = {}
+        # Gazetteer order, the last tie-breaker between equally supported divisions.
+        self.order: dict[Division, int] = {}
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Gazetteer":
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_mapping(yaml.safe_load(handle))
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "Gazetteer":
+        gazetteer = cls()
+        for name in data.get("municipalities") or []:
+            gazetteer.add_division((name, name), (name,))
+        for province, cities in (data.get("provinces") or {}).items():
+            gazetteer.add_division((province,))
+            for city in cities or []:
+                gazetteer.add_division((province, city))
+        for parent, districts in (data.get("districts") or {}).items():
+            for district in districts or []:
+                gazetteer.add_division((*parent.split("/"), district))
+        for alias, path in (data.get("aliases") or {}).items():
+            gazetteer.add(alias, tuple(path.split("/")))
+        return gazetteer
+
+    def add_division(self, division: Division, names: Division | None = None) -> None:
+        """Index a division under its name (or `names`) with every suffix of its level."""
+        for name in names or division[-1:]:
+            for suffix in LEVEL_SUFFIXES[len(division)]:
+                self.add(name + suffix, division)
+
+    def add(self, surface: str, division: Division) -> None:
+        surface = surface.strip().lower()
+        if len(surface) < 2:
+            return  # single characters match inside too many unrelated words
+        self.order.setdefault(division, len(self.order))
+        node = self.root
+        for char in surface:
+            node = node.setdefault(char, {})
+        divisions = node.setdefault(_END, [])
+        if division not in divisions:
+            divisions.append(division)
+
+    def scan(self, text: str) -> list[list[Division]]:
+        """Candidate divisions of each name in `text`, left to right.
+
+        Greedy longest match from each position, resuming after a match: O(len(text) x the
+        longest surface form). Latin aliases only match as whole words.
+        """
+        matches: list[list[Division]] = []
+        start = 0
+        while start < len(text):
+            node = self.root
+            found: tuple[int, list[Division]] | None = None
+            end = start
+            while end < len(text) and text[end] in node:
+                node = node[text[end]]
+                end += 1
+                if _END in node and _word_bounded(text, start, end):
+                    found = end, node[_END]
+            if found is None:
+                start += 1
+            else:
+                start, divisions = found
+                matches.append(divisions)
+        return matches
 
-    text = raw.strip().replace("市", "").replace("省", "")
-    parts = [p for p in text.replace("/", "-").split("-") if p]
+    def resolve(self, text: str) -> Division | None:
+        """The division named by `text`, or None when it names none.
 
-    province = parts[0] if len(parts) >= 1 else None
-    city = parts[1] if len(parts) >= 2 else parts[0] if province else None
-    district = parts[2] if len(parts) >= 3 else None
+        A division's support is the number of matches naming it or one of its ancestors, so
+        "北京-朝阳" picks Beijing's 朝阳 district over the 朝阳 city in Liaoning. Ties go to the
+        coarser division, then the earlier match, then gazetteer order.
+        """
+        matches = self.scan(text.lower())
+        best: Division | None = None
+        best_rank: tuple[int, int, int, int] | None = None
+        for position, divisions in enumerate(matches):
+            for division in divisions:
+                support = sum(
+                    any(division[: len(candidate)] == candidate for candidate in candidates)
+                    for candidates in matches
+                )
+                rank = (-support, len(division), position, self.order[division])
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = division, rank
+        return best
 
-    key = f"cn::{province or 'unknown'}::{city or 'unknown'}::{district or 'unknown'}"
+
+_GAZETTEER: Gazetteer | None = None
+
+
+def get_gazetteer() -> Gazetteer:
+    global _GAZETTEER
+    if _GAZETTEER is None:
+        _GAZETTEER = Gazetteer.load(get_settings().gazetteer_path)
+    return _GAZETTEER
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def normalize_location(raw: str | None) -> tuple[str | None, str | None, str | None, str]:
+    """`(province, city, district, location_key)` of a raw location string.
+
+    Municipalities are both province and city ("上海" -> 上海 / 上海). A string naming no
+    gazetteer division keys on its whitespace-collapsed text; only an empty one maps to
+    UNKNOWN_KEY.
+    """
+    text = " ".join(raw.split()) if raw else ""
+    if not text:
+        return None, None, None, UNKNOWN_KEY
+    division = get_gazetteer().resolve(text)
+    if division is None:
+        return None, None, None, RAW_KEY_PREFIX + text[:RAW_TEXT_MAX_CHARS]
+
+    province, city, district = (*division, None, None)[:3]
+    key = f"cn::{province}::{city or 'unknown'}::{district or 'unknown'}"
     return province, city, district, key
+
+
+def stored_location_text(
+    normalized_key: str, province: str | None, city: str | None, district: str | None
+) -> str | None:
+    """Text to re-resolve an existing `locations` row from, or None for the unknown row.
+
+    `raw::` rows keep their original string; other rows (including ones keyed by the old
+    "-" splitter) are rebuilt from their division names.
+    """
+    if normalized_key.startswith(RAW_KEY_PREFIX):
+        return normalized_key[len(RAW_KEY_PREFIX) :]
+    names = [name for name in (province, city, district) if name]
+    return "-".join(dict.fromkeys(names)) or None
+
+
+def _word_bounded(text: str, start: int, end: int) -> bool:
+    if not _is_latin(text[start]):
+        return True
+    return (start == 0 or not _is_latin(text[start - 1])) and (end == len(text) or not _is_latin(text[end]))
+
+
+def _is_latin(char: str) -> bool:
+    return char.isascii() and char.isalnum()
@@ -5,6 +5,7 @@ from app.models.enums import EducationLevel, JobType, RemoteType
 from app.utils.hash import sha1_hex
 from app.utils.location import normalize_location
 from app.utils.salary import parse_salary_range
+from app.utils.search_tokens import build_search_document
 from app.utils.time import now_utc
 
 
@@ -96,6 +97,12 @@ def normalize_job(raw: RawJob) -> NormalizedJob:
         first_crawled_at=now_utc(),
         last_crawled_at=now_utc(),
         skills=skills,
+        search_document=build_search_document(
+            raw.title,
+            raw.responsibilities or raw.description,
+            raw.qualifications,
+            " ".join(skills),
+        ),
     )
     _ = asdict(normalized)
     return normalized
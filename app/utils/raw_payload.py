@@ -0,0 +1,37 @@
+import hashlib
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+ENCODING_JSON = "json"
+ENCODING_ZLIB = "zlib+json"
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    data: bytes
+    encoding: str
+    sha256: str
+
+
+def encode_payload(payload: Any, compression: str = "zlib") -> EncodedPayload:
+    """Canonical (sorted-key) JSON bytes, zlib-compressed unless `compression` is "none".
+
+    The digest is taken over the canonical JSON, so an unchanged payload hashes the same on
+    every crawl regardless of compression and the stored copy does not need rewriting.
+    """
+    raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.sha256(raw).hexdigest()
+    if compression == "zlib":
+        return EncodedPayload(zlib.compress(raw, 6), ENCODING_ZLIB, digest)
+    return EncodedPayload(raw, ENCODING_JSON, digest)
+
+
+def decode_payload(data: bytes, encoding: str) -> Any:
+    if encoding == ENCODING_ZLIB:
+        data = zlib.decompress(data)
+    elif encoding != ENCODING_JSON:
+        raise ValueError(f"unknown payload encoding {encoding}")
+    return orjson.loads(data)
@@ -1,5 +1,5 @@
 import re
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 
 
 SALARY_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*[kK]\s*[-~]\s*(\d+(?:\.\d+)?)\s*[kK]")
@@ -19,3 +19,36 @@ def parse_salary_range(salary_text: str | None) -> tuple[Decimal | None, Decimal
     if "年" in text or "year" in text.lower():
         period = "year"
     return low, high, "CNY", period
+
+
+# Months one pay period covers; amounts are divided by it to get a monthly figure.
+PERIOD_MONTHS = {"month": Decimal(1), "year": Decimal(12)}
+# Only amounts already in this currency are normalized; others count as unknown salary.
+NORMALIZED_CURRENCY = "CNY"
+
+
+def monthly_salary_range(
+    salary_min: Decimal | None, salary_max: Decimal | None, currency: str | None, period: str | None
+) -> tuple[int, int] | None:
+    """Inclusive CNY/month bounds of a parsed salary, comparable across periods.
+
+    A one-sided range uses its known end for both bounds; unknown amounts, currencies or periods
+    give None.
+    """
+    months = PERIOD_MONTHS.get(period or "")
+    if currency != NORMALIZED_CURRENCY or months is None:
+        return None
+    low = salary_min if salary_min is not None else salary_max
+    high = salary_max if salary_max is not None else salary_min
+    if low is None or high is None:
+        return None
+    low, high = sorted((low, high))
+    return _to_month(low, months), _to_month(high, months)
+
+
+def monthly_salary_midpoint(bounds: tuple[int, int] | None) -> int | None:
+    return (bounds[0] + bounds[1]) // 2 if bounds is not None else None
+
+
+def _to_month(amount: Decimal, months: Decimal) -> int:
+    return int((Decimal(amount) / months).to_integral_value(rounding=ROUND_HALF_UP))
@@ -0,0 +1,54 @@
+import re
+
+# CJK unified ideographs (basic + extension A + compatibility); kana/hangul are rare in listings.
+_CJK_RUN = r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+"
+_TOKEN_RE = re.compile(rf"({_CJK_RUN})|([0-9a-z]+)")
+
+
+def tokenize_search_text(text: str | None) -> list[str]:
+    """Split mixed Chinese/English text into index terms.
+
+    Each run of CJK characters yields its unigrams and overlapping bigrams ("后端开发" ->
+    后 端 开 发 后端 端开 开发); Latin letters and digits yield lowercase words. The `simple`
+    text search config keeps space-separated terms as-is, so they become tsvector lexemes.
+    """
+    if not text:
+        return []
+    tokens: list[str] = []
+    for cjk, word in _TOKEN_RE.findall(text.lower()):
+        if word:
+            tokens.append(word)
+            continue
+        tokens.extend(cjk)
+        tokens.extend(cjk[i : i + 2] for i in range(len(cjk) - 1))
+    return tokens
+
+
+def build_search_document(*parts: str | None) -> str:
+    """Space-separated index terms for `to_tsvector('simple', ...)`; duplicates are dropped."""
+    tokens: dict[str, None] = {}
+    for part in parts:
+        for token in tokenize_search_text(part):
+            tokens.setdefault(token, None)
+    return " ".join(tokens)
+
+
+def build_search_query(keyword: str | None) -> str | None:
+    """Tokenize a keyword like a document and AND the terms for `to_tsquery('simple', ...)`.
+
+    A CJK run of two or more characters matches through its bigrams (a single character through
+    its unigram); Latin words use prefix matching so "pyth" still finds "python". Terms only
+    contain CJK characters and [0-9a-z], so the result needs no tsquery escaping.
+    """
+    if not keyword:
+        return None
+    terms: dict[str, None] = {}
+    for cjk, word in _TOKEN_RE.findall(keyword.lower()):
+        if word:
+            terms.setdefault(f"{word}:*", None)
+        elif len(cjk) == 1:
+            terms.setdefault(cjk, None)
+        else:
+            for i in range(len(cjk) - 1):
+                terms.setdefault(cjk[i : i + 2], None)
+    return " & ".join(terms) or None
@@ -1,6 +1,7 @@
 export interface EventsQueryParams {
   page?: number;
   page_size?: number;
+  cursor?: string;
   sort_by?: "time" | "recent";
   keyword?: string;
   city?: string;
@@ -29,6 +30,8 @@ export interface CampusEventsListResult {
   page: number;
   page_size: number;
   total: number;
+  total_exact: boolean;
+  next_cursor: string | null;
 }
 
 export interface CampusEventDetail extends CampusEventListItem {
@@ -1,6 +1,8 @@
 export interface JobsQueryParams {
   page?: number;
   page_size?: number;
+  cursor?: string;
+  facets?: boolean;
   sort_by?: "time" | "salary" | "relevance";
   keyword?: string;
   province?: string;
@@ -29,11 +31,21 @@ export interface JobListItem {
   source_code: string;
 }
 
+export type JobFacetName = "city" | "category" | "education" | "source" | "salary";
+
+export interface JobFacetBucket {
+  value: string;
+  count: number;
+}
+
 export interface JobsListResult {
   items: JobListItem[];
   page: number;
   page_size: number;
   total: number;
+  total_exact: boolean;
+  next_cursor: string | null;
+  facets?: Record<JobFacetName, JobFacetBucket[]>;
 }
 
 export interface JobDetail extends JobListItem {
@@ -27,6 +27,7 @@ export interface CreateOrderResult {
 export interface OrdersQueryParams {
   page?: number;
   page_size?: number;
+  cursor?: string;
   phone?: string;
 }
 
@@ -50,4 +51,5 @@ export interface OrdersListResult {
   page: number;
   page_size: number;
   total: number;
+  next_cursor: string | null;
 }
@@ -0,0 +1,158 @@
+"""Compare legacy keyword search (simple tsvector + ILIKE fallback) with CJK-tokenized search.
+
+Builds a throwaway `bench_job_search` table with N synthetic Chinese job postings in the
+configured database, indexes both vectors with GIN and times the two query shapes
+`JobDAO.search_jobs` used before/after CJK tokenization:
+
+    uv run python scripts/bench_job_search.py --rows 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.utils.search_tokens import build_search_document, build_search_query
+
+TABLE = "bench_job_search"
+ROLES = [
+    "后端开发",
+    "前端开发",
+    "数据分析",
+    "算法工程师",
+    "产品经理",
+    "测试开发",
+    "运维",
+    "销售",
+    "会计",
+    "人力资源",
+]
+PREFIXES = ["高级", "资深", "初级", "校招", "实习", ""]
+STACK = ["Python", "Java", "Go", "FastAPI", "Spring", "PostgreSQL", "Redis", "Kafka", "Excel"]
+DUTIES = [
+    "负责核心系统设计与开发",
+    "参与数据仓库建设",
+    "维护线上服务稳定性",
+    "对接业务需求并推进落地",
+    "编写自动化测试用例",
+    "分析用户行为数据",
+    "负责招聘与员工关系",
+    "完成月度财务报表",
+]
+KEYWORDS = ["后端", "数据分析", "算法", "python", "财务报表", "校招 java"]
+
+
+def _synthetic_job(rng: random.Random) -> tuple[str, str]:
+    title = f"{rng.choice(PREFIXES)}{rng.choice(ROLES)}"
+    duties = "，".join(rng.sample(DUTIES, 3))
+    skills = "、".join(rng.sample(STACK, 3))
+    return title, f"{duties}；熟悉 {skills}"
+
+
+async def _load(rows: int, batch_size: int, seed: int) -> None:
+    rng = random.Random(seed)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        await conn.execute(
+            text(
+                f"CREATE TABLE {TABLE} (id bigserial PRIMARY KEY, title text, "
+                "responsibilities text, legacy_vector tsvector, cjk_vector tsvector)"
+            )
+        )
+    inserted = 0
+    while inserted < rows:
+        count = min(batch_size, rows - inserted)
+        jobs = [_synthetic_job(rng) for _ in range(count)]
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    f"INSERT INTO {TABLE} (title, responsibilities, legacy_vector, cjk_vector) "
+                    "SELECT t, r, to_tsvector('simple', t || ' ' || r), to_tsvector('simple', d) "
+                    "FROM unnest(CAST(:titles AS text[]), CAST(:resps AS text[]), "
+                    "CAST(:docs AS text[])) AS u(t, r, d)"
+                ),
+                {
+                    "titles": [title for title, _ in jobs],
+                    "resps": [resp for _, resp in jobs],
+                    "docs": [build_search_document(title, resp) for title, resp in jobs],
+                },
+            )
+        inserted += count
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE INDEX ON {TABLE} USING gin (legacy_vector)"))
+        await conn.execute(text(f"CREATE INDEX ON {TABLE} USING gin (cjk_vector)"))
+        await conn.execute(text(f"ANALYZE {TABLE}"))
+
+
+def _queries(keyword: str) -> dict[str, tuple[str, dict]]:
+    return {
+        "legacy": (
+            f"FROM {TABLE} WHERE legacy_vector @@ plainto_tsquery('simple', :kw) "
+            "OR title ILIKE :like OR responsibilities ILIKE :like",
+            {"kw": keyword, "like": f"%{keyword}%"},
+        ),
+        "cjk": (
+            f"FROM {TABLE} WHERE cjk_vector @@ to_tsquery('simple', :q)",
+            {"q": build_search_query(keyword)},
+        ),
+    }
+
+
+async def _measure(repeats: int) -> list[dict]:
+    results = []
+    async with engine.connect() as conn:
+        for keyword in KEYWORDS:
+            for name, (where, params) in _queries(keyword).items():
+                page_sql = f"SELECT id {where} ORDER BY id DESC LIMIT 20"
+                count_sql = f"SELECT count(*) {where}"
+                plan = (await conn.execute(text(f"EXPLAIN {count_sql}"), params)).scalars().all()
+                timings = []
+                total = 0
+                for _ in range(repeats):
+                    started = time.perf_counter()
+                    total = (await conn.execute(text(count_sql), params)).scalar_one()
+                    await conn.execute(text(page_sql), params)
+                    timings.append((time.perf_counter() - started) * 1000)
+                results.append(
+                    {
+                        "keyword": keyword,
+                        "mode": name,
+                        "matches": total,
+                        "p50_ms": round(statistics.median(timings), 2),
+                        "max_ms": round(max(timings), 2),
+                        "uses_index": any("Index" in line for line in plan),
+                    }
+                )
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="职位关键词检索基准：simple+ILIKE vs 中文分词 GIN")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="保留基准表，默认结束后删除")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    await _load(args.rows, args.batch_size, args.seed)
+    elapsed = round(time.perf_counter() - started, 1)
+    print(json.dumps({"message": "loaded", "rows": args.rows, "seconds": elapsed}))
+    try:
+        for row in await _measure(args.repeats):
+            print(json.dumps(row, ensure_ascii=False))
+    finally:
+        if not args.keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,185 @@
+"""Compare full-entity list queries with the lean column projections used by list endpoints.
+
+Runs against the rows already in the configured database. For each list endpoint it measures
+the bytes the page query ships (sum of `pg_column_size` over the returned rows) and per-request
+CPU (`time.process_time`) for fetch + item building + JSON encoding, in two shapes:
+
+- entity: `select(Model)` hydrated into the session, items built from attributes, encoded with
+  FastAPI's jsonable_encoder + json.dumps (the pre-projection path);
+- lean: `select(*LIST_COLUMNS)` plain rows, items from `row._asdict()`, encoded with orjson.
+
+    uv run python scripts/bench_list_projection.py --page-size 100 --repeats 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Select, func, select
+
+from app.core.database import SessionLocal, engine
+from app.core.response import OrjsonResponse, success_response
+from app.dao.campus_event_dao import EVENT_LIST_COLUMNS
+from app.dao.job_dao import JOB_LIST_COLUMNS
+from app.dao.service_order_dao import ORDER_LIST_COLUMNS
+from app.models.campus_event import CampusEvent
+from app.models.company import Company
+from app.models.job import Job
+from app.models.job_search_doc import JobSearchDoc
+from app.models.location import Location
+from app.models.service_order import ServiceOrder
+from app.models.source import Source
+
+
+def _job_entity_item(row: Any) -> dict:
+    job, company_name, source_code, city = row
+    return {
+        "id": job.id,
+        "title": job.title,
+        "company_name": company_name,
+        "city": city,
+        "salary_min": job.salary_min,
+        "salary_max": job.salary_max,
+        "salary_currency": job.salary_currency,
+        "salary_period": job.salary_period,
+        "education_requirement": job.education_requirement,
+        "published_at": job.published_at,
+        "source_code": source_code,
+    }
+
+
+def _event_entity_item(row: Any) -> dict:
+    event, source_code = row
+    return {
+        "id": event.id,
+        "title": event.title,
+        "company_name": event.company_name,
+        "school_name": event.school_name,
+        "city": event.city,
+        "venue": event.venue,
+        "starts_at": event.starts_at,
+        "event_type": event.event_type,
+        "event_status": event.event_status,
+        "source_code": source_code,
+        "source_url": event.source_url,
+    }
+
+
+def _order_entity_item(row: Any) -> dict:
+    (order,) = row
+    return {column.key: getattr(order, column.key) for column in ORDER_LIST_COLUMNS}
+
+
+def _lean_item(row: Any) -> dict:
+    return row._asdict()
+
+
+def _cases(page_size: int) -> dict[str, dict[str, tuple[Select, Callable[[Any], dict]]]]:
+    job_entity = (
+        select(Job, Company.display_name, Source.code, Location.city)
+        .join(Company, Company.id == Job.company_id)
+        .join(Source, Source.id == Job.source_id)
+        .join(Location, Location.id == Job.location_id, isouter=True)
+        .order_by(Job.id.desc())
+    )
+    event_entity = (
+        select(CampusEvent, Source.code)
+        .join(Source, Source.id == CampusEvent.source_id)
+        .order_by(CampusEvent.id.desc())
+    )
+    event_lean = (
+        select(*EVENT_LIST_COLUMNS)
+        .join(Source, Source.id == CampusEvent.source_id)
+        .order_by(CampusEvent.id.desc())
+    )
+    return {
+        "jobs": {
+            "entity": (job_entity.limit(page_size), _job_entity_item),
+            "lean": (
+                select(*JOB_LIST_COLUMNS).order_by(JobSearchDoc.job_id.desc()).limit(page_size),
+                _lean_item,
+            ),
+        },
+        "campus_events": {
+            "entity": (event_entity.limit(page_size), _event_entity_item),
+            "lean": (event_lean.limit(page_size), _lean_item),
+        },
+        "orders": {
+            "entity": (
+                select(ServiceOrder).order_by(ServiceOrder.id.desc()).limit(page_size),
+                _order_entity_item,
+            ),
+            "lean": (
+                select(*ORDER_LIST_COLUMNS).order_by(ServiceOrder.id.desc()).limit(page_size),
+                _lean_item,
+            ),
+        },
+    }
+
+
+def _encode(mode: str, items: list[dict]) -> bytes:
+    payload = success_response({"items": items})
+    if mode == "entity":
+        return json.dumps(jsonable_encoder(payload), ensure_ascii=False).encode("utf-8")
+    return OrjsonResponse(payload).body
+
+
+async def _row_bytes(stmt: Select) -> int:
+    page = stmt.subquery()
+    size_stmt = select(func.coalesce(func.sum(func.pg_column_size(page.table_valued())), 0))
+    async with engine.connect() as conn:
+        return int((await conn.execute(size_stmt)).scalar_one())
+
+
+async def _measure(page_size: int, repeats: int) -> list[dict]:
+    results = []
+    for endpoint, modes in _cases(page_size).items():
+        for mode, (stmt, build_item) in modes.items():
+            cpu_ms = []
+            wall_ms = []
+            body = b""
+            rows = 0
+            for _ in range(repeats):
+                # A fresh session per request, like the API: the identity map starts empty.
+                async with SessionLocal() as session:
+                    cpu_started = time.process_time()
+                    wall_started = time.perf_counter()
+                    items = [build_item(row) for row in (await session.execute(stmt)).all()]
+                    body = _encode(mode, items)
+                    cpu_ms.append((time.process_time() - cpu_started) * 1000)
+                    wall_ms.append((time.perf_counter() - wall_started) * 1000)
+                    rows = len(items)
+            results.append(
+                {
+                    "endpoint": endpoint,
+                    "mode": mode,
+                    "rows": rows,
+                    "row_bytes": await _row_bytes(stmt),
+                    "response_bytes": len(body),
+                    "cpu_p50_ms": round(statistics.median(cpu_ms), 3),
+                    "wall_p50_ms": round(statistics.median(wall_ms), 3),
+                }
+            )
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="列表查询基准：整实体加载 vs 列投影 + orjson")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    try:
+        for row in await _measure(args.page_size, args.repeats):
+            print(json.dumps(row, ensure_ascii=False))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""Compare the legacy split-on-separator location normalizer with the gazetteer trie.
+
+Generates N synthetic raw location strings the way sources spell them (suffixed and bare
+names, province prefixes, districts, pinyin, mixed separators, remote / overseas junk) and
+reports strings per second and the number of distinct location keys each normalizer yields,
+i.e. the `locations` rows an ingest of those strings would create:
+
+    uv run python scripts/bench_location_normalizer.py --rows 1000000
+"""
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+
+from app.utils.location import get_gazetteer, normalize_location
+
+SEPARATORS = ["", "-", "/", " ", "·", "，"]
+JUNK = ["Worldwide", "Remote", "远程", "全国", "不限", "Singapore", "San Francisco, CA", "海外"]
+PINYIN = ["Beijing", "Shanghai", "shenzhen", "Guangzhou", "Hangzhou", "Chengdu", "Hong Kong"]
+
+
+def _legacy_normalize_location(raw: str | None) -> tuple[str | None, str | None, str | None, str]:
+    # The normalizer before the gazetteer, kept here as the baseline.
+    if not raw:
+        return None, None, None, "cn::unknown"
+
+    text = raw.strip().replace("市", "").replace("省", "")
+    parts = [p for p in text.replace("/", "-").split("-") if p]
+
+    province = parts[0] if len(parts) >= 1 else None
+    city = parts[1] if len(parts) >= 2 else parts[0] if province else None
+    district = parts[2] if len(parts) >= 3 else None
+
+    key = f"cn::{province or 'unknown'}::{city or 'unknown'}::{district or 'unknown'}"
+    return province, city, district, key
+
+
+def _synthetic_locations(rows: int, distinct: int, seed: int) -> list[str]:
+    """`rows` strings drawn from `distinct` spellings, the repetition a crawl sees."""
+    rng = random.Random(seed)
+    divisions = [division for division in get_gazetteer().order if len(division) >= 2]
+    spellings = []
+    for _ in range(distinct):
+        roll = rng.random()
+        if roll < 0.05:
+            spellings.append(rng.choice(JUNK))
+            continue
+        if roll < 0.1:
+            spellings.append(rng.choice(PINYIN))
+            continue
+        division = rng.choice(divisions)
+        names = [division[-2], division[-1]] if len(division) == 3 else [division[-1]]
+        if rng.random() < 0.4 and division[0] != division[1]:
+            names.insert(0, division[0] + rng.choice(["", "省"]))
+        names[-1] += rng.choice(["", "", "市" if len(division) == 2 else "区"])
+        spellings.append(rng.choice(SEPARATORS).join(names))
+    return [rng.choice(spellings) for _ in range(rows)]
+
+
+def _measure(name: str, normalize: Callable, raws: list[str]) -> dict:
+    started = time.perf_counter()
+    keys = {normalize(raw)[3] for raw in raws}
+    elapsed = time.perf_counter() - started
+    return {
+        "normalizer": name,
+        "rows": len(raws),
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(len(raws) / elapsed),
+        "distinct_keys": len(keys),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="地点归一化基准：旧版分隔符切分 vs 行政区划词表 trie")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=20_000, help="原始写法池大小，逐行从中抽取")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    get_gazetteer()
+    print(json.dumps({"message": "gazetteer_loaded", "seconds": round(time.perf_counter() - started, 3)}))
+    raws = _synthetic_locations(args.rows, args.distinct, args.seed)
+    print(json.dumps({"message": "generated", "rows": len(raws), "distinct_raw": len(set(raws))}))
+
+    normalize_location.cache_clear()
+    for row in (
+        _measure("legacy", _legacy_normalize_location, raws),
+        _measure("gazetteer_uncached", normalize_location.__wrapped__, raws),
+        _measure("gazetteer_memoized", normalize_location, raws),
+    ):
+        print(json.dumps(row, ensure_ascii=False))
+    info = normalize_location.cache_info()
+    print(json.dumps({"message": "memo", "hits": info.hits, "misses": info.misses, "size": info.currsize}))
+
+
+if __name__ == "__main__":
+    main()
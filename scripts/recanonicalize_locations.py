@@ -0,0 +1,24 @@
+import asyncio
+
+from app.core.cache import get_response_cache
+from app.core.database import SessionLocal
+from app.dao.location_dao import LocationDAO
+from app.service.stats_rollup_service import StatsRollupService
+
+
+async def main() -> None:
+    """Re-resolve existing `locations` rows after a normalizer or gazetteer change.
+
+    Rows keyed by the old "-" splitter and `raw::` rows the gazetteer has since learned move to
+    their canonical row; city rollups are then recounted.
+    """
+    async with SessionLocal() as session:
+        stats = await LocationDAO().recanonicalize(session)
+        await session.commit()
+        print(stats)
+        print(await StatsRollupService().reconcile(session))
+    await get_response_cache().bump("jobs")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
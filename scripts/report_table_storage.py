@@ -0,0 +1,66 @@
+"""Report heap size, TOAST size, row width and buffer-cache hit ratio for the hot tables.
+
+Run it before and after `alembic upgrade head` (20261019_0012 moves long text and raw payloads
+into job_bodies / campus_event_bodies) and compare; `--reset-stats` zeroes the I/O counters so
+the hit ratio reflects only the workload run between two reports:
+
+    uv run python scripts/report_table_storage.py --reset-stats
+    # ... drive list / stats traffic ...
+    uv run python scripts/report_table_storage.py
+"""
+
+import argparse
+import asyncio
+import json
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+TABLES = (
+    "jobs",
+    "job_bodies",
+    "job_search_docs",
+    "campus_events",
+    "campus_event_bodies",
+)
+
+REPORT_SQL = text(
+    """
+    SELECT c.relname AS table_name,
+           c.reltuples::bigint AS estimated_rows,
+           pg_relation_size(c.oid) AS heap_bytes,
+           coalesce(pg_total_relation_size(c.reltoastrelid), 0) AS toast_bytes,
+           pg_indexes_size(c.oid) AS index_bytes,
+           CASE WHEN c.reltuples > 0 THEN round(pg_relation_size(c.oid) / c.reltuples) END
+               AS heap_bytes_per_row,
+           s.heap_blks_hit,
+           s.heap_blks_read,
+           CASE WHEN s.heap_blks_hit + s.heap_blks_read > 0
+                THEN round(s.heap_blks_hit::numeric / (s.heap_blks_hit + s.heap_blks_read), 4)
+           END AS heap_hit_ratio
+    FROM pg_class c
+    JOIN pg_statio_user_tables s ON s.relid = c.oid
+    WHERE c.relname = ANY(:tables)
+    ORDER BY c.relname
+    """
+)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="热表堆大小与缓冲命中率报告（拆分大字段前后对比）")
+    parser.add_argument("--reset-stats", action="store_true", help="报告后清零本库的 I/O 统计计数")
+    args = parser.parse_args()
+
+    try:
+        async with engine.begin() as conn:
+            for row in (await conn.execute(REPORT_SQL, {"tables": list(TABLES)})).mappings():
+                print(json.dumps(dict(row), ensure_ascii=False, default=str))
+            if args.reset_stats:
+                await conn.execute(text("SELECT pg_stat_reset()"))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,7 +2,9 @@ import argparse
 import asyncio
 import json
 import logging
+import math
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -52,18 +54,47 @@ def _resource_snapshot(disk_path: str) -> dict[str, float]:
     }
 
 
-def _low_resource(snapshot: dict[str, float], min_free_ratio: float) -> bool:
-    return (
-        snapshot["disk_free_ratio"] < min_free_ratio
-        or snapshot["memory_free_ratio"] < min_free_ratio
-    )
-
-
-async def _load_enabled_sources() -> list[str]:
+def _allowed_concurrency(
+    snapshot: dict[str, float],
+    *,
+    min_free_ratio: float,
+    soft_margin: float,
+    max_concurrency: int,
+) -> int:
+    """Shrink the number of parallel sources linearly as headroom falls into the soft band.
+
+    Above `min_free_ratio + soft_margin` every slot is available; at `min_free_ratio` no new
+    source is started (running ones finish), so memory/disk pressure slows the loop down
+    instead of killing it.
+    """
+    headroom = min(snapshot["disk_free_ratio"], snapshot["memory_free_ratio"])
+    if headroom < min_free_ratio:
+        return 0
+    if soft_margin <= 0 or headroom >= min_free_ratio + soft_margin:
+        return max_concurrency
+    fraction = (headroom - min_free_ratio) / soft_margin
+    return max(1, math.ceil(max_concurrency * fraction))
+
+
+@dataclass
+class SourceSchedule:
+    source_code: str
+    interval_seconds: float
+    next_due: float = 0.0
+    runs: int = 0
+    idle_runs: int = 0
+    inserted: int = 0
+    updated: int = 0
+    stopped_reason: str | None = None
+
+
+async def _load_sources() -> tuple[list[str], dict[str, dict]]:
     dao = SourceDAO()
     async with SessionLocal() as session:
-        enabled = await dao.list_enabled(session)
-        return [source.code for source in enabled]
+        sources = await dao.list_all(session)
+        enabled = [source.code for source in sources if source.enabled]
+        configs = {source.code: dict(source.config_json or {}) for source in sources}
+        return enabled, configs
 
 
 async def _run_one_source(
@@ -79,6 +110,28 @@ async def _run_one_source(
         return {"source_code": source_code, "skipped": True, "reason": "adapter_not_registered"}
 
 
+async def _guarded_run(
+    source_code: str,
+    crawl_service: CrawlService,
+    campus_crawl_service: CampusCrawlService,
+) -> dict:
+    try:
+        result = await _run_one_source(source_code, crawl_service, campus_crawl_service)
+        return {"source_code": source_code, **result}
+    except Exception as exc:  # noqa: BLE001
+        return {
+            "source_code": source_code,
+            "status": "failed",
+            "inserted_count": 0,
+            "updated_count": 0,
+            "error": str(exc),
+        }
+
+
+def _print_event(payload: dict) -> None:
+    print(json.dumps(payload, ensure_ascii=False, default=str))
+
+
 async def run_loop(
     sources: list[str],
     *,
@@ -87,10 +140,20 @@ async def run_loop(
     interval_seconds: int,
     idle_rounds_to_stop: int,
     max_rounds: int | None,
+    max_concurrency: int = 4,
+    soft_free_margin: float = 0.15,
+    low_resource_grace_seconds: float = 300.0,
 ) -> None:
+    """Run every source on its own interval, several at a time.
+
+    Each source is rescheduled `interval_seconds` (or its `config_json.loop_interval_seconds`)
+    after its own run finishes, and retires after `idle_rounds_to_stop` consecutive runs without
+    inserts/updates or after `max_rounds` runs. Concurrency follows `_allowed_concurrency`; the
+    loop only gives up on resources after `low_resource_grace_seconds` below the threshold.
+    """
     crawl_service = CrawlService()
     campus_crawl_service = CampusCrawlService()
-    all_enabled = await _load_enabled_sources()
+    all_enabled, source_configs = await _load_sources()
     if sources:
         # Explicitly requested sources should not be silently dropped.
         target_sources = list(dict.fromkeys(sources))
@@ -98,138 +161,148 @@ async def run_loop(
         target_sources = all_enabled
 
     if not target_sources:
-        print(json.dumps({"message": "no enabled sources to run"}, ensure_ascii=False))
+        _print_event({"message": "no enabled sources to run"})
         return
 
-    db_info = _database_target_info()
-    print(
-        json.dumps(
-            {
-                "message": "crawler loop started",
-                "sources": target_sources,
-                "enabled_sources": all_enabled,
-                "min_free_ratio": min_free_ratio,
-                "interval_seconds": interval_seconds,
-                "idle_rounds_to_stop": idle_rounds_to_stop,
-                "max_rounds": max_rounds,
-                "database_target": db_info,
-            },
-            ensure_ascii=False,
+    schedules = {
+        code: SourceSchedule(
+            source_code=code,
+            interval_seconds=float(
+                source_configs.get(code, {}).get("loop_interval_seconds") or interval_seconds
+            ),
         )
+        for code in target_sources
+    }
+    _print_event(
+        {
+            "message": "crawler loop started",
+            "sources": target_sources,
+            "enabled_sources": all_enabled,
+            "intervals": {code: item.interval_seconds for code, item in schedules.items()},
+            "min_free_ratio": min_free_ratio,
+            "soft_free_margin": soft_free_margin,
+            "max_concurrency": max_concurrency,
+            "idle_rounds_to_stop": idle_rounds_to_stop,
+            "max_rounds": max_rounds,
+            "database_target": _database_target_info(),
+        }
     )
 
-    round_no = 0
-    idle_rounds = 0
+    loop = asyncio.get_running_loop()
+    running: dict[asyncio.Task, str] = {}
     total_inserted = 0
     total_updated = 0
+    starved_since: float | None = None
+    last_limit: int | None = None
 
     while True:
-        round_no += 1
+        now = loop.time()
+        active = [item for item in schedules.values() if item.stopped_reason is None]
+        if not active and not running:
+            break
+
         snapshot = _resource_snapshot(disk_path)
-        if _low_resource(snapshot, min_free_ratio):
-            print(
-                json.dumps(
+        limit = _allowed_concurrency(
+            snapshot,
+            min_free_ratio=min_free_ratio,
+            soft_margin=soft_free_margin,
+            max_concurrency=max_concurrency,
+        )
+        if limit != last_limit:
+            _print_event({"message": "concurrency_changed", "limit": limit, "snapshot": snapshot})
+            last_limit = limit
+
+        if limit == 0 and not running:
+            starved_since = starved_since if starved_since is not None else now
+            if now - starved_since >= low_resource_grace_seconds:
+                _print_event(
                     {
                         "message": "stop_due_to_low_resource",
-                        "round": round_no,
                         "snapshot": snapshot,
                         "threshold": min_free_ratio,
-                    },
-                    ensure_ascii=False,
-                )
-            )
-            break
-
-        round_inserted = 0
-        round_updated = 0
-        run_results: list[dict] = []
-
-        for source_code in target_sources:
-            try:
-                result = await _run_one_source(source_code, crawl_service, campus_crawl_service)
-                result = {"source_code": source_code, **result}
-            except Exception as exc:  # noqa: BLE001
-                result = {
-                    "source_code": source_code,
-                    "status": "failed",
-                    "inserted_count": 0,
-                    "updated_count": 0,
-                    "error": str(exc),
-                }
-            run_results.append(result)
-
-            if not result.get("skipped"):
-                round_inserted += int(result.get("inserted_count", 0) or 0)
-                round_updated += int(result.get("updated_count", 0) or 0)
-
-            snapshot = _resource_snapshot(disk_path)
-            if _low_resource(snapshot, min_free_ratio):
-                print(
-                    json.dumps(
-                        {
-                            "message": "stop_due_to_low_resource",
-                            "round": round_no,
-                            "source_code": source_code,
-                            "snapshot": snapshot,
-                            "threshold": min_free_ratio,
-                        },
-                        ensure_ascii=False,
-                    )
+                        "waited_seconds": round(now - starved_since, 1),
+                    }
                 )
                 break
-
-        total_inserted += round_inserted
-        total_updated += round_updated
-        if round_inserted == 0 and round_updated == 0:
-            idle_rounds += 1
         else:
-            idle_rounds = 0
+            starved_since = None
 
-        print(
-            json.dumps(
-                {
-                    "message": "round_finished",
-                    "round": round_no,
-                    "round_inserted": round_inserted,
-                    "round_updated": round_updated,
-                    "idle_rounds": idle_rounds,
-                    "total_inserted": total_inserted,
-                    "total_updated": total_updated,
-                    "results": run_results,
-                },
-                ensure_ascii=False,
-                default=str,
+        busy = set(running.values())
+        due = sorted(
+            (item for item in active if item.source_code not in busy and item.next_due <= now),
+            key=lambda item: item.next_due,
+        )
+        for item in due[: max(0, limit - len(running))]:
+            task = asyncio.create_task(
+                _guarded_run(item.source_code, crawl_service, campus_crawl_service)
             )
+            running[task] = item.source_code
+
+        busy = set(running.values())
+        waiting = [item.next_due for item in active if item.source_code not in busy]
+        timeout = max(0.5, min(waiting) - now) if waiting and limit > len(running) else 5.0
+        if not running:
+            await asyncio.sleep(timeout)
+            continue
+        done, _ = await asyncio.wait(
+            list(running), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
         )
 
-        if idle_rounds >= idle_rounds_to_stop:
-            print(
-                json.dumps(
-                    {
-                        "message": "stop_due_to_no_new_data",
-                        "round": round_no,
-                        "idle_rounds": idle_rounds,
-                    },
-                    ensure_ascii=False,
-                )
+        for task in done:
+            item = schedules[running.pop(task)]
+            result = task.result()
+            inserted = 0 if result.get("skipped") else int(result.get("inserted_count", 0) or 0)
+            updated = 0 if result.get("skipped") else int(result.get("updated_count", 0) or 0)
+            item.runs += 1
+            item.inserted += inserted
+            item.updated += updated
+            item.idle_runs = item.idle_runs + 1 if inserted == 0 and updated == 0 else 0
+            item.next_due = loop.time() + item.interval_seconds
+            total_inserted += inserted
+            total_updated += updated
+            if result.get("skipped"):
+                item.stopped_reason = "skipped"
+            elif item.idle_runs >= idle_rounds_to_stop:
+                item.stopped_reason = "no_new_data"
+            elif max_rounds is not None and item.runs >= max_rounds:
+                item.stopped_reason = "max_rounds"
+            _print_event(
+                {
+                    "message": "source_run_finished",
+                    "source_code": item.source_code,
+                    "run": item.runs,
+                    "idle_runs": item.idle_runs,
+                    "stopped_reason": item.stopped_reason,
+                    "total_inserted": total_inserted,
+                    "total_updated": total_updated,
+                    "result": result,
+                }
             )
-            break
 
-        if max_rounds is not None and round_no >= max_rounds:
-            print(
-                json.dumps(
-                    {"message": "stop_due_to_max_rounds", "round": round_no},
-                    ensure_ascii=False,
-                )
-            )
-            break
-
-        await asyncio.sleep(interval_seconds)
+    _print_event(
+        {
+            "message": "crawler loop finished",
+            "total_inserted": total_inserted,
+            "total_updated": total_updated,
+            "sources": {
+                code: {
+                    "runs": item.runs,
+                    "inserted": item.inserted,
+                    "updated": item.updated,
+                    "stopped_reason": item.stopped_reason,
+                }
+                for code, item in schedules.items()
+            },
+        }
+    )
+    # Low-resource exit can leave runs in flight; let them record their CrawlRun before returning.
+    if running:
+        await asyncio.gather(*running)
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="持续运行爬虫：直到连续无新增数据，或磁盘/内存剩余低于阈值"
+        description="持续并发运行爬虫：各源按自身间隔调度，直到无新增数据或资源长期不足"
     )
     parser.add_argument(
         "--source",
@@ -252,19 +325,37 @@ def parse_args() -> argparse.Namespace:
         "--interval-seconds",
         type=int,
         default=30,
-        help="每轮抓取间隔秒数，默认 30 秒",
+        help="单个源两次抓取之间的间隔秒数，默认 30 秒；源配置 loop_interval_seconds 可覆盖",
     )
     parser.add_argument(
         "--idle-rounds-to-stop",
         type=int,
         default=3,
-        help="连续无新增轮次达到该值后停止，默认 3",
+        help="单个源连续无新增次数达到该值后停止该源，默认 3",
     )
     parser.add_argument(
         "--max-rounds",
         type=int,
         default=None,
-        help="可选，最大轮次（用于调试）",
+        help="可选，每个源最多运行次数（用于调试）",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="最多同时运行的源数量，默认 4",
+    )
+    parser.add_argument(
+        "--soft-free-margin",
+        type=float,
+        default=0.15,
+        help="剩余比例低于 min-free-ratio + 该值时按比例降低并发，默认 0.15",
+    )
+    parser.add_argument(
+        "--low-resource-grace-seconds",
+        type=float,
+        default=300.0,
+        help="资源低于阈值且无运行中任务持续该秒数后退出，默认 300",
     )
     parser.add_argument(
         "--log-level",
@@ -297,6 +388,9 @@ async def main() -> None:
         interval_seconds=args.interval_seconds,
         idle_rounds_to_stop=args.idle_rounds_to_stop,
         max_rounds=args.max_rounds,
+        max_concurrency=max(1, args.max_concurrency),
+        soft_free_margin=max(0.0, args.soft_free_margin),
+        low_resource_grace_seconds=max(0.0, args.low_resource_grace_seconds),
     )
 
 
@@ -1,9 +1,11 @@
 import argparse
 import asyncio
+from datetime import timedelta
 
 from app.core.database import SessionLocal
 from app.crawler.adapters.http_common import parse_cookie_string
 from app.dao.source_dao import SourceDAO
+from app.utils.time import now_utc
 
 
 def parse_args() -> argparse.Namespace:
@@ -12,6 +14,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--cookie", default="", help="浏览器复制的完整 Cookie 字符串")
     parser.add_argument("--cookie-file", default="", help="从文件读取完整 Cookie 字符串")
     parser.add_argument("--enable", action="store_true", help="写入 Cookie 后立即启用源")
+    parser.add_argument("--ttl-hours", type=float, default=0.0, help="Cookie 有效期（小时），到期后抓取直接失败")
     return parser.parse_args()
 
 
@@ -32,6 +35,10 @@ async def main() -> None:
 
         config = dict(source.config_json or {})
         config["cookies"] = cookies
+        if args.ttl_hours > 0:
+            config["cookie_expires_at"] = (now_utc() + timedelta(hours=args.ttl_hours)).isoformat()
+        else:
+            config.pop("cookie_expires_at", None)
         source.config_json = config
         if args.enable:
             source.enabled = True
@@ -43,6 +50,7 @@ async def main() -> None:
             "source": args.source,
             "cookies_keys": sorted(cookies.keys()),
             "enabled": bool(args.enable),
+            "cookie_expires_at": config.get("cookie_expires_at"),
         }
     )
 
@@ -0,0 +1,86 @@
+import json
+
+import httpx
+import pytest
+
+from app.crawler.adapters.demo_platform import DemoPlatformAdapter
+from app.crawler.adapters.yingjiesheng_xjh import YingJieShengXjhAdapter
+from app.crawler.deadline import CrawlDeadline
+from app.crawler.sandbox import CrawlOutcome
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _adapter(clock: FakeClock, requested_pages: list[int]) -> YingJieShengXjhAdapter:
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = json.loads(request.content)["pageNum"]
+        requested_pages.append(page)
+        clock.now += 4.0
+        items = [{"id": page * 10 + i, "title": f"宣讲会 {page}-{i}"} for i in range(2)]
+        return httpx.Response(200, json={"status": "1", "resultbody": {"xjh": {"items": items, "totalCount": 20}}})
+
+    adapter = YingJieShengXjhAdapter(
+        config={
+            "young_sign_key": "static-key",
+            "kx_types": [0],
+            "page_size": 2,
+            "max_pages": 10,
+            "fetch_detail": False,
+            "include_legacy_html": False,
+            "request_interval_seconds": 0.001,
+        }
+    )
+    adapter.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    adapter.deadline = CrawlDeadline(10.0, clock=clock)
+    return adapter
+
+
+@pytest.mark.asyncio
+async def test_deadline_stops_between_pages_and_next_run_resumes() -> None:
+    clock = FakeClock()
+    first_pages: list[int] = []
+    first = _adapter(clock, first_pages)
+    events = await first.crawl()
+
+    assert first_pages == [1, 2, 3]
+    assert len(events) == 6
+    assert first.resume_state == {"phase": "api", "kx_index": 0, "page": 4}
+    assert first.last_crawl_meta["resume"] == first.resume_state
+
+    clock = FakeClock()
+    second_pages: list[int] = []
+    second = _adapter(clock, second_pages)
+    second.resume_from = dict(first.resume_state)
+    await second.crawl()
+    assert second_pages[0] == 4
+
+
+@pytest.mark.asyncio
+async def test_skipped_details_are_a_metric_not_a_resume_point() -> None:
+    clock = FakeClock()
+
+    class SlowDetailAdapter(DemoPlatformAdapter):
+        async def fetch_detail(self, list_item: dict) -> dict:
+            clock.now += 10.0
+            return await super().fetch_detail(list_item)
+
+    adapter = SlowDetailAdapter()
+    adapter.fetch_detail_enabled = True
+    adapter.deadline = CrawlDeadline(10.0, clock=clock)
+    outcome = CrawlOutcome.from_adapter(adapter, await adapter.crawl())
+
+    assert len(outcome.items) == 1
+    assert outcome.resume_state is None
+    assert outcome.crawl_meta["skipped_details"] == 1
+
+
+def test_deadline_disabled_without_config() -> None:
+    deadline = CrawlDeadline.from_config({})
+    assert deadline.remaining() is None
+    assert not deadline.expired()
@@ -0,0 +1,160 @@
+import multiprocessing
+import time
+
+import pytest
+
+from app.core.cache import ResponseCache
+from app.crawler import sandbox
+from app.crawler.adapters.demo_platform import DemoPlatformAdapter
+from app.crawler.credentials import CredentialStore
+from app.crawler.sandbox import SandboxCrawlError, SandboxLimits, run_in_sandbox
+from app.crawler.timing import collect_timings
+from app.models.enums import CrawlRunStatus
+from app.models.source import Source
+from app.service.crawl_service import CrawlService
+
+
+class RecordingConn:
+    def __init__(self) -> None:
+        self.sent: list[tuple] = []
+
+    def send(self, message: tuple) -> None:
+        self.sent.append(message)
+
+
+@pytest.mark.asyncio
+async def test_sandboxed_crawl_streams_items_and_records_peak_rss() -> None:
+    store = CredentialStore("demo_platform")
+    with collect_timings() as timings:
+        outcome = await run_in_sandbox(
+            "job",
+            "demo_platform",
+            {},
+            resume_from={},
+            credentials=store,
+            limits=SandboxLimits(memory_mb=2048, cpu_seconds=60, wall_seconds=60),
+        )
+
+    assert [job.external_job_id for job in outcome.items] == ["p-1001", "p-1002"]
+    assert outcome.item_failures == []
+    assert outcome.resume_state is None
+    assert outcome.peak_rss_kb and outcome.peak_rss_kb > 0
+    assert timings.to_dict()["peak_rss_kb"] == outcome.peak_rss_kb
+
+
+@pytest.mark.asyncio
+async def test_sandbox_is_killed_on_wall_clock_limit() -> None:
+    with pytest.raises(SandboxCrawlError, match="wall-clock"):
+        await run_in_sandbox(
+            "job",
+            "demo_platform",
+            {},
+            resume_from={},
+            credentials=CredentialStore("demo_platform"),
+            limits=SandboxLimits(memory_mb=None, cpu_seconds=None, wall_seconds=0.01),
+        )
+
+
+@pytest.mark.asyncio
+async def test_child_sends_items_before_the_crawl_returns(monkeypatch) -> None:
+    conn = RecordingConn()
+    sent_before_return: list[int] = []
+
+    class WatchedAdapter(DemoPlatformAdapter):
+        async def crawl(self) -> list:
+            jobs = await super().crawl()
+            sent_before_return.append(sum(len(batch) for tag, batch in conn.sent if tag == "items"))
+            return jobs
+
+    monkeypatch.setattr(sandbox, "ITEM_BATCH_SIZE", 1)
+    monkeypatch.setattr("app.crawler.registry.get_adapter", lambda code, config: WatchedAdapter(config))
+    result = await sandbox._child_crawl(conn, "job", "demo_platform", {}, {}, [])
+
+    assert "error" not in result
+    assert sent_before_return == [2]
+    assert [job.external_job_id for _, batch in conn.sent for job in batch] == ["p-1001", "p-1002"]
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.added: list = []
+
+    def add(self, obj) -> None:
+        self.added.append(obj)
+
+    async def flush(self) -> None:
+        return None
+
+    async def commit(self) -> None:
+        return None
+
+    async def rollback(self) -> None:
+        return None
+
+
+class Stub:
+    """Answers any awaited DAO call with `result`."""
+
+    def __init__(self, result=None) -> None:
+        self.result = result
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, name: str):
+        async def call(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self.result
+
+        return call
+
+
+def _stream_then_hang(conn, *args) -> None:
+    conn.send(("items", ["first", "second"]))
+    time.sleep(60)
+
+
+@pytest.mark.asyncio
+async def test_killed_sandbox_keeps_the_items_it_streamed(monkeypatch) -> None:
+    fork = multiprocessing.get_context("fork")
+    monkeypatch.setattr(sandbox.multiprocessing, "get_context", lambda method: fork)
+    monkeypatch.setattr(sandbox, "_child_main", _stream_then_hang)
+
+    outcome = await run_in_sandbox(
+        "job",
+        "demo_platform",
+        {},
+        resume_from={},
+        credentials=CredentialStore("demo_platform"),
+        limits=SandboxLimits(memory_mb=None, cpu_seconds=None, wall_seconds=1.0),
+    )
+
+    assert outcome.items == ["first", "second"]
+    assert "wall-clock" in outcome.crawl_meta["sandbox_aborted"]
+    assert outcome.resume_state is None
+
+
+@pytest.mark.asyncio
+async def test_killed_sandbox_run_is_not_recorded_as_success(monkeypatch) -> None:
+    fork = multiprocessing.get_context("fork")
+    monkeypatch.setattr(sandbox.multiprocessing, "get_context", lambda method: fork)
+    monkeypatch.setattr(sandbox, "_child_main", _stream_then_hang)
+    monkeypatch.setattr("app.service.crawl_service.get_response_cache", lambda: ResponseCache(None, 300))
+
+    service = CrawlService()
+    source = Source(
+        id=1, code="demo_platform", enabled=True, robots_allowed=True, config_json={"sandbox": {"wall_seconds": 1}}
+    )
+    service.source_dao = Stub(source)
+    service.job_dao = Stub((2, 0))
+    service.credential_dao = Stub()
+    service.quarantine_dao = Stub()
+    monkeypatch.setattr(service.run_dao, "get_resume_state", Stub({}).get_resume_state)
+    session = FakeSession()
+
+    result = await service.run_source(session, "demo_platform", sandboxed=True)
+
+    run = session.added[0]
+    assert result["status"] == CrawlRunStatus.failed.value
+    assert run.status == CrawlRunStatus.failed
+    assert "wall-clock" in run.error_summary
+    assert run.crawled_count == 2
+    assert result["crawl_meta"]["resume"] is None
@@ -0,0 +1,82 @@
+import httpx
+import pytest
+
+from app.crawler.policy import CircuitBreaker, RequestPolicy, RetryPolicy
+from app.crawler.proxy_pool import build_http_client
+from app.crawler.timing import CrawlTimings, collect_timings, summarize_timings
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_nested_phases_are_exclusive() -> None:
+    clock = FakeClock()
+    timings = CrawlTimings(clock=clock)
+    with timings.phase("db_write"):
+        clock.now += 1.0
+        with timings.phase("db_read"):
+            clock.now += 2.0
+        clock.now += 0.5
+
+    assert timings.seconds["db_write"] == pytest.approx(1.5)
+    assert timings.seconds["db_read"] == pytest.approx(2.0)
+    assert timings.to_dict()["unaccounted_seconds"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_client_hooks_and_policy_record_requests_bytes_and_retries() -> None:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(500, text="busy")
+        return httpx.Response(200, content=b"x" * 1000)
+
+    client = build_http_client("timing_test", {}, {"transport": httpx.MockTransport(handler)})
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    policy = RequestPolicy(
+        RetryPolicy(max_attempts=2, base_delay_seconds=0.01, max_delay_seconds=0.01),
+        CircuitBreaker(source_code="timing_test"),
+        sleep=fake_sleep,
+    )
+
+    async def attempt() -> httpx.Response:
+        response = await client.get("https://example.com/list")
+        response.raise_for_status()
+        return response
+
+    with collect_timings() as timings:
+        response = await policy.call(attempt)
+    await client.aclose()
+
+    assert response.content == b"x" * 1000
+    data = timings.to_dict()
+    assert data["requests"] == 2
+    assert data["bytes_downloaded"] == 1004
+    assert data["retries"] == 1
+    assert len(sleeps) == 1
+
+
+def test_summarize_timings_averages_phases() -> None:
+    runs = [
+        {"total_seconds": 10.0, "phases": {"http_wait": 6.0, "db_write": 2.0}, "requests": 10, "retries": 1},
+        {"total_seconds": 20.0, "phases": {"http_wait": 14.0, "db_write": 4.0}, "requests": 30, "retries": 0},
+    ]
+    summary = summarize_timings(runs)
+
+    assert summary["runs"] == 2
+    assert summary["avg_total_seconds"] == 15.0
+    assert summary["avg_phase_seconds"]["http_wait"] == 10.0
+    assert summary["phase_share"]["db_write"] == 0.2
+    assert summary["avg_requests"] == 20.0
+    assert summarize_timings([]) == {"runs": 0}
@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from app.crawler import credentials
+from app.crawler.adapters.yingjiesheng_xjh import SIGN_KEY_CREDENTIAL, YingJieShengXjhAdapter
+from app.crawler.credentials import (
+    CredentialExpiredError,
+    CredentialStore,
+    ensure_cookie_credential,
+    fingerprint_name,
+    get_credential_store,
+)
+from app.utils.time import now_utc
+
+
+def test_store_ttl_invalidation_and_refresh_window() -> None:
+    store = CredentialStore("t_store")
+    store.put("key", {"v": 1}, ttl_seconds=600)
+    assert store.get("key") == {"v": 1}
+    assert store.due_for_refresh(lead_seconds=60) == []
+    assert store.due_for_refresh(lead_seconds=3600) == ["key"]
+
+    store.invalidate("key", "签名不正确")
+    assert store.get("key") is None
+    assert store.is_invalidated("key")
+    assert [entry.name for entry in store.dirty_entries()] == ["key"]
+
+
+def test_track_keeps_first_seen_expiry_and_replacement_starts_clean() -> None:
+    store = CredentialStore("t_track")
+    first = store.track(fingerprint_name("signed_url", "https://a"), {}, ttl_seconds=60)
+    again = store.track(fingerprint_name("signed_url", "https://a"), {}, ttl_seconds=3600)
+    assert again is first
+
+    store.invalidate(first.name, "110011")
+    replacement = store.track(fingerprint_name("signed_url", "https://b"), {}, ttl_seconds=60)
+    assert replacement.is_valid(now_utc())
+
+
+def test_expired_cookie_fails_fast() -> None:
+    source = "t_cookie"
+    credentials._STORES.pop(source, None)
+    expired = (now_utc() - timedelta(minutes=1)).isoformat()
+    with pytest.raises(CredentialExpiredError):
+        ensure_cookie_credential(source, {"cookie_expires_at": expired}, {"sid": "abc"})
+
+    fresh = (now_utc() + timedelta(hours=1)).isoformat()
+    ensure_cookie_credential(source, {"cookie_expires_at": fresh}, {"sid": "new"})
+
+
+@pytest.mark.asyncio
+async def test_yingjiesheng_rotated_sign_key_is_invalidated_and_rescraped() -> None:
+    credentials._STORES.pop(YingJieShengXjhAdapter.source_code, None)
+    store = get_credential_store(YingJieShengXjhAdapter.source_code)
+    store.put(SIGN_KEY_CREDENTIAL, {"key": "stale", "from_domain": "yjs_web"}, ttl_seconds=3600)
+    landing_hits = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal landing_hits
+        if request.url.host == "www.yingjiesheng.com":
+            landing_hits += 1
+            return httpx.Response(200, text='young_sign_key:"fresh",from_domain:"yjs_web"')
+        if landing_hits == 0:
+            # The upstream rotated its key, so anything signed with the cached one is rejected.
+            return httpx.Response(200, json={"status": "0", "message": "签名错误"})
+        return httpx.Response(200, json={"status": "1", "resultbody": {}})
+
+    adapter = YingJieShengXjhAdapter(config={"request_interval_seconds": 0.0, "retry_count": 1})
+    adapter.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        await adapter._ensure_sign_key()
+        assert adapter._sign_key == "stale"
+        assert landing_hits == 0
+        payload = await adapter._signed_json_request(method="GET", path="open/noauth/job/fair/list")
+    finally:
+        await adapter.client.aclose()
+
+    assert payload["status"] == "1"
+    assert landing_hits == 1
+    assert adapter._sign_key == "fresh"
+    assert store.get(SIGN_KEY_CREDENTIAL) == {"key": "fresh", "from_domain": "yjs_web"}
+
+
+@pytest.mark.asyncio
+async def test_yingjiesheng_unrelated_error_keeps_the_sign_key() -> None:
+    credentials._STORES.pop(YingJieShengXjhAdapter.source_code, None)
+    store = get_credential_store(YingJieShengXjhAdapter.source_code)
+    store.put(SIGN_KEY_CREDENTIAL, {"key": "cached", "from_domain": "yjs_web"}, ttl_seconds=3600)
+
+    landing_hits = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal landing_hits
+        if request.url.host == "www.yingjiesheng.com":
+            landing_hits += 1
+            return httpx.Response(200, text='young_sign_key:"fresh",from_domain:"yjs_web"')
+        return httpx.Response(200, json={"status": "0", "message": "assign design template failed"})
+
+    adapter = YingJieShengXjhAdapter(config={"request_interval_seconds": 0.0, "retry_count": 1})
+    adapter.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        await adapter._ensure_sign_key()
+        with pytest.raises(RuntimeError, match="api request failed"):
+            await adapter._signed_json_request(method="GET", path="open/noauth/job/fair/list")
+    finally:
+        await adapter.client.aclose()
+
+    assert landing_hits == 0
+    assert store.get(SIGN_KEY_CREDENTIAL) == {"key": "cached", "from_domain": "yjs_web"}
@@ -0,0 +1,53 @@
+import pytest
+
+from app.crawler.adapters.demo_platform import DemoPlatformAdapter
+from app.crawler.base import ItemFailureRatioError
+from app.crawler.policy import RiskSignalError
+from app.service.crawl_service import CrawlService
+
+
+class FlakyPlatformAdapter(DemoPlatformAdapter):
+    async def fetch_list(self) -> list[dict]:
+        items = await super().fetch_list()
+        return items + [{"job_id": "p-broken", "url": "https://platform.example/jobs/p-broken"}]
+
+    async def fetch_detail(self, list_item: dict) -> dict:
+        if list_item["job_id"] == "p-broken":
+            return {"company": "NoTitle"}
+        return await super().fetch_detail(list_item)
+
+
+class BlockedPlatformAdapter(DemoPlatformAdapter):
+    async def fetch_detail(self, list_item: dict) -> dict:
+        try:
+            raise RiskSignalError("captcha page")
+        except RiskSignalError as exc:
+            raise RuntimeError(f"detail request failed: {list_item['url']}") from exc
+
+
+@pytest.mark.asyncio
+async def test_malformed_item_is_quarantined_and_run_continues() -> None:
+    adapter = FlakyPlatformAdapter()
+    jobs = await adapter.crawl()
+
+    assert [job.external_job_id for job in jobs] == ["p-1001", "p-1002"]
+    assert len(adapter.item_failures) == 1
+    failure = adapter.item_failures[0]
+    assert failure.stage == "parse"
+    assert failure.error_type == "KeyError"
+    assert failure.external_id == "p-broken"
+    assert failure.payload_ref == "https://platform.example/jobs/p-broken"
+    assert failure.payload == {"job_id": "p-broken", "url": "https://platform.example/jobs/p-broken"}
+
+
+@pytest.mark.asyncio
+async def test_risk_signal_still_aborts_the_run() -> None:
+    with pytest.raises(RuntimeError, match="detail request failed"):
+        await BlockedPlatformAdapter().crawl()
+
+
+def test_failure_ratio_threshold() -> None:
+    CrawlService._check_failure_ratio({}, succeeded=9, failed=1)
+    CrawlService._check_failure_ratio({"max_item_failure_ratio": 0.5}, succeeded=1, failed=1)
+    with pytest.raises(ItemFailureRatioError):
+        CrawlService._check_failure_ratio({"max_item_failure_ratio": 0.1}, succeeded=8, failed=2)
@@ -0,0 +1,109 @@
+import httpx
+import pytest
+
+from app.crawler.proxy_pool import (
+    ProxyPool,
+    ProxyPoolClient,
+    ProxyPoolExhaustedError,
+    hint_detector,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _granted_in(pool: ProxyPool, clock: FakeClock, seconds: float, step: float = 0.01) -> int:
+    granted = 0
+    while clock.now < seconds:
+        while True:
+            proxy, _ = pool.try_acquire()
+            if proxy is None:
+                break
+            pool.report(proxy, ok=True, latency=0.05)
+            granted += 1
+        clock.now += step
+    return granted
+
+
+def test_throughput_scales_with_healthy_proxy_count() -> None:
+    results: dict[int, int] = {}
+    for count in (1, 2, 4, 8):
+        clock = FakeClock()
+        pool = ProxyPool(
+            "stand_in",
+            [f"http://proxy-{i}.local:8080" for i in range(count)],
+            rate_per_second=2.0,
+            burst=1.0,
+            clock=clock,
+        )
+        results[count] = _granted_in(pool, clock, seconds=30.0)
+
+    for count, granted in results.items():
+        expected = results[1] * count
+        assert abs(granted - expected) <= expected * 0.05
+
+
+def test_challenged_proxy_is_quarantined_and_skipped() -> None:
+    clock = FakeClock()
+    pool = ProxyPool("stand_in", ["http://a.local", "http://b.local"], rate_per_second=100.0, clock=clock)
+    first, _ = pool.try_acquire()
+    assert first is not None
+    pool.report(first, ok=True, latency=0.1, challenged=True)
+
+    for _ in range(5):
+        clock.now += 0.1
+        proxy, _ = pool.try_acquire()
+        assert proxy is not None
+        assert proxy.url != first.url
+    assert first not in pool.healthy()
+
+    clock.now += pool.quarantine_seconds + 1
+    assert len(pool.healthy()) == 2
+
+
+@pytest.mark.asyncio
+async def test_exhausted_error_names_the_limit_that_blocked() -> None:
+    clock = FakeClock()
+    throttled = ProxyPool(
+        "stand_in", ["http://a.local", "http://b.local"], rate_per_second=0.01, max_wait_seconds=5.0, clock=clock
+    )
+    assert (await throttled.acquire()) is not None
+    assert (await throttled.acquire()) is not None
+    with pytest.raises(ProxyPoolExhaustedError, match="rate limit") as rate_exc:
+        await throttled.acquire()
+    assert "quarantined=0/2" in str(rate_exc.value)
+
+    quarantined = ProxyPool("stand_in", ["http://a.local"], max_wait_seconds=5.0, clock=clock)
+    proxy = await quarantined.acquire()
+    quarantined.report(proxy, ok=True, latency=0.1, challenged=True)
+    with pytest.raises(ProxyPoolExhaustedError, match="all proxies quarantined"):
+        await quarantined.acquire()
+
+
+@pytest.mark.asyncio
+async def test_pool_client_rotates_away_from_captcha_proxy() -> None:
+    def factory(**kwargs: object) -> httpx.AsyncClient:
+        proxy_url = str(kwargs.pop("proxy"))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "bad" in proxy_url:
+                return httpx.Response(200, text="<title>请输入验证码</title>")
+            return httpx.Response(200, text=f"ok via {proxy_url}")
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler), **kwargs)  # type: ignore[arg-type]
+
+    pool = ProxyPool("stand_in", ["http://bad.local", "http://good.local"], rate_per_second=1000.0, burst=10.0)
+    client = ProxyPoolClient(
+        pool, {"timeout": 5.0}, challenge_detector=hint_detector(("请输入验证码",)), client_factory=factory
+    )
+    bodies = [(await client.get("https://example.com/list")).text for _ in range(6)]
+    await client.aclose()
+
+    assert sum("验证码" in body for body in bodies) <= 1
+    bad = next(p for p in pool.proxies if "bad" in p.url)
+    assert bad.captcha_hits <= 1
@@ -0,0 +1,180 @@
+import json
+
+import httpx
+import pytest
+
+from app.crawler.client import CrawlerClient
+from app.crawler.policy import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RequestPolicy,
+    RetryPolicy,
+    RiskSignalError,
+    TransientResponseError,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _policy(max_attempts: int, breaker: CircuitBreaker, sleeps: list[float]) -> RequestPolicy:
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    retry = RetryPolicy(max_attempts=max_attempts, base_delay_seconds=1.0, max_delay_seconds=30.0)
+    return RequestPolicy(retry, breaker, sleep=fake_sleep)
+
+
+def test_full_jitter_delay_is_bounded_by_exponential_ceiling() -> None:
+    retry = RetryPolicy(max_attempts=5, base_delay_seconds=1.0, max_delay_seconds=4.0)
+    for attempt, ceiling in ((1, 1.0), (2, 2.0), (3, 4.0), (4, 4.0)):
+        for _ in range(50):
+            assert 0.0 <= retry.compute_delay(attempt) <= ceiling
+    assert retry.compute_delay(1, retry_after=3.0) >= 3.0
+
+
+def test_parse_retry_after_seconds_and_invalid() -> None:
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("") is None
+    assert parse_retry_after("not-a-date") is None
+
+
+@pytest.mark.asyncio
+async def test_retry_after_header_is_honored() -> None:
+    sleeps: list[float] = []
+    policy = _policy(2, CircuitBreaker(source_code="t1", failure_threshold=5), sleeps)
+    request = httpx.Request("GET", "https://example.com")
+    calls = 0
+
+    async def operation() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            response = httpx.Response(429, headers={"Retry-After": "7"}, request=request)
+            raise httpx.HTTPStatusError("throttled", request=request, response=response)
+        return "ok"
+
+    assert await policy.call(operation) == "ok"
+    assert sleeps and sleeps[0] >= 7.0
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_on_captcha_burst_and_stops_requests() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(source_code="t2", failure_threshold=2, cooldown_seconds=60.0, clock=clock)
+    policy = _policy(5, breaker, [])
+    calls = 0
+
+    async def operation() -> str:
+        nonlocal calls
+        calls += 1
+        raise RiskSignalError("captcha page")
+
+    with pytest.raises(CircuitOpenError):
+        await policy.call(operation)
+    assert calls == 2
+    assert breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        await policy.call(operation)
+    assert calls == 2
+
+    clock.now = 61.0
+    assert breaker.state == "half_open"
+
+    async def healthy() -> str:
+        return "ok"
+
+    assert await policy.call(healthy) == "ok"
+    assert breaker.state == "closed"
+
+
+def _http_client(handler, sleeps: list[float]) -> CrawlerClient:
+    policy = _policy(3, CircuitBreaker(source_code="t3", failure_threshold=10), sleeps)
+    client = CrawlerClient(qps=1000.0, jitter_ms=0, policy=policy)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [400, 403, 404])
+async def test_client_errors_are_attempted_once(status_code: int) -> None:
+    sleeps: list[float] = []
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(status_code)
+
+    client = _http_client(handler, sleeps)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get("https://example.com/jobs/1")
+    assert calls == 1 and sleeps == []
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_transport_and_server_errors_are_retried() -> None:
+    sleeps: list[float] = []
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(503 if calls == 2 else 200)
+
+    client = _http_client(handler, sleeps)
+    assert (await client.get("https://example.com/jobs/1")).status_code == 200
+    assert calls == 3 and len(sleeps) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [KeyError("title"), TypeError("bad operand"), ValueError("missing fields")])
+async def test_programming_errors_are_attempted_once(error: Exception) -> None:
+    sleeps: list[float] = []
+    calls = 0
+
+    async def operation() -> str:
+        nonlocal calls
+        calls += 1
+        raise error
+
+    policy = _policy(3, CircuitBreaker(source_code="t4", failure_threshold=10), sleeps)
+    with pytest.raises(type(error)):
+        await policy.call(operation)
+    assert calls == 1 and sleeps == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        json.JSONDecodeError("Unterminated string", '{"a": "', 6),
+        TransientResponseError("non-json response"),
+        RiskSignalError("captcha page"),
+    ],
+)
+async def test_truncated_and_transient_responses_are_retried(error: Exception) -> None:
+    sleeps: list[float] = []
+    calls = 0
+
+    async def operation() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise error
+        return "ok"
+
+    policy = _policy(3, CircuitBreaker(source_code="t5", failure_threshold=10), sleeps)
+    assert await policy.call(operation) == "ok"
+    assert calls == 2 and len(sleeps) == 1
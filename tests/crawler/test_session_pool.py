@@ -0,0 +1,91 @@
+import httpx
+import pytest
+
+from app.crawler.proxy_pool import hint_detector
+from app.crawler.session_pool import (
+    SessionPool,
+    SessionPoolClient,
+    SessionPoolExhaustedError,
+    get_session_pool,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_picks_least_recently_throttled_session() -> None:
+    clock = FakeClock()
+    cookie_sets = [{"sid": "a"}, {"sid": "b"}, {"sid": "c"}]
+    pool = SessionPool("t_lrt", cookie_sets, cooldown_seconds=10.0, clock=clock)
+    a, b, c = pool.sessions
+
+    pool.report(a, throttled=True)
+    clock.now = 5.0
+    pool.report(b, throttled=True)
+    clock.now = 20.0
+
+    picked = [pool.try_acquire()[0] for _ in range(3)]
+    assert picked[0] is c
+    # c is still never-throttled so it keeps winning; a was throttled before b.
+    assert all(session is c for session in picked)
+    pool.report(c, throttled=True)
+    clock.now = 31.0
+    assert pool.try_acquire()[0] is a
+
+
+def test_budget_and_cooldown_exhaust_pool() -> None:
+    clock = FakeClock()
+    pool = SessionPool(
+        "t_budget", [{"sid": "a"}, {"sid": "b"}], request_budget=2, budget_window_seconds=60.0, clock=clock
+    )
+    granted = [pool.try_acquire()[0] for _ in range(4)]
+    assert all(session is not None for session in granted)
+    session, wait = pool.try_acquire()
+    assert session is None
+    assert wait == pytest.approx(60.0)
+
+    clock.now = 60.0
+    assert pool.try_acquire()[0] is not None
+
+
+@pytest.mark.asyncio
+async def test_client_retires_challenged_session_and_rotates() -> None:
+    pool = SessionPool("t_client", [{"sid": "bad"}, {"sid": "good"}], max_wait_seconds=0.0)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "sid=bad" in request.headers.get("cookie", ""):
+            return httpx.Response(200, text="<html>请输入验证码</html>")
+        return httpx.Response(200, text="<html>ok</html>")
+
+    client = SessionPoolClient(
+        pool,
+        lambda cookies: httpx.AsyncClient(transport=httpx.MockTransport(handler), cookies=cookies),
+        challenge_detector=hint_detector(("请输入验证码",)),
+    )
+    try:
+        bodies = [(await client.get("https://example.com/list")).text for _ in range(4)]
+    finally:
+        await client.aclose()
+
+    assert bodies.count("<html>请输入验证码</html>") == 1
+    retired = [session for session in pool.sessions if session.retired]
+    assert [session.cookies for session in retired] == [{"sid": "bad"}]
+
+    pool.retire(pool.sessions[1], reason="manual")
+    with pytest.raises(SessionPoolExhaustedError):
+        await pool.acquire()
+
+
+def test_pool_is_reused_until_cookie_sets_change() -> None:
+    config = {"session_pool": {"cookies": ["sid=a; uid=1", {"sid": "b"}]}}
+    pool = get_session_pool("t_registry", config)
+    assert pool is not None and len(pool.sessions) == 2
+    assert get_session_pool("t_registry", config) is pool
+    changed = get_session_pool("t_registry", {"session_pool": {"cookies": ["sid=c"]}})
+    assert changed is not pool
+    assert get_session_pool("t_registry", {}) is None
@@ -0,0 +1,49 @@
+import itertools
+import os
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.dao.campus_event_dao import CampusEventDAO
+
+# Needs a migrated Postgres (alembic upgrade head); the plan check is meaningless on other engines.
+DATABASE_URL = os.environ.get("APP_TEST_DATABASE_URL")
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="APP_TEST_DATABASE_URL not set")
+
+SUBSTRING_FILTERS = {
+    "keyword": ("宣讲会", "ix_campus_events_search_text_trgm"),
+    "school": ("清华大学", "ix_campus_events_school_name_trgm"),
+    "company": ("科技有限", "ix_campus_events_company_name_trgm"),
+}
+
+
+def _combinations() -> list[tuple[str, ...]]:
+    names = list(SUBSTRING_FILTERS)
+    return [combo for size in range(1, len(names) + 1) for combo in itertools.combinations(names, size)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("combo", _combinations(), ids="+".join)
+@pytest.mark.parametrize("extra", [{}, {"city": "北京", "event_type": "talk"}], ids=["plain", "with_eq_filters"])
+async def test_every_substring_filter_combination_uses_a_trigram_index(
+    combo: tuple[str, ...], extra: dict
+) -> None:
+    filters = {name: SUBSTRING_FILTERS[name][0] for name in combo}
+    stmt = CampusEventDAO().build_search_stmt(**filters, **extra)
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    sql = str(count_stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    engine = create_async_engine(DATABASE_URL)
+    try:
+        async with engine.connect() as conn:
+            # An empty table would always win with a seq scan; disable it to see which index is usable.
+            await conn.execute(text("SET enable_seqscan = off"))
+            plan = "\n".join((await conn.execute(text(f"EXPLAIN {sql}"))).scalars().all())
+    finally:
+        await engine.dispose()
+
+    expected = {SUBSTRING_FILTERS[name][1] for name in combo}
+    assert any(index in plan for index in expected), plan
+    assert "Seq Scan on campus_events" not in plan, plan
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.dao.job_dao import JOB_KEYSETS, JobDAO
+from app.dao.job_search_doc_dao import JobSearchDocDAO
+from app.models.job_search_doc import JobSearchDoc
+from app.search.job_index import JobIndexQuery, JobSearchIndex
+from app.service.job_index_service import JobIndexService
+
+# Compares the in-process index with the SQL path on a migrated, populated database.
+DATABASE_URL = os.environ.get("APP_TEST_DATABASE_URL")
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="APP_TEST_DATABASE_URL not set")
+
+
+async def _queries(session: AsyncSession) -> list[dict]:
+    """Filters drawn from the data itself, so every shape matches something."""
+    sample = (await session.execute(select(JobSearchDoc).limit(1))).scalar_one_or_none()
+    if sample is None:
+        pytest.skip("job_search_docs is empty")
+    queries: list[dict] = [{}, {"salary_min": 5000}, {"experience_min": 12, "salary_max": 30000}]
+    if sample.city:
+        queries += [{"city": sample.city}, {"city": sample.city, "source_code": sample.source_code}]
+    if sample.province:
+        queries.append({"province": sample.province})
+    if sample.job_category:
+        queries.append({"category": sample.job_category})
+    queries += [{"keyword": sample.title[:4]}, {"keyword": "python"}, {"keyword": "pyth"}]
+    return queries
+
+
+@pytest.mark.asyncio
+async def test_index_and_sql_return_the_same_pages() -> None:
+    engine = create_async_engine(DATABASE_URL)
+    try:
+        async with AsyncSession(engine) as session:
+            index = JobSearchIndex()
+            async for batch in JobSearchDocDAO().iter_index_docs(session):
+                index.add(batch)
+
+            for filters in await _queries(session):
+                for sort_by in ("time", "salary"):
+                    sql_cursor = index_cursor = None
+                    for page in (1, 2, 3):
+                        sql = await JobDAO().search_jobs(
+                            session,
+                            page=page,
+                            page_size=20,
+                            keyword=filters.get("keyword"),
+                            province=filters.get("province"),
+                            city=filters.get("city"),
+                            district=None,
+                            category=filters.get("category"),
+                            education=None,
+                            experience_min=filters.get("experience_min"),
+                            salary_min=filters.get("salary_min"),
+                            salary_max=filters.get("salary_max"),
+                            industry=None,
+                            source_code=filters.get("source_code"),
+                            sort_by=sort_by,
+                            cursor=sql_cursor,
+                        )
+                        query = await JobIndexService().resolve_regions(
+                            session,
+                            JobIndexQuery(page=page, page_size=20, sort_by=sort_by, cursor=index_cursor, **filters),
+                        )
+                        indexed = index.search(query, JOB_KEYSETS[sort_by])
+
+                        label = f"{sort_by} {filters} page {page}"
+                        assert indexed["items"] == sql["items"], label
+                        if sql["total_exact"]:
+                            assert indexed["total"] == sql["total"], label
+                        sql_cursor, index_cursor = sql["next_cursor"], indexed["next_cursor"]
+                        if sql_cursor is None:
+                            assert index_cursor is None, label
+                            break
+    finally:
+        await engine.dispose()
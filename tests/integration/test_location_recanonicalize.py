@@ -0,0 +1,52 @@
+import os
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.dao.location_dao import LocationDAO
+from app.models.job import Job
+from app.models.job_search_doc import JobSearchDoc
+from app.models.location import Location
+
+# Runs the backfill on a migrated, populated database inside a transaction that is rolled back.
+DATABASE_URL = os.environ.get("APP_TEST_DATABASE_URL")
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="APP_TEST_DATABASE_URL not set")
+
+
+@pytest.mark.asyncio
+async def test_legacy_rows_are_merged_or_rekeyed() -> None:
+    engine = create_async_engine(DATABASE_URL)
+    try:
+        async with AsyncSession(engine) as session:
+            job = (await session.execute(select(Job).limit(1))).scalar_one_or_none()
+            if job is None:
+                pytest.skip("jobs is empty")
+            dao = LocationDAO()
+            canonical = await dao.get_or_create(session, "cn::上海::上海::unknown", "上海", "上海", None)
+            legacy = Location(normalized_key="cn::Shanghai::Shanghai::unknown", province="Shanghai", city="Shanghai")
+            tag = f"zzq{uuid.uuid4().hex[:8]}"
+            unresolved = Location(normalized_key=f"cn::{tag}::{tag}::unknown", province=tag, city=tag)
+            session.add_all([legacy, unresolved])
+            await session.flush()
+            job.location_id = legacy.id
+            doc = await session.get(JobSearchDoc, job.id)
+            if doc is not None:
+                doc.location_id, doc.city = legacy.id, "Shanghai"
+            await session.flush()
+
+            stats = await dao.recanonicalize(session)
+
+            assert stats["merged"] >= 1 and stats["rekeyed"] >= 1
+            await session.refresh(job)
+            assert job.location_id == canonical.id
+            if doc is not None:
+                await session.refresh(doc)
+                assert (doc.location_id, doc.city) == (canonical.id, "上海")
+            keys = set((await session.execute(select(Location.normalized_key))).scalars())
+            assert "cn::Shanghai::Shanghai::unknown" not in keys
+            assert f"raw::{tag}" in keys
+            await session.rollback()
+    finally:
+        await engine.dispose()
@@ -0,0 +1,28 @@
+from sqlalchemy.dialects import postgresql
+
+from app.dao.campus_event_dao import CampusEventDAO
+
+
+def _compiled(**filters) -> tuple[str, dict]:
+    compiled = CampusEventDAO().build_search_stmt(**filters).compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+def test_like_metacharacters_in_filters_match_literally() -> None:
+    sql, params = _compiled(keyword="100%_offer", school="a\\b", company="C_o")
+
+    assert sql.count("ESCAPE '\\'") == 3
+    patterns = sorted(value for value in params.values() if isinstance(value, str) and value.startswith("%"))
+    assert patterns == [
+        "%100\\%\\_offer%",
+        "%C\\_o%",
+        "%a\\\\b%",
+    ]
+
+
+def test_keyword_cannot_contain_the_field_separator() -> None:
+    _, params = _compiled(keyword="清华\x1f宣讲")
+    assert "%清华宣讲%" in params.values()
+
+    sql, _ = _compiled(keyword="\x1f")
+    assert "search_text" not in sql.split("WHERE", 1)[1]
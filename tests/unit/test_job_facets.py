@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import select
+
+from app.dao.job_dao import FACET_LIMIT, JobDAO
+from app.models.enums import EducationLevel
+from app.models.job_search_doc import JobSearchDoc
+
+
+class ScriptedSession:
+    def __init__(self, rows: list[tuple]) -> None:
+        self.rows = rows
+        self.statements: list = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        rows = self.rows
+
+        class Result:
+            def all(self) -> list[tuple]:
+                return rows
+
+        return Result()
+
+
+def _row(facet: str | None, value, count: int) -> tuple:
+    """A GROUPING SETS result row; `facet=None` is the grand-total row."""
+    names = ("city", "category", "education", "source", "salary")
+    values = tuple(value if name == facet else None for name in names)
+    grouped = tuple(0 if name == facet else 1 for name in names)
+    return (*values, *grouped, count)
+
+
+@pytest.mark.asyncio
+async def test_facets_come_from_one_grouping_sets_query() -> None:
+    session = ScriptedSession(
+        [
+            _row("city", "上海", 3),
+            _row("city", "北京", 5),
+            _row("city", None, 1),
+            _row("education", EducationLevel.bachelor, 9),
+            _row("source", "job51", 9),
+            _row("salary", "50k+", 1),
+            _row("salary", "10-15k", 6),
+            _row("salary", "unknown", 2),
+            _row(None, None, 9),
+        ]
+    )
+    facets, total = await JobDAO().facet_counts(session, select(JobSearchDoc))
+
+    assert len(session.statements) == 1
+    assert total == 9
+    assert facets["city"] == [
+        {"value": "北京", "count": 5},
+        {"value": "上海", "count": 3},
+        {"value": "unknown", "count": 1},
+    ]
+    assert facets["education"] == [{"value": "bachelor", "count": 9}]
+    assert facets["category"] == []
+    assert [item["value"] for item in facets["salary"]] == ["10-15k", "50k+", "unknown"]
+
+
+@pytest.mark.asyncio
+async def test_total_counts_rows_beyond_the_truncated_facets() -> None:
+    sources = FACET_LIMIT + 5
+    session = ScriptedSession(
+        [_row("source", f"source-{i}", 2) for i in range(sources)] + [_row(None, None, 2 * sources)]
+    )
+    facets, total = await JobDAO().facet_counts(session, select(JobSearchDoc))
+
+    assert len(facets["source"]) == FACET_LIMIT
+    assert total == 2 * sources
@@ -0,0 +1,226 @@
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.dao.job_dao import JOB_KEYSETS
+from app.models.enums import EducationLevel
+from app.search.job_index import JobIndexQuery, JobSearchIndex
+from app.search.snapshot import MappedJobIndex, SnapshotError, write_job_snapshot
+from app.utils.salary import monthly_salary_midpoint, monthly_salary_range
+from app.utils.search_tokens import build_search_document, build_search_query
+
+CITIES = ["北京", "上海", "深圳", "朝阳", None]
+# Region paths (province id, city id) per city; 朝阳 is a city name in two provinces.
+REGION_PATHS = {"北京": [[1, 2]], "上海": [[3, 4]], "深圳": [[5, 6]], "朝阳": [[7, 8], [1, 9]], None: [[]]}
+# What RegionDAO.filter_ids would return for each (level, name).
+REGION_DIRECTORY = {("province", "北京"): (1,), ("city", "北京"): (2,), ("city", "上海"): (4,), ("city", "朝阳"): (8, 9)}
+CATEGORIES = ["后端", "数据", "产品", None]
+TITLES = ["后端开发工程师", "Python 数据分析", "产品经理", "Java 后端", "算法工程师 python"]
+BASE = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def _doc(rng: random.Random, job_id: int, updated: datetime = BASE) -> dict:
+    salary_max = rng.choice([None, Decimal("8000.00"), Decimal("15000.50"), Decimal("30000.00")])
+    salary_period = rng.choice(["month", "month", "year"])
+    if salary_max is not None and salary_period == "year":
+        salary_max *= 12
+    salary_min = salary_max / 2 if salary_max is not None else None
+    monthly = monthly_salary_range(salary_min, salary_max, "CNY", salary_period)
+    title = rng.choice(TITLES)
+    city = rng.choice(CITIES)
+    return {
+        "job_id": job_id,
+        "title": title,
+        "company_name": f"公司{job_id % 7}",
+        "industry": rng.choice(["互联网", "金融", None]),
+        "city": city,
+        "region_ids": rng.choice(REGION_PATHS[city]),
+        "job_category": rng.choice(CATEGORIES),
+        "education_requirement": rng.choice([EducationLevel.bachelor, EducationLevel.master]),
+        "experience_min_months": rng.choice([None, 0, 12, 36]),
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": "CNY",
+        "salary_period": salary_period,
+        "salary_monthly_low": monthly[0] if monthly else None,
+        "salary_monthly_high": monthly[1] if monthly else None,
+        "salary_monthly_mid": monthly_salary_midpoint(monthly),
+        # Repeated timestamps exercise the id tie-break.
+        "published_at": rng.choice([None, BASE + timedelta(hours=rng.randrange(5))]),
+        "source_code": rng.choice(["job51", "zhipin"]),
+        "updated_at": updated,
+        "terms": build_search_document(title).split(),
+    }
+
+
+def _query(**fields) -> JobIndexQuery:
+    """JobIndexQuery with location filters resolved the way JobIndexService does."""
+    query = JobIndexQuery(**fields)
+    regions = tuple(REGION_DIRECTORY.get(item, ()) for item in query.location_filters().items())
+    return replace(query, regions=regions)
+
+
+def _reference(docs: list[dict], query: JobIndexQuery) -> list[int]:
+    """Plain-Python restatement of the SQL filters and ORDER BY in JobDAO.search_jobs."""
+    search_query = build_search_query(query.keyword)
+    terms = search_query.split(" & ") if search_query else []
+
+    def matches(doc: dict) -> bool:
+        for term in terms:
+            if term.endswith(":*"):
+                if not any(t.startswith(term[:-2]) for t in doc["terms"]):
+                    return False
+            elif term not in doc["terms"]:
+                return False
+        for region_ids in query.regions or ():
+            if not set(region_ids) & set(doc["region_ids"]):
+                return False
+        for field, value in query.equality_filters().items():
+            actual = doc["education_requirement"].value if field == "education" else doc[field]
+            if actual != value:
+                return False
+        experience = doc["experience_min_months"]
+        if query.experience_min is not None and experience is not None and experience < query.experience_min:
+            return False
+        if query.salary_min is not None or query.salary_max is not None:
+            if doc["salary_monthly_mid"] is None:
+                return query.salary_unknown
+            if query.salary_min is not None and doc["salary_monthly_low"] < query.salary_min:
+                return False
+            if query.salary_max is not None and doc["salary_monthly_high"] > query.salary_max:
+                return False
+        return True
+
+    def key(doc: dict) -> tuple:
+        published = doc["published_at"] or datetime.min.replace(tzinfo=timezone.utc)
+        if query.sort_by == "salary":
+            salary = doc["salary_monthly_mid"] if doc["salary_monthly_mid"] is not None else -1
+            return (salary, published, doc["job_id"])
+        return (published, doc["job_id"])
+
+    return [doc["job_id"] for doc in sorted(filter(matches, docs), key=key, reverse=True)]
+
+
+QUERIES = [
+    {},
+    {"city": "北京"},
+    {"city": "北京", "category": "后端"},
+    {"keyword": "后端"},
+    {"keyword": "pyth"},
+    {"keyword": "python 数据", "city": "上海"},
+    {"education": "master", "source_code": "job51"},
+    {"salary_min": 5000, "salary_max": 16000},
+    {"salary_min": 4000.5, "salary_unknown": False},
+    {"salary_min": 16000, "salary_max": 15000},
+    {"experience_min": 12, "industry": "金融"},
+    {"city": "广州"},
+    {"city": "朝阳"},
+    {"province": "北京", "category": "后端"},
+    {"keyword": "不存在"},
+]
+
+
+@pytest.mark.parametrize("sort_by", ["time", "salary"])
+@pytest.mark.parametrize("filters", QUERIES, ids=lambda f: ",".join(f) or "none")
+def test_index_matches_sql_semantics_across_offset_and_cursor_pages(sort_by: str, filters: dict) -> None:
+    rng = random.Random(7)
+    docs = [_doc(rng, job_id) for job_id in range(1, 301)]
+    index = JobSearchIndex()
+    index.add(docs)
+    # Re-crawled docs get a new position; the stale one must never surface again.
+    changed = [_doc(rng, job_id, BASE + timedelta(days=1)) for job_id in range(1, 301, 3)]
+    index.add(changed)
+    latest = {doc["job_id"]: doc for doc in [*docs, *changed]}
+    expected = _reference(list(latest.values()), _query(page=1, page_size=1, sort_by=sort_by, **filters))
+
+    keyset = JOB_KEYSETS[sort_by]
+    second = index.search(_query(page=2, page_size=7, sort_by=sort_by, **filters), keyset)
+    assert second["total"] == len(expected)
+    assert [item["id"] for item in second["items"]] == expected[7:14]
+
+    walked: list[int] = []
+    cursor = None
+    while True:
+        result = index.search(
+            _query(page=1, page_size=25, sort_by=sort_by, cursor=cursor, **filters), keyset
+        )
+        walked.extend(item["id"] for item in result["items"])
+        cursor = result["next_cursor"]
+        if cursor is None:
+            break
+    assert walked == expected
+
+
+def test_range_filter_totals_stop_counting_past_the_threshold() -> None:
+    rng = random.Random(3)
+    docs = [_doc(rng, job_id) for job_id in range(1, 301)]
+    index = JobSearchIndex()
+    index.add(docs)
+    keyset = JOB_KEYSETS["time"]
+    query = _query(page=2, page_size=5, experience_min=12)
+    expected = _reference(docs, query)
+    checked: list[int] = []
+    predicate = index._predicate(query, [])[0]
+    index._predicate = lambda *args: (lambda p: checked.append(p) or predicate(p), True)
+
+    exact = index.search(query, keyset, count_threshold=len(expected))
+    assert (exact["total"], exact["total_exact"]) == (len(expected), True)
+
+    checked.clear()
+    estimated = index.search(query, keyset, count_threshold=20)
+    assert [item["id"] for item in estimated["items"]] == expected[5:10]
+    assert estimated["total_exact"] is False
+    assert 0 < estimated["total"] <= len(index)
+    assert len(checked) < len(index)
+
+
+def test_unresolved_location_filters_are_rejected() -> None:
+    index = JobSearchIndex()
+    index.add([_doc(random.Random(2), 1)])
+    with pytest.raises(ValueError):
+        index.search(JobIndexQuery(page=1, page_size=10, city="北京"), JOB_KEYSETS["time"])
+
+
+def test_unchanged_docs_are_not_reindexed() -> None:
+    rng = random.Random(1)
+    doc = _doc(rng, 1)
+    index = JobSearchIndex()
+    index.add([doc])
+    index.add([doc])
+
+    assert len(index) == 1 and index.dead == 0
+    item = index.search(_query(page=1, page_size=10), JOB_KEYSETS["time"])["items"][0]
+    assert item["published_at"] == doc["published_at"]
+    assert item["education_requirement"] == doc["education_requirement"].value
+
+
+@pytest.mark.parametrize("sort_by", ["time", "salary"])
+def test_mapped_snapshot_serves_the_same_pages(tmp_path, sort_by: str) -> None:
+    rng = random.Random(11)
+    index = JobSearchIndex()
+    index.add([_doc(rng, job_id) for job_id in range(1, 201)])
+    index.add([_doc(rng, job_id, BASE + timedelta(days=1)) for job_id in range(1, 201, 4)])
+    path = str(tmp_path / "jobs.snapshot")
+    write_job_snapshot(index, path, {"watermark": "2026-10-02T00:00:00+00:00"})
+    mapped = MappedJobIndex(path)
+
+    assert len(mapped) == len(index) and mapped.meta["docs"] == len(index)
+    keyset = JOB_KEYSETS[sort_by]
+    for filters in QUERIES:
+        for page in (1, 3):
+            query = _query(page=page, page_size=9, sort_by=sort_by, **filters)
+            assert mapped.search(query, keyset) == index.search(query, keyset), filters
+        cursor = index.search(_query(page=1, page_size=9, sort_by=sort_by, **filters), keyset)["next_cursor"]
+        if cursor is not None:
+            query = _query(page=1, page_size=9, sort_by=sort_by, cursor=cursor, **filters)
+            assert mapped.search(query, keyset) == index.search(query, keyset), filters
+
+
+def test_snapshot_rejects_foreign_files(tmp_path) -> None:
+    path = tmp_path / "jobs.snapshot"
+    path.write_bytes(b"not a snapshot")
+    with pytest.raises(SnapshotError):
+        MappedJobIndex(str(path))
@@ -0,0 +1,82 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.config import Settings
+from app.search.job_index import JobIndexQuery, JobSearchIndex
+from app.service.job_index_service import JobIndexService
+
+
+class NoSession:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+def _doc(job_id: int) -> dict:
+    return {
+        "job_id": job_id,
+        "title": f"职位{job_id}",
+        "company_name": "公司",
+        "industry": None,
+        "city": None,
+        "region_ids": [],
+        "job_category": None,
+        "education_requirement": None,
+        "experience_min_months": None,
+        "salary_min": None,
+        "salary_max": None,
+        "salary_currency": None,
+        "salary_period": None,
+        "salary_monthly_low": None,
+        "salary_monthly_high": None,
+        "salary_monthly_mid": None,
+        "published_at": datetime(2026, 10, job_id, tzinfo=timezone.utc),
+        "source_code": "job51",
+        "updated_at": datetime(2026, 10, 1, tzinfo=timezone.utc),
+        "terms": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_due_rebuild_runs_in_the_background_while_the_old_generation_serves(monkeypatch) -> None:
+    settings = Settings(search_index_enabled=True, search_snapshot_path="")
+    monkeypatch.setattr("app.service.job_index_service.get_settings", lambda: settings)
+    monkeypatch.setattr("app.service.job_index_service.SessionLocal", NoSession)
+
+    old = JobSearchIndex()
+    old.add([_doc(1)])
+    service = JobIndexService()
+    service.index = service.local = old
+    overdue = time.monotonic() - settings.search_index_rebuild_interval_minutes * 60
+    service.rebuilt_at = service.refreshed_at = overdue
+
+    release = asyncio.Event()
+    new = JobSearchIndex()
+    new.add([_doc(1), _doc(2)])
+
+    async def rebuild(session) -> None:
+        await release.wait()
+        service.index = service.local = new
+        service.rebuilt_at = service.refreshed_at = time.monotonic()
+
+    monkeypatch.setattr(service, "rebuild", rebuild)
+    query = JobIndexQuery(page=1, page_size=10)
+
+    first = await service.search(None, query)
+    assert [item["id"] for item in first["items"]] == [1]
+    assert not service._maintenance.done()
+    # A second request neither waits nor starts another rebuild.
+    task = service._maintenance
+    await service.search(None, query)
+    assert service._maintenance is task
+
+    release.set()
+    await task
+    second = await service.search(None, query)
+    assert [item["id"] for item in second["items"]] == [2, 1]
+    assert service._maintenance is task
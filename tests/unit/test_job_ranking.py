@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.dao.job_dao import JOB_LIST_COLUMNS, JobDAO
+from app.search.ranking import quality_score, rank_prior, rerank
+from app.utils.search_tokens import build_search_query
+
+BASE = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+class FakeRow:
+    def __init__(self, **values) -> None:
+        self._mapping = values
+        self.__dict__.update(values)
+
+
+class WindowSession:
+    """Answers `ORDER BY rank_prior DESC LIMIT/OFFSET` statements from presorted rows."""
+
+    def __init__(self, rows: list[FakeRow]) -> None:
+        self.rows = rows
+
+    async def execute(self, stmt):
+        start = stmt._offset or 0
+        rows = self.rows[start : start + stmt._limit]
+        return type("Result", (), {"all": lambda self: rows})()
+
+
+def _row(job_id: int, title: str, *, days_old: float = 0, quality: float = 0.5, category=None) -> FakeRow:
+    return FakeRow(
+        job_id=job_id,
+        title=title,
+        company_name="某公司",
+        job_category=category,
+        industry=None,
+        published_at=BASE - timedelta(days=days_old),
+        quality_score=quality,
+    )
+
+
+def test_quality_rewards_filled_fields_and_body_text() -> None:
+    empty = quality_score(
+        salary_max=None,
+        education="unknown",
+        experience_min_months=None,
+        city=None,
+        responsibilities=None,
+        qualifications=None,
+    )
+    full = quality_score(
+        salary_max=20000,
+        education="bachelor",
+        experience_min_months=12,
+        city="北京",
+        responsibilities="负责" * 200,
+        qualifications="熟悉" * 200,
+    )
+    assert empty == 0.0 and full == 1.0
+
+
+def test_rank_prior_trades_quality_for_recency() -> None:
+    # A complete listing from three days ago outranks an empty one from today; a week is too much.
+    assert rank_prior(1.0, BASE - timedelta(days=3)) > rank_prior(0.0, BASE)
+    assert rank_prior(1.0, BASE - timedelta(days=8)) < rank_prior(0.0, BASE)
+    assert rank_prior(1.0, None) < rank_prior(0.0, BASE)
+
+
+def test_rerank_prefers_title_matches_then_freshness() -> None:
+    rows = [
+        _row(1, "产品经理", days_old=0),  # keyword only in the body
+        _row(2, "后端开发工程师", days_old=30),
+        _row(3, "后端开发工程师", days_old=1),
+        _row(4, "测试工程师", days_old=0, category="后端开发"),
+    ]
+    ranked = [row.job_id for row in rerank(rows, build_search_query("后端开发"))]
+    assert ranked == [3, 2, 4, 1]
+    assert [row.job_id for row in rerank(list(reversed(rows)), build_search_query("后端开发"))] == ranked
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("page_size", [3, 4, 7])
+async def test_relevance_pages_rerank_the_window_and_continue_in_prior_order(monkeypatch, page_size) -> None:
+    window = 10
+    monkeypatch.setattr(
+        "app.dao.job_dao.get_settings", lambda: type("Settings", (), {"search_rerank_window": window})()
+    )
+    # Presorted by rank_prior; titles alternate so the rerank reorders the window.
+    rows = [_row(100 - i, "后端开发" if i % 3 == 0 else "产品经理", days_old=i) for i in range(23)]
+    search_query = build_search_query("后端开发")
+    expected = [row.job_id for row in [*rerank(rows[:window], search_query), *rows[window:]]]
+
+    walked: list[int] = []
+    dao, page = JobDAO(), 1
+    while True:
+        items, has_more = await dao.relevance_page(
+            WindowSession(rows), select(*JOB_LIST_COLUMNS), search_query, page, page_size
+        )
+        walked.extend(row.job_id for row in items)
+        if not has_more:
+            break
+        page += 1
+    assert walked == expected
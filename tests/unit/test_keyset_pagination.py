@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.dao.campus_event_dao import EVENT_KEYSET
+from app.dao.job_dao import JOB_KEYSETS
+from app.dao.pagination import InvalidCursorError, page_window
+
+
+def test_cursor_round_trips_typed_values_including_nulls() -> None:
+    keyset = JOB_KEYSETS["salary"]
+    values = [25000, None, 42]
+    assert keyset.decode(keyset.encode(values)) == values
+
+    published = datetime(2026, 10, 1, 8, 30, tzinfo=timezone.utc)
+    time_keyset = JOB_KEYSETS["time"]
+    assert time_keyset.decode(time_keyset.encode([published, 7])) == [published, 7]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", JOB_KEYSETS["time"].encode([None, 1])])
+def test_rejects_malformed_or_foreign_cursors(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        JOB_KEYSETS["salary"].decode(cursor)
+
+
+def test_after_is_a_row_comparison_over_the_index_expressions() -> None:
+    sql = str(
+        EVENT_KEYSET.after([None, 9]).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    assert sql == (
+        "(coalesce(campus_events.starts_at, 'infinity'::timestamptz), campus_events.id) "
+        "> ('infinity'::timestamptz, 9)"
+    )
+    rows, has_more = page_window([1, 2, 3], 2)
+    assert rows == [1, 2] and has_more
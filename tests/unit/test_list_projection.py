@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import orjson
+
+from app.core.response import OrjsonResponse
+from app.dao.campus_event_dao import CampusEventDAO
+from app.dao.job_dao import JOB_LIST_COLUMNS
+from app.dao.service_order_dao import ORDER_LIST_COLUMNS
+from app.models.enums import EducationLevel
+
+
+def test_list_statements_skip_heavy_columns() -> None:
+    heavy = {"description", "tags_json", "raw_payload_json", "responsibilities", "qualifications", "note"}
+    event_columns = {column.key for column in CampusEventDAO().build_search_stmt().selected_columns}
+    job_columns = {column.key for column in JOB_LIST_COLUMNS}
+    order_columns = {column.key for column in ORDER_LIST_COLUMNS}
+
+    assert "source_code" in event_columns and "source_url" in event_columns
+    assert not heavy & (event_columns | job_columns | order_columns)
+
+
+def test_orjson_response_matches_api_encoding() -> None:
+    published = datetime(2026, 10, 19, 8, 30, tzinfo=timezone.utc)
+    response = OrjsonResponse(
+        {
+            "items": [
+                {"published_at": published, "education": EducationLevel.bachelor, "amount": Decimal("12.50")}
+            ]
+        }
+    )
+
+    assert response.media_type == "application/json"
+    assert orjson.loads(response.body) == {
+        "items": [{"published_at": "2026-10-19T08:30:00+00:00", "education": "bachelor", "amount": 12.5}]
+    }
@@ -0,0 +1,73 @@
+import pytest
+
+from app.utils.location import UNKNOWN_KEY, Gazetteer, normalize_location, stored_location_text
+
+SMALL = {
+    "municipalities": ["北京", "天津"],
+    "provinces": {"河北": ["石家庄"], "辽宁": ["朝阳"], "广东": ["深圳"]},
+    "districts": {"北京/北京": ["朝阳"], "天津/天津": ["河北"], "广东/深圳": ["南山"]},
+    "aliases": {"shenzhen": "广东/深圳"},
+}
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("北京-朝阳", ("北京", "北京", "朝阳")),
+        ("北京市朝阳区", ("北京", "北京", "朝阳")),
+        ("朝阳", ("辽宁", "朝阳")),  # the coarser division wins a tie
+        ("天津河北区", ("天津", "天津", "河北")),
+        ("河北", ("河北",)),
+        ("河北省 石家庄市", ("河北", "石家庄")),
+        ("深圳南山", ("广东", "深圳", "南山")),
+        ("Shenzhen, China", ("广东", "深圳")),
+        ("北京 / 深圳", ("北京", "北京")),  # equally supported: the first one named
+    ],
+)
+def test_resolve_picks_the_best_supported_division(raw: str, expected: tuple[str, ...]) -> None:
+    assert Gazetteer.from_mapping(SMALL).resolve(raw) == expected
+
+
+def test_latin_aliases_only_match_whole_words() -> None:
+    gazetteer = Gazetteer.from_mapping(SMALL)
+    assert gazetteer.resolve("shenzhenxyz") is None
+    assert gazetteer.resolve("Worldwide") is None
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("上海", ("上海", "上海", None, "cn::上海::上海::unknown")),
+        ("Shanghai", ("上海", "上海", None, "cn::上海::上海::unknown")),
+        ("深圳", ("广东", "深圳", None, "cn::广东::深圳::unknown")),
+        ("广东省深圳市南山区", ("广东", "深圳", "南山", "cn::广东::深圳::南山")),
+        ("浦东新区", ("上海", "上海", "浦东", "cn::上海::上海::浦东")),
+        ("广西壮族自治区南宁市", ("广西", "南宁", None, "cn::广西::南宁::unknown")),
+        ("Worldwide", (None, None, None, "raw::Worldwide")),
+        (" 远程  办公 ", (None, None, None, "raw::远程 办公")),
+        ("  ", (None, None, None, UNKNOWN_KEY)),
+        ("", (None, None, None, UNKNOWN_KEY)),
+        (None, (None, None, None, UNKNOWN_KEY)),
+    ],
+)
+def test_normalize_location_uses_the_bundled_gazetteer(raw: str | None, expected: tuple) -> None:
+    assert normalize_location(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("row", "canonical"),
+    [
+        # Rows keyed by the old "-" splitter, which stripped 市 / 省.
+        (("cn::上海::上海::unknown", "上海", "上海", None), "cn::上海::上海::unknown"),
+        (("cn::广东::深圳::南山", "广东", "深圳", "南山"), "cn::广东::深圳::南山"),
+        (("cn::浦东新区::浦东新区::unknown", "浦东新区", "浦东新区", None), "cn::上海::上海::浦东"),
+        (("cn::Worldwide::Worldwide::unknown", "Worldwide", "Worldwide", None), "raw::Worldwide"),
+        (("raw::Shenzhen", None, None, None), "cn::广东::深圳::unknown"),
+    ],
+)
+def test_stored_rows_re_resolve_to_their_canonical_key(row: tuple, canonical: str) -> None:
+    assert normalize_location(stored_location_text(*row))[3] == canonical
+
+
+def test_unknown_row_is_not_re_resolved() -> None:
+    assert stored_location_text(UNKNOWN_KEY, None, None, None) is None
@@ -0,0 +1,15 @@
+from app.utils.raw_payload import ENCODING_JSON, ENCODING_ZLIB, decode_payload, encode_payload
+
+
+def test_payload_round_trips_and_digest_ignores_key_order_and_compression() -> None:
+    payload = {"title": "宣讲会", "detail": {"body": "<p>" + "招聘" * 500 + "</p>"}, "id": 7}
+    reordered = {"id": 7, "detail": payload["detail"], "title": "宣讲会"}
+
+    zipped = encode_payload(payload)
+    plain = encode_payload(reordered, compression="none")
+
+    assert zipped.encoding == ENCODING_ZLIB and plain.encoding == ENCODING_JSON
+    assert zipped.sha256 == plain.sha256
+    assert len(zipped.data) < len(plain.data)
+    assert decode_payload(zipped.data, zipped.encoding) == payload
+    assert decode_payload(plain.data, plain.encoding) == payload
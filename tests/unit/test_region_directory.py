@@ -0,0 +1,56 @@
+import pytest
+
+from app.dao.region_dao import DIRECTORY_MISS_RELOAD_SECONDS, DIRECTORY_TTL_SECONDS, RegionDirectory
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RegionTable:
+    """Answers the directory's `SELECT id, level, name FROM regions`."""
+
+    def __init__(self, rows: list[tuple[int, int, str]]) -> None:
+        self.rows = rows
+        self.loads = 0
+
+    async def execute(self, stmt):
+        self.loads += 1
+        rows = list(self.rows)
+        return type("Result", (), {"all": lambda self: rows})()
+
+
+@pytest.mark.asyncio
+async def test_names_expand_to_every_node_of_the_level() -> None:
+    table = RegionTable([(1, 1, "北京"), (2, 2, "北京"), (3, 3, "朝阳"), (7, 1, "辽宁"), (8, 2, "朝阳")])
+    directory = RegionDirectory(FakeClock())
+
+    assert await directory.ids(table, 2, "北京") == (2,)
+    assert await directory.ids(table, 3, "朝阳") == (3,)
+    assert await directory.ids(table, 2, "朝阳") == (8,)
+    assert table.loads == 1
+
+
+@pytest.mark.asyncio
+async def test_misses_reload_at_most_once_per_interval() -> None:
+    clock = FakeClock()
+    table = RegionTable([(1, 1, "北京")])
+    directory = RegionDirectory(clock)
+    assert await directory.ids(table, 1, "上海") == ()
+
+    table.rows.append((2, 1, "上海"))
+    assert await directory.ids(table, 1, "上海") == ()  # just loaded; the miss is not retried yet
+    clock.now += DIRECTORY_MISS_RELOAD_SECONDS
+    assert await directory.ids(table, 1, "上海") == (2,)
+    assert table.loads == 2
+
+    clock.now += DIRECTORY_TTL_SECONDS
+    await directory.ids(table, 1, "北京")
+    assert table.loads == 3
+    directory.clear()
+    await directory.ids(table, 1, "北京")
+    assert table.loads == 4
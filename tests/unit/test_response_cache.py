@@ -0,0 +1,128 @@
+import pytest
+
+from app.core.cache import DatabaseVersions, MemoryCacheBackend, ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SharedVersionTable:
+    """Stands in for the cache_versions table both processes talk to."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, int] = {}
+        self.reads = 0
+
+    async def get(self, session, name: str) -> int:
+        self.reads += 1
+        return self.rows.get(name, 0)
+
+    async def bump(self, session, name: str) -> int:
+        self.rows[name] = self.rows.get(name, 0) + 1
+        return self.rows[name]
+
+
+class FakeSession:
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def commit(self) -> None:
+        return None
+
+
+def _process(table: SharedVersionTable, clock: FakeClock) -> ResponseCache:
+    versions = DatabaseVersions(FakeSession, ttl_seconds=1.0, clock=clock)
+    versions.dao = table
+    return ResponseCache(backend=MemoryCacheBackend(max_entries=16, versions=versions), ttl_seconds=300)
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        return {"items": [], "calls": self.calls}
+
+
+@pytest.mark.asyncio
+async def test_versioned_keys_follow_source_bumps() -> None:
+    cache = ResponseCache(backend=MemoryCacheBackend(max_entries=16), ttl_seconds=300)
+    compute = Counter()
+
+    all_sources = {"city": "北京", "page": 1}
+    job51_only = {"city": "北京", "page": 1, "source": "job51"}
+    await cache.get_or_compute("jobs", "search", all_sources, compute)
+    await cache.get_or_compute("jobs", "search", {"page": 1, "city": "北京", "keyword": ""}, compute)
+    await cache.get_or_compute("jobs", "search", job51_only, compute, source_code="job51")
+    assert compute.calls == 2
+
+    # A job58 crawl invalidates unfiltered queries but not the job51-only entry.
+    await cache.bump("jobs", "job58")
+    await cache.get_or_compute("jobs", "search", job51_only, compute, source_code="job51")
+    await cache.get_or_compute("jobs", "search", all_sources, compute)
+    assert compute.calls == 3
+
+    stats = cache.snapshot()["endpoints"]["jobs.search"]
+    assert (stats["hits"], stats["misses"]) == (2, 3)
+    assert stats["hit_ratio"] == 0.4
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_entry() -> None:
+    backend = MemoryCacheBackend(max_entries=2)
+    cache = ResponseCache(backend=backend, ttl_seconds=300)
+    compute = Counter()
+
+    for page in (1, 2, 1, 3):
+        await cache.get_or_compute("campus_events", "search", {"page": page}, compute)
+    assert len(backend.entries) == 2
+    assert compute.calls == 3
+
+    await cache.get_or_compute("campus_events", "search", {"page": 1}, compute)
+    await cache.get_or_compute("campus_events", "search", {"page": 2}, compute)
+    assert compute.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_bump_in_another_process_reaches_the_memory_cache() -> None:
+    table = SharedVersionTable()
+    clock = FakeClock()
+    api, crawler = _process(table, clock), _process(table, clock)
+    compute = Counter()
+
+    await api.get_or_compute("jobs", "search", {"page": 1}, compute)
+    await api.get_or_compute("jobs", "search", {"page": 1}, compute)
+    assert (compute.calls, table.reads) == (1, 1)
+
+    await crawler.bump("jobs", "job51")
+    # The API process keeps its memoized version until the version TTL passes.
+    await api.get_or_compute("jobs", "search", {"page": 1}, compute)
+    assert compute.calls == 1
+    clock.now += 1.0
+    await api.get_or_compute("jobs", "search", {"page": 1}, compute)
+    assert compute.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hits_are_copies_callers_cannot_corrupt() -> None:
+    cache = ResponseCache(backend=MemoryCacheBackend(max_entries=16), ttl_seconds=300)
+
+    async def compute() -> dict:
+        return {"items": [{"id": 1}, {"id": 2}], "facets": {"city": ["北京"]}}
+
+    first = await cache.get_or_compute("jobs", "search", {"page": 1}, compute)
+    first["items"].pop()
+    hit = await cache.get_or_compute("jobs", "search", {"page": 1}, compute)
+    hit["facets"]["city"].append("上海")
+
+    again = await cache.get_or_compute("jobs", "search", {"page": 1}, compute)
+    assert again == {"items": [{"id": 1}, {"id": 2}], "facets": {"city": ["北京"]}}
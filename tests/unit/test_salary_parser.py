@@ -1,4 +1,9 @@
-from app.utils.salary import parse_salary_range
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from app.dao.job_dao import salary_filter
+from app.utils.salary import monthly_salary_midpoint, monthly_salary_range, parse_salary_range
 
 
 def test_parse_salary_range_k() -> None:
@@ -7,3 +12,25 @@ def test_parse_salary_range_k() -> None:
     assert float(high) == 40000
     assert currency == "CNY"
     assert period == "month"
+
+
+def test_monthly_salary_range_normalizes_periods() -> None:
+    assert monthly_salary_range(*parse_salary_range("15k-22k/月")) == (15000, 22000)
+    assert monthly_salary_range(*parse_salary_range("200k-300k/年")) == (16667, 25000)
+    assert monthly_salary_range(Decimal("9000"), None, "CNY", "month") == (9000, 9000)
+    assert monthly_salary_range(Decimal("9000"), Decimal("12000"), "USD", "month") is None
+    assert monthly_salary_range(*parse_salary_range("面议")) is None
+    assert monthly_salary_midpoint((16667, 25000)) == 20833
+    assert monthly_salary_midpoint(None) is None
+
+
+def test_salary_filter_is_a_range_containment() -> None:
+    def sql(*args, **kwargs) -> str:
+        clause = salary_filter(*args, **kwargs)
+        return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert sql(8000.5, 20000, include_unknown=False) == (
+        "job_search_docs.salary_monthly_range <@ int4range(8001, 20000, '[]')"
+    )
+    assert sql(8000, None, include_unknown=True).endswith("OR job_search_docs.salary_monthly_range IS NULL")
+    assert sql(9000, 8000, include_unknown=False) == "false"
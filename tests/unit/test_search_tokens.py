@@ -0,0 +1,44 @@
+from app.crawler.types import RawJob
+from app.utils.normalizers import normalize_job
+from app.utils.search_tokens import build_search_document, build_search_query, tokenize_search_text
+
+
+def test_tokenize_mixed_text_into_cjk_ngrams_and_words() -> None:
+    assert tokenize_search_text("后端开发 Python3/FastAPI") == [
+        "后",
+        "端",
+        "开",
+        "发",
+        "后端",
+        "端开",
+        "开发",
+        "python3",
+        "fastapi",
+    ]
+    assert build_search_document("后端", "后端 后端") == "后 端 后端"
+
+
+def test_query_terms_are_a_subset_of_document_terms() -> None:
+    document = set(build_search_document("高级后端开发工程师", "熟悉 PostgreSQL").split())
+    query = build_search_query("后端开发 postgres")
+
+    assert query == "后端 & 端开 & 开发 & postgres:*"
+    cjk_terms = [term for term in query.split(" & ") if not term.endswith(":*")]
+    assert set(cjk_terms) <= document
+    assert build_search_query("岗") == "岗"
+    assert build_search_query("!!") is None
+
+
+def test_normalizer_fills_search_document() -> None:
+    job = normalize_job(
+        RawJob(
+            source_code="demo_platform",
+            external_job_id="p-1",
+            source_url="https://example/jobs/p-1",
+            title="数据分析师",
+            company_name="Demo",
+            description="SQL, Excel",
+        )
+    )
+    assert "数据" in job.search_document.split()
+    assert "sql" in job.search_document.split()
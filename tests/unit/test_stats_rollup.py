@@ -0,0 +1,21 @@
+from app.dao.stats_rollup_dao import RollupDelta
+
+
+def test_rollup_delta_nets_moves_and_drops_unchanged_buckets() -> None:
+    delta = RollupDelta()
+    delta.add("source", "job51")
+    delta.add("city", "北京")
+    delta.add("category", None)
+    # An updated job moves city; a second one moves back, so only the insert remains.
+    delta.move("city", "上海", "北京")
+    delta.move("city", "北京", "上海")
+    delta.move("category", None, "")
+    delta.move("category", "后端", "算法")
+
+    assert delta.nonzero() == [
+        ("category", "", 1),
+        ("category", "后端", -1),
+        ("category", "算法", 1),
+        ("city", "北京", 1),
+        ("source", "job51", 1),
+    ]
@@ -0,0 +1,68 @@
+import pytest
+
+from app.core.cache import query_signature
+from app.dao.counting import CountResult, TotalCounter, _CountCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ScriptedCounter(TotalCounter):
+    def __init__(self, estimate: int, actual: int, cache: _CountCache) -> None:
+        super().__init__("jobs", cache)
+        self.estimate = estimate
+        self.actual = actual
+        self.calls: list[str] = []
+
+    async def estimate_rows(self, session, stmt) -> int:
+        self.calls.append("estimate")
+        return self.estimate
+
+    async def bounded_count(self, session, stmt, limit: int) -> int:
+        self.calls.append("count")
+        return min(self.actual, limit)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("estimate", "actual", "expected", "calls"),
+    [
+        (120, 95, CountResult(95, True), ["count"]),
+        (900_000, 870_000, CountResult(900_000, False), ["count", "estimate"]),
+        # Overestimated: a selective filter is still counted exactly.
+        (40_000, 12, CountResult(12, True), ["count"]),
+        # Underestimated: the capped count proves the set is large, so the total is approximate.
+        (500, 50_000, CountResult(10_001, False), ["count", "estimate"]),
+    ],
+)
+async def test_exact_below_threshold_and_estimated_above(estimate, actual, expected, calls) -> None:
+    counter = ScriptedCounter(estimate, actual, _CountCache())
+    assert await counter.count(None, None, {"city": "北京"}) == expected
+    assert counter.calls == calls
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_by_signature_until_ttl_or_invalidation() -> None:
+    clock = FakeClock()
+    cache = _CountCache(clock)
+    counter = ScriptedCounter(120, 95, cache)
+
+    await counter.count(None, None, {"city": "北京", "keyword": None})
+    await counter.count(None, None, {"city": "北京", "category": ""})
+    assert counter.calls == ["count"]
+
+    clock.now += 31
+    await counter.count(None, None, {"city": "北京"})
+    assert counter.calls.count("count") == 2
+
+    cache.clear("jobs")
+    await counter.count(None, None, {"city": "北京"})
+    assert counter.calls.count("count") == 3
+    assert query_signature({"b": 1, "a": "x"}) == query_signature({"a": "x", "b": 1})
+    # Filters compare raw strings, so padded values are a different query.
+    assert query_signature({"category": " 销售"}) != query_signature({"category": "销售"})